@@ -58,10 +58,37 @@ class Config:
     # Plotting settings
     PLOT_BACKEND = "matplotlib"  # Options: "plotly", "matplotlib"
 
+    # Storage format for raw/processed SHPB series files
+    SERIES_FILE_FORMAT = "csv"  # Options: "csv", "npz"
+
+    # SHPB wizard array storage: "memmap" keeps raw data and pulse/result
+    # arrays in memory-mapped scratch files instead of RAM
+    SHPB_ARRAY_BACKEND = "memory"  # Options: "memory", "memmap"
+    SHPB_SCRATCH_DIR = None  # Parent of per-session scratch dirs (None: system temp)
+
     # Cache settings (for GUI forms, metadata, etc.)
     USE_FORM_CACHE = True  # Enable/disable form widget caching
     USE_METADATA_CACHE = True  # Enable/disable ontology metadata caching
     USE_SCHEMA_CACHE = True  # Enable/disable GUI schema caching
+    USE_BULK_SCHEMA_EXTRACTION = True  # Fetch property enumerations/flags per class, not per property
+    PREFETCH_FORM_METADATA = True  # Build wizard form metadata in the background at startup
+    PREFETCH_FORM_CLASSES = [
+        "https://dynamat.utep.edu/ontology#SHPBCompression",
+        "https://dynamat.utep.edu/ontology#PulseDetectionParams",
+        "https://dynamat.utep.edu/ontology#SegmentationParams",
+        "https://dynamat.utep.edu/ontology#AlignmentParams",
+        "https://dynamat.utep.edu/ontology#TukeyWindowParams",
+        "https://dynamat.utep.edu/ontology#EquilibriumMetrics",
+    ]
+    USE_ONTOLOGY_SNAPSHOT = True  # Load parsed ontology from on-disk snapshot when unchanged
+    ONTOLOGY_SNAPSHOT_DIR = USER_DATA_ROOT / "cache"
+    ONTOLOGY_LOAD_WORKERS = 1  # TTL parser processes (1: serial, 0: one per CPU)
+    USE_QUDT_UNIT_TABLE = True  # Load QUDT units from the compiled binary table next to the JSON cache
+    USE_INCREMENTAL_VALIDATION = True  # SHPB wizard: re-validate only the SHACL shapes a page change affects
+    USE_INSTANCE_INDEX = True  # Keep extracted instance metadata on disk; rescans parse only changed files
+    INSTANCE_INDEX_PATH = USER_DATA_ROOT / "cache" / "instance_index.sqlite"
+    INSTANCE_SCAN_WORKERS = 1  # Specimen TTL parser processes for index scans and SpecimenLoader (1: serial, 0: one per CPU)
+    INSTANCE_GRAPH_CACHE_TRIPLES = 200000  # Triples of parsed instance TTL files kept for detail views (0: no cache)
 
     @classmethod
     def get_config_dict(cls):
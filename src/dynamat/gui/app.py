@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication, QStyleFactory
-from PyQt6.QtCore import Qt, QDir
+from PyQt6.QtCore import Qt, QDir, QTimer
 from PyQt6.QtGui import QIcon, QPalette, QColor
 
 from .main_window import MainWindow
@@ -95,12 +95,28 @@ class DynaMatApp(QApplication):
             self.main_window = MainWindow(self.ontology_manager)
         
         self.main_window.show()
+
+        # Start building wizard form metadata once the event loop is running
+        QTimer.singleShot(0, self._start_metadata_prefetch)
         return self.main_window
+
+    def _start_metadata_prefetch(self):
+        """Prefetch form metadata for the configured classes in the background"""
+        if self.ontology_manager is None or not config.PREFETCH_FORM_METADATA:
+            return
+        try:
+            self.ontology_manager.prefetch_class_metadata()
+        except Exception as e:
+            logger.warning(f"Could not start form metadata prefetch: {e}")
     
     def run(self):
         """Run the application"""
         self.create_main_window()
-        return self.exec()
+        try:
+            return self.exec()
+        finally:
+            if self.ontology_manager is not None:
+                self.ontology_manager.metadata_prefetcher.shutdown()
 
 
 def main():
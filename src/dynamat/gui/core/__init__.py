@@ -77,7 +77,7 @@ SHACL Spec: https://www.w3.org/TR/shacl/
 from .widget_factory import WidgetFactory
 from .form_manager import FormManager, FormStyle, FormField
 from .data_handler import FormDataHandler
-from .form_validator import SHACLValidator, ValidationResult, ValidationIssue
+from .form_validator import SHACLValidator, IncrementalSHACLValidator, ValidationResult, ValidationIssue
 
 __all__ = [
     'WidgetFactory',
@@ -86,6 +86,7 @@ __all__ = [
     'FormField',
     'FormDataHandler',
     'SHACLValidator',
+    'IncrementalSHACLValidator',
     'ValidationResult',
     'ValidationIssue',
 ]
\ No newline at end of file
@@ -18,6 +18,10 @@ ValidationResult
 SHACLValidator
     Main validator class that runs SHACL validation.
 
+IncrementalSHACLValidator
+    Validator for a growing set of page graphs that re-validates only
+    the shapes whose focus nodes were affected by the latest change.
+
 Severity Levels
 ---------------
 Violation
@@ -55,12 +59,15 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, FrozenSet, List, Mapping, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
-from rdflib import Graph, URIRef, Literal, Namespace
+from rdflib import BNode, Graph, URIRef, Literal, Namespace, Variable
+from rdflib.collection import Collection
 from rdflib.namespace import RDF, RDFS, SH
+from rdflib.paths import InvPath, Path as PropertyPath
+from rdflib.term import Node
 
 try:
     from pyshacl import validate
@@ -322,15 +329,19 @@ class SHACLValidator:
 
         except Exception as e:
             logger.error(f"SHACL validation failed: {e}", exc_info=True)
-            # Return failure result
-            return ValidationResult(
-                conforms=False,
-                violations=[ValidationIssue(
-                    severity=ValidationSeverity.VIOLATION,
-                    message=f"Validation system error: {str(e)}"
-                )],
-                raw_report=str(e)
-            )
+            return self._system_error_result(e)
+
+    @staticmethod
+    def _system_error_result(error: Exception) -> ValidationResult:
+        """Blocking result reported when pyshacl itself fails."""
+        return ValidationResult(
+            conforms=False,
+            violations=[ValidationIssue(
+                severity=ValidationSeverity.VIOLATION,
+                message=f"Validation system error: {str(error)}"
+            )],
+            raw_report=str(error)
+        )
 
     def _parse_validation_results(self, conforms: bool, results_graph: Graph,
                                   results_text: str) -> ValidationResult:
@@ -349,12 +360,45 @@ class SHACLValidator:
         warnings = []
         infos = []
 
+        try:
+            for _, issue in self._collect_issues(results_graph):
+                # Categorize by severity
+                if issue.severity == ValidationSeverity.VIOLATION:
+                    violations.append(issue)
+                elif issue.severity == ValidationSeverity.WARNING:
+                    warnings.append(issue)
+                elif issue.severity == ValidationSeverity.INFO:
+                    infos.append(issue)
+
+            logger.info(f"Parsed {len(violations)} violations, {len(warnings)} warnings, {len(infos)} infos")
+
+        except Exception as e:
+            logger.error(f"Failed to parse validation results: {e}", exc_info=True)
+
+        return ValidationResult(
+            conforms=conforms and len(violations) == 0,
+            violations=violations,
+            warnings=warnings,
+            infos=infos,
+            raw_report=results_text
+        )
+
+    def _collect_issues(self, results_graph: Graph) -> List[Tuple[Node, ValidationIssue]]:
+        """
+        Convert the sh:ValidationResult nodes of a report into issues.
+
+        Args:
+            results_graph: RDF graph with validation results
+
+        Returns:
+            (result node, issue) pairs ordered by severity and result path
+        """
         # Query for validation results
         # pyshacl creates sh:ValidationResult instances for each issue
         query = """
         PREFIX sh: <http://www.w3.org/ns/shacl#>
 
-        SELECT ?severity ?message ?focusNode ?resultPath ?value ?sourceShape
+        SELECT ?result ?severity ?message ?focusNode ?resultPath ?value ?sourceShape
         WHERE {
             ?result a sh:ValidationResult ;
                     sh:resultSeverity ?severity ;
@@ -368,54 +412,34 @@ class SHACLValidator:
         ORDER BY ?severity ?resultPath
         """
 
-        try:
-            results = results_graph.query(query)
-
-            for row in results:
-                # Determine severity
-                severity_uri = str(row.severity)
-
-                if "Violation" in severity_uri:
-                    severity = ValidationSeverity.VIOLATION
-                elif "Warning" in severity_uri:
-                    severity = ValidationSeverity.WARNING
-                elif "Info" in severity_uri:
-                    severity = ValidationSeverity.INFO
-                else:
-                    # Default to violation for unknown severity
-                    severity = ValidationSeverity.VIOLATION
-                    logger.warning(f"Unknown severity: {severity_uri}, treating as Violation")
-
-                # Create issue
-                issue = ValidationIssue(
-                    severity=severity,
-                    message=str(row.message) if row.message else "Validation failed",
-                    focus_node=str(row.focusNode) if row.focusNode else None,
-                    result_path=str(row.resultPath) if row.resultPath else None,
-                    value=str(row.value) if row.value else None,
-                    source_shape=str(row.sourceShape) if row.sourceShape else None
-                )
-
-                # Categorize by severity
-                if severity == ValidationSeverity.VIOLATION:
-                    violations.append(issue)
-                elif severity == ValidationSeverity.WARNING:
-                    warnings.append(issue)
-                elif severity == ValidationSeverity.INFO:
-                    infos.append(issue)
-
-            logger.info(f"Parsed {len(violations)} violations, {len(warnings)} warnings, {len(infos)} infos")
-
-        except Exception as e:
-            logger.error(f"Failed to parse validation results: {e}", exc_info=True)
+        issues = []
+        for row in results_graph.query(query):
+            # Determine severity
+            severity_uri = str(row.severity)
+
+            if "Violation" in severity_uri:
+                severity = ValidationSeverity.VIOLATION
+            elif "Warning" in severity_uri:
+                severity = ValidationSeverity.WARNING
+            elif "Info" in severity_uri:
+                severity = ValidationSeverity.INFO
+            else:
+                # Default to violation for unknown severity
+                severity = ValidationSeverity.VIOLATION
+                logger.warning(f"Unknown severity: {severity_uri}, treating as Violation")
+
+            # Create issue
+            issue = ValidationIssue(
+                severity=severity,
+                message=str(row.message) if row.message else "Validation failed",
+                focus_node=str(row.focusNode) if row.focusNode else None,
+                result_path=str(row.resultPath) if row.resultPath else None,
+                value=str(row.value) if row.value else None,
+                source_shape=str(row.sourceShape) if row.sourceShape else None
+            )
+            issues.append((row.result, issue))
 
-        return ValidationResult(
-            conforms=conforms and len(violations) == 0,
-            violations=violations,
-            warnings=warnings,
-            infos=infos,
-            raw_report=results_text
-        )
+        return issues
 
     def validate_form_data(self, form_data: Dict[str, Any],
                           class_uri: str, instance_id: str) -> ValidationResult:
@@ -437,3 +461,570 @@ class SHACLValidator:
         """
         logger.warning("validate_form_data is a placeholder - use instance_writer for validation")
         return ValidationResult(conforms=True, raw_report="Placeholder validation")
+
+
+Triple = Tuple[Node, Node, Node]
+
+
+class IncrementalSHACLValidator(SHACLValidator):
+    """SHACL validator for a set of named page graphs, validated incrementally.
+
+    Keeps the union of the page graphs as one persistent data graph with its
+    RDFS closure already applied (the inference ``SHACLValidator.validate``
+    asks pyshacl to run on every call). Each call to :meth:`validate_pages`
+    diffs the pages against the previous call, updates the closure, and
+    re-runs only the shapes that can observe the change; results of the
+    other shapes are reused from earlier runs. The combined result matches
+    a full :meth:`SHACLValidator.validate` run over the merged pages.
+
+    A top-level shape is re-run when one of its focus nodes (old or new)
+    reaches a changed node by following triples forward. That bound holds
+    for shapes that target by ``sh:targetClass`` and only read triples
+    forward from the focus node; shapes with other targets, inverse paths
+    or SPARQL constraints not anchored at ``$this`` (e.g. uniqueness checks
+    over ``?other``) are global and re-run on every change to the data.
+
+    Parameters
+    ----------
+    ontology_manager : OntologyManager, optional
+        Ontology manager to access shapes directory.
+
+    Notes
+    -----
+    The first call, and any call whose results cannot be attributed to a
+    shape, runs every shape. Shapes graphs using SHACL rules or custom
+    constraint components are always validated in full.
+
+    Example
+    -------
+    ::
+
+        validator = IncrementalSHACLValidator(ontology_manager)
+
+        result = validator.validate_pages({"equipment": equipment_graph})
+        result = validator.validate_pages({"equipment": equipment_graph,
+                                           "raw_data": raw_data_graph})
+    """
+
+    # Links from a shape to the shapes evaluated on its focus or value nodes
+    _SHAPE_LINKS = (SH.property, SH.node, SH.qualifiedValueShape, SH["not"])
+    _SHAPE_LIST_LINKS = (SH["and"], SH["or"], SH.xone)
+    _OTHER_TARGETS = (SH.targetNode, SH.targetSubjectsOf, SH.targetObjectsOf, SH.target)
+
+    def __init__(self, ontology_manager=None):
+        super().__init__(ontology_manager)
+
+        self._pages: Dict[str, FrozenSet[Triple]] = {}
+        self._triple_refs: Dict[Triple, int] = {}   # triple -> pages asserting it
+        self._closed = Graph()                       # RDFS closure of all pages
+        self._closed_triples: Set[Triple] = set()
+
+        # Results and focus nodes of the last run, per shape group / shape
+        self._issues: Optional[Dict[URIRef, List[ValidationIssue]]] = None
+        self._focus: Dict[URIRef, Set[Node]] = {}
+
+        self._stats = {
+            'full_runs': 0,
+            'partial_runs': 0,
+            'skipped_runs': 0,
+            'shapes_validated': 0,
+            'closures': 0,
+        }
+
+        self._analyze_shapes()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def validate_pages(self, page_graphs: Mapping[str, Graph]) -> ValidationResult:
+        """
+        Validate the union of the given page graphs.
+
+        Pages are identified by key and diffed by content against the
+        previous call, so graphs edited in place are picked up. Pages missing
+        from *page_graphs* are removed from the data graph.
+
+        Args:
+            page_graphs: Page key -> RDF graph with that page's instance data
+
+        Returns:
+            ValidationResult equal to a full validation of the merged pages
+        """
+        if not self._incremental:
+            merged = Graph()
+            for graph in page_graphs.values():
+                for triple in graph:
+                    merged.add(triple)
+            return self.validate(merged)
+
+        try:
+            changed = self._update_pages(page_graphs)
+            if self._issues is not None and not changed:
+                self._stats['skipped_runs'] += 1
+                return self._combined_result()
+            return self._run(changed)
+
+        except Exception as e:
+            logger.error(f"SHACL validation failed: {e}", exc_info=True)
+            self.reset()
+            return self._system_error_result(e)
+
+    def reset(self):
+        """Forget all pages and cached results."""
+        self._pages.clear()
+        self._triple_refs.clear()
+        self._closed = Graph()
+        self._closed_triples = set()
+        self._issues = None
+        self._focus = {}
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get data graph size and run counters."""
+        stats = dict(self._stats)
+        stats.update({
+            'pages': len(self._pages),
+            'triples': len(self._triple_refs),
+            'closed_triples': len(self._closed_triples),
+            'shapes': len(self._shape_classes),
+            'global_shapes': len(self._global_shapes),
+            'shape_groups': len(self._group_shapes),
+        })
+        return stats
+
+    # ============================================================================
+    # DATA GRAPH
+    # ============================================================================
+
+    def _update_pages(self, page_graphs: Mapping[str, Graph]) -> Set[Node]:
+        """
+        Apply page additions, changes and removals to the closed data graph.
+
+        Returns:
+            Subjects of the closed-graph triples that were added or removed
+        """
+        added: List[Triple] = []
+        removed: List[Triple] = []
+
+        for key in [key for key in self._pages if key not in page_graphs]:
+            self._release(self._pages.pop(key), removed)
+
+        for key, graph in page_graphs.items():
+            previous = self._pages.get(key)
+            triples = frozenset(graph)
+            if previous is None:
+                self._retain(triples, added)
+            elif triples != previous:
+                self._retain(triples - previous, added)
+                self._release(previous - triples, removed)
+            self._pages[key] = triples
+
+        if not added and not removed:
+            return set()
+
+        # owlrl closures are not idempotent (re-expanding a closed graph types
+        # its properties as rdfs:Resource), so close the asserted triples afresh
+        closed = Graph()
+        for triple in self._triple_refs:
+            closed.add(triple)
+        self._expand_closure(closed)
+        self._stats['closures'] += 1
+
+        closed_triples = set(closed)
+        changed = {s for s, _, _ in closed_triples.symmetric_difference(self._closed_triples)}
+        self._closed, self._closed_triples = closed, closed_triples
+        return changed
+
+    def _retain(self, triples, added: List[Triple]):
+        for triple in triples:
+            count = self._triple_refs.get(triple, 0)
+            self._triple_refs[triple] = count + 1
+            if count == 0:
+                added.append(triple)
+
+    def _release(self, triples, removed: List[Triple]):
+        for triple in triples:
+            count = self._triple_refs[triple] - 1
+            if count:
+                self._triple_refs[triple] = count
+            else:
+                del self._triple_refs[triple]
+                removed.append(triple)
+
+    @staticmethod
+    def _expand_closure(graph: Graph):
+        """Apply pyshacl's ``inference='rdfs'`` closure to *graph* in place."""
+        import owlrl
+        from pyshacl.inference import CustomRDFSSemantics
+
+        owlrl.DeductiveClosure(CustomRDFSSemantics).expand(graph)
+
+    def _focus_nodes(self, classes: Tuple[Node, ...]) -> Set[Node]:
+        """Instances of the classes or their subclasses in the closed graph."""
+        nodes: Set[Node] = set()
+        for cls in classes:
+            for subclass in self._closed.transitive_subjects(RDFS.subClassOf, cls):
+                nodes.update(self._closed.subjects(RDF.type, subclass))
+        return nodes
+
+    def _reaching_nodes(self, changed: Set[Node]) -> Set[Node]:
+        """Nodes with a forward path (of any length) to a changed node."""
+        reached = set(changed)
+        stack = list(changed)
+        while stack:
+            for subject in self._closed.subjects(None, stack.pop()):
+                if subject not in reached:
+                    reached.add(subject)
+                    stack.append(subject)
+        return reached
+
+    # ============================================================================
+    # VALIDATION
+    # ============================================================================
+
+    def _run(self, changed: Set[Node]) -> ValidationResult:
+        """Validate the shapes affected by *changed* (all shapes on the first run)."""
+        focus = {
+            shape: self._focus_nodes(classes) if classes is not None else set()
+            for shape, classes in self._shape_classes.items()
+        }
+
+        if self._issues is None:
+            groups = set(self._group_shapes)
+        else:
+            reaching = self._reaching_nodes(changed)
+            groups = set()
+            for shape, nodes in focus.items():
+                old_nodes = self._focus.get(shape, set())
+                if self._shape_classes[shape] is None:
+                    affected = True
+                elif shape in self._global_shapes:
+                    affected = bool(nodes or old_nodes)
+                else:
+                    affected = not (reaching.isdisjoint(nodes) and reaching.isdisjoint(old_nodes))
+                if affected:
+                    groups.add(self._shape_group[shape])
+        self._focus = focus
+
+        if not groups:
+            self._stats['skipped_runs'] += 1
+            return self._combined_result()
+
+        full_run = len(groups) == len(self._group_shapes)
+        shapes = [shape for group in groups for shape in self._group_shapes[group]]
+        logger.info(f"Running SHACL validation on {len(shapes)} of {len(self._shape_classes)} shapes...")
+
+        conforms, results_graph, results_text = validate(
+            data_graph=self._closed,
+            shacl_graph=self.shapes_graph,
+            ont_graph=None,
+            inference='none',  # Data graph is already RDFS-closed
+            inplace=True,
+            abort_on_first=False,
+            allow_infos=True,
+            allow_warnings=True,
+            meta_shacl=False,
+            advanced=True,
+            js=False,
+            debug=False,
+            use_shapes=None if full_run else shapes,
+        )
+        self._stats['full_runs' if full_run else 'partial_runs'] += 1
+        self._stats['shapes_validated'] += len(shapes)
+
+        issues = self._attribute_issues(results_graph)
+        if issues is None:
+            if not full_run:
+                logger.info("Unattributed validation result, re-running all shapes")
+                self._issues = None
+                return self._run(changed)
+            # Report the run as is and validate in full next time
+            self._issues = None
+            return self._parse_validation_results(conforms, results_graph, results_text)
+
+        if self._issues is None:
+            self._issues = {}
+        for group in groups:
+            self._issues[group] = issues.get(group, [])
+        return self._combined_result()
+
+    def _attribute_issues(self, results_graph: Graph) -> Optional[Dict[URIRef, List[ValidationIssue]]]:
+        """
+        Group the issues of a report by the shape group that produced them.
+
+        Returns:
+            Shape group -> issues, or None if a result has an unknown source shape
+        """
+        issues: Dict[URIRef, List[ValidationIssue]] = {}
+        for result, issue in self._collect_issues(results_graph):
+            # Nested results (sh:detail) belong to the shape of their parent
+            parent = results_graph.value(predicate=SH.detail, object=result)
+            while parent is not None:
+                result = parent
+                parent = results_graph.value(predicate=SH.detail, object=result)
+            group = self._source_group.get(results_graph.value(result, SH.sourceShape))
+            if group is None:
+                return None
+            issues.setdefault(group, []).append(issue)
+        return issues
+
+    def _combined_result(self) -> ValidationResult:
+        """Merge the cached issues of every shape group into one result."""
+        violations, warnings, infos = [], [], []
+        by_severity = {
+            ValidationSeverity.VIOLATION: violations,
+            ValidationSeverity.WARNING: warnings,
+            ValidationSeverity.INFO: infos,
+        }
+        for group_issues in self._issues.values():
+            for issue in group_issues:
+                by_severity[issue.severity].append(issue)
+
+        lines = []
+        for issues in (violations, warnings, infos):
+            # Same order as the report query: unbound result paths first
+            issues.sort(key=lambda i: (i.result_path is not None, i.result_path or ""))
+            lines.extend(
+                f"{i.severity.value} on {i.focus_node}: {i.get_display_message()}" for i in issues
+            )
+
+        conforms = not violations
+        result = ValidationResult(
+            conforms=conforms,
+            violations=violations,
+            warnings=warnings,
+            infos=infos,
+            raw_report="\n".join(
+                ["Validation Report", f"Conforms: {conforms}", f"Results ({len(lines)}):"] + lines
+            ),
+        )
+        logger.info(f"Validation summary: {result.get_summary()}")
+        return result
+
+    # ============================================================================
+    # SHAPE ANALYSIS
+    # ============================================================================
+
+    def _analyze_shapes(self):
+        """Classify top-level shapes as local or global and group them for attribution."""
+        self._incremental = False
+        self._shape_classes: Dict[URIRef, Optional[Tuple[Node, ...]]] = {}
+        self._global_shapes: Set[URIRef] = set()
+        self._shape_group: Dict[URIRef, URIRef] = {}
+        self._group_shapes: Dict[URIRef, List[URIRef]] = {}
+        self._source_group: Dict[Node, URIRef] = {}
+
+        sg = self.shapes_graph
+        if not PYSHACL_AVAILABLE or sg is None or len(sg) == 0:
+            return
+        if (None, SH.rule, None) in sg or (None, RDF.type, SH.ConstraintComponent) in sg:
+            logger.info("Shapes use SHACL rules or custom components, validating in full")
+            return
+
+        top_shapes = set(sg.subjects(SH.targetClass, None))
+        for predicate in self._OTHER_TARGETS:
+            top_shapes.update(sg.subjects(predicate, None))
+        implicit = {
+            shape for shape in sg.subjects(RDF.type, RDFS.Class)
+            if (shape, RDF.type, SH.NodeShape) in sg or (shape, RDF.type, SH.PropertyShape) in sg
+        }
+        top_shapes |= implicit
+        if any(not isinstance(shape, URIRef) for shape in top_shapes):
+            logger.info("Shapes graph has blank-node targets, validating in full")
+            return
+
+        # Union-find over shapes whose results can share a source shape
+        parent: Dict[URIRef, URIRef] = {shape: shape for shape in top_shapes}
+
+        def find(shape: URIRef) -> URIRef:
+            while parent[shape] != shape:
+                parent[shape] = parent[parent[shape]]
+                shape = parent[shape]
+            return shape
+
+        source_owner: Dict[Node, URIRef] = {}
+        for shape in sorted(top_shapes):
+            has_other_target = shape in implicit or any(
+                (shape, predicate, None) in sg for predicate in self._OTHER_TARGETS
+            )
+            self._shape_classes[shape] = (
+                None if has_other_target else tuple(sg.objects(shape, SH.targetClass))
+            )
+            if has_other_target or not self._reads_forward_only(shape):
+                self._global_shapes.add(shape)
+            for source in (shape, *sg.objects(shape, SH.property)):
+                owner = source_owner.setdefault(source, shape)
+                if owner != shape:
+                    parent[find(shape)] = find(owner)
+
+        for shape in self._shape_classes:
+            group = self._shape_group[shape] = find(shape)
+            self._group_shapes.setdefault(group, []).append(shape)
+        self._source_group = {source: find(owner) for source, owner in source_owner.items()}
+        self._incremental = True
+
+        logger.info(
+            f"Incremental validation: {len(self._shape_classes)} shapes, "
+            f"{len(self._global_shapes)} global, {len(self._group_shapes)} groups"
+        )
+
+    def _reads_forward_only(self, shape: URIRef) -> bool:
+        """Check that a shape and its nested shapes only follow triples forward from the focus node."""
+        sg = self.shapes_graph
+        seen: Set[Node] = set()
+        stack: List[Node] = [shape]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+
+            path = sg.value(node, SH.path)
+            if path is not None and not self._is_forward_path(path):
+                return False
+            for constraint in sg.objects(node, SH.sparql):
+                if not self._is_anchored_constraint(constraint):
+                    return False
+
+            for link in self._SHAPE_LINKS:
+                stack.extend(sg.objects(node, link))
+            for link in self._SHAPE_LIST_LINKS:
+                for members in sg.objects(node, link):
+                    stack.extend(Collection(sg, members))
+        return True
+
+    def _is_forward_path(self, path: Node) -> bool:
+        """Check that a SHACL property path has no sh:inversePath step."""
+        stack = [path]
+        while stack:
+            node = stack.pop()
+            for predicate, obj in self.shapes_graph.predicate_objects(node):
+                if predicate == SH.inversePath:
+                    return False
+                if isinstance(obj, BNode):
+                    stack.append(obj)
+        return True
+
+    def _is_anchored_constraint(self, constraint: Node) -> bool:
+        """Check that every triple pattern of a SPARQL constraint hangs off ``$this``."""
+        from rdflib.plugins.sparql import prepareQuery
+
+        sg = self.shapes_graph
+        query = sg.value(constraint, SH.select) or sg.value(constraint, SH.ask)
+        if query is None:
+            return False
+
+        namespaces = dict(sg.namespaces())
+        for prefixes in sg.objects(constraint, SH.prefixes):
+            for declaration in sg.objects(prefixes, SH.declare):
+                prefix = sg.value(declaration, SH.prefix)
+                namespace = sg.value(declaration, SH.namespace)
+                if prefix is not None and namespace is not None:
+                    namespaces[str(prefix)] = str(namespace)
+
+        try:
+            algebra = prepareQuery(str(query), initNs=namespaces).algebra
+            _forward_bindings(algebra, frozenset([Variable("this")]))
+            return True
+        except Exception:
+            # Unparseable queries are treated as global as well
+            return False
+
+
+class _UnanchoredQuery(Exception):
+    """A SPARQL pattern reads triples that are not reachable from ``$this``."""
+
+
+# Algebra operators that evaluate a single sub-pattern unchanged
+_PASS_THROUGH_OPERATORS = {
+    'SelectQuery', 'AskQuery', 'Project', 'Distinct', 'Reduced', 'Slice',
+    'OrderBy', 'Group', 'AggregateJoin',
+}
+
+
+def _forward_bindings(node, bound: FrozenSet[Node]) -> FrozenSet[Node]:
+    """
+    Check that a SPARQL algebra pattern only reads forward from bound variables.
+
+    Every triple pattern must have a subject that is already bound (starting
+    from ``?this``); its object variable then becomes bound. Subqueries,
+    GRAPH, SERVICE, VALUES, MINUS and inverse paths are rejected.
+
+    Args:
+        node: rdflib SPARQL algebra node
+        bound: Variables whose values are forward-reachable from ``?this``
+
+    Returns:
+        Variables bound after evaluating the pattern
+
+    Raises:
+        _UnanchoredQuery: If a pattern may read triples elsewhere in the graph
+    """
+    name = getattr(node, 'name', None)
+
+    if name in _PASS_THROUGH_OPERATORS:
+        return _forward_bindings(node.p, bound)
+
+    if name == 'BGP':
+        reachable = set(bound)
+        pending = list(node.triples)
+        while pending:
+            waiting = []
+            for subject, predicate, obj in pending:
+                if subject not in reachable:
+                    waiting.append((subject, predicate, obj))
+                    continue
+                _check_forward_predicate(predicate)
+                if isinstance(obj, (Variable, BNode)):
+                    reachable.add(obj)
+            if len(waiting) == len(pending):
+                raise _UnanchoredQuery(f"unanchored pattern {waiting[0]}")
+            pending = waiting
+        return frozenset(reachable)
+
+    if name == 'Join':
+        try:
+            return _forward_bindings(node.p2, _forward_bindings(node.p1, bound))
+        except _UnanchoredQuery:
+            return _forward_bindings(node.p1, _forward_bindings(node.p2, bound))
+
+    if name == 'LeftJoin':
+        left = _forward_bindings(node.p1, bound)
+        _check_forward_expression(node.expr, _forward_bindings(node.p2, left))
+        return left
+
+    if name in ('Filter', 'Extend'):
+        inner = _forward_bindings(node.p, bound)
+        _check_forward_expression(node.expr, inner)
+        return inner
+
+    if name == 'Union':
+        return _forward_bindings(node.p1, bound) & _forward_bindings(node.p2, bound)
+
+    raise _UnanchoredQuery(f"unsupported operator {name}")
+
+
+def _check_forward_predicate(predicate):
+    """Reject property paths with an inverse step."""
+    if isinstance(predicate, InvPath):
+        raise _UnanchoredQuery("inverse path")
+    if isinstance(predicate, PropertyPath):
+        for attr in ('args', 'path'):
+            sub = getattr(predicate, attr, None)
+            for step in (sub if isinstance(sub, list) else [sub] if sub is not None else []):
+                _check_forward_predicate(step)
+
+
+def _check_forward_expression(expr, bound: FrozenSet[Node]):
+    """Check the (NOT) EXISTS patterns nested in a filter or bind expression."""
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    if isinstance(expr, CompValue):
+        if expr.name in ('Builtin_EXISTS', 'Builtin_NOTEXISTS'):
+            _forward_bindings(expr.graph, bound)
+            return
+        for value in expr.values():
+            _check_forward_expression(value, bound)
+    elif isinstance(expr, list):
+        for value in expr:
+            _check_forward_expression(value, bound)
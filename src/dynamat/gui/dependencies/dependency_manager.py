@@ -771,6 +771,15 @@ class DependencyManager(QObject):
         Returns:
             True if instance is of the class
         """
+        try:
+            # O(k) lookup in the class hierarchy index (k = types of the instance)
+            return self.ontology_manager.class_index.is_instance_of(instance_uri, class_uri)
+        except AttributeError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Class membership check failed: {e}")
+            return False
+
         try:
             from rdflib import URIRef
             query = """
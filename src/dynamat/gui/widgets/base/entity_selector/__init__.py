@@ -10,6 +10,7 @@ Components:
     SelectionMode: Enum for single/multiple selection
     FilterPanel: Composable filter dropdown panel
     DetailsPanel: Composable details display panel
+    EntityTableModel: Table model over a columnar EntityTableSnapshot
     EntitySelectorWidget: Core embeddable widget
     EntitySelectorDialog: Modal dialog wrapper
 
@@ -52,6 +53,7 @@ Example - Modal Dialog:
 from .entity_selector_config import EntitySelectorConfig, SelectionMode
 from .filter_panel import FilterPanel
 from .details_panel import DetailsPanel
+from .entity_table_model import EntityTableModel, EntityTableSnapshot
 from .entity_selector_widget import EntitySelectorWidget
 from .entity_selector_dialog import EntitySelectorDialog
 
@@ -60,6 +62,8 @@ __all__ = [
     'SelectionMode',
     'FilterPanel',
     'DetailsPanel',
+    'EntityTableModel',
+    'EntityTableSnapshot',
     'EntitySelectorWidget',
     'EntitySelectorDialog',
 ]
@@ -5,20 +5,34 @@ Core embeddable widget for selecting entities using SPARQL queries
 
 import logging
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Set
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QLabel, QGroupBox, QSplitter, QAbstractItemView
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QHeaderView, QLabel, QGroupBox, QSplitter, QAbstractItemView, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QCoreApplication, QEventLoop
 
 from .entity_selector_config import EntitySelectorConfig, SelectionMode
+from .entity_table_model import EntityQueryWorker, EntityTableModel, EntityTableSnapshot
 from .filter_panel import FilterPanel
 from .details_panel import DetailsPanel
 
 logger = logging.getLogger(__name__)
 
+# Workers that are still running; keeps them alive after their widget
+# started a newer query or was destroyed
+_running_workers: Set[EntityQueryWorker] = set()
+
+
+def _release_worker(worker: EntityQueryWorker):
+    """Forget a worker thread that stopped and schedule its deletion."""
+    _running_workers.discard(worker)
+    worker.deleteLater()
+
 
 class EntitySelectorWidget(QWidget):
     """
@@ -29,9 +43,10 @@ class EntitySelectorWidget(QWidget):
     or other layouts.
 
     Features:
-        - SPARQL-based filtering (efficient server-side filtering)
-        - Text search within displayed results
-        - Sortable, selectable table
+        - Filtering through the query builder's search index, with facet counts
+        - Queries run in a worker thread; a new query supersedes a running one
+        - Text search within displayed results (precomputed search column)
+        - Sortable, selectable table (model/view, no per-cell items)
         - Optional details panel
         - Single or multiple selection modes
         - Configurable columns and filters
@@ -42,6 +57,7 @@ class EntitySelectorWidget(QWidget):
         filter_changed(dict): Emitted when filter values change
         loading_started(): Emitted when data loading begins
         loading_finished(int): Emitted when loading completes (count of items)
+        scan_progress(int, int): Emitted while entity files are indexed (done, total)
         error_occurred(str): Emitted on errors
 
     Example:
@@ -63,6 +79,7 @@ class EntitySelectorWidget(QWidget):
     filter_changed = pyqtSignal(dict)
     loading_started = pyqtSignal()
     loading_finished = pyqtSignal(int)
+    scan_progress = pyqtSignal(int, int)
     error_occurred = pyqtSignal(str)
 
     def __init__(
@@ -90,12 +107,22 @@ class EntitySelectorWidget(QWidget):
 
         # Instance cache from queries
         self._instances_cache: List[Dict[str, Any]] = []
+        # Labels are looked up from worker threads while formatting cells
+        self._label_cache: Dict[str, Optional[str]] = {}
+        self._label_lock = threading.Lock()
+
+        # Background query state
+        self._generation = 0
+        self._worker: Optional[EntityQueryWorker] = None
+        self._pending_selection: Optional[str] = None
 
         # UI components
         self._filter_panel: Optional[FilterPanel] = None
-        self._table: Optional[QTableWidget] = None
+        self._model: Optional[EntityTableModel] = None
+        self._table: Optional[QTableView] = None
         self._details_panel: Optional[DetailsPanel] = None
         self._status_label: Optional[QLabel] = None
+        self._progress_bar: Optional[QProgressBar] = None
 
         self._setup_ui()
 
@@ -146,14 +173,26 @@ class EntitySelectorWidget(QWidget):
             self._create_table()
             layout.addWidget(self._table)
 
-        # Status label
+        # Status label and scan progress
+        status_layout = QHBoxLayout()
         self._status_label = QLabel("")
         self._status_label.setStyleSheet("color: gray; font-style: italic;")
-        layout.addWidget(self._status_label)
+        status_layout.addWidget(self._status_label, 1)
+
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setMaximumWidth(200)
+        self._progress_bar.setVisible(False)
+        status_layout.addWidget(self._progress_bar)
+        layout.addLayout(status_layout)
 
     def _create_table(self):
-        """Create the entity table."""
-        self._table = QTableWidget()
+        """Create the entity table view and its model."""
+        display_props = self.config.get_normalized_display_properties()
+        headers = [self.config.get_property_label(p) for p in display_props]
+        self._model = EntityTableModel(headers, parent=self)
+
+        self._table = QTableView()
+        self._table.setModel(self._model)
 
         # Selection behavior based on config
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -165,50 +204,23 @@ class EntitySelectorWidget(QWidget):
         self._table.setAlternatingRowColors(True)
         self._table.setSortingEnabled(True)
 
-        # Setup columns
-        display_props = self.config.get_normalized_display_properties()
-        self._table.setColumnCount(len(display_props))
-
-        # Column headers
-        headers = [self.config.get_property_label(p) for p in display_props]
-        self._table.setHorizontalHeaderLabels(headers)
-
         # Auto-resize columns
         header = self._table.horizontalHeader()
         for i in range(len(display_props)):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
 
         # Connect signals
-        self._table.itemSelectionChanged.connect(self._on_selection_changed)
+        self._table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self._table.doubleClicked.connect(self._on_double_click)
 
     def _on_filters_changed(self, filters: Dict[str, Any]):
-        """Handle filter changes - reload with SPARQL filtering."""
+        """Handle filter changes - reload from the search index."""
         self.filter_changed.emit(filters)
         self.refresh()
 
     def _on_search_changed(self, text: str):
         """Handle search text changes - filter table rows."""
-        self._filter_table_rows(text)
-
-    def _filter_table_rows(self, search_text: str):
-        """
-        Filter table rows based on search text.
-
-        Args:
-            search_text: Text to search for (case-insensitive)
-        """
-        search_text = search_text.lower()
-
-        for row in range(self._table.rowCount()):
-            match = False
-            for col in range(self._table.columnCount()):
-                item = self._table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-
-            self._table.setRowHidden(row, not match)
+        self._model.set_search_text(text)
 
     def _on_selection_changed(self):
         """Handle table selection change."""
@@ -278,20 +290,16 @@ class EntitySelectorWidget(QWidget):
         self.entity_selected.emit(instance_metadata)
 
     def _get_instance_at_row(self, row: int) -> Optional[Dict[str, Any]]:
-        """Get instance data stored in table row."""
-        if row < 0 or row >= self._table.rowCount():
-            return None
-
-        first_item = self._table.item(row, 0)
-        if first_item:
-            return first_item.data(Qt.ItemDataRole.UserRole)
-        return None
+        """Get instance data of a visible table row."""
+        return self._model.instance_at(row)
 
     def _load_full_data_for_details(self, uri: str, cached_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Load full instance data for details panel.
 
-        Merges cached data with full data from query builder.
+        Merges cached data with full data from query builder. The query
+        builder keeps parsed instance files in its graph cache, so moving
+        back to a row shown before does not parse its file again.
 
         Args:
             uri: Instance URI
@@ -317,43 +325,80 @@ class EntitySelectorWidget(QWidget):
 
         return None
 
-    def _populate_table(self, instances: List[Dict[str, Any]]):
+    def _query_snapshot(self, filters: Dict[str, Any],
+                        is_cancelled: Callable[[], bool]) -> Optional[EntityTableSnapshot]:
         """
-        Populate table with instance data.
+        Run a query and format its results (worker thread).
 
         Args:
-            instances: List of instance metadata dicts
-        """
-        # Block signals during repopulation to prevent spurious
-        # itemSelectionChanged events that fire with stale row data.
-        self._table.blockSignals(True)
-        self._table.clearSelection()
-        self._table.setRowCount(len(instances))
-        self._table.setSortingEnabled(False)
+            filters: Filter values (property_uri -> value)
+            is_cancelled: Returns True once a newer query superseded this one
 
+        Returns:
+            Snapshot of the results, or None if cancelled
+        """
         display_props = self.config.get_normalized_display_properties()
+        filter_props = self.config.get_normalized_filter_properties()
 
-        for row, instance in enumerate(instances):
-            for col, prop_uri in enumerate(display_props):
-                value = instance.get(prop_uri, "")
-                display_value = self._format_cell_value(value)
-
-                item = QTableWidgetItem(display_value)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-                # Store instance data in first column
-                if col == 0:
-                    item.setData(Qt.ItemDataRole.UserRole, instance)
-
-                self._table.setItem(row, col, item)
+        # Query the search index; facet counts label the filter dropdowns
+        instances = self.query_builder.search_instances(self.config.class_uri, filters=filters)
+        facets = (
+            self.query_builder.facet_counts(self.config.class_uri, filter_props, filters=filters)
+            if filter_props else {}
+        )
 
-        self._table.setSortingEnabled(True)
-        self._table.blockSignals(False)
+        if is_cancelled():
+            return None
+        snapshot = EntityTableSnapshot.build(instances, display_props, self._format_cell_value, is_cancelled)
+        if snapshot is not None:
+            snapshot.facets = facets
+        return snapshot
+
+    def _on_snapshot_ready(self, generation: int, snapshot: EntityTableSnapshot):
+        """Show the results of the latest query."""
+        if generation != self._generation:
+            return
+        self._worker = None
+
+        # Block selection signals during the model reset to prevent
+        # spurious selection events that fire with stale row data.
+        selection_model = self._table.selectionModel()
+        selection_model.blockSignals(True)
+        self._model.set_snapshot(snapshot)
+        selection_model.blockSignals(False)
+        self._instances_cache = snapshot.instances
+        if self._filter_panel:
+            self._filter_panel.set_facet_counts(snapshot.facets)
 
         # Clear details panel since no row is selected after repopulation
         if self._details_panel:
             self._details_panel.clear()
 
+        if self._pending_selection is not None:
+            uri, self._pending_selection = self._pending_selection, None
+            self.set_selected_entity(uri)
+
+        # Update status
+        count = len(snapshot)
+        self._status_label.setText(f"Found {count} item(s)")
+        self.loading_finished.emit(count)
+
+        self.logger.info(f"Loaded {count} instances of {self.config.class_uri}")
+
+    def _on_query_failed(self, generation: int, error: str):
+        """Report a failed query unless a newer one superseded it."""
+        if generation != self._generation:
+            return
+        self._worker = None
+        self.logger.error(f"Failed to load instances: {error}")
+        self._status_label.setText(f"Error: {error}")
+        self.error_occurred.emit(error)
+
+    def _on_worker_finished(self):
+        """Forget a worker that stopped without delivering results."""
+        if self.sender() is self._worker:
+            self._worker = None
+
     def _format_cell_value(self, value: Any) -> str:
         """Format a value for table cell display."""
         if value is None or value == "":
@@ -391,7 +436,7 @@ class EntitySelectorWidget(QWidget):
 
     def _get_label_for_uri(self, uri: str) -> Optional[str]:
         """
-        Get rdfs:label for a URI from ontology.
+        Get rdfs:label for a URI from ontology (cached per widget).
 
         Args:
             uri: URI to look up
@@ -402,6 +447,17 @@ class EntitySelectorWidget(QWidget):
         if not self.ontology_manager:
             return None
 
+        with self._label_lock:
+            cache = self._label_cache
+            if uri in cache:
+                return cache[uri]
+        label = self._query_label(uri)
+        with self._label_lock:
+            cache[uri] = label
+        return label
+
+    def _query_label(self, uri: str) -> Optional[str]:
+        """Query rdfs:label for a URI."""
         try:
             # Query for rdfs:label
             query = f"""
@@ -448,55 +504,112 @@ class EntitySelectorWidget(QWidget):
     # ============================================================================
 
     def refresh(self):
-        """Reload data from query builder with current filters."""
+        """
+        Reload data from query builder with current filters.
+
+        The query runs in a worker thread and the table is updated when it
+        finishes (loading_finished); a query still running is superseded.
+        Use wait_for_refresh() to block until the results are shown.
+        """
         if not self.query_builder:
             self._status_label.setText("No query builder configured")
             return
 
-        try:
-            self.loading_started.emit()
-            self._status_label.setText("Loading...")
-
-            # Get filter values
-            filters = {}
-            if self._filter_panel:
-                filters = self._filter_panel.get_filter_values()
-
-            # Get display properties
-            display_props = self.config.get_normalized_display_properties()
-
-            # Query instances - use filter_instances if filters set, otherwise find_all
-            if filters:
-                self._instances_cache = self.query_builder.filter_instances(
-                    self.config.class_uri,
-                    filters
-                )
-            else:
-                self._instances_cache = self.query_builder.find_all_instances(
-                    self.config.class_uri,
-                    display_properties=display_props
-                )
-
-            # Populate table
-            self._populate_table(self._instances_cache)
-
-            # Apply search filter if active
-            if self._filter_panel:
-                search_text = self._filter_panel.get_search_text()
-                if search_text:
-                    self._filter_table_rows(search_text)
-
-            # Update status
-            count = len(self._instances_cache)
-            self._status_label.setText(f"Found {count} item(s)")
-            self.loading_finished.emit(count)
-
-            self.logger.info(f"Loaded {count} instances of {self.config.class_uri}")
+        self.cancel_refresh()
+        self._generation += 1
 
-        except Exception as e:
-            self.logger.error(f"Failed to load instances: {e}")
-            self._status_label.setText(f"Error: {e}")
-            self.error_occurred.emit(str(e))
+        self.loading_started.emit()
+        self._status_label.setText("Loading...")
+
+        # Get filter values (read here, on the GUI thread)
+        filters = self._filter_panel.get_filter_values() if self._filter_panel else {}
+
+        worker = EntityQueryWorker(
+            self._generation,
+            lambda is_cancelled: self._query_snapshot(filters, is_cancelled)
+        )
+        worker.snapshot_ready.connect(self._on_snapshot_ready)
+        worker.query_failed.connect(self._on_query_failed)
+        # Cleanup must not depend on this widget, which may be destroyed first
+        worker.finished.connect(partial(_release_worker, worker))
+        worker.finished.connect(self._on_worker_finished)
+        _running_workers.add(worker)
+        self._worker = worker
+        worker.start()
+
+    def cancel_refresh(self):
+        """Interrupt a running query; its results are discarded."""
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker = None
+        self._generation += 1
+
+    def is_loading(self) -> bool:
+        """Check whether a query is running or its results are not shown yet."""
+        return self._worker is not None
+
+    def wait_for_refresh(self, timeout_ms: int = 30000) -> bool:
+        """
+        Block until the running query's results are shown.
+
+        Args:
+            timeout_ms: Maximum time to wait
+
+        Returns:
+            True if no query is running anymore
+        """
+        worker = self._worker
+        if worker is not None and not worker.wait(timeout_ms):
+            return False
+        # Deliver the worker's queued signals
+        QCoreApplication.sendPostedEvents()
+        return True
+
+    def scan_and_refresh(self, entity_dir: Path, file_pattern: str = "*.ttl") -> int:
+        """
+        Index an entity directory with the query builder, then reload.
+
+        Progress of the scan is shown below the table.
+
+        Args:
+            entity_dir: Directory containing entity folders (e.g., specimens/)
+            file_pattern: Glob pattern for TTL files
+
+        Returns:
+            Number of instances indexed
+        """
+        if not self.query_builder:
+            self._status_label.setText("No query builder configured")
+            return 0
+
+        count = self.query_builder.scan_and_index(
+            entity_dir, self.config.class_uri, file_pattern,
+            progress_callback=self.show_scan_progress
+        )
+        self.refresh()
+        return count
+
+    def show_scan_progress(self, done: int, total: int):
+        """
+        Display indexing progress (InstanceQueryBuilder progress callback).
+
+        The scan runs on the GUI thread, so pending paint events are
+        processed here to keep the progress bar current.
+
+        Args:
+            done: Files processed so far
+            total: Files to process; done == total hides the progress bar
+        """
+        self.scan_progress.emit(done, total)
+        if done >= total:
+            self._progress_bar.setVisible(False)
+            return
+
+        self._progress_bar.setRange(0, total)
+        self._progress_bar.setValue(done)
+        self._progress_bar.setVisible(True)
+        self._status_label.setText(f"Indexing files... {done}/{total}")
+        QCoreApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
 
     def get_selected_entity(self) -> Optional[Dict[str, Any]]:
         """
@@ -533,17 +646,23 @@ class EntitySelectorWidget(QWidget):
         """
         Select an entity by URI.
 
+        While a query is running, the entity is selected once its results
+        are shown.
+
         Args:
             uri: Instance URI to select
         """
-        for row in range(self._table.rowCount()):
-            instance = self._get_instance_at_row(row)
-            if instance and instance.get('uri') == uri:
-                self._table.selectRow(row)
-                break
+        if self.is_loading():
+            self._pending_selection = uri
+            return
+
+        row = self._model.row_of_uri(uri)
+        if row >= 0:
+            self._table.selectRow(row)
 
     def clear_selection(self):
         """Clear current selection."""
+        self._pending_selection = None
         self._table.clearSelection()
         if self._details_panel:
             self._details_panel.clear()
@@ -589,6 +708,9 @@ class EntitySelectorWidget(QWidget):
             ontology_manager: OntologyManager instance
         """
         self.ontology_manager = ontology_manager
+        # A new dict, so a lookup still running keeps the old manager's label out
+        with self._label_lock:
+            self._label_cache = {}
         if self._filter_panel:
             self._filter_panel.set_ontology_manager(ontology_manager)
 
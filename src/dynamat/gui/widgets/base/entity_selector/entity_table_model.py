@@ -0,0 +1,259 @@
+"""
+DynaMat Platform - Entity Table Model
+Columnar snapshot of query results, the table model that presents it, and
+the worker thread that builds it off the GUI thread
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal
+)
+
+logger = logging.getLogger(__name__)
+
+# Separates cells in the search column so a search cannot match across cells
+_CELL_SEPARATOR = "\n"
+
+
+@dataclass
+class EntityTableSnapshot:
+    """
+    Immutable, column-oriented view of one query result.
+
+    Attributes:
+        instances: Instance dicts in query order (row data for selection)
+        columns: Display text per column, each aligned with instances
+        search_text: Lowercase cell texts of each row, for text search
+        uri_rows: Instance URI -> row in instances
+        facets: Filter property URI -> value -> count of the query
+    """
+    instances: List[Dict[str, Any]] = field(default_factory=list)
+    columns: List[List[str]] = field(default_factory=list)
+    search_text: List[str] = field(default_factory=list)
+    uri_rows: Dict[str, int] = field(default_factory=dict)
+    facets: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    @classmethod
+    def build(
+        cls,
+        instances: List[Dict[str, Any]],
+        properties: List[str],
+        format_value: Callable[[Any], str],
+        is_cancelled: Callable[[], bool] = lambda: False
+    ) -> Optional['EntityTableSnapshot']:
+        """
+        Format query results into display and search columns.
+
+        Args:
+            instances: Instance dicts from InstanceQueryBuilder
+            properties: Property URI of each column
+            format_value: Formats a property value for display
+            is_cancelled: Polled while building; True aborts the build
+
+        Returns:
+            The snapshot, or None if cancelled
+        """
+        columns: List[List[str]] = [[] for _ in properties]
+        search_text: List[str] = []
+        uri_rows: Dict[str, int] = {}
+        for row, instance in enumerate(instances):
+            if row % 1000 == 0 and is_cancelled():
+                return None
+            cells = [format_value(instance.get(prop, "")) for prop in properties]
+            for column, cell in zip(columns, cells):
+                column.append(cell)
+            search_text.append(_CELL_SEPARATOR.join(cells).lower())
+            uri = instance.get('uri')
+            if uri is not None:
+                uri_rows.setdefault(uri, row)
+        return cls(instances, columns, search_text, uri_rows)
+
+
+class EntityTableModel(QAbstractTableModel):
+    """
+    Read-only table model over an EntityTableSnapshot.
+
+    The visible rows are a list of snapshot row numbers in sort order,
+    restricted to rows whose search column contains the search text.
+    Sorting computes the order once per column; searching is one substring
+    test per row, and a search that extends the previous one only tests the
+    rows that are still visible.
+
+    Example:
+        >>> model = EntityTableModel(["Specimen ID", "Material"])
+        >>> model.set_snapshot(EntityTableSnapshot.build(instances, props, str))
+        >>> model.set_search_text("al6061")
+        >>> model.instance_at(0)['uri']
+    """
+
+    def __init__(self, headers: List[str], parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            headers: Column header labels
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._snapshot = EntityTableSnapshot(columns=[[] for _ in self._headers])
+        self._order: List[int] = []     # All snapshot rows in sort order
+        self._rows: List[int] = []      # Visible snapshot rows in sort order
+        self._search = ""
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    # ============================================================================
+    # QAbstractTableModel INTERFACE
+    # ============================================================================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.ToolTipRole:
+            return self._snapshot.columns[index.column()][self._rows[index.row()]]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._snapshot.instances[self._rows[index.row()]]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._update_rows(resort=True)
+
+    # ============================================================================
+    # SNAPSHOT AND SEARCH
+    # ============================================================================
+
+    def set_snapshot(self, snapshot: EntityTableSnapshot):
+        """Replace the displayed data, keeping the sort and search settings."""
+        self.beginResetModel()
+        self._snapshot = snapshot
+        self._order = self._sorted_order()
+        self._rows = self._filter(self._order, self._search)
+        self.endResetModel()
+
+    def set_search_text(self, text: str):
+        """Show only rows with a cell containing text (case-insensitive)."""
+        text = text.lower()
+        if text == self._search:
+            return
+        narrowing = self._search in text
+        self._search = text
+        self._update_rows(narrowing=narrowing)
+
+    def snapshot(self) -> EntityTableSnapshot:
+        """The displayed snapshot."""
+        return self._snapshot
+
+    def instance_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Instance dict of a visible row."""
+        if 0 <= row < len(self._rows):
+            return self._snapshot.instances[self._rows[row]]
+        return None
+
+    def row_of_uri(self, uri: str) -> int:
+        """Visible row of an instance URI, or -1."""
+        source_row = self._snapshot.uri_rows.get(uri)
+        if source_row is None:
+            return -1
+        try:
+            return self._rows.index(source_row)
+        except ValueError:
+            return -1
+
+    def _sorted_order(self) -> List[int]:
+        rows = range(len(self._snapshot))
+        if not 0 <= self._sort_column < len(self._headers):
+            return list(rows)
+        column = self._snapshot.columns[self._sort_column]
+        return sorted(rows, key=column.__getitem__,
+                      reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
+    def _filter(self, rows: List[int], text: str) -> List[int]:
+        if not text:
+            return list(rows)
+        search_text = self._snapshot.search_text
+        return [row for row in rows if text in search_text[row]]
+
+    def _update_rows(self, resort: bool = False, narrowing: bool = False):
+        """Recompute the visible rows, keeping persistent indexes (selection) valid."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_rows = [self._rows[index.row()] for index in persistent]
+
+        if resort:
+            self._order = self._sorted_order()
+            self._rows = self._filter(self._order, self._search)
+        elif narrowing:
+            self._rows = self._filter(self._rows, self._search)
+        else:
+            self._rows = self._filter(self._order, self._search)
+
+        if persistent:
+            positions = {source_row: row for row, source_row in enumerate(self._rows)}
+            self.changePersistentIndexList(persistent, [
+                self.index(positions[source_row], index.column())
+                if source_row in positions else QModelIndex()
+                for index, source_row in zip(persistent, persistent_rows)
+            ])
+        self.layoutChanged.emit()
+
+
+class EntityQueryWorker(QThread):
+    """
+    Runs an entity query and builds its snapshot off the GUI thread.
+
+    The job receives a callable that returns True once the worker was
+    interrupted (QThread.requestInterruption) and should return None in
+    that case. Results are delivered with the generation the worker was
+    started for, so the receiver can drop results of superseded queries.
+
+    Signals:
+        snapshot_ready(int, object): generation, EntityTableSnapshot
+        query_failed(int, str): generation, error message
+    """
+
+    snapshot_ready = pyqtSignal(int, object)
+    query_failed = pyqtSignal(int, str)
+
+    def __init__(self, generation: int,
+                 job: Callable[[Callable[[], bool]], Optional[EntityTableSnapshot]],
+                 parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self._job = job
+
+    def run(self):
+        try:
+            snapshot = self._job(self.isInterruptionRequested)
+        except Exception as e:
+            logger.error(f"Entity query failed: {e}")
+            self.query_failed.emit(self.generation, str(e))
+            return
+        if snapshot is not None and not self.isInterruptionRequested():
+            self.snapshot_ready.emit(self.generation, snapshot)
@@ -22,7 +22,8 @@ class FilterPanel(QWidget):
     Composable filter panel with dropdowns and search box.
 
     Dynamically creates filter dropdowns based on configuration.
-    Populates dropdown options from ontology individuals.
+    Populates dropdown options from ontology individuals, and labels
+    them with the result counts of the current query (set_facet_counts).
 
     Signals:
         filters_changed(dict): Emitted when any filter value changes.
@@ -67,6 +68,8 @@ class FilterPanel(QWidget):
 
         # Filter dropdowns keyed by property URI
         self._filter_combos: Dict[str, QComboBox] = {}
+        self._option_labels: Dict[str, Dict[str, str]] = {}   # property -> value -> label
+        self._facet_counts: Dict[str, Dict[str, int]] = {}    # property -> value -> count
         self._search_box: Optional[QLineEdit] = None
         self._refresh_button: Optional[QPushButton] = None
 
@@ -160,8 +163,10 @@ class FilterPanel(QWidget):
             combo.removeItem(1)
 
         # Add options
+        self._option_labels[normalized_uri] = dict(options)
         for value_uri, display_label in options:
             combo.addItem(display_label, value_uri)
+        self._apply_facet_counts(normalized_uri)
 
         # Restore previous selection if still valid
         if current_data:
@@ -282,6 +287,18 @@ class FilterPanel(QWidget):
 
         return None
 
+    def _apply_facet_counts(self, prop_uri: str):
+        """Append the facet count of each option of a dropdown to its label."""
+        combo = self._filter_combos[prop_uri]
+        labels = self._option_labels.get(prop_uri, {})
+        counts = self._facet_counts.get(prop_uri)
+        for idx in range(1, combo.count()):
+            value = combo.itemData(idx)
+            label = labels.get(value, combo.itemText(idx))
+            if counts is not None:
+                label = f"{label} ({counts.get(value, 0)})"
+            combo.setItemText(idx, label)
+
     def _on_filter_changed(self, prop_uri: str):
         """Handle filter dropdown value change."""
         self.filters_changed.emit(self.get_filter_values())
@@ -325,6 +342,22 @@ class FilterPanel(QWidget):
                 if idx >= 0:
                     combo.setCurrentIndex(idx)
 
+    def set_facet_counts(self, counts: Dict[str, Dict[str, int]]):
+        """
+        Show result counts next to the dropdown options.
+
+        Args:
+            counts: Property URI -> option value -> number of results
+                (InstanceQueryBuilder.facet_counts); properties not in
+                counts show plain labels
+        """
+        self._facet_counts = {
+            self.config.normalize_property_uri(prop_uri): values
+            for prop_uri, values in counts.items()
+        }
+        for prop_uri in self._filter_combos:
+            self._apply_facet_counts(prop_uri)
+
     def clear_filters(self):
         """Reset all filters to "All" (index 0)."""
         for combo in self._filter_combos.values():
@@ -360,13 +360,17 @@ class BasePlotWidget(QWidget):
         alpha: float = 1.0,
         marker: str = None,
         analysis_method: str = None,
-        subplot_idx: int = None
+        subplot_idx: int = None,
+        x_unit: str = None,
+        y_unit: str = None
     ) -> str:
         """
         Add a trace with ontology-driven axis labels and legend text.
 
         Automatically resolves axis labels from SeriesType URIs and generates
-        legend text using the ontology's legend templates.
+        legend text using the ontology's legend templates. Data given in
+        another unit (x_unit/y_unit) is converted to the series type's unit
+        shown in the axis label.
 
         Args:
             x_data: X-axis data array
@@ -381,6 +385,8 @@ class BasePlotWidget(QWidget):
             marker: Marker style (None, 'o', 's', etc.)
             analysis_method: Analysis method for legend (e.g., '1-wave', '3-wave')
             subplot_idx: Subplot index, or None for active subplot
+            x_unit: Unit URI of x_data, if not the x series type's unit
+            y_unit: Unit URI of y_data, if not the y series type's unit
 
         Returns:
             Trace ID string for later reference
@@ -408,6 +414,11 @@ class BasePlotWidget(QWidget):
         if label is None and y_series_type_uri:
             label = self.resolver.get_legend_text(y_series_type_uri, analysis_method)
 
+        if x_unit and x_series_type_uri:
+            x_data = self.convert_series(x_data, x_unit, self.resolver.get_unit_uri(x_series_type_uri))
+        if y_unit and y_series_type_uri:
+            y_data = self.convert_series(y_data, y_unit, self.resolver.get_unit_uri(y_series_type_uri))
+
         return self.add_trace(
             x_data, y_data,
             label=label, color=color,
@@ -416,6 +427,29 @@ class BasePlotWidget(QWidget):
             subplot_idx=subplot_idx
         )
 
+    def convert_series(self, data: np.ndarray, from_unit: str, to_unit: str) -> np.ndarray:
+        """
+        Convert a whole data series between QUDT units.
+
+        Returns the data unchanged when either unit is missing, no QUDT
+        manager is available or the units cannot be converted.
+
+        Args:
+            data: Series values in from_unit
+            from_unit: Unit URI of the data (full or prefixed)
+            to_unit: Unit URI to convert to (full or prefixed)
+
+        Returns:
+            Converted array (a new array; the input is not modified)
+        """
+        if not from_unit or not to_unit or self.qudt_manager is None:
+            return data
+        try:
+            return self.qudt_manager.convert_array(data, from_unit, to_unit)
+        except ValueError as e:
+            logger.warning(f"Plotting unconverted series: {e}")
+            return data
+
     # =========================================================================
     # Optional Methods - Can be overridden by subclasses
     # =========================================================================
@@ -282,6 +282,20 @@ class SeriesMetadataResolver:
         self._label_cache[cache_key] = display_name
         return display_name
 
+    def get_unit_uri(self, series_type_uri: str) -> Optional[str]:
+        """
+        Get the display unit of a SeriesType (the unit shown in its axis label).
+
+        Args:
+            series_type_uri: URI of the SeriesType individual
+
+        Returns:
+            Full unit URI, or None if the series type has no unit
+        """
+        metadata = self._get_series_metadata(series_type_uri)
+        unit_uri = metadata.get('unit') if metadata else None
+        return self._normalize_uri(unit_uri) if unit_uri else None
+
     def get_axis_label_with_custom_unit(self, series_type_uri: str, unit_uri: str) -> str:
         """
         Get axis label with a specific unit (overriding the default).
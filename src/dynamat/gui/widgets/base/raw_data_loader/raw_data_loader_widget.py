@@ -498,6 +498,38 @@ class RawDataLoaderWidget(QWidget):
                 mapping[sm.key] = {'unit': uri, 'symbol': symbol}
         return mapping
 
+    def get_series_array(self, key: str, to_unit: Optional[str] = None) -> Optional[np.ndarray]:
+        """Get a mapped column as a float array converted to a target unit.
+
+        Args:
+            key: Series key (e.g., "time")
+            to_unit: Target QUDT unit URI (defaults to the series' ontology unit)
+
+        Returns:
+            Converted copy of the column, or None if the series is unmapped.
+            Values are returned unconverted when units are unknown or no
+            QUDT manager is available.
+        """
+        if self._dataframe is None:
+            return None
+        sm = next((s for s in self._series_mappings if s.key == key), None)
+        if sm is None or sm.column_combo is None:
+            return None
+        col = sm.column_combo.currentData()
+        if not col or col not in self._dataframe.columns:
+            return None
+
+        values = self._dataframe[col].to_numpy(dtype=np.float64, copy=True)
+        from_unit = sm.unit_combo.currentData() if sm.unit_combo else None
+        to_unit = to_unit or sm.default_unit
+        if self._qudt_manager and from_unit and to_unit:
+            try:
+                # Column is a private copy: convert in place
+                self._qudt_manager.convert_array(values, from_unit, to_unit, out=values)
+            except ValueError as e:
+                logger.warning(f"Could not convert series '{key}' to {to_unit}: {e}")
+        return values
+
     def get_sampling_interval(self) -> Optional[float]:
         """Get calculated sampling interval, or None."""
         if self._dataframe is None:
@@ -46,6 +46,7 @@ class AlignmentPage(BaseSHPBPage):
     """Pulse alignment page for SHPB analysis.
 
     Features:
+    - Select the shift search method (differential evolution or grid)
     - Configure alignment weights
     - Set k_linear parameter
     - Define search bounds for shifts
@@ -217,6 +218,24 @@ class AlignmentPage(BaseSHPBPage):
                     form_data[key] = value
         self.state.alignment_form_data = form_data
 
+    def _get_method_value(self, method_uri: Optional[str]) -> str:
+        """Get alignment method string value from individual URI."""
+        if not method_uri:
+            return "differential_evolution"
+
+        try:
+            query = f"""
+            PREFIX dyn: <https://dynamat.utep.edu/ontology#>
+            SELECT ?value WHERE {{
+                <{method_uri}> dyn:hasAlignmentMethodValue ?value .
+            }}
+            """
+            results = self.ontology_manager.sparql_executor.execute_query(query)
+            return str(results[0]['value']) if results else "differential_evolution"
+        except Exception as e:
+            logger.warning(f"Failed to get alignment method value: {e}")
+            return "differential_evolution"
+
     def _append_log(self, message: str) -> None:
         """Append a line to the log display."""
         if self.log_display is not None:
@@ -277,8 +296,12 @@ class AlignmentPage(BaseSHPBPage):
                 form_data.get(f"{DYN_NS}hasReflectedSearchMin", -100),
                 form_data.get(f"{DYN_NS}hasReflectedSearchMax", 100),
             )
+            method = self._get_method_value(
+                form_data.get(f"{DYN_NS}hasAlignmentMethod")
+            )
 
             self._append_log(f"\n=== Parameters ===")
+            self._append_log(f"Method:        {method}")
             self._append_log(f"k_linear:      {k_linear}")
             self._append_log(
                 f"Weights:       corr={weights['corr']:.2f}  u={weights['u']:.2f}"
@@ -328,7 +351,8 @@ class AlignmentPage(BaseSHPBPage):
                 bar_wave_speed=bar_wave_speed,
                 specimen_height=float(specimen_height),
                 k_linear=k_linear,
-                weights=weights
+                weights=weights,
+                method=method
             )
 
             # Attach a temporary log handler and capture scipy's disp output
@@ -17,6 +17,8 @@ from PyQt6.QtGui import QFont
 from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import RDF
 
+from .....config import config
+
 if TYPE_CHECKING:
     from ..state.analysis_state import SHPBAnalysisState
     from ....ontology import OntologyManager
@@ -340,11 +342,16 @@ class BaseSHPBPage(QWizardPage):
     ) -> bool:
         """Validate page data against SHACL shapes using cumulative context.
 
-        Merges all previously stored page graphs (from ``state.page_graphs``)
-        with the current page's *data_graph* to give SHACL a full view of
-        cross-page references (e.g. DataSeries nodes created by the raw-data
-        page can satisfy ``appliedToSeries`` constraints on the pulse-detection
-        page).
+        Validates all previously stored page graphs (from ``state.page_graphs``)
+        together with the current page's *data_graph* to give SHACL a full
+        view of cross-page references (e.g. DataSeries nodes created by the
+        raw-data page can satisfy ``appliedToSeries`` constraints on the
+        pulse-detection page).
+
+        With ``Config.USE_INCREMENTAL_VALIDATION`` the wizard's
+        IncrementalSHACLValidator keeps the cumulative graph between calls
+        and only re-runs the shapes this page's changes can affect;
+        otherwise the graphs are merged and validated in full.
 
         On successful validation the current page's graph is stored on state
         under *page_key* so that subsequent pages benefit from it.
@@ -359,19 +366,24 @@ class BaseSHPBPage(QWizardPage):
         """
         from ...validation_results_dialog import ValidationResultsDialog
 
-        # Build cumulative graph: all stored page graphs + current page
-        merged = Graph()
-        for key, stored_graph in self.state.page_graphs.items():
-            # Skip the current page's stale graph (will be replaced)
-            if key == page_key:
-                continue
-            for triple in stored_graph:
-                merged.add(triple)
-        for triple in data_graph:
-            merged.add(triple)
+        # Cumulative view: all stored page graphs + current page
+        # (the current page's stale graph is replaced)
+        page_graphs = {
+            key: stored_graph
+            for key, stored_graph in self.state.page_graphs.items()
+            if key != page_key
+        }
+        page_graphs[page_key if page_key is not None else "_current"] = data_graph
 
         validator = self._get_cached_validator()
-        result = validator.validate(merged)
+        if config.USE_INCREMENTAL_VALIDATION:
+            result = validator.validate_pages(page_graphs)
+        else:
+            merged = Graph()
+            for stored_graph in page_graphs.values():
+                for triple in stored_graph:
+                    merged.add(triple)
+            result = validator.validate(merged)
 
         if result.has_blocking_issues():
             dialog = ValidationResultsDialog(result, parent=self)
@@ -391,22 +403,29 @@ class BaseSHPBPage(QWizardPage):
     def _get_cached_validator(self) -> "SHACLValidator":
         """Get or create cached SHACL validator from wizard.
 
-        Caches a single SHACLValidator instance on the wizard to avoid
-        reloading shapes on every page transition.
+        Caches a single validator instance on the wizard to avoid reloading
+        shapes on every page transition and, for the incremental validator,
+        to keep its cumulative data graph and per-shape results.
 
         Returns:
-            SHACLValidator instance
+            IncrementalSHACLValidator (or SHACLValidator when
+            ``Config.USE_INCREMENTAL_VALIDATION`` is off)
         """
-        from ....core.form_validator import SHACLValidator
+        from ....core.form_validator import IncrementalSHACLValidator, SHACLValidator
+
+        validator_class = (
+            IncrementalSHACLValidator if config.USE_INCREMENTAL_VALIDATION else SHACLValidator
+        )
 
         wizard = self.get_wizard()
         if wizard is not None:
-            if not hasattr(wizard, '_shacl_validator') or wizard._shacl_validator is None:
-                wizard._shacl_validator = SHACLValidator(self.ontology_manager)
+            cached = getattr(wizard, '_shacl_validator', None)
+            if type(cached) is not validator_class:
+                wizard._shacl_validator = validator_class(self.ontology_manager)
             return wizard._shacl_validator
 
         # Fallback if no wizard (e.g., testing)
-        return SHACLValidator(self.ontology_manager)
+        return validator_class(self.ontology_manager)
 
     # ==================== WIZARD PAGE OVERRIDES ====================
 
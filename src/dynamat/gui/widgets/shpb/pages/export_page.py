@@ -27,6 +27,7 @@ from rdflib.namespace import RDF
 
 from .base_page import BaseSHPBPage
 from .....mechanical.shpb.io.csv_data_handler import CSVDataHandler
+from .....mechanical.shpb.io.series_storage import normalize_series_format, save_series_table
 from .....config import config
 from ....builders.customizable_form_builder import CustomizableFormBuilder
 
@@ -440,7 +441,7 @@ class ExportPage(BaseSHPBPage):
             if not specimen_dir.exists():
                 raise FileNotFoundError(f"Specimen directory not found: {specimen_dir}")
 
-            # Save raw CSV
+            # Save raw data file
             raw_dir = specimen_dir / "raw"
             raw_dir.mkdir(parents=True, exist_ok=True)
 
@@ -461,8 +462,9 @@ class ExportPage(BaseSHPBPage):
             csv_handler.validate_structure()
 
             test_id_clean = test_id.replace('-', '_')
-            csv_path = raw_dir / f"{test_id_clean}_raw.csv"
-            csv_handler.save_to_csv(csv_path)
+            series_format = normalize_series_format(config.SERIES_FILE_FORMAT)
+            csv_path = raw_dir / f"{test_id_clean}_raw.{series_format}"
+            csv_handler.save(csv_path, series_format)
 
             DYN = Namespace(DYN_NS)
             raw_file_id = f"{test_id_clean}_raw_csv"
@@ -470,18 +472,19 @@ class ExportPage(BaseSHPBPage):
             raw_rel_path = csv_path.relative_to(specimen_dir).as_posix()
             final.remove((raw_file_node, DYN.hasFilePath, None))
             final.add((raw_file_node, DYN.hasFilePath, writer._convert_to_rdf_value(raw_rel_path)))
+            final.remove((raw_file_node, DYN.hasFileFormat, None))
+            final.add((raw_file_node, DYN.hasFileFormat, writer._convert_to_rdf_value(series_format)))
             final.add((raw_file_node, DYN.hasFileName, writer._convert_to_rdf_value(csv_path.name)))
             final.add((raw_file_node, DYN.hasFileSize, writer._convert_to_rdf_value(os.path.getsize(csv_path))))
             final.add((raw_file_node, DYN.hasCreatedDate, writer._convert_to_rdf_value(date.today().isoformat())))
 
-            # Save processed CSV if results available
+            # Save processed data file if results available
             if self.state.calculation_results:
-                import pandas as pd
                 processed_dir = specimen_dir / "processed"
-                processed_dir.mkdir(parents=True, exist_ok=True)
-                processed_path = processed_dir / f"{test_id_clean}_processed.csv"
-                pd.DataFrame(self.state.calculation_results).to_csv(
-                    processed_path, index=False, float_format='%.6e'
+                processed_path = processed_dir / f"{test_id_clean}_processed.{series_format}"
+                save_series_table(
+                    self.state.calculation_results, processed_path,
+                    series_format, float_format='%.6e'
                 )
 
                 processed_file_id = f"{test_id_clean}_processed_csv"
@@ -489,6 +492,8 @@ class ExportPage(BaseSHPBPage):
                 processed_rel_path = processed_path.relative_to(specimen_dir).as_posix()
                 final.remove((processed_file_node, DYN.hasFilePath, None))
                 final.add((processed_file_node, DYN.hasFilePath, writer._convert_to_rdf_value(processed_rel_path)))
+                final.remove((processed_file_node, DYN.hasFileFormat, None))
+                final.add((processed_file_node, DYN.hasFileFormat, writer._convert_to_rdf_value(series_format)))
                 final.add((processed_file_node, DYN.hasFileName, writer._convert_to_rdf_value(processed_path.name)))
                 final.add((processed_file_node, DYN.hasFileSize, writer._convert_to_rdf_value(os.path.getsize(processed_path))))
                 final.add((processed_file_node, DYN.hasCreatedDate, writer._convert_to_rdf_value(date.today().isoformat())))
@@ -340,7 +340,11 @@ class SpecimenSelectionPage(BaseSHPBPage):
                 indexed = self.query_builder.scan_and_index(
                     config.SPECIMENS_DIR,
                     f"{DYN_NS}Specimen",
-                    "*_specimen.ttl"
+                    "*_specimen.ttl",
+                    progress_callback=(
+                        self._entity_selector.show_scan_progress
+                        if self._entity_selector else None
+                    )
                 )
                 self.logger.info(f"Indexed {indexed} specimens")
             else:
@@ -243,6 +243,7 @@ class SHPBAnalysisWizard(QWizard):
 
     def _restart_for_new_analysis(self) -> None:
         """Reset state and restart wizard without confirmation (used after export)."""
+        self.state.release_arrays()
         self.state = SHPBAnalysisState()
 
         for page_id in self.pageIds():
@@ -1,5 +1,6 @@
 """SHPB Analysis State Management."""
 
 from .analysis_state import SHPBAnalysisState
+from .array_store import MemmapArrayStore
 
-__all__ = ["SHPBAnalysisState"]
+__all__ = ["SHPBAnalysisState", "MemmapArrayStore"]
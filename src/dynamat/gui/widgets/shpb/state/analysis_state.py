@@ -8,6 +8,10 @@ array data (DataFrames, numpy arrays) remain as typed fields.
 Pages store form data via ``form_builder.get_form_data()`` and restore via
 ``form_builder.set_form_data()``. Accessor helpers read values from the
 stored form dicts.
+
+With ``array_backend="memmap"`` the raw DataFrame and the pulse/result
+arrays are spilled to a per-session scratch directory (see
+``MemmapArrayStore``) and the fields hold read-only memory-mapped views.
 """
 
 from dataclasses import dataclass, field
@@ -17,9 +21,21 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from .....config import config
+from .array_store import MappedArrayDict, MemmapArrayStore
+
 # DynaMat ontology namespace
 DYN_NS = "https://dynamat.utep.edu/ontology#"
 
+ARRAY_BACKENDS = ("memory", "memmap")
+
+# Fields spilled to disk by the memmap backend
+_MAPPED_FRAME_FIELDS = ("raw_df",)
+_MAPPED_ARRAY_FIELDS = ("time_vector",)
+_MAPPED_DICT_FIELDS = (
+    "segmented_pulses", "aligned_pulses", "tapered_pulses", "calculation_results",
+)
+
 
 @dataclass
 class SHPBAnalysisState:
@@ -104,11 +120,87 @@ class SHPBAnalysisState:
     # ==================== LOAD STATE ====================
     _loaded_from_previous: bool = False
 
+    # ==================== ARRAY STORAGE ====================
+    # "memory" keeps arrays in RAM; "memmap" stores them in memory-mapped
+    # files and exposes read-only views (see module docstring)
+    array_backend: str = field(default_factory=lambda: config.SHPB_ARRAY_BACKEND)
+    _array_store: Optional[MemmapArrayStore] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # ==================== EXPORT ====================
     test_id: Optional[str] = None
     export_form_data: Optional[Dict[str, Any]] = None  # validity, test_type
     exported_file_path: Optional[Path] = None
 
+    def __post_init__(self):
+        if self.array_backend not in ARRAY_BACKENDS:
+            raise ValueError(
+                f"Unknown array backend '{self.array_backend}'. "
+                f"Supported: {ARRAY_BACKENDS}"
+            )
+        # Fields assigned by __init__ before array_backend was set
+        if self.array_backend == "memmap":
+            for name in _MAPPED_FRAME_FIELDS + _MAPPED_ARRAY_FIELDS + _MAPPED_DICT_FIELDS:
+                setattr(self, name, getattr(self, name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("array_backend") == "memmap":
+            if name in _MAPPED_FRAME_FIELDS:
+                value = self._map_frame(name, value)
+            elif name in _MAPPED_ARRAY_FIELDS:
+                value = self._map_array(name, value)
+            elif name in _MAPPED_DICT_FIELDS:
+                value = self._map_dict(name, value)
+        super().__setattr__(name, value)
+
+    # ==================== ARRAY STORAGE ====================
+
+    @property
+    def array_store(self) -> MemmapArrayStore:
+        """Scratch store of the memmap backend, created on first use."""
+        if self._array_store is None or self._array_store.closed:
+            self._array_store = MemmapArrayStore(config.SHPB_SCRATCH_DIR)
+        return self._array_store
+
+    def _map_frame(self, name: str, df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Spill the numeric columns of a DataFrame field."""
+        if df is None:
+            self._discard_mapped(name)
+            return None
+        return self.array_store.put_frame(name, df)
+
+    def _map_array(self, name: str, array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Spill a single-array field."""
+        if not MemmapArrayStore.is_mappable(array):
+            self._discard_mapped(name)
+            return array
+        return self.array_store.put(name, array)
+
+    def _map_dict(self, name: str, items: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Spill every array of a dict-of-arrays field."""
+        if isinstance(items, MappedArrayDict) and items is self.__dict__.get(name):
+            return items
+        self._discard_mapped(name)
+        if items is None:
+            return None
+        return MappedArrayDict(self.array_store, name, items)
+
+    def _discard_mapped(self, name: str) -> None:
+        """Drop the stored files of a field without creating a store."""
+        if self._array_store is not None and not self._array_store.closed:
+            self._array_store.discard(name)
+
+    def release_arrays(self) -> None:
+        """Delete the memmap scratch directory of this session.
+
+        Views already handed out stay readable on POSIX systems; the state
+        itself should not be used for array access afterwards.
+        """
+        if self._array_store is not None:
+            self._array_store.close()
+            self._array_store = None
+
     # ==================== ACCESSOR HELPERS ====================
 
     def get_equipment_value(self, property_name: str) -> Any:
@@ -0,0 +1,219 @@
+"""MemmapArrayStore - Disk-backed storage for large SHPB analysis arrays.
+
+Arrays are written once to ``.npy`` files in a per-session scratch
+directory and handed back as read-only ``np.memmap`` views. The OS page
+cache then decides what stays resident, so several wizard sessions with
+long records can coexist without holding every intermediate array in RAM.
+
+The scratch directory is removed by ``close()`` or, at the latest, when the
+store is garbage collected or the interpreter exits.
+"""
+
+import logging
+import re
+import shutil
+import tempfile
+import weakref
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class MemmapArrayStore:
+    """Per-session scratch directory of memory-mapped, read-only arrays.
+
+    Each array is stored under a string key. Storing a new array under an
+    existing key replaces it; the old file is deleted (where the platform
+    allows deleting a mapped file) and views handed out earlier stay valid.
+
+    Example:
+        >>> store = MemmapArrayStore()
+        >>> view = store.put('aligned_pulses.incident', incident)
+        >>> view.flags.writeable
+        False
+        >>> store.close()
+    """
+
+    def __init__(self, root_dir: Optional[Path] = None, prefix: str = "dynamat_shpb_"):
+        """Create the scratch directory.
+
+        Args:
+            root_dir: Parent directory for the scratch directory
+                (defaults to the system temp directory)
+            prefix: Scratch directory name prefix
+        """
+        if root_dir is not None:
+            Path(root_dir).mkdir(parents=True, exist_ok=True)
+        self.scratch_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=root_dir))
+        self._files: Dict[str, Path] = {}
+        self._counter = count()
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, str(self.scratch_dir), True
+        )
+        logger.debug(f"Array scratch directory created: {self.scratch_dir}")
+
+    # ==================== ARRAYS ====================
+
+    @staticmethod
+    def is_mappable(value: Any) -> bool:
+        """Check whether a value is an array the store can hold."""
+        return (
+            isinstance(value, np.ndarray)
+            and value.dtype.kind in "biufc"
+            and value.size > 0
+        )
+
+    def owns(self, array: np.ndarray) -> bool:
+        """Check whether an array is a view of a file in this store."""
+        filename = getattr(array, "filename", None)
+        return filename is not None and Path(filename).parent == self.scratch_dir
+
+    def put(self, key: str, array: np.ndarray) -> np.ndarray:
+        """Write an array to disk and return a read-only memory-mapped view.
+
+        Args:
+            key: Storage key, e.g. 'aligned_pulses.incident'
+            array: Numeric array to store
+
+        Returns:
+            Read-only np.memmap with the same shape, dtype and values
+        """
+        if self.owns(array) and self._files.get(key) == Path(array.filename):
+            return array
+
+        safe_key = re.sub(r"[^\w.-]", "_", key)
+        path = self.scratch_dir / f"{safe_key}-{next(self._counter)}.npy"
+        np.save(path, np.asarray(array), allow_pickle=False)
+        self._unlink(self._files.pop(key, None))
+        self._files[key] = path
+        return np.load(path, mmap_mode="r")
+
+    def put_frame(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the numeric columns of a DataFrame on disk.
+
+        Args:
+            key: Storage key prefix for the columns
+            df: DataFrame to store
+
+        Returns:
+            DataFrame with the same index and columns whose numeric columns
+            are read-only memory-mapped views (other columns stay in memory)
+        """
+        columns: Dict[int, np.ndarray] = {}
+        stored = set()
+        for position in range(df.shape[1]):
+            values = df.iloc[:, position].to_numpy()
+            if self.is_mappable(values):
+                column_key = f"{key}.{position}"
+                values = self.put(column_key, values)
+                stored.add(column_key)
+            columns[position] = values
+
+        # Drop columns left over from a previous, wider frame
+        for name in [k for k in self._files if k.startswith(f"{key}.") and k not in stored]:
+            self._unlink(self._files.pop(name))
+        frame = pd.DataFrame(columns, index=df.index, copy=False)
+        frame.columns = df.columns
+        return frame
+
+    def discard(self, key: str) -> None:
+        """Drop an entry and every entry nested under it ('key.*')."""
+        nested = f"{key}."
+        for name in [k for k in self._files if k == key or k.startswith(nested)]:
+            self._unlink(self._files.pop(name))
+
+    def keys(self) -> Iterable[str]:
+        """Keys of the arrays currently stored."""
+        return list(self._files)
+
+    def nbytes(self) -> int:
+        """Total size of the stored files in bytes."""
+        return sum(p.stat().st_size for p in self._files.values() if p.exists())
+
+    # ==================== LIFECYCLE ====================
+
+    @property
+    def closed(self) -> bool:
+        """True once the scratch directory has been removed."""
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Remove the scratch directory and all stored arrays."""
+        self._files.clear()
+        self._finalizer()
+
+    @staticmethod
+    def _unlink(path: Optional[Path]) -> None:
+        """Delete a file, leaving it for close() if it is still mapped (Windows)."""
+        if path is None:
+            return
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class MappedArrayDict(dict):
+    """Dict of named arrays whose values are spilled to a MemmapArrayStore.
+
+    Used for the per-pulse and per-result fields of SHPBAnalysisState so
+    that item assignment (``state.segmented_pulses['incident'] = arr``)
+    stores the array on disk and keeps only the read-only view. Every
+    mutating dict method goes through __setitem__ / __delitem__ or discards
+    the store entry itself, so replaced and removed arrays free their
+    scratch files.
+    """
+
+    def __init__(self, store: MemmapArrayStore, key: str, items: Optional[Mapping] = None):
+        super().__init__()
+        self._store = store
+        self._key = key
+        if items:
+            self.update(items)
+
+    def __setitem__(self, name, value):
+        if self._store.is_mappable(value):
+            value = self._store.put(f"{self._key}.{name}", value)
+        else:
+            self._store.discard(f"{self._key}.{name}")
+        super().__setitem__(name, value)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._store.discard(f"{self._key}.{name}")
+
+    def update(self, *args, **kwargs):
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name, *default):
+        value = super().pop(name, *default)
+        self._store.discard(f"{self._key}.{name}")
+        return value
+
+    def popitem(self):
+        name, value = super().popitem()
+        self._store.discard(f"{self._key}.{name}")
+        return name, value
+
+    def clear(self):
+        super().clear()
+        self._store.discard(self._key)
+
+    def copy(self) -> Dict[str, Any]:
+        """Plain-dict shallow copy (values remain read-only views)."""
+        return dict(self)
@@ -9,10 +9,11 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-import pandas as pd
 from rdflib import Graph, Namespace, Literal, URIRef, BNode
 from rdflib.namespace import RDF
 
+from dynamat.mechanical.shpb.io.series_storage import load_series_table
+
 from .analysis_state import SHPBAnalysisState
 
 logger = logging.getLogger(__name__)
@@ -125,9 +126,11 @@ class TestTTLLoader:
             logger.warning(f"Raw CSV not found at {csv_path}")
             return
 
-        # Load CSV
+        # Load raw data (CSV or NPZ, per dyn:hasFileFormat or suffix)
         try:
-            state.raw_df = pd.read_csv(csv_path)
+            state.raw_df = load_series_table(
+                csv_path, self._get_literal(raw_file_uri, DYN.hasFileFormat)
+            )
             state.csv_file_path = csv_path
             state.total_samples = len(state.raw_df)
         except Exception as e:
@@ -4,6 +4,17 @@ This module provides tools for aligning transmitted and reflected pulses
 to the incident pulse by optimizing integer sample shifts that maximize
 physical equilibrium criteria.
 
+Two search engines are available:
+
+- ``'differential_evolution'`` (default): stochastic global optimizer
+  over the continuous shift box, rounded to integer shifts.
+- ``'grid'``: exhaustive evaluation of every integer (shift_t, shift_r)
+  pair in the search box. The fitness terms are expanded into windowed
+  sums that are computed for the whole box at once with matrix products,
+  and candidates that cannot be excluded by a rounding-error bound are
+  re-scored with the exact fitness function. The returned shifts are
+  therefore identical to a brute-force scan of ``_fitness_function``.
+
 Classes
 -------
 PulseAligner : Configurable pulse alignment optimizer
@@ -19,7 +30,7 @@ Testing and Applications. Springer.
 from __future__ import annotations
 
 import logging
-from typing import Tuple, Dict, Optional, Sequence
+from typing import Tuple, Dict, Optional, Sequence, Literal, Any
 
 import numpy as np
 from scipy.integrate import cumulative_trapezoid
@@ -27,6 +38,19 @@ from scipy.optimize import differential_evolution
 
 logger = logging.getLogger(__name__)
 
+ALIGNMENT_METHODS = ('differential_evolution', 'grid')
+
+# Upper bound on the number of float64 elements the grid search holds at
+# once (32 MB), and the number of (transmitted x reflected) tile-sized
+# temporaries one tile evaluation keeps alive
+_GRID_CHUNK_ELEMENTS = 1 << 22
+_GRID_TILE_TEMPORARIES = 40
+
+# Largest grid search, in multiply-adds (shift pairs x linear region
+# points), that method='grid' runs (about ten seconds on one core); larger
+# boxes fall back to differential evolution
+GRID_MAX_OPERATIONS = 5 * 10 ** 10
+
 
 class PulseAligner:
     """Align transmitted and reflected pulses using multi-criteria optimization.
@@ -50,6 +74,13 @@ class PulseAligner:
     weights : dict, optional
         Fitness component weights. Keys: 'corr', 'u', 'sr', 'e'.
         Defaults to {'corr': 0.3, 'u': 0.3, 'sr': 0.3, 'e': 0.1}.
+    method : {'differential_evolution', 'grid'}, default 'differential_evolution'
+        Shift search engine. ``'grid'`` scans every integer shift pair in
+        the search box and returns the exact global optimum; its cost grows
+        with the box area, so it is intended for bounded search boxes. Boxes
+        costing more than ``GRID_MAX_OPERATIONS`` (e.g. the default ±N/2
+        bounds of long records) log a warning and use differential
+        evolution instead.
 
     Examples
     --------
@@ -73,11 +104,19 @@ class PulseAligner:
         bar_wave_speed: float,
         specimen_height: float,
         k_linear: float = 0.35,
-        weights: Dict[str, float] | None = None
+        weights: Dict[str, float] | None = None,
+        method: Literal['differential_evolution', 'grid'] = 'differential_evolution'
     ):
+        if method not in ALIGNMENT_METHODS:
+            raise ValueError(
+                f"Unknown alignment method '{method}'. "
+                f"Expected one of {ALIGNMENT_METHODS}"
+            )
+
         self.bar_wave_speed = bar_wave_speed
         self.specimen_height = specimen_height
         self.k_linear = k_linear
+        self.method = method
         self.weights = weights or {
             'corr': 0.3,
             'u': 0.3,
@@ -117,6 +156,45 @@ class PulseAligner:
         else:
             return signal.copy()
 
+    @staticmethod
+    def _shifted_window(
+        signal: np.ndarray,
+        shift: int,
+        start: int,
+        stop: int
+    ) -> np.ndarray:
+        """Samples [start, stop) of the zero-padded shifted signal.
+
+        Equivalent to ``_shift_signal(signal, shift)[start:stop]`` without
+        building the full shifted array: windows that lie inside the
+        original samples are returned as views, and only windows reaching
+        into the padding are copied (over the window length only).
+
+        Parameters
+        ----------
+        signal : np.ndarray
+            Input signal.
+        shift : int
+            Shift amount (positive = right, negative = left).
+        start, stop : int
+            Window bounds in shifted coordinates.
+
+        Returns
+        -------
+        np.ndarray
+            Window of the shifted signal (read-only view when possible).
+        """
+        n = len(signal)
+        s = int(round(shift))
+        lo, hi = start - s, stop - s
+        if lo >= 0 and hi <= n:
+            return signal[lo:hi]
+        out = np.zeros(stop - start)
+        src_lo, src_hi = max(lo, 0), min(hi, n)
+        if src_lo < src_hi:
+            out[src_lo - lo:src_hi - lo] = signal[src_lo:src_hi]
+        return out
+
     @staticmethod
     def _pulse_correlation(
         inc: np.ndarray,
@@ -130,7 +208,7 @@ class PulseAligner:
         ----------
         inc, trs, ref : np.ndarray
             Pulse arrays.
-        idx : np.ndarray
+        idx : np.ndarray or slice
             Indices to evaluate (linear region).
 
         Returns
@@ -163,7 +241,7 @@ class PulseAligner:
             Bar wave speed (mm/ms).
         inc, trs, ref : np.ndarray
             Pulse arrays.
-        idx : np.ndarray
+        idx : np.ndarray or slice
             Indices to evaluate.
 
         Returns
@@ -197,7 +275,7 @@ class PulseAligner:
             Specimen height (mm).
         inc, trs, ref : np.ndarray
             Pulse arrays.
-        idx : np.ndarray
+        idx : np.ndarray or slice
             Indices to evaluate.
 
         Returns
@@ -234,7 +312,7 @@ class PulseAligner:
             Pulse arrays.
         time : np.ndarray
             Time vector (ms).
-        idx : np.ndarray
+        idx : np.ndarray or slice
             Indices to evaluate.
 
         Returns
@@ -246,6 +324,148 @@ class PulseAligner:
         e1 = (2 * c / L) * cumulative_trapezoid(ref, time, initial=0)
         return float(np.sqrt(np.mean((e1[idx] - e3[idx]) ** 2)))
 
+    @staticmethod
+    def _cumulative_integrals(
+        inc: np.ndarray,
+        trs: np.ndarray,
+        ref: np.ndarray,
+        time: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        """Precompute cumulative trapezoid integrals of the unshifted pulses.
+
+        On a uniform time grid, shifting a signal by ``s`` samples only
+        offsets its cumulative integral (plus one edge trapezoid where the
+        signal meets the zero padding), so these integrals can be reused
+        for every candidate shift of an ``align()`` call.
+
+        Parameters
+        ----------
+        inc, trs, ref : np.ndarray
+            Pulse arrays.
+        time : np.ndarray
+            Time vector (ms).
+
+        Returns
+        -------
+        dict or None
+            Keys 'dt', 'inc', 'trs', 'ref'; None if the time vector is not
+            uniformly sampled (strain is then integrated per candidate).
+        """
+        if len(time) < 2:
+            return None
+        steps = np.diff(time)
+        dt = float(steps.mean())
+        if not np.allclose(steps, dt, rtol=1e-6, atol=0):
+            logger.debug("Non-uniform time vector; strain integrals computed per candidate")
+            return None
+        return {
+            'dt': dt,
+            'inc': cumulative_trapezoid(inc, time, initial=0),
+            'trs': cumulative_trapezoid(trs, time, initial=0),
+            'ref': cumulative_trapezoid(ref, time, initial=0),
+        }
+
+    @staticmethod
+    def _shifted_integral(
+        cumulative: np.ndarray,
+        signal: np.ndarray,
+        shift: int,
+        start: int,
+        stop: int,
+        dt: float
+    ) -> np.ndarray:
+        """Window [start, stop) of the cumulative integral of a shifted signal.
+
+        Parameters
+        ----------
+        cumulative : np.ndarray
+            Cumulative trapezoid integral of the unshifted signal.
+        signal : np.ndarray
+            Unshifted signal (for the padding edge trapezoids).
+        shift : int
+            Shift amount (positive = right, negative = left).
+        start, stop : int
+            Window bounds in shifted coordinates.
+        dt : float
+            Uniform sampling interval (ms).
+
+        Returns
+        -------
+        np.ndarray
+            Integral of ``_shift_signal(signal, shift)`` over [start, stop).
+        """
+        n = len(signal)
+        s = int(round(shift))
+        out = np.zeros(stop - start)
+        if s >= n or s <= -n:
+            # Signal shifted entirely into the padding
+            return out
+
+        # Samples backed by the original signal: [s, n + s)
+        lo = min(max(s, start), stop)
+        hi = min(max(n + s, start), stop)
+        if s > 0:
+            # Leading zeros contribute the step from 0 to signal[0]
+            offset = dt * signal[0] / 2.0
+        elif s < 0:
+            offset = -cumulative[-s]
+        else:
+            offset = 0.0
+        if lo < hi:
+            out[lo - start:hi - start] = cumulative[lo - s:hi - s] + offset
+        if hi < stop:
+            # Trailing zeros after the step from signal[-1] to 0
+            out[hi - start:] = cumulative[n - 1] + offset + dt * signal[n - 1] / 2.0
+        return out
+
+    @classmethod
+    def _strain_rmse_precomputed(
+        cls,
+        c: float,
+        L: float,
+        integrals: Dict[str, Any],
+        trs: np.ndarray,
+        ref: np.ndarray,
+        shift_t: int,
+        shift_r: int,
+        start: int,
+        stop: int
+    ) -> float:
+        """RMSE between 1-wave and 3-wave strain from precomputed integrals.
+
+        Same quantity as :meth:`_strain_rmse` on the shifted pulses over the
+        window [start, stop), but built from the integrals returned by
+        :meth:`_cumulative_integrals` in O(window) per candidate instead of
+        integrating the full pulses.
+
+        Parameters
+        ----------
+        c : float
+            Bar wave speed (mm/ms).
+        L : float
+            Specimen height (mm).
+        integrals : dict
+            Output of :meth:`_cumulative_integrals`.
+        trs, ref : np.ndarray
+            Unshifted transmitted and reflected pulses.
+        shift_t, shift_r : int
+            Candidate shifts (samples).
+        start, stop : int
+            Evaluation window (linear region).
+
+        Returns
+        -------
+        float
+            RMSE in strain (unitless).
+        """
+        dt = integrals['dt']
+        int_inc = integrals['inc'][start:stop]
+        int_trs = cls._shifted_integral(integrals['trs'], trs, shift_t, start, stop, dt)
+        int_ref = cls._shifted_integral(integrals['ref'], ref, shift_r, start, stop, dt)
+        e3 = (c / L) * (int_inc - int_ref - int_trs)
+        e1 = (2 * c / L) * int_ref
+        return float(np.sqrt(np.mean((e1 - e3) ** 2)))
+
     def _fitness_function(
         self,
         shifts: Sequence[float],
@@ -253,12 +473,21 @@ class PulseAligner:
         trs: np.ndarray,
         ref: np.ndarray,
         idx: np.ndarray,
-        time: np.ndarray
+        time: np.ndarray,
+        integrals: Optional[Dict[str, Any]] = None
     ) -> float:
         """Negative fitness for minimization.
 
         Combines four equilibrium criteria with user-defined weights.
 
+        Each metric is evaluated on the shifted index window of the
+        original arrays (see :meth:`_shifted_window`), so no padded copies
+        of the pulses are built: correlation, displacement and strain rate
+        only touch the linear region. The strain term uses the precomputed
+        ``integrals`` when given; otherwise it integrates the prefix that
+        ends at the linear region, bit-identical to
+        :meth:`_fitness_function_padded`.
+
         Parameters
         ----------
         shifts : Sequence[float]
@@ -266,9 +495,11 @@ class PulseAligner:
         inc, trs, ref : np.ndarray
             Pulse arrays.
         idx : np.ndarray
-            Linear region indices.
+            Linear region indices (contiguous range).
         time : np.ndarray
             Time vector.
+        integrals : dict, optional
+            Output of :meth:`_cumulative_integrals` for these pulses.
 
         Returns
         -------
@@ -276,19 +507,46 @@ class PulseAligner:
             Negative weighted fitness (lower is better).
         """
         shift_t, shift_r = shifts
-        T = self._shift_signal(trs, shift_t)
-        R = self._shift_signal(ref, shift_r)
+        a, b = int(idx[0]), int(idx[-1]) + 1
+        window = slice(0, b - a)
 
-        # Calculate metrics
-        r = self._pulse_correlation(inc, T, R, idx)
-        u_rmse = self._bar_displacement_rmse(self.bar_wave_speed, inc, T, R, idx)
+        # Linear-region windows
+        I = inc[a:b]
+        T = self._shifted_window(trs, shift_t, a, b)
+        R = self._shifted_window(ref, shift_r, a, b)
+
+        r = self._pulse_correlation(I, T, R, window)
+        u_rmse = self._bar_displacement_rmse(self.bar_wave_speed, I, T, R, window)
         sr_rmse = self._strain_rate_rmse(
-            self.bar_wave_speed, self.specimen_height, inc, T, R, idx
-        )
-        e_rmse = self._strain_rmse(
-            self.bar_wave_speed, self.specimen_height, inc, T, R, time, idx
+            self.bar_wave_speed, self.specimen_height, I, T, R, window
         )
 
+        if integrals is not None:
+            e_rmse = self._strain_rmse_precomputed(
+                self.bar_wave_speed, self.specimen_height, integrals,
+                trs, ref, shift_t, shift_r, a, b
+            )
+        else:
+            # Strain integrals only depend on samples up to the window end
+            e_rmse = self._strain_rmse(
+                self.bar_wave_speed, self.specimen_height,
+                inc[:b],
+                self._shifted_window(trs, shift_t, 0, b),
+                self._shifted_window(ref, shift_r, 0, b),
+                time[:b],
+                slice(a, b)
+            )
+
+        return self._combine_metrics(r, u_rmse, sr_rmse, e_rmse)
+
+    def _combine_metrics(
+        self,
+        r: float,
+        u_rmse: float,
+        sr_rmse: float,
+        e_rmse: float
+    ) -> float:
+        """Weighted negative fitness from the four equilibrium metrics."""
         # Convert RMSEs to similarities (0 to 1)
         sim_u = 1.0 / (1.0 + u_rmse)
         sim_sr = 1.0 / (1.0 + sr_rmse)
@@ -304,6 +562,383 @@ class PulseAligner:
 
         return -fitness if not np.isnan(fitness) else 1e3
 
+    def _fitness_function_padded(
+        self,
+        shifts: Sequence[float],
+        inc: np.ndarray,
+        trs: np.ndarray,
+        ref: np.ndarray,
+        idx: np.ndarray,
+        time: np.ndarray,
+        integrals: Optional[Dict[str, Any]] = None
+    ) -> float:
+        """Negative fitness computed on fully shifted, zero-padded copies.
+
+        Reference implementation of :meth:`_fitness_function`; it builds two
+        full-length shifted arrays per call and is kept for verification
+        and benchmarking.
+
+        Parameters
+        ----------
+        shifts : Sequence[float]
+            [shift_transmitted, shift_reflected].
+        inc, trs, ref : np.ndarray
+            Pulse arrays.
+        idx : np.ndarray
+            Linear region indices.
+        time : np.ndarray
+            Time vector.
+        integrals : dict, optional
+            Accepted for signature compatibility with
+            :meth:`_fitness_function`; ignored.
+
+        Returns
+        -------
+        float
+            Negative weighted fitness (lower is better).
+        """
+        shift_t, shift_r = shifts
+        T = self._shift_signal(trs, shift_t)
+        R = self._shift_signal(ref, shift_r)
+
+        # Calculate metrics
+        r = self._pulse_correlation(inc, T, R, idx)
+        u_rmse = self._bar_displacement_rmse(self.bar_wave_speed, inc, T, R, idx)
+        sr_rmse = self._strain_rate_rmse(
+            self.bar_wave_speed, self.specimen_height, inc, T, R, idx
+        )
+        e_rmse = self._strain_rmse(
+            self.bar_wave_speed, self.specimen_height, inc, T, R, time, idx
+        )
+
+        return self._combine_metrics(r, u_rmse, sr_rmse, e_rmse)
+
+    @staticmethod
+    def _window_rows(
+        padded: np.ndarray,
+        starts: np.ndarray,
+        length: int
+    ) -> np.ndarray:
+        """Gather fixed-length windows of a padded signal as matrix rows.
+
+        Parameters
+        ----------
+        padded : np.ndarray
+            Zero-padded signal.
+        starts : np.ndarray
+            Start index of each window in ``padded``.
+        length : int
+            Window length.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (len(starts), length).
+        """
+        return padded[starts[:, None] + np.arange(length)]
+
+    @staticmethod
+    def _grid_tile_shape(n_t: int, n_r: int, length: int) -> Tuple[int, int]:
+        """Tile size (reflected columns, transmitted rows) of the grid search.
+
+        A tile holds ``_GRID_TILE_TEMPORARIES`` arrays of shape
+        (rows, cols) plus the (rows, length) and (cols, length) window
+        matrices of both shifted signals and their integrals; the shape
+        keeps their total within ``_GRID_CHUNK_ELEMENTS``.
+
+        Parameters
+        ----------
+        n_t, n_r : int
+            Number of transmitted and reflected shifts.
+        length : int
+            Linear region length.
+
+        Returns
+        -------
+        cols, rows : int
+            Reflected and transmitted shifts per tile (at least 1).
+        """
+        budget, temps = _GRID_CHUNK_ELEMENTS, _GRID_TILE_TEMPORARIES
+        # Largest square tile: temps * s² + 4 * s * length <= budget
+        side = int((np.sqrt(4.0 * length ** 2 + temps * budget) - 2.0 * length) / temps)
+        cols = max(1, min(n_r, side))
+        rows = (budget - 2 * cols * length) // (temps * cols + 2 * length)
+        return cols, max(1, min(n_t, rows))
+
+    def _grid_search(
+        self,
+        inc: np.ndarray,
+        trs: np.ndarray,
+        ref: np.ndarray,
+        idx: np.ndarray,
+        time: np.ndarray,
+        search_bounds_t: Tuple[int, int],
+        search_bounds_r: Tuple[int, int],
+        integrals: Optional[Dict[str, Any]] = None,
+        debug: bool = False
+    ) -> Tuple[int, int, float]:
+        """Exhaustive integer shift search over the full search box.
+
+        Every fitness term is a quadratic form of the shifted pulses over
+        the linear region, so it expands into windowed sums (Σx, Σx², Σxy).
+        Single-shift sums are evaluated for all shifts at once and the
+        transmitted/reflected cross sums with one matrix product per tile
+        of shift pairs; tiles are sized so that the working set stays within
+        ``_GRID_CHUNK_ELEMENTS`` elements. The strain term uses the same expansion on
+        the cumulative integrals, which for a shifted signal are a shifted
+        copy of the padded signal's integral minus a constant.
+
+        The batched values carry rounding error, so each candidate also gets
+        a rigorous error bound. Candidates whose lower bound cannot beat the
+        best exactly evaluated fitness are discarded; the rest are re-scored
+        with :meth:`_fitness_function`. The result is the first (row-major,
+        transmitted shift outermost) minimizer of the exact fitness, i.e.
+        the same shifts a brute-force scan returns.
+
+        Parameters
+        ----------
+        inc, trs, ref : np.ndarray
+            Pulse arrays.
+        idx : np.ndarray
+            Linear region indices (contiguous range).
+        time : np.ndarray
+            Time vector.
+        search_bounds_t, search_bounds_r : Tuple[int, int]
+            Inclusive shift bounds (samples), rounded to integers.
+        integrals : dict, optional
+            Precomputed integrals passed on to :meth:`_fitness_function`.
+        debug : bool
+            Log search diagnostics.
+
+        Returns
+        -------
+        shift_t : int
+            Optimal transmitted shift (samples).
+        shift_r : int
+            Optimal reflected shift (samples).
+        fitness : float
+            Exact fitness of the optimal shifts (higher is better).
+        """
+        t_lo, t_hi = (int(round(v)) for v in search_bounds_t)
+        r_lo, r_hi = (int(round(v)) for v in search_bounds_r)
+        if t_lo > t_hi or r_lo > r_hi:
+            raise ValueError(
+                f"Invalid search bounds: transmitted={search_bounds_t}, "
+                f"reflected={search_bounds_r}"
+            )
+        shifts_t = np.arange(t_lo, t_hi + 1)
+        shifts_r = np.arange(r_lo, r_hi + 1)
+        n_t, n_r = len(shifts_t), len(shifts_r)
+
+        n = len(inc)
+        a = int(idx[0])
+        L = len(idx)
+        c = float(self.bar_wave_speed)
+        k = c / float(self.specimen_height)
+        w = self.weights
+
+        # Uniform-step integrals; deviations of the actual time steps from
+        # dt enter the strain-term error bound below.
+        steps = np.diff(time)
+        dt = float(time[-1] - time[0]) / (n - 1) if n > 1 else 0.0
+        ddt = float(np.max(np.abs(steps - dt))) if n > 1 else 0.0
+        dt_max = float(np.max(np.abs(steps))) if n > 1 else 0.0
+
+        # Zero padding so that every shifted window and integral offset
+        # indexes inside the arrays
+        pad_l = max(0, t_hi, r_hi)
+        pad_r = max(0, a + L - min(t_lo, r_lo) - n)
+        m = pad_l + n + pad_r
+
+        def padded(signal):
+            out = np.zeros(m)
+            out[pad_l:pad_l + n] = signal
+            return out
+
+        p_trs, p_ref = padded(trs), padded(ref)
+        g_trs = cumulative_trapezoid(p_trs, dx=dt, initial=0)
+        g_ref = cumulative_trapezoid(p_ref, dx=dt, initial=0)
+
+        eps = np.finfo(float).eps
+        # Rounding budget for length-L dot products, doubled to cover both
+        # the batched evaluation and the exact reference evaluation
+        kappa = 2.0 * (L + 16) * eps
+        # Per-sample error budget of the cumulative integrals
+        kappa_int = 2.0 * (2 * m + 8) * eps * dt_max + 2.0 * ddt
+
+        # Incident terms (shift independent)
+        I = inc[a:a + L].astype(float)
+        CI = cumulative_trapezoid(inc, dx=dt, initial=0)[a:a + L]
+        Ic = I - I.mean()
+        SI, SI2 = I.sum(), I @ I
+        SCI2 = CI @ CI
+        vb = Ic @ Ic
+        sum_ic = abs(Ic.sum())
+        base_const = bool(inc[idx].std() == 0)
+        e_inc = kappa_int * np.abs(inc).sum()
+        e_trs = kappa_int * np.abs(trs).sum()
+        e_ref = kappa_int * np.abs(ref).sum()
+        e_r = e_trs + 3.0 * e_ref + e_inc
+
+        # Tiles of (rows transmitted x cols reflected) shift pairs
+        cols, rows = self._grid_tile_shape(n_t, n_r, L)
+
+        def windows(p_sig, g_sig, shifts):
+            """Shifted windows of a signal and of its integral."""
+            starts = a - shifts + pad_l
+            W = self._window_rows(p_sig, starts, L)
+            CW = self._window_rows(g_sig, starts, L) - g_sig[pad_l - shifts][:, None]
+            return W, CW
+
+        # Reflected single-shift terms for every reflected shift
+        r_terms = np.empty((6, n_r))
+        for r0 in range(0, n_r, cols):
+            sl = slice(r0, r0 + cols)
+            Rw, CRw = windows(p_ref, g_ref, shifts_r[sl])
+            r_terms[:, sl] = (
+                Rw.sum(axis=1),
+                np.einsum('ij,ij->i', Rw, Rw),
+                Rw @ I,
+                Rw @ Ic,
+                np.einsum('ij,ij->i', CRw, CRw),
+                CRw @ CI,
+            )
+        del Rw, CRw
+
+        wsum = sum(abs(v) for v in w.values())
+
+        upper_best = np.inf
+        cand_flat = []
+        cand_lower = []
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for start in range(0, n_t, rows):
+                st = shifts_t[start:start + rows]
+                Tw, CTw = windows(p_trs, g_trs, st)
+                ST = Tw.sum(axis=1)
+                ST2 = np.einsum('ij,ij->i', Tw, Tw)
+                SIT = Tw @ I
+                SIcT = Tw @ Ic
+                SCT2 = np.einsum('ij,ij->i', CTw, CTw)
+                SCIT = CTw @ CI
+                nT, nCT = np.sqrt(ST2), np.sqrt(SCT2)
+
+                for r0 in range(0, n_r, cols):
+                    sl = slice(r0, r0 + cols)
+                    Rw, CRw = windows(p_ref, g_ref, shifts_r[sl])
+                    STR = Tw @ Rw.T
+                    SCTR = CTw @ CRw.T
+                    del Rw, CRw
+                    SR, SR2, SIR, SIcR, SCR2, SCIR = r_terms[:, sl]
+                    nR, nCR = np.sqrt(SR2), np.sqrt(SCR2)
+
+                    # Σ(T - R - I)², Σ(3R + T - I)², Σ(3CR + CT - CI)²
+                    q_u = (ST2[:, None] + SR2 + SI2 - 2 * STR
+                           - 2 * SIT[:, None] + 2 * SIR)
+                    q_sr = (9 * SR2 + ST2[:, None] + SI2 + 6 * STR
+                            - 2 * SIT[:, None] - 6 * SIR)
+                    q_e = (9 * SCR2 + SCT2[:, None] + SCI2 + 6 * SCTR
+                           - 2 * SCIT[:, None] - 6 * SCIR)
+
+                    d_u = kappa * (nT[:, None] + nR + np.sqrt(SI2)) ** 2
+                    d_sr = kappa * (nT[:, None] + 3 * nR + np.sqrt(SI2)) ** 2
+                    d_e = (kappa * (nCT[:, None] + 3 * nCR + np.sqrt(SCI2)) ** 2
+                           + 2 * e_r * np.sqrt(L * np.maximum(q_e, 0)) + L * e_r ** 2)
+
+                    def rmse_with_bound(q, d, scale):
+                        mse = np.maximum(q, 0) / L
+                        dm = d / L
+                        rmse = scale * np.sqrt(mse)
+                        bound = np.sqrt(dm)
+                        np.minimum(bound, dm / np.sqrt(mse), out=bound, where=mse > 0)
+                        return rmse, scale * bound
+
+                    u, err_u = rmse_with_bound(q_u, d_u, c)
+                    sr, err_sr = rmse_with_bound(q_sr, d_sr, k)
+                    e, err_e = rmse_with_bound(q_e, d_e, k)
+
+                    # Pearson correlation of incident vs (T - R)
+                    if base_const:
+                        corr = np.full(STR.shape, -1.0)
+                        err_corr = np.zeros_like(corr)
+                    else:
+                        s_cand = ST[:, None] - SR
+                        vc = ST2[:, None] + SR2 - 2 * STR - s_cand ** 2 / L
+                        cov = SIcT[:, None] - SIcR
+                        n_cand = nT[:, None] + nR
+                        d_vc = kappa * n_cand ** 2
+                        d_cov = kappa * np.sqrt(vb) * n_cand + sum_ic * np.abs(s_cand) / L
+                        v_lo = vc - d_vc
+                        ok = v_lo > 0
+                        corr = np.where(ok, np.clip(cov / np.sqrt(vb * vc), -1, 1), 0.0)
+                        err_corr = np.where(
+                            ok,
+                            d_cov / np.sqrt(vb * v_lo)
+                            + np.abs(cov) / np.sqrt(vb) * (1 / np.sqrt(v_lo) - 1 / np.sqrt(vc))
+                            + kappa,
+                            1.0
+                        )
+
+                    neg_fit = -(
+                        w['corr'] * corr +
+                        w['u'] / (1.0 + u) +
+                        w['sr'] / (1.0 + sr) +
+                        w['e'] / (1.0 + e)
+                    )
+                    err = (
+                        abs(w['corr']) * err_corr +
+                        abs(w['u']) * err_u +
+                        abs(w['sr']) * err_sr +
+                        abs(w['e']) * err_e +
+                        8 * eps * wsum
+                    )
+
+                    lower = neg_fit - err
+                    upper = neg_fit + err
+                    bad = ~(np.isfinite(lower) & np.isfinite(upper))
+                    lower[bad] = -np.inf
+                    upper[bad] = np.inf
+
+                    upper_best = min(upper_best, float(upper.min()))
+                    keep = np.flatnonzero(lower <= upper_best)
+                    i, j = np.divmod(keep, STR.shape[1])
+                    cand_flat.append((start + i) * n_r + r0 + j)
+                    cand_lower.append(lower.ravel()[keep])
+
+        cand_flat = np.concatenate(cand_flat)
+        cand_lower = np.concatenate(cand_lower)
+        keep = cand_lower <= upper_best
+        cand_flat, cand_lower = cand_flat[keep], cand_lower[keep]
+
+        # Exact refinement in order of increasing lower bound
+        best_val = np.inf
+        best_flat = -1
+        n_exact = 0
+        for pos in np.argsort(cand_lower, kind='stable'):
+            if cand_lower[pos] > best_val:
+                break
+            flat = int(cand_flat[pos])
+            shift_t = int(shifts_t[flat // n_r])
+            shift_r = int(shifts_r[flat % n_r])
+            val = self._fitness_function(
+                (shift_t, shift_r), inc, trs, ref, idx, time, integrals
+            )
+            n_exact += 1
+            if val < best_val or (val == best_val and flat < best_flat):
+                best_val, best_flat = val, flat
+
+        if debug:
+            logger.debug(
+                f"Grid search: {n_t * n_r} candidates screened, "
+                f"{n_exact} evaluated exactly"
+            )
+
+        return (
+            int(shifts_t[best_flat // n_r]),
+            int(shifts_r[best_flat % n_r]),
+            -float(best_val),
+        )
+
     def align(
         self,
         incident: np.ndarray,
@@ -316,8 +951,9 @@ class PulseAligner:
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, int]:
         """Align transmitted and reflected pulses to incident.
 
-        Uses differential evolution to find optimal integer shifts that
-        maximize physical equilibrium between 1-wave and 3-wave analysis.
+        Uses the configured search engine (differential evolution or
+        exhaustive grid search) to find optimal integer shifts that maximize
+        physical equilibrium between 1-wave and 3-wave analysis.
 
         Parameters
         ----------
@@ -354,7 +990,8 @@ class PulseAligner:
         Raises
         ------
         ValueError
-            If input arrays have different heights.
+            If input arrays have different heights, or if the grid engine
+            is given an empty search box.
         """
         # Validate inputs
         N = len(incident)
@@ -391,29 +1028,56 @@ class PulseAligner:
                 f"reflected={search_bounds_r}"
             )
 
-        # Run differential evolution
-        bounds = [search_bounds_t, search_bounds_r]
-        result = differential_evolution(
-            self._fitness_function,
-            bounds,
-            args=(incident, transmitted, reflected, idx_linear, time_vector),
-            strategy="best2bin",
-            popsize=50,
-            maxiter=250,
-            tol=5e-5,
-            polish=True,
-            disp=debug
+        # Strain integrals shared by every candidate shift
+        integrals = self._cumulative_integrals(
+            incident, transmitted, reflected, time_vector
         )
 
-        # Extract optimal shifts
-        shift_t, shift_r = map(lambda x: int(round(x)), result.x)
+        method = self.method
+        if method == 'grid':
+            box = [int(round(hi)) - int(round(lo)) + 1
+                   for lo, hi in (search_bounds_t, search_bounds_r)]
+            operations = max(box[0], 0) * max(box[1], 0) * len(idx_linear)
+            if operations > GRID_MAX_OPERATIONS:
+                logger.warning(
+                    f"Grid search over {box[0]} x {box[1]} shifts with "
+                    f"{len(idx_linear)} region points exceeds "
+                    f"{GRID_MAX_OPERATIONS:.1e} operations; "
+                    f"using differential evolution instead"
+                )
+                method = 'differential_evolution'
+
+        if method == 'grid':
+            shift_t, shift_r, fitness = self._grid_search(
+                incident, transmitted, reflected, idx_linear, time_vector,
+                search_bounds_t, search_bounds_r, integrals, debug=debug
+            )
+        else:
+            # Run differential evolution
+            bounds = [search_bounds_t, search_bounds_r]
+            result = differential_evolution(
+                self._fitness_function,
+                bounds,
+                args=(incident, transmitted, reflected, idx_linear, time_vector,
+                      integrals),
+                strategy="best2bin",
+                popsize=50,
+                maxiter=250,
+                tol=5e-5,
+                polish=True,
+                disp=debug
+            )
+
+            # Extract optimal shifts
+            shift_t, shift_r = map(lambda x: int(round(x)), result.x)
+            fitness = -result.fun
 
         if debug:
             logger.debug(
                 f"Optimal shifts: transmitted={shift_t:+d}, "
                 f"reflected={shift_r:+d} samples"
             )
-            logger.debug(f"Final fitness: {-result.fun:.6f}")
+            logger.debug(f"Final fitness: {fitness:.6f}")
 
         # Apply shifts and return
         inc_aligned = incident.copy()
@@ -20,13 +20,75 @@ and Technology, 105(1), 61-66.
 from __future__ import annotations
 
 import logging
-from typing import Tuple, List, Dict, Sequence, Literal
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    Tuple, List, Dict, Sequence, Literal, Callable, Iterable, Iterator, Union
+)
 
 import numpy as np
-from scipy.signal import fftconvolve
+from scipy import fft as sp_fft
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of template spectra kept by the process-wide cache. A batch
+# reanalysis typically needs one entry per (pulse_points, polarity, record
+# length) combination, i.e. a handful for a whole campaign.
+TEMPLATE_CACHE_SIZE = 16
+
+# Default number of samples per block in streaming detection
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Streaming input: a 1D array-like supporting len() and slicing (ndarray,
+# np.memmap), or a zero-argument callable returning a fresh iterator of 1D
+# chunks (e.g. a generator function reading a file piece by piece).
+SignalSource = Union[np.ndarray, Callable[[], Iterable[np.ndarray]]]
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _half_sine_template(
+    pulse_points: int,
+    polarity: Literal["compressive", "tensile"]
+) -> np.ndarray:
+    """Cached, read-only unit-energy half-sine template."""
+    template = PulseDetector._build_half_sine_template(pulse_points, polarity)
+    template.setflags(write=False)
+    return template
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _template_spectrum(
+    pulse_points: int,
+    polarity: Literal["compressive", "tensile"],
+    padded_length: int
+) -> np.ndarray:
+    """Cached, read-only rfft of the time-reversed template.
+
+    Parameters
+    ----------
+    pulse_points : int
+        Template length in samples.
+    polarity : {'compressive', 'tensile'}
+        Template sign convention.
+    padded_length : int
+        FFT length the template is zero-padded to.
+
+    Returns
+    -------
+    np.ndarray
+        Complex half-spectrum of length ``padded_length // 2 + 1``.
+    """
+    template = _half_sine_template(pulse_points, polarity)
+    spectrum = sp_fft.rfft(template[::-1], padded_length)
+    spectrum.setflags(write=False)
+    return spectrum
+
+
+def clear_template_cache() -> None:
+    """Drop all cached templates and template spectra."""
+    _half_sine_template.cache_clear()
+    _template_spectrum.cache_clear()
+
 
 class PulseDetector:
     """Detect and segment stress pulses in SHPB gauge signals.
@@ -46,7 +108,7 @@ class PulseDetector:
         Sign convention for the pulse front.
     min_separation : int, optional
         Minimum allowed distance between detected peaks in samples.
-        Defaults to ``0.8 * pulse_points``.
+        Defaults to ``0.8 * pulse_points`` (at least 1).
 
     Examples
     --------
@@ -69,10 +131,10 @@ class PulseDetector:
         self.pulse_points = pulse_points
         self.k_trials = k_trials
         self.polarity = polarity
-        self.min_separation = min_separation or int(0.8 * pulse_points)
+        self.min_separation = min_separation or max(1, int(0.8 * pulse_points))
 
-        # Build template once
-        self._template = self._build_half_sine_template(pulse_points, polarity)
+        # Template is shared between detectors with the same configuration
+        self._template = _half_sine_template(pulse_points, polarity)
 
     @staticmethod
     def _build_half_sine_template(
@@ -99,6 +161,148 @@ class PulseDetector:
             h = -h
         return h / np.linalg.norm(h)  # unit energy
 
+    def _correlate_same(self, signal: np.ndarray) -> np.ndarray:
+        """Cross-correlate the signal with the template (``'same'`` length).
+
+        Equivalent to ``fftconvolve(signal, template[::-1], mode='same')``,
+        but the template spectrum comes from a process-wide LRU cache keyed
+        by ``(pulse_points, polarity, padded_length)``. Each call therefore
+        costs one forward and one inverse real FFT of the trace.
+
+        Parameters
+        ----------
+        signal : np.ndarray
+            Raw gauge trace (1D).
+
+        Returns
+        -------
+        np.ndarray
+            Correlation, same length as the signal.
+        """
+        signal = np.asarray(signal, dtype=float)
+        n_samples = len(signal)
+        full_length = n_samples + self.pulse_points - 1
+        padded_length = sp_fft.next_fast_len(full_length, True)
+
+        spectrum = _template_spectrum(self.pulse_points, self.polarity, padded_length)
+        full = sp_fft.irfft(sp_fft.rfft(signal, padded_length) * spectrum, padded_length)
+
+        start = (full_length - n_samples) // 2
+        return full[start:start + n_samples]
+
+    def _correlate(self, signal: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Correlate the signal with the template and estimate noise.
+
+        Parameters
+        ----------
+        signal : np.ndarray
+            Raw gauge trace (1D).
+
+        Returns
+        -------
+        Tuple[np.ndarray, float]
+            Matched-filter output (same length as signal) and its noise
+            standard deviation, estimated from the first 10% of samples.
+        """
+        corr = self._correlate_same(signal)
+        sigma = np.std(corr[:max(1, len(corr) // 10)])
+        return corr, sigma
+
+    def _isolate_peaks(
+        self,
+        peaks: np.ndarray,
+        last_peak: int | None = None
+    ) -> np.ndarray:
+        """Keep peaks separated by at least ``min_separation`` samples.
+
+        Greedy left-to-right selection: a peak is kept when it lies at least
+        ``min_separation`` after the previously kept one. Each step jumps
+        directly to the next candidate with ``searchsorted``, so the cost
+        scales with the number of kept peaks rather than with the number of
+        above-threshold samples.
+
+        Parameters
+        ----------
+        peaks : np.ndarray
+            Sorted indices of above-threshold samples.
+        last_peak : int, optional
+            Previously kept peak (streaming mode); candidates closer than
+            ``min_separation`` to it are skipped.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the isolated peaks.
+        """
+        selected = []
+        i = 0
+        if last_peak is not None:
+            i = int(np.searchsorted(peaks, last_peak + self.min_separation))
+        while i < peaks.size:
+            selected.append(i)
+            # max() keeps the scan moving when min_separation < 1
+            i = max(i + 1, int(np.searchsorted(peaks, peaks[i] + self.min_separation)))
+        return peaks[selected]
+
+    def _peaks_to_windows(
+        self,
+        peaks: np.ndarray,
+        n_samples: int
+    ) -> List[Tuple[int, int]]:
+        """Convert peak indices to (start_idx, end_idx) windows."""
+        half = self.pulse_points // 2
+        starts = np.maximum(0, peaks - half)
+        ends = np.minimum(n_samples, peaks + half)
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _detect_windows(
+        self,
+        signal: np.ndarray,
+        k_trials: Sequence[float],
+        debug: bool = False
+    ) -> Dict[float, List[Tuple[int, int]]]:
+        """Run the matched-filter detector for several thresholds at once.
+
+        The correlation and noise estimate do not depend on the threshold,
+        so they are computed once and only the thresholding and peak
+        isolation are repeated for each k_sigma.
+
+        Parameters
+        ----------
+        signal : np.ndarray
+            Raw gauge trace (1D).
+        k_trials : Sequence[float]
+            Detection thresholds (multiples of noise std).
+        debug : bool
+            Print diagnostics.
+
+        Returns
+        -------
+        Dict[float, List[Tuple[int, int]]]
+            Detected pulse windows for each k_sigma value.
+        """
+        corr, sigma = self._correlate(signal)
+
+        windows_by_k: Dict[float, List[Tuple[int, int]]] = {}
+        for k_sigma in k_trials:
+            thr = k_sigma * sigma
+            peaks = np.flatnonzero(corr > thr)
+
+            if debug:
+                logger.debug(
+                    f"Matched filter: k_sigma={k_sigma}, sigma={sigma:.2e}, "
+                    f"threshold={thr:.2e}, peaks={len(peaks)}"
+                )
+
+            windows = self._peaks_to_windows(self._isolate_peaks(peaks), len(signal))
+            if debug:
+                for start, end in windows:
+                    logger.debug(f"  Window: idx=({start},{end}), length={end-start}")
+
+            windows_by_k[k_sigma] = windows
+
+        return windows_by_k
+
     def _matched_filter(
         self,
         signal: np.ndarray,
@@ -121,37 +325,7 @@ class PulseDetector:
         List[Tuple[int, int]]
             Detected pulse windows as (start_idx, end_idx).
         """
-        # Correlate with template
-        corr = fftconvolve(signal, self._template[::-1], mode="same")
-
-        # Noise estimate from first 10% of signal
-        sigma = np.std(corr[:max(1, len(corr) // 10)])
-        thr = k_sigma * sigma
-        peaks = np.where(corr > thr)[0]
-
-        if debug:
-            logger.debug(f"Matched filter: sigma={sigma:.2e}, threshold={thr:.2e}, peaks={len(peaks)}")
-
-        if peaks.size == 0:
-            return []
-
-        # Keep isolated peaks only
-        peaks = np.sort(peaks)
-        selected = [peaks[0]]
-        for p in peaks[1:]:
-            if p - selected[-1] >= self.min_separation:
-                selected.append(p)
-
-        # Convert peaks to windows
-        windows = []
-        for pk in selected:
-            start = max(0, int(pk - self.pulse_points // 2))
-            end = min(len(signal), int(pk + self.pulse_points // 2))
-            windows.append((start, end))
-            if debug:
-                logger.debug(f"  Window: peak={pk}, idx=({start},{end}), length={end-start}")
-
-        return windows
+        return self._detect_windows(signal, (k_sigma,), debug=debug)[k_sigma]
 
     def find_window(
         self,
@@ -164,7 +338,9 @@ class PulseDetector:
         """Detect the best pulse window in the signal.
 
         Tries all k_sigma thresholds and selects the window with highest
-        amplitude (measured by metric) within the specified bounds.
+        amplitude (measured by metric) within the specified bounds. The
+        matched-filter correlation is computed once and shared by all
+        thresholds.
 
         Parameters
         ----------
@@ -189,16 +365,11 @@ class PulseDetector:
         RuntimeError
             If no valid window is found.
         """
-        windows_by_k: Dict[float, List[Tuple[int, int]]] = {}
-
-        # Run detector for all k_sigma values
-        for k in self.k_trials:
-            if debug:
-                logger.debug(f"find_window: trying k_sigma={k}")
-            win_list = self._matched_filter(signal, k, debug=debug)
-            windows_by_k[k] = win_list
-            if debug:
-                logger.debug(f"  Found {len(win_list)} window(s)")
+        # Run detector for all k_sigma values on a single correlation
+        windows_by_k = self._detect_windows(signal, self.k_trials, debug=debug)
+        if debug:
+            for k, win_list in windows_by_k.items():
+                logger.debug(f"find_window: k_sigma={k} found {len(win_list)} window(s)")
 
         # Select best window across all thresholds
         best_win = None
@@ -242,6 +413,328 @@ class PulseDetector:
 
         return best_win
 
+    # ------------------------------------------------------------------
+    # Streaming detection
+    # ------------------------------------------------------------------
+
+    def iter_windows(
+        self,
+        source: SignalSource,
+        n_samples: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        debug: bool = False
+    ) -> Iterator[Tuple[float, Tuple[int, int]]]:
+        """Detect pulse windows block by block with bounded memory.
+
+        Streaming counterpart of the matched filter used by
+        :meth:`find_window`. The correlation is computed with overlap-save,
+        so only one block of ``chunk_size`` samples (plus one template
+        length of history) is held in memory at a time. The source is read
+        twice: once over its first 10% to estimate the noise sigma, then in
+        full to report windows as soon as they are detected.
+
+        Parameters
+        ----------
+        source : np.ndarray, np.memmap or callable
+            Full gauge trace as a sliceable 1D array, or a zero-argument
+            callable returning a new iterator of 1D chunks on every call.
+        n_samples : int, optional
+            Total number of samples. Required when ``source`` is a callable.
+        chunk_size : int, default STREAM_CHUNK_SIZE
+            Samples per processing block.
+        debug : bool
+            Print diagnostics.
+
+        Yields
+        ------
+        Tuple[float, Tuple[int, int]]
+            ``(k_sigma, (start_idx, end_idx))`` for every detected window,
+            in increasing position for each threshold.
+        """
+        for k_sigma, window, _ in self._stream_windows(
+            source, n_samples, chunk_size, debug
+        ):
+            yield k_sigma, window
+
+    def find_window_streaming(
+        self,
+        source: SignalSource,
+        lower_bound: int | None = None,
+        upper_bound: int | None = None,
+        metric: Literal["median", "peak"] = "median",
+        n_samples: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        debug: bool = False
+    ) -> Tuple[int, int]:
+        """Detect the best pulse window without loading the whole trace.
+
+        Selects the same window as :meth:`find_window` on the equivalent
+        in-memory signal, using :meth:`iter_windows` for detection and
+        measuring each candidate's amplitude while its samples are still
+        in the current block.
+
+        Parameters
+        ----------
+        source : np.ndarray, np.memmap or callable
+            See :meth:`iter_windows`.
+        lower_bound : int, optional
+            Discard windows starting before this index.
+        upper_bound : int, optional
+            Discard windows ending after this index.
+        metric : {'median', 'peak'}, default 'median'
+            Amplitude measure for selection.
+        n_samples : int, optional
+            Total number of samples. Required when ``source`` is a callable.
+        chunk_size : int, default STREAM_CHUNK_SIZE
+            Samples per processing block.
+        debug : bool
+            Print diagnostics.
+
+        Returns
+        -------
+        Tuple[int, int]
+            Best (start_idx, end_idx) window.
+
+        Raises
+        ------
+        RuntimeError
+            If no valid window is found.
+        """
+        # Best candidate per threshold, then across thresholds in k_trials
+        # order, mirroring the selection order of find_window
+        best_by_k: Dict[float, Tuple[float, Tuple[int, int]]] = {}
+
+        for k_sigma, (s, e), seg in self._stream_windows(
+            source, n_samples, chunk_size, debug
+        ):
+            if lower_bound is not None and s < lower_bound:
+                continue
+            if upper_bound is not None and e > upper_bound:
+                continue
+
+            val = (
+                np.max(np.abs(seg)) if metric == "peak"
+                else np.median(np.abs(seg))
+            )
+            if k_sigma not in best_by_k or val > best_by_k[k_sigma][0]:
+                best_by_k[k_sigma] = (val, (s, e))
+
+        best_win = None
+        best_val = -np.inf
+        for k_sigma in dict.fromkeys(self.k_trials):
+            if k_sigma in best_by_k and best_by_k[k_sigma][0] > best_val:
+                best_val, best_win = best_by_k[k_sigma]
+
+        if best_win is None:
+            logger.error(
+                f"No pulse window found within bounds "
+                f"(lower={lower_bound}, upper={upper_bound})"
+            )
+            raise RuntimeError("No pulse window found within bounds")
+
+        if debug:
+            logger.debug(
+                f"Selected window (streaming): idx={best_win}, "
+                f"{metric}={best_val:.4e}"
+            )
+
+        return best_win
+
+    def _stream_windows(
+        self,
+        source: SignalSource,
+        n_samples: int | None,
+        chunk_size: int,
+        debug: bool
+    ) -> Iterator[Tuple[float, Tuple[int, int], np.ndarray]]:
+        """Yield ``(k_sigma, window, samples)`` for each streamed detection."""
+        n_samples, open_chunks = self._open_source(source, n_samples, chunk_size)
+        if n_samples == 0:
+            return
+
+        sigma = self._stream_noise_sigma(open_chunks, n_samples, chunk_size)
+        thresholds = {k: k * sigma for k in dict.fromkeys(self.k_trials)}
+        last_peaks: Dict[float, int | None] = dict.fromkeys(thresholds)
+
+        if debug:
+            logger.debug(
+                f"Streaming matched filter: n={n_samples}, sigma={sigma:.2e}, "
+                f"chunk_size={chunk_size}"
+            )
+
+        for offset, corr, raw, raw_offset in self._stream_correlation(
+            open_chunks(), n_samples, chunk_size
+        ):
+            for k_sigma, thr in thresholds.items():
+                peaks = np.flatnonzero(corr > thr) + offset
+                if peaks.size == 0:
+                    continue
+                peaks = self._isolate_peaks(peaks, last_peaks[k_sigma])
+                if peaks.size == 0:
+                    continue
+                last_peaks[k_sigma] = int(peaks[-1])
+
+                for start, end in self._peaks_to_windows(peaks, n_samples):
+                    if debug:
+                        logger.debug(
+                            f"  k_sigma={k_sigma}: window=({start},{end}), "
+                            f"length={end-start}"
+                        )
+                    yield (
+                        k_sigma,
+                        (start, end),
+                        raw[start - raw_offset:end - raw_offset],
+                    )
+
+    @staticmethod
+    def _open_source(
+        source: SignalSource,
+        n_samples: int | None,
+        chunk_size: int
+    ) -> Tuple[int, Callable[[], Iterator[np.ndarray]]]:
+        """Normalize a streaming source to ``(n_samples, chunk factory)``."""
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        if callable(source):
+            if n_samples is None:
+                raise ValueError("n_samples is required when source is a callable")
+
+            def open_chunks() -> Iterator[np.ndarray]:
+                return (np.asarray(c, dtype=float).ravel() for c in source())
+
+            return n_samples, open_chunks
+
+        total = len(source)
+        if n_samples is not None and n_samples != total:
+            raise ValueError(
+                f"n_samples={n_samples} does not match source length {total}"
+            )
+
+        def open_chunks() -> Iterator[np.ndarray]:
+            return (
+                np.asarray(source[i:i + chunk_size], dtype=float)
+                for i in range(0, total, chunk_size)
+            )
+
+        return total, open_chunks
+
+    def _stream_noise_sigma(
+        self,
+        open_chunks: Callable[[], Iterator[np.ndarray]],
+        n_samples: int,
+        chunk_size: int
+    ) -> float:
+        """Noise sigma of the first 10% of the correlation, block by block.
+
+        Block statistics are merged with the pairwise (Chan et al.) update,
+        matching ``np.std`` on the concatenated samples to rounding error.
+        """
+        n_noise = max(1, n_samples // 10)
+        count, mean, m2 = 0, 0.0, 0.0
+
+        for offset, corr, _, _ in self._stream_correlation(
+            open_chunks(), n_samples, chunk_size
+        ):
+            block = corr[:max(0, n_noise - offset)]
+            if block.size:
+                n_b = block.size
+                mean_b = block.mean()
+                m2_b = np.sum((block - mean_b) ** 2)
+                delta = mean_b - mean
+                total = count + n_b
+                mean += delta * n_b / total
+                m2 += m2_b + delta ** 2 * count * n_b / total
+                count = total
+            if offset + corr.size >= n_noise:
+                break
+
+        return float(np.sqrt(m2 / count))
+
+    def _stream_correlation(
+        self,
+        chunks: Iterable[np.ndarray],
+        n_samples: int,
+        block_size: int
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray, int]]:
+        """Overlap-save matched filter over a chunked signal.
+
+        Produces the same ``'same'``-mode correlation as
+        :meth:`_correlate_same`, in consecutive pieces. Each input block is
+        prefixed with the previous ``pulse_points - 1`` samples so the
+        circular FFT product contains only valid linear-correlation terms
+        for the block.
+
+        Yields
+        ------
+        Tuple[int, np.ndarray, np.ndarray, int]
+            ``(offset, corr, raw, raw_offset)``: correlation samples
+            starting at ``offset``, and raw samples starting at
+            ``raw_offset`` (zero-filled outside the signal) that cover every
+            window whose peak lies in ``corr``.
+        """
+        m = self.pulse_points
+        lag = (m - 1) // 2  # 'same' output j is full-correlation sample j + lag
+        nfft = sp_fft.next_fast_len(block_size + m - 1, True)
+        spectrum = _template_spectrum(m, self.polarity, nfft)
+
+        history = np.zeros(m - 1)
+        position = 0  # Global index of the first sample of the current block
+
+        for block in self._reblock(chunks, n_samples, lag, block_size):
+            seg = np.concatenate((history, block))
+            full = sp_fft.irfft(sp_fft.rfft(seg, nfft) * spectrum, nfft)
+            full = full[m - 1:m - 1 + block.size]
+
+            # Keep only 'same'-mode samples 0 <= j < n_samples
+            first = max(0, position - lag)
+            last = min(n_samples, position + block.size - lag)
+            if last > first:
+                corr = full[first + lag - position:last + lag - position]
+                yield first, corr, seg, position - (m - 1)
+
+            history = seg[seg.size - (m - 1):]
+            position += block.size
+
+    @staticmethod
+    def _reblock(
+        chunks: Iterable[np.ndarray],
+        n_samples: int,
+        n_trailing_zeros: int,
+        block_size: int
+    ) -> Iterator[np.ndarray]:
+        """Regroup chunks into ``block_size`` blocks, then append zeros.
+
+        The signal is truncated to ``n_samples`` and followed by
+        ``n_trailing_zeros`` zeros that flush the correlation tail.
+        """
+        def limited() -> Iterator[np.ndarray]:
+            remaining = n_samples
+            for chunk in chunks:
+                if remaining <= 0:
+                    break
+                chunk = chunk[:remaining]
+                remaining -= chunk.size
+                yield chunk
+            if remaining > 0:
+                raise ValueError(
+                    f"Source ended {remaining} samples before n_samples={n_samples}"
+                )
+
+        pending: List[np.ndarray] = []
+        filled = 0
+        for chunk in chain(limited(), [np.zeros(n_trailing_zeros)]):
+            while chunk.size:
+                take = min(block_size - filled, chunk.size)
+                pending.append(chunk[:take])
+                filled += take
+                chunk = chunk[take:]
+                if filled == block_size:
+                    yield np.concatenate(pending)
+                    pending, filled = [], 0
+        if filled:
+            yield np.concatenate(pending)
+
     def segment_and_center(
         self,
         signal: np.ndarray,
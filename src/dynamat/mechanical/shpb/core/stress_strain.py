@@ -24,7 +24,7 @@ Testing and Applications. Springer.
 from __future__ import annotations
 
 import logging
-from typing import Dict
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 from scipy.integrate import cumulative_trapezoid
@@ -32,6 +32,17 @@ from scipy.stats import pearsonr
 
 logger = logging.getLogger(__name__)
 
+# Target number of samples per block in batch methods; keeps the
+# intermediate arrays of one block cache-resident
+BATCH_BLOCK_ELEMENTS = 1 << 15
+
+# Keys returned by the equilibrium metric methods, in order
+EQUILIBRIUM_METRIC_KEYS = (
+    'FBC', 'SEQI', 'SOI', 'DSUF',
+    'windowed_FBC_loading', 'windowed_FBC_plateau', 'windowed_FBC_unloading',
+    'windowed_DSUF_loading', 'windowed_DSUF_plateau', 'windowed_DSUF_unloading',
+)
+
 
 class StressStrainCalculator:
     """Calculate stress-strain curves from aligned SHPB pulses.
@@ -109,6 +120,15 @@ class StressStrainCalculator:
     >>> displacement_3w = results['bar_displacement_3w']
     """
 
+    # Per-sample series returned by calculate() / calculate_batch(), in order
+    SERIES_KEYS = (
+        'incident', 'transmitted', 'reflected',
+        'bar_displacement_1w', 'bar_force_1w', 'strain_rate_1w', 'strain_1w',
+        'stress_1w', 'true_strain_rate_1w', 'true_strain_1w', 'true_stress_1w',
+        'bar_displacement_3w', 'bar_force_3w', 'strain_rate_3w', 'strain_3w',
+        'stress_3w', 'true_strain_rate_3w', 'true_strain_3w', 'true_stress_3w',
+    )
+
     def __init__(
         self,
         bar_area: float,
@@ -247,6 +267,137 @@ class StressStrainCalculator:
             logger.error(msg)
             raise ValueError(msg)
 
+        results = self.calculate_batch(
+            np.asarray(incident)[np.newaxis],
+            np.asarray(transmitted)[np.newaxis],
+            np.asarray(reflected)[np.newaxis],
+            time_vector
+        )
+
+        # Unstack the single test; scalars and the time axis pass through
+        return {
+            key: value[0] if key in self.SERIES_KEYS else value
+            for key, value in results.items()
+        }
+
+    def calculate_batch(
+        self,
+        incident: np.ndarray,
+        transmitted: np.ndarray,
+        reflected: np.ndarray,
+        time_vector: np.ndarray,
+        specimen_area: Union[float, np.ndarray, None] = None,
+        specimen_height: Union[float, np.ndarray, None] = None,
+        out: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Calculate stress-strain curves for many tests in one pass.
+
+        Vectorized form of :meth:`calculate` for stacked pulses sharing the
+        same bar setup. Every 1-wave and 3-wave series is computed once with
+        broadcasting over the test axis; row ``i`` of each result equals
+        ``calculate()`` on test ``i`` with that test's specimen geometry.
+
+        Parameters
+        ----------
+        incident, transmitted, reflected : np.ndarray
+            Aligned pulses, shape (n_tests, n_samples) (voltage if
+            use_voltage_input=True, else strain).
+        time_vector : np.ndarray
+            Time axis (ms), shape (n_samples,) shared by all tests or
+            (n_tests, n_samples).
+        specimen_area : float or np.ndarray, optional
+            Specimen cross-sectional area (mm²), scalar or shape (n_tests,).
+            Defaults to the calculator's specimen_area.
+        specimen_height : float or np.ndarray, optional
+            Initial specimen height (mm), scalar or shape (n_tests,).
+            Defaults to the calculator's specimen_height.
+        out : Dict[str, np.ndarray], optional
+            Preallocated float64 buffers of shape (n_tests, n_samples), keyed
+            like the returned series (any subset of SERIES_KEYS). Results are
+            written in place; missing keys are allocated.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Same keys as :meth:`calculate`, with (n_tests, n_samples)
+            arrays for every series in SERIES_KEYS.
+
+        Raises
+        ------
+        ValueError
+            If array shapes, geometry vectors or output buffers do not match.
+
+        Examples
+        --------
+        >>> calculator = StressStrainCalculator(...)
+        >>> results = calculator.calculate_batch(
+        ...     inc_stack, trs_stack, ref_stack, time,
+        ...     specimen_area=areas, specimen_height=heights
+        ... )
+        >>> stress_3w = results['stress_3w']  # (n_tests, n_samples)
+        """
+        incident = np.asarray(incident)
+        transmitted = np.asarray(transmitted)
+        reflected = np.asarray(reflected)
+        time_vector = np.asarray(time_vector)
+
+        shape = incident.shape
+        if (
+            incident.ndim != 2
+            or transmitted.shape != shape
+            or reflected.shape != shape
+            or time_vector.shape not in (shape, shape[1:])
+        ):
+            msg = (
+                f"Pulses must be stacked (n_tests, n_samples) arrays of equal "
+                f"shape with a matching time axis. Got: time={time_vector.shape}, "
+                f"incident={incident.shape}, transmitted={transmitted.shape}, "
+                f"reflected={reflected.shape}"
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+
+        n_tests = shape[0]
+        A_spec = self._per_test_value(specimen_area, self.specimen_area, n_tests, 'specimen_area')
+        L = self._per_test_value(specimen_height, self.specimen_height, n_tests, 'specimen_height')
+        buffers = self._output_buffers(out, shape)
+
+        # Process blocks of tests small enough for temporaries to stay in cache
+        rows = max(1, BATCH_BLOCK_ELEMENTS // max(1, shape[1]))
+        for i in range(0, n_tests, rows):
+            block = slice(i, i + rows)
+            self._calculate_rows(
+                incident[block], transmitted[block], reflected[block],
+                time_vector[block] if time_vector.ndim == 2 else time_vector,
+                A_spec[block] if np.ndim(A_spec) else A_spec,
+                L[block] if np.ndim(L) else L,
+                {key: buf[block] for key, buf in buffers.items()}
+            )
+
+        # First four entries: time, incident, transmitted, reflected (pulse
+        # windows), then all processed quantities for 1-wave and 3-wave
+        results = {'time': time_vector}
+        results.update((key, buffers[key]) for key in self.SERIES_KEYS)
+
+        # Propagated uncertainty scalars (dimensionless relative uncertainties)
+        # delta_sigma/sigma = delta_A/A; delta_epsilon/epsilon = delta_L/L
+        results['relative_uncertainty_stress'] = self.specimen_area_rel_uncertainty
+        results['relative_uncertainty_strain'] = self.specimen_height_rel_uncertainty
+        results['relative_uncertainty_strain_rate'] = self.specimen_height_rel_uncertainty
+
+        return results
+
+    def _calculate_rows(
+        self,
+        incident: np.ndarray,
+        transmitted: np.ndarray,
+        reflected: np.ndarray,
+        time_vector: np.ndarray,
+        A_spec: Union[float, np.ndarray],
+        L: Union[float, np.ndarray],
+        buffers: Dict[str, np.ndarray]
+    ) -> None:
+        """Compute every series for a block of tests into ``buffers``."""
         # Convert voltage to strain if needed
         if self.use_voltage_input:
             incident = self.voltage_to_strain(incident, self.incident_reflected_gauge_params)
@@ -254,104 +405,130 @@ class StressStrainCalculator:
             reflected = self.voltage_to_strain(reflected, self.incident_reflected_gauge_params)
 
         # Convert to dimensionless strain
-        incident_norm = incident / self.strain_scale_factor
-        transmitted_norm = transmitted / self.strain_scale_factor
-        reflected_norm = reflected / self.strain_scale_factor
+        incident_norm = np.divide(incident, self.strain_scale_factor, out=buffers['incident'])
+        transmitted_norm = np.divide(transmitted, self.strain_scale_factor, out=buffers['transmitted'])
+        reflected_norm = np.divide(reflected, self.strain_scale_factor, out=buffers['reflected'])
 
         # Common parameters
         c = self.bar_wave_speed
-        L = self.specimen_height
         E_bar = self.bar_elastic_modulus  # GPa
         A_bar = self.bar_area
-        A_spec = self.specimen_area
-
-        # ===== 1-WAVE ANALYSIS =====
-        # Bar displacement (mm)
-        bar_displacement_1w = c * transmitted_norm
 
-        # Bar force (N)
-        bar_force_1w = A_bar * E_bar  * transmitted_norm
+        # Wave combinations shared by several 3-wave quantities
+        inc_plus_ref = incident_norm + reflected_norm
+        inc_minus_ref_trs = incident_norm - reflected_norm - transmitted_norm
 
-        # Engineering strain rate (1/ms)
-        strain_rate_1w = (2 * c * reflected_norm) / L
+        # Each series is evaluated once, then made absolute in place
+        # (compressive convention); strain rates are converted to 1/s.
+        def finish(key, scale=None):
+            np.abs(buffers[key], out=buffers[key])
+            if scale is not None:
+                np.multiply(buffers[key], scale, out=buffers[key])
 
-        # True strain rate (1/ms)
-        true_strain_rate_1w = np.log(1 + strain_rate_1w)
+        # ===== 1-WAVE ANALYSIS =====
+        # Bar displacement (mm) and bar force (N)
+        np.multiply(c, transmitted_norm, out=buffers['bar_displacement_1w'])
+        finish('bar_displacement_1w')
+        np.multiply(A_bar * E_bar, transmitted_norm, out=buffers['bar_force_1w'])
+        finish('bar_force_1w')
+
+        # Engineering and true strain rate
+        np.divide(2 * c * reflected_norm, L, out=buffers['strain_rate_1w'])
+        np.log(1 + buffers['strain_rate_1w'], out=buffers['true_strain_rate_1w'])
+        finish('strain_rate_1w', 1000)
+        finish('true_strain_rate_1w', 1000)
 
         # Engineering strain (integrate strain rate)
-        strain_1w = ((2 * c) / L) * cumulative_trapezoid(reflected_norm, time_vector, initial=0)
+        np.multiply(
+            (2 * c) / L,
+            cumulative_trapezoid(reflected_norm, time_vector, axis=-1, initial=0),
+            out=buffers['strain_1w']
+        )
 
         # Engineering stress (MPa)
-        stress_1w = E_bar  * (A_bar / A_spec) * transmitted_norm
-
-        # True strain
-        true_strain_1w = np.log(1 + strain_1w)
+        np.multiply(E_bar * (A_bar / A_spec), transmitted_norm, out=buffers['stress_1w'])
 
-        # True stress (MPa) - uses strain_1w
-        true_stress_1w = stress_1w * (1 + strain_1w)
+        # True strain and true stress (MPa) - use strain_1w
+        np.log(1 + buffers['strain_1w'], out=buffers['true_strain_1w'])
+        np.multiply(buffers['stress_1w'], 1 + buffers['strain_1w'], out=buffers['true_stress_1w'])
+        for key in ('strain_1w', 'stress_1w', 'true_strain_1w', 'true_stress_1w'):
+            finish(key)
 
         # ===== 3-WAVE ANALYSIS =====
-        # Bar displacement (mm)
-        bar_displacement_3w = c * (incident_norm + reflected_norm)
-
-        # Bar force (N)
-        bar_force_3w = A_bar * E_bar  * (incident_norm + reflected_norm)
-
-        # Engineering strain rate (1/ms)
-        strain_rate_3w = (c / L) * (incident_norm - reflected_norm - transmitted_norm)
-
-        # True strain rate (1/ms)
-        true_strain_rate_3w = np.log(1 - strain_rate_3w)
+        # Bar displacement (mm) and bar force (N)
+        np.multiply(c, inc_plus_ref, out=buffers['bar_displacement_3w'])
+        finish('bar_displacement_3w')
+        np.multiply(A_bar * E_bar, inc_plus_ref, out=buffers['bar_force_3w'])
+        finish('bar_force_3w')
+
+        # Engineering and true strain rate
+        np.multiply(c / L, inc_minus_ref_trs, out=buffers['strain_rate_3w'])
+        np.log(1 - buffers['strain_rate_3w'], out=buffers['true_strain_rate_3w'])
+        finish('strain_rate_3w', 1000)
+        finish('true_strain_rate_3w', 1000)
 
         # Engineering strain (integrate strain rate)
-        strain_3w = (c / L) * cumulative_trapezoid(
-            (incident_norm - reflected_norm - transmitted_norm),
-            time_vector,
-            initial=0
+        np.multiply(
+            c / L,
+            cumulative_trapezoid(inc_minus_ref_trs, time_vector, axis=-1, initial=0),
+            out=buffers['strain_3w']
         )
 
         # Engineering stress (MPa)
-        stress_3w = E_bar  * (A_bar / A_spec) * (incident_norm + reflected_norm)
-
-        # True strain
-        true_strain_3w = np.log(1 + strain_3w)
-
-        # True stress (MPa) - uses strain_3w
-        true_stress_3w = stress_3w * (1 + strain_3w)
-
-        # Return all results in a single flat dictionary with absolute values
-        # First four columns: time, incident, transmitted, reflected (pulse windows)
-        # Then all processed quantities for 1-wave and 3-wave analyses
-        results = {
-            'time': time_vector,
-            'incident': incident_norm,
-            'transmitted': transmitted_norm,
-            'reflected': reflected_norm,
-            'bar_displacement_1w': np.abs(bar_displacement_1w),
-            'bar_force_1w': np.abs(bar_force_1w),
-            'strain_rate_1w': np.abs(strain_rate_1w) * 1000,
-            'strain_1w': np.abs(strain_1w),
-            'stress_1w': np.abs(stress_1w),
-            'true_strain_rate_1w': np.abs(true_strain_rate_1w) *1000,
-            'true_strain_1w': np.abs(true_strain_1w),
-            'true_stress_1w': np.abs(true_stress_1w),
-            'bar_displacement_3w': np.abs(bar_displacement_3w),
-            'bar_force_3w': np.abs(bar_force_3w),
-            'strain_rate_3w': np.abs(strain_rate_3w) * 1000,
-            'strain_3w': np.abs(strain_3w),
-            'stress_3w': np.abs(stress_3w),
-            'true_strain_rate_3w': np.abs(true_strain_rate_3w) * 1000,
-            'true_strain_3w': np.abs(true_strain_3w),
-            'true_stress_3w': np.abs(true_stress_3w),
-        }
+        np.multiply(E_bar * (A_bar / A_spec), inc_plus_ref, out=buffers['stress_3w'])
+
+        # True strain and true stress (MPa) - use strain_3w
+        np.log(1 + buffers['strain_3w'], out=buffers['true_strain_3w'])
+        np.multiply(buffers['stress_3w'], 1 + buffers['strain_3w'], out=buffers['true_stress_3w'])
+        for key in ('strain_3w', 'stress_3w', 'true_strain_3w', 'true_stress_3w'):
+            finish(key)
+
+    @staticmethod
+    def _per_test_value(
+        value: Union[float, np.ndarray, None],
+        default: float,
+        n_tests: int,
+        name: str
+    ) -> Union[float, np.ndarray]:
+        """Return a scalar or an (n_tests, 1) column for broadcasting."""
+        if value is None:
+            return default
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 0:
+            return float(value)
+        if value.shape != (n_tests,):
+            msg = f"{name} must be a scalar or have shape ({n_tests},), got {value.shape}"
+            logger.error(msg)
+            raise ValueError(msg)
+        return value[:, np.newaxis]
 
-        # Propagated uncertainty scalars (dimensionless relative uncertainties)
-        # delta_sigma/sigma = delta_A/A; delta_epsilon/epsilon = delta_L/L
-        results['relative_uncertainty_stress'] = self.specimen_area_rel_uncertainty
-        results['relative_uncertainty_strain'] = self.specimen_height_rel_uncertainty
-        results['relative_uncertainty_strain_rate'] = self.specimen_height_rel_uncertainty
+    def _output_buffers(
+        self,
+        out: Optional[Dict[str, np.ndarray]],
+        shape: Tuple[int, int]
+    ) -> Dict[str, np.ndarray]:
+        """Validate caller-provided buffers and allocate the missing ones."""
+        out = out or {}
+        unknown = set(out) - set(self.SERIES_KEYS)
+        if unknown:
+            msg = f"Unknown output buffer keys: {sorted(unknown)}"
+            logger.error(msg)
+            raise ValueError(msg)
 
-        return results
+        buffers = {}
+        for key in self.SERIES_KEYS:
+            buf = out.get(key)
+            if buf is None:
+                buf = np.empty(shape)
+            elif buf.shape != shape or buf.dtype != np.float64:
+                msg = (
+                    f"Output buffer '{key}' must be float64 with shape {shape}, "
+                    f"got {buf.dtype} {buf.shape}"
+                )
+                logger.error(msg)
+                raise ValueError(msg)
+            buffers[key] = buf
+        return buffers
 
     def _normalize_inputs(
         self,
@@ -670,6 +847,190 @@ class StressStrainCalculator:
         Chen, W. W., & Song, B. (2011). Split Hopkinson (Kolsky) Bar: Design,
         Testing and Applications. Springer.
         """
+        metrics = self.calculate_equilibrium_metrics_batch({
+            key: np.asarray(results[key])[np.newaxis]
+            for key in ('stress_1w', 'stress_3w', 'bar_force_1w', 'bar_force_3w')
+        })
+        return {key: float(values[0]) for key, values in metrics.items()}
+
+    def calculate_equilibrium_metrics_batch(
+        self,
+        results: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Calculate equilibrium metrics for a batch of tests in one sweep.
+
+        Fused form of :meth:`calculate_equilibrium_metrics`. Phase
+        boundaries (valid threshold, 50%/80% of peak stress, peak index)
+        are computed first; every metric is then derived from per-phase
+        sums (count, force ratio, first and second moments of both
+        stresses) that a single matrix product accumulates for all phases
+        at once. Pearson correlations are evaluated from moments about
+        half the peak stress, which agrees with the two-pass reference to
+        rounding error.
+
+        Parameters
+        ----------
+        results : Dict[str, np.ndarray]
+            Dictionary from :meth:`calculate_batch` (or any mapping with
+            'stress_1w', 'stress_3w', 'bar_force_1w' and 'bar_force_3w'
+            arrays of shape (n_tests, n_samples)).
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Same keys as :meth:`calculate_equilibrium_metrics`, each an
+            array of shape (n_tests,). Tests without valid data get NaN.
+        """
+        stress_1w = np.atleast_2d(results['stress_1w'])
+        stress_3w = np.atleast_2d(results['stress_3w'])
+        bar_force_1w = np.atleast_2d(results['bar_force_1w'])
+        bar_force_3w = np.atleast_2d(results['bar_force_3w'])
+
+        n_tests, n_samples = stress_3w.shape
+        metrics = {key: np.full(n_tests, np.nan) for key in EQUILIBRIUM_METRIC_KEYS}
+
+        # Process blocks of tests small enough for temporaries to stay in cache
+        rows = max(1, BATCH_BLOCK_ELEMENTS // max(1, n_samples))
+        for i in range(0, n_tests, rows):
+            block = slice(i, i + rows)
+            self._equilibrium_metrics_rows(
+                stress_1w[block], stress_3w[block],
+                bar_force_1w[block], bar_force_3w[block],
+                {key: values[block] for key, values in metrics.items()}
+            )
+
+        return metrics
+
+    @staticmethod
+    def _equilibrium_metrics_rows(
+        stress_1w: np.ndarray,
+        stress_3w: np.ndarray,
+        bar_force_1w: np.ndarray,
+        bar_force_3w: np.ndarray,
+        out: Dict[str, np.ndarray]
+    ) -> None:
+        """Fill ``out`` with the equilibrium metrics of a block of tests."""
+        n_samples = stress_3w.shape[1]
+
+        # ----- Phase boundaries -----
+        peak_stress = np.max(stress_3w, axis=1, keepdims=True)
+        peak_idx = np.argmax(stress_3w, axis=1)[:, np.newaxis]
+        stress_threshold = 0.01 * peak_stress  # 1% of peak
+        valid = (stress_3w > stress_threshold) & (stress_1w > stress_threshold)
+
+        half_peak = 0.5 * peak_stress
+        loading = valid & (stress_3w < half_peak)
+        plateau = valid & (stress_3w >= half_peak)
+        plateau_high = valid & (stress_3w >= 0.8 * peak_stress)
+        unloading = valid & (np.arange(n_samples) > peak_idx)
+
+        # ----- Per-sample quantities, one row per accumulated sum -----
+        n_tests = stress_3w.shape[0]
+        quantities = np.empty((n_tests, 8, n_samples))
+        count_q, ratio_q, x, y, xx, yy, xy, dd = np.moveaxis(quantities, 1, 0)
+        count_q.fill(1.0)
+        np.divide(
+            np.abs(bar_force_3w - bar_force_1w),
+            np.maximum(bar_force_3w, bar_force_1w) + 1e-10,
+            out=ratio_q
+        )
+        np.subtract(stress_1w, half_peak, out=x)
+        np.subtract(stress_3w, half_peak, out=y)
+        np.multiply(x, x, out=xx)
+        np.multiply(y, y, out=yy)
+        np.multiply(x, y, out=xy)
+        np.subtract(stress_3w, stress_1w, out=dd)
+        np.multiply(dd, dd, out=dd)
+        # Non-finite samples outside the valid region must not reach the sums
+        np.copyto(quantities, 0.0, where=~valid[:, np.newaxis, :])
+
+        phases = np.empty((n_tests, 4, n_samples))
+        for column, mask in enumerate((loading, plateau, unloading, plateau_high)):
+            phases[:, column] = mask
+
+        # One sweep: sums[test, quantity, phase]
+        sums = np.matmul(quantities, phases.transpose(0, 2, 1))
+        count, ratio, sx, sy, sxx, syy, sxy, sdd = np.moveaxis(sums, 1, 0)
+
+        def pearson_r2(n, sx, sy, sxx, syy, sxy):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                var_x = sxx - sx * sx / n
+                var_y = syy - sy * sy / n
+                r = (sxy - sx * sy / n) / np.sqrt(var_x * var_y)
+            # Constant input (zero variance up to rounding) has no correlation
+            eps = np.finfo(float).eps
+            constant = (var_x <= n * eps * sxx) | (var_y <= n * eps * syy)
+            return np.where((n >= 2) & ~constant, np.clip(r, -1.0, 1.0) ** 2, np.nan)
+
+        # Columns: loading, plateau, unloading, plateau_high; the valid
+        # region is the disjoint union of loading and plateau
+        phase_cols = slice(0, 3)
+        n_valid = count[:, 0] + count[:, 1]
+        has_valid = n_valid > 0
+
+        def valid_sum(q):
+            return q[:, 0] + q[:, 1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # ===== METRIC 1: Force Balance Coefficient (FBC) =====
+            fbc = 1.0 - valid_sum(ratio) / n_valid
+
+            # ===== METRIC 2: Stress Equilibrium Quality Index (SEQI) =====
+            rmse = np.sqrt(valid_sum(sdd) / n_valid)
+            stress_range = (
+                np.max(np.where(valid, stress_3w, -np.inf), axis=1)
+                - np.min(np.where(valid, stress_3w, np.inf), axis=1)
+            )
+            seqi = np.exp(-(rmse / (stress_range + 1e-10)))
+
+            # ===== METRIC 3: Time-Windowed Analysis =====
+            enough = count[:, phase_cols] >= 3
+            phase_fbc = np.where(
+                enough, 1.0 - ratio[:, phase_cols] / count[:, phase_cols], np.nan
+            )
+            phase_dsuf = np.where(enough, pearson_r2(
+                count[:, phase_cols], sx[:, phase_cols], sy[:, phase_cols],
+                sxx[:, phase_cols], syy[:, phase_cols], sxy[:, phase_cols]
+            ), np.nan)
+
+            # ===== METRIC 4: Stress Oscillation Index (SOI) =====
+            n_high = count[:, 3]
+            mean_high = sy[:, 3] / n_high
+            std_high = np.sqrt(np.maximum(syy[:, 3] / n_high - mean_high ** 2, 0.0))
+            soi = np.where(
+                n_high > 2,
+                std_high / (mean_high + half_peak[:, 0] + 1e-10),
+                np.nan
+            )
+
+            # ===== METRIC 5: Dynamic Stress Uniformity Factor (DSUF) =====
+            dsuf = pearson_r2(
+                n_valid, valid_sum(sx), valid_sum(sy),
+                valid_sum(sxx), valid_sum(syy), valid_sum(sxy)
+            )
+
+        values = {
+            'FBC': fbc,
+            'SEQI': seqi,
+            'SOI': soi,
+            'DSUF': dsuf,
+            'windowed_FBC_loading': phase_fbc[:, 0],
+            'windowed_FBC_plateau': phase_fbc[:, 1],
+            'windowed_FBC_unloading': phase_fbc[:, 2],
+            'windowed_DSUF_loading': phase_dsuf[:, 0],
+            'windowed_DSUF_plateau': phase_dsuf[:, 1],
+            'windowed_DSUF_unloading': phase_dsuf[:, 2],
+        }
+        for key, value in values.items():
+            out[key][...] = np.where(has_valid, value, np.nan)
+
+    def _equilibrium_metrics_reference(self, results: Dict[str, np.ndarray]) -> Dict[str, float]:
+        """Equilibrium metrics computed with separate masked passes.
+
+        Reference implementation of :meth:`calculate_equilibrium_metrics`;
+        it rebuilds masks and force ratios for every metric and is kept for
+        verification and benchmarking.
+        """
         # Extract required data
         stress_1w = results['stress_1w']
         stress_3w = results['stress_3w']
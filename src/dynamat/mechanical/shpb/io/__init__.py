@@ -15,6 +15,7 @@ Extracted modules:
 - rdf_helpers: Type conversion utilities for RDF Literals
 - validity_assessment: ValidityAssessor for test quality assessment
 - series_config: SERIES_METADATA constant and DataSeriesBuilder class
+- series_storage: CSV/NPZ reading and writing of raw and processed series files
 """
 
 from .specimen_loader import SpecimenLoader
@@ -27,6 +28,7 @@ from .state_instances import StateToInstancesConverter
 from .rdf_helpers import ensure_typed_literal, apply_type_conversion_to_dict
 from .validity_assessment import ValidityAssessor
 from .series_config import SERIES_METADATA, DataSeriesBuilder
+from .series_storage import SERIES_FILE_FORMATS, load_series_table, save_series_table
 from .form_conversion import FormDataConverter
 
 __all__ = [
@@ -44,4 +46,7 @@ __all__ = [
     'ValidityAssessor',
     'SERIES_METADATA',
     'DataSeriesBuilder',
+    'SERIES_FILE_FORMATS',
+    'load_series_table',
+    'save_series_table',
 ]
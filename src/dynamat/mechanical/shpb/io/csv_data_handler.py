@@ -10,6 +10,8 @@ from typing import Dict, List
 import pandas as pd
 import numpy as np
 
+from .series_storage import normalize_series_format, save_series_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -219,26 +221,68 @@ class CSVDataHandler:
             logger.error(f"Failed to save CSV to {output_path}: {e}")
             raise IOError(f"Could not save CSV file: {e}") from e
 
-    def get_file_metadata_for_saving(self) -> Dict[str, any]:
+    def save(self, output_path: Path, file_format: str = 'csv'):
+        """
+        Save DataFrame in the given series file format.
+
+        Args:
+            output_path: Path where the file will be saved
+            file_format: 'csv' (see save_to_csv) or 'npz' (lossless binary)
+
+        Raises:
+            ValueError: If the format is not supported
+            IOError: If file cannot be written
+
+        Example:
+            >>> handler.save(Path('data/raw_signals.npz'), file_format='npz')
+        """
+        fmt = normalize_series_format(file_format)
+        if fmt == 'csv':
+            self.save_to_csv(output_path)
+            return
+
+        try:
+            save_series_table(self.data, output_path, fmt)
+            logger.info(
+                f"DataFrame saved to {output_path} "
+                f"({len(self.data)} rows, {output_path.stat().st_size} bytes)"
+            )
+        except Exception as e:
+            logger.error(f"Failed to save {fmt.upper()} to {output_path}: {e}")
+            raise IOError(f"Could not save {fmt.upper()} file: {e}") from e
+
+    def get_file_metadata_for_saving(self, file_format: str = 'csv') -> Dict[str, any]:
         """
         Get metadata dictionary for creating AnalysisFile instance.
 
         Returns metadata that will be used when creating the AnalysisFile
         RDF instance.
 
+        Args:
+            file_format: Format the file is saved in ('csv' or 'npz')
+
         Returns:
             Dict with file format metadata:
-            - delimiter: ','
-            - encoding: 'UTF-8'
-            - has_header: True
+            - delimiter: ',' (None for binary formats)
+            - encoding: 'UTF-8' (None for binary formats)
+            - has_header: True (column names are stored)
             - skip_rows: 0
-            - file_format: 'CSV'
+            - file_format: 'CSV' or 'NPZ'
 
         Example:
             >>> metadata = handler.get_file_metadata_for_saving()
             >>> metadata['delimiter']
             ','
         """
+        fmt = normalize_series_format(file_format)
+        if fmt != 'csv':
+            return {
+                'delimiter': None,
+                'encoding': None,
+                'has_header': True,
+                'skip_rows': 0,
+                'file_format': fmt.upper()
+            }
         return {
             'delimiter': ',',
             'encoding': 'UTF-8',
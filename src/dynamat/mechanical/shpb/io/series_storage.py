@@ -0,0 +1,142 @@
+"""
+Series Storage for SHPB Raw and Processed Data
+
+Reads and writes tables of equal-length signal columns (raw gauge traces,
+processed stress-strain results) in one of the supported file formats:
+
+- csv: comma-separated text with a header row (human readable, lossy)
+- npz: NumPy archive with one float64 array per column (binary, lossless)
+
+The format is recorded on the AnalysisFile instance (dyn:hasFileFormat) and
+readers detect it from that value or from the file suffix.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Supported series file formats (lowercase, as stored in dyn:hasFileFormat)
+SERIES_FILE_FORMATS = ('csv', 'npz')
+
+
+def normalize_series_format(file_format: str) -> str:
+    """
+    Validate a series file format name and return its canonical form.
+
+    Args:
+        file_format: Format name, case-insensitive (e.g. 'CSV', 'npz')
+
+    Returns:
+        Lowercase format name from SERIES_FILE_FORMATS
+
+    Raises:
+        ValueError: If the format is not supported
+
+    Example:
+        >>> normalize_series_format('NPZ')
+        'npz'
+    """
+    fmt = str(file_format).lower().lstrip('.')
+    if fmt not in SERIES_FILE_FORMATS:
+        raise ValueError(
+            f"Unsupported series file format '{file_format}'. "
+            f"Supported: {SERIES_FILE_FORMATS}"
+        )
+    return fmt
+
+
+def detect_series_format(path: Path, declared_format: Optional[str] = None) -> str:
+    """
+    Determine the format of a series file.
+
+    The declared format (dyn:hasFileFormat) takes precedence when it names a
+    supported format; otherwise the file suffix decides. Unknown suffixes
+    are read as CSV, matching the historical behavior of the readers.
+
+    Args:
+        path: Path to the series file
+        declared_format: Format recorded in the AnalysisFile metadata, if any
+
+    Returns:
+        Format name from SERIES_FILE_FORMATS
+    """
+    for candidate in (declared_format, Path(path).suffix):
+        if candidate:
+            fmt = str(candidate).lower().lstrip('.')
+            if fmt in SERIES_FILE_FORMATS:
+                return fmt
+    return 'csv'
+
+
+def save_series_table(
+    data: Union[pd.DataFrame, Mapping[str, np.ndarray]],
+    output_path: Path,
+    file_format: str = 'csv',
+    float_format: str = '%.6e'
+) -> Path:
+    """
+    Save a table of signal columns.
+
+    Scalars in a dictionary are broadcast to full columns, exactly as
+    ``pd.DataFrame(data)`` does for the CSV format, so both formats store
+    the same columns.
+
+    Args:
+        data: DataFrame or dict of column name -> array/scalar
+        output_path: Destination file path (suffix should match the format)
+        file_format: One of SERIES_FILE_FORMATS
+        float_format: printf-style float format (CSV only)
+
+    Returns:
+        Path of the written file
+
+    Example:
+        >>> save_series_table(results, Path('processed/TEST_001_processed.npz'), 'npz')
+    """
+    fmt = normalize_series_format(file_format)
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == 'npz':
+        # Write through a file handle so numpy does not alter the suffix
+        with open(output_path, 'wb') as f:
+            np.savez(f, **{str(col): df[col].to_numpy() for col in df.columns})
+    else:
+        df.to_csv(output_path, index=False, float_format=float_format)
+
+    logger.debug(
+        f"Saved {fmt.upper()} series file: {output_path} "
+        f"({len(df)} rows, {len(df.columns)} columns)"
+    )
+    return output_path
+
+
+def load_series_table(path: Path, file_format: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load a table of signal columns saved by save_series_table().
+
+    Args:
+        path: Path to the series file
+        file_format: Declared format (e.g. from dyn:hasFileFormat); detected
+            from the suffix when None or unsupported
+
+    Returns:
+        DataFrame with one column per stored series, in saved order
+
+    Example:
+        >>> df = load_series_table(Path('processed/TEST_001_processed.npz'))
+        >>> df['stress_1w'].values
+    """
+    fmt = detect_series_format(path, file_format)
+
+    if fmt == 'npz':
+        with np.load(path, allow_pickle=False) as archive:
+            columns: Dict[str, np.ndarray] = {name: archive[name] for name in archive.files}
+        return pd.DataFrame(columns)
+
+    return pd.read_csv(path)
@@ -21,6 +21,7 @@ from dynamat.config import config
 
 from .test_metadata import SHPBTestMetadata
 from .csv_data_handler import CSVDataHandler
+from .series_storage import normalize_series_format, save_series_table
 from .state_instances import StateToInstancesConverter
 
 # Type hints only - avoid circular import at runtime
@@ -40,7 +41,7 @@ class SHPBTestWriter:
 
     Workflow:
     1. Validate metadata and DataFrame
-    2. Save CSV file
+    2. Save raw data file (CSV or NPZ, see series_format)
     3. Create AnalysisFile instance
     4. Create DataSeries instances (time, incident, transmitted)
     5. Create processing instances (windows, shifts, params, metrics) via batch
@@ -63,19 +64,27 @@ class SHPBTestWriter:
         >>> test_path, validation = writer.ingest_test(metadata, raw_df)
     """
 
-    def __init__(self, ontology_manager, qudt_manager=None):
+    def __init__(self, ontology_manager, qudt_manager=None, series_format: Optional[str] = None):
         """
         Initialize SHPB test writer.
 
         Args:
             ontology_manager: OntologyManager instance
             qudt_manager: QUDTManager for unit conversions
+            series_format: File format for raw/processed series ('csv' or 'npz').
+                Defaults to config.SERIES_FILE_FORMAT.
+
+        Raises:
+            ValueError: If series_format is not supported
         """
         # Lazy import to avoid circular dependency
         from dynamat.gui.parsers.instance_writer import InstanceWriter
 
         self.ontology_manager = ontology_manager
         self.qudt_manager = qudt_manager
+        self.series_format = normalize_series_format(
+            series_format or config.SERIES_FILE_FORMAT
+        )
         self.instance_writer = InstanceWriter(ontology_manager, qudt_manager)
 
         logger.info("SHPBTestWriter initialized (simplified architecture)")
@@ -207,9 +216,9 @@ class SHPBTestWriter:
             self._create_directory_structure(specimen_dir)
 
             test_id_clean = state.test_id.replace('-', '_')
-            raw_filename = f"{test_id_clean}_raw.csv"
+            raw_filename = f"{test_id_clean}_raw.{self.series_format}"
             csv_path = specimen_dir / 'raw' / raw_filename
-            csv_handler.save_to_csv(csv_path)
+            csv_handler.save(csv_path, self.series_format)
 
             processed_csv_path = None
             if processed_results is not None:
@@ -220,7 +229,8 @@ class SHPBTestWriter:
             # Step 3: Build all instances from state
             converter = StateToInstancesConverter()
             all_instances = converter.build_all_instances(
-                state, raw_data_df, processed_results
+                state, raw_data_df, processed_results,
+                processed_file_format=self.series_format
             )
 
             # Step 4: Save to TTL
@@ -312,7 +322,7 @@ class SHPBTestWriter:
         csv_handler: CSVDataHandler
     ) -> Path:
         """
-        Save DataFrame to CSV in raw/ subdirectory.
+        Save DataFrame to raw/ subdirectory in the writer's series format.
 
         Args:
             test_metadata: Test metadata
@@ -320,12 +330,12 @@ class SHPBTestWriter:
             csv_handler: CSVDataHandler with validated DataFrame
 
         Returns:
-            Path to saved CSV file
+            Path to saved raw data file
         """
-        filename = f"{test_metadata.test_id.replace('-', '_')}_raw.csv"
+        filename = f"{test_metadata.test_id.replace('-', '_')}_raw.{self.series_format}"
         csv_path = specimen_dir / 'raw' / filename
-        csv_handler.save_to_csv(csv_path)
-        logger.debug(f"Saved CSV: {csv_path}")
+        csv_handler.save(csv_path, self.series_format)
+        logger.debug(f"Saved raw data file: {csv_path}")
         return csv_path
 
     def _save_processed_csv(
@@ -335,7 +345,10 @@ class SHPBTestWriter:
         test_id: str
     ) -> Path:
         """
-        Save processed results dictionary to CSV in processed/ subdirectory.
+        Save processed results dictionary to processed/ subdirectory.
+
+        Uses the writer's series format; CSV output keeps scientific notation
+        ('%.6e'), NPZ output stores full float64 precision.
 
         Args:
             results: Dictionary from StressStrainCalculator.calculate()
@@ -343,19 +356,15 @@ class SHPBTestWriter:
             test_id: Test ID
 
         Returns:
-            Path to saved CSV file
+            Path to saved processed data file
         """
-        # Create DataFrame from results dictionary
-        processed_df = pd.DataFrame(results)
-
         # Define filename and path
-        filename = f"{test_id.replace('-', '_')}_processed.csv"
+        filename = f"{test_id.replace('-', '_')}_processed.{self.series_format}"
         csv_path = specimen_dir / 'processed' / filename
 
-        # Save with scientific notation for precision
-        processed_df.to_csv(csv_path, index=False, float_format='%.6e')
+        save_series_table(results, csv_path, self.series_format, float_format='%.6e')
 
-        logger.debug(f"Saved processed CSV: {csv_path} ({len(processed_df)} rows, {len(results)} columns)")
+        logger.debug(f"Saved processed data file: {csv_path} ({len(results)} columns)")
         return csv_path
 
     def _build_all_instances(
@@ -392,7 +401,7 @@ class SHPBTestWriter:
 
         # === ANALYSIS FILE ===
         file_size = csv_path.stat().st_size
-        file_metadata = csv_handler.get_file_metadata_for_saving()
+        file_metadata = csv_handler.get_file_metadata_for_saving(self.series_format)
 
         # Get data point count and column count from DataFrame
         data_point_count = len(csv_handler.data)
@@ -400,7 +409,7 @@ class SHPBTestWriter:
 
         analysis_file_form = SHPBTestMetadata._apply_type_conversion_to_dict({
             'dyn:hasFilePath': str(csv_path.relative_to(csv_path.parent.parent)),
-            'dyn:hasFileFormat': 'csv',
+            'dyn:hasFileFormat': file_metadata['file_format'].lower(),
             'dyn:hasFileSize': file_size,
             'dyn:hasDataPointCount': data_point_count,
             'dyn:hasColumnCount': column_count,
@@ -467,7 +476,7 @@ class SHPBTestWriter:
             file_size = processed_csv_path.stat().st_size
             processed_file_form = SHPBTestMetadata._apply_type_conversion_to_dict({
                 'dyn:hasFilePath': str(processed_csv_path.relative_to(processed_csv_path.parent.parent)),
-                'dyn:hasFileFormat': 'csv',
+                'dyn:hasFileFormat': self.series_format,
                 'dyn:hasFileSize': file_size,
                 'dyn:hasDataPointCount': len(next(iter(processed_results.values()))),
                 'dyn:hasColumnCount': len(processed_results),
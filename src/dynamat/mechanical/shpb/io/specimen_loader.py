@@ -4,13 +4,30 @@ Reusable class for loading and querying specimen data from RDF graphs
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from decimal import Decimal
 
+from dynamat.ontology.core.ontology_loader import parse_ttl_file
+from dynamat.ontology.core.parallel import parallel_map_files
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_specimen_file(ttl_file: Path) -> Tuple[List[tuple], List[Tuple[str, str]], Optional[str]]:
+    """
+    Process-pool entry point: parse one specimen TTL file.
+
+    Returns:
+        Tuple of (triples, namespace bindings, error message or None)
+    """
+    try:
+        triples, bindings = parse_ttl_file(ttl_file)
+        return triples, bindings, None
+    except Exception as e:
+        return [], [], str(e)
+
+
 class SpecimenLoader:
     """
     High-level interface for loading and querying specimen data.
@@ -50,12 +67,21 @@ class SpecimenLoader:
 
         logger.info("SpecimenLoader initialized")
 
-    def load_specimen_files(self, specimens_dir: Optional[Path] = None) -> int:
+    def load_specimen_files(self, specimens_dir: Optional[Path] = None,
+                            max_workers: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
         """
         Load specimen TTL files from the specimens directory into the RDF graph.
 
+        Files are parsed independently of the shared graph (in a process pool
+        when max_workers > 1 and there are enough files) and their triples
+        are added in one batch under the SPARQL lock.
+
         Args:
             specimens_dir: Path to specimens directory (defaults to config.SPECIMENS_DIR)
+            max_workers: Parser processes; 1 parses serially, 0 uses one per
+                CPU (defaults to config.INSTANCE_SCAN_WORKERS)
+            progress_callback: Called with (files parsed, files total)
 
         Returns:
             Number of specimen files successfully loaded
@@ -64,25 +90,44 @@ class SpecimenLoader:
 
         if specimens_dir is None:
             specimens_dir = config.SPECIMENS_DIR
+        if max_workers is None:
+            max_workers = getattr(config, 'INSTANCE_SCAN_WORKERS', 1)
 
         if not specimens_dir.exists():
             logger.warning(f"Specimens directory not found: {specimens_dir}")
             return 0
 
-        files_loaded = 0
-
         logger.info(f"Loading specimen files from: {specimens_dir}")
 
-        for specimen_folder in specimens_dir.iterdir():
-            if specimen_folder.is_dir():
-                # Each specimen has its own folder with TTL files
-                for ttl_file in specimen_folder.glob("*.ttl"):
-                    try:
-                        self.ontology_manager.loader.graph.parse(ttl_file, format="turtle")
-                        logger.debug(f"Loaded: {ttl_file.name}")
-                        files_loaded += 1
-                    except Exception as e:
-                        logger.error(f"Error loading {ttl_file.name}: {e}")
+        # Each specimen has its own folder with TTL files
+        ttl_files = [
+            ttl_file
+            for specimen_folder in specimens_dir.iterdir() if specimen_folder.is_dir()
+            for ttl_file in specimen_folder.glob("*.ttl")
+        ]
+
+        files_loaded = 0
+        triples: List[tuple] = []
+        bindings = set()
+        for done, (ttl_file, (file_triples, file_bindings, error)) in enumerate(
+            zip(ttl_files, parallel_map_files(_parse_specimen_file, ttl_files, max_workers)),
+            start=1
+        ):
+            if error is None:
+                triples.extend(file_triples)
+                bindings.update(file_bindings)
+                logger.debug(f"Loaded: {ttl_file.name}")
+                files_loaded += 1
+            else:
+                logger.error(f"Error loading {ttl_file.name}: {error}")
+            if progress_callback:
+                progress_callback(done, len(ttl_files))
+
+        graph = self.ontology_manager.loader.graph
+        with self.sparql.lock:
+            graph.addN((s, p, o, graph) for s, p, o in triples)
+            for prefix, namespace in sorted(bindings):
+                graph.bind(prefix, namespace)
 
         logger.info(f"Total specimen files loaded: {files_loaded}")
         return files_loaded
@@ -41,7 +41,8 @@ class StateToInstancesConverter:
         self,
         state,
         raw_df,
-        processed_results: Optional[Dict[str, np.ndarray]] = None
+        processed_results: Optional[Dict[str, np.ndarray]] = None,
+        processed_file_format: str = 'csv'
     ) -> List[Tuple[Dict[str, Any], str, str]]:
         """Build all RDF instances from analysis state.
 
@@ -49,6 +50,7 @@ class StateToInstancesConverter:
             state: SHPBAnalysisState with form-data dicts populated
             raw_df: DataFrame with columns 'time', 'incident', 'transmitted'
             processed_results: Optional dict from StressStrainCalculator.calculate()
+            processed_file_format: Format of the saved processed file ('csv' or 'npz')
 
         Returns:
             List of (form_data, class_uri, instance_id) tuples for InstanceWriter
@@ -148,7 +150,7 @@ class StateToInstancesConverter:
         if processed_results is not None:
             # Processed file instance
             processed_file_form = apply_type_conversion_to_dict({
-                'dyn:hasFileFormat': 'csv',
+                'dyn:hasFileFormat': processed_file_format,
                 'dyn:hasDataPointCount': len(next(iter(processed_results.values()))),
                 'dyn:hasColumnCount': len(processed_results),
                 'dyn:hasCreatedDate': datetime.now().strftime('%Y-%m-%d'),
@@ -21,6 +21,10 @@ Example:
     >>>
     >>> # Re-run analysis
     >>> results = reanalyzer.recalculate(mode='analysis_only')
+    >>>
+    >>> # Full re-alignment with the exhaustive grid search engine
+    >>> reanalyzer.update_alignment_param('method', 'grid')
+    >>> results = reanalyzer.recalculate(mode='full')
 """
 
 from __future__ import annotations
@@ -44,6 +48,12 @@ from dynamat.mechanical.shpb.io import (
     ValidityAssessor,
 )
 from dynamat.mechanical.shpb.io.rdf_helpers import extract_numeric_value
+from dynamat.mechanical.shpb.io.series_storage import (
+    detect_series_format,
+    load_series_table,
+    normalize_series_format,
+    save_series_table,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +100,8 @@ class SHPBReanalyzer:
         self._test_ttl_path: Optional[Path] = None
         self._raw_csv_path: Optional[Path] = None
         self._processed_csv_path: Optional[Path] = None
+        self._raw_file_format: Optional[str] = None
+        self._processed_file_format: Optional[str] = None
         self._specimens_dir: Optional[Path] = None
 
         # Loaded data
@@ -176,16 +188,17 @@ class SHPBReanalyzer:
         return self
 
     def _extract_file_paths(self):
-        """Extract raw and processed CSV file paths from TTL."""
+        """Extract raw and processed data file paths and formats from TTL."""
         dyn = Namespace(self.DYN_NS)
         specimen_dir = self._test_ttl_path.parent
 
         # Query for raw file path
         raw_query = """
         PREFIX dyn: <https://dynamat.utep.edu/ontology#>
-        SELECT ?filePath WHERE {
+        SELECT ?filePath ?fileFormat WHERE {
             ?file a dyn:AnalysisFile ;
                   dyn:hasFilePath ?filePath .
+            OPTIONAL { ?file dyn:hasFileFormat ?fileFormat }
             FILTER(CONTAINS(STR(?filePath), "raw"))
         }
         """
@@ -193,14 +206,18 @@ class SHPBReanalyzer:
         if raw_results:
             raw_rel_path = str(raw_results[0][0])
             self._raw_csv_path = specimen_dir / raw_rel_path
+            self._raw_file_format = detect_series_format(
+                self._raw_csv_path, raw_results[0][1]
+            )
             logger.debug(f"Raw CSV path: {self._raw_csv_path}")
 
         # Query for processed file path
         proc_query = """
         PREFIX dyn: <https://dynamat.utep.edu/ontology#>
-        SELECT ?filePath WHERE {
+        SELECT ?filePath ?fileFormat WHERE {
             ?file a dyn:AnalysisFile ;
                   dyn:hasFilePath ?filePath .
+            OPTIONAL { ?file dyn:hasFileFormat ?fileFormat }
             FILTER(CONTAINS(STR(?filePath), "processed"))
         }
         """
@@ -208,13 +225,18 @@ class SHPBReanalyzer:
         if proc_results:
             proc_rel_path = str(proc_results[0][0])
             self._processed_csv_path = specimen_dir / proc_rel_path
+            self._processed_file_format = detect_series_format(
+                self._processed_csv_path, proc_results[0][1]
+            )
             logger.debug(f"Processed CSV path: {self._processed_csv_path}")
 
     def _load_csv_data(self):
-        """Load raw and processed CSV data."""
+        """Load raw and processed data files (CSV or NPZ, auto-detected)."""
         # Load processed CSV (contains aligned pulses)
         if self._processed_csv_path and self._processed_csv_path.exists():
-            self._processed_df = pd.read_csv(self._processed_csv_path)
+            self._processed_df = load_series_table(
+                self._processed_csv_path, self._processed_file_format
+            )
             logger.debug(f"Loaded processed CSV: {self._processed_df.shape}")
 
             # Extract aligned pulses
@@ -229,7 +251,7 @@ class SHPBReanalyzer:
 
         # Load raw CSV (for full re-alignment)
         if self._raw_csv_path and self._raw_csv_path.exists():
-            self._raw_df = pd.read_csv(self._raw_csv_path)
+            self._raw_df = load_series_table(self._raw_csv_path, self._raw_file_format)
             logger.debug(f"Loaded raw CSV: {self._raw_df.shape}")
         else:
             logger.warning(f"Raw CSV not found: {self._raw_csv_path}")
@@ -396,7 +418,7 @@ class SHPBReanalyzer:
         alignment_query = """
         PREFIX dyn: <https://dynamat.utep.edu/ontology#>
         SELECT ?kLinear ?weightCorr ?weightU ?weightSR ?weightE
-               ?tMin ?tMax ?rMin ?rMax ?shiftT ?shiftR ?nPoints WHERE {
+               ?tMin ?tMax ?rMin ?rMax ?shiftT ?shiftR ?nPoints ?method WHERE {
             ?test dyn:hasAlignmentParams ?params .
             OPTIONAL { ?params dyn:hasKLinear ?kLinear }
             OPTIONAL { ?params dyn:hasCorrelationWeight ?weightCorr }
@@ -410,6 +432,7 @@ class SHPBReanalyzer:
             OPTIONAL { ?params dyn:hasTransmittedShiftValue ?shiftT }
             OPTIONAL { ?params dyn:hasReflectedShiftValue ?shiftR }
             OPTIONAL { ?params dyn:hasCenteredSegmentPoints ?nPoints }
+            OPTIONAL { ?params dyn:hasAlignmentMethod ?method }
         }
         """
         results = list(self._test_graph.query(alignment_query))
@@ -426,6 +449,7 @@ class SHPBReanalyzer:
                 'shift_t': int(r[9]) if r[9] else None,
                 'shift_r': int(r[10]) if r[10] else None,
                 'n_points': int(r[11]) if r[11] else 25000,
+                'method': self._get_alignment_method_value(r[12]),
             }
             logger.debug(f"Alignment params: {self._alignment_params}")
 
@@ -443,6 +467,25 @@ class SHPBReanalyzer:
         else:
             self._alignment_params.setdefault('thresh_ratio', 0.0)
 
+    def _get_alignment_method_value(self, method_uri) -> str:
+        """Resolve an AlignmentMethod individual to its PulseAligner method string."""
+        if not method_uri:
+            return 'differential_evolution'
+
+        query = f"""
+        PREFIX dyn: <https://dynamat.utep.edu/ontology#>
+        SELECT ?value WHERE {{
+            <{method_uri}> dyn:hasAlignmentMethodValue ?value .
+        }}
+        """
+        try:
+            results = self.ontology_manager.sparql_executor.execute_query(query)
+            if results:
+                return str(results[0]['value'])
+        except Exception as e:
+            logger.warning(f"Failed to resolve alignment method {method_uri}: {e}")
+        return 'differential_evolution'
+
     def _extract_detection_params(self):
         """Extract pulse detection parameters from TTL."""
         detection_query = """
@@ -595,8 +638,10 @@ class SHPBReanalyzer:
 
         Args:
             param_name: 'k_linear', 'search_bounds_t', 'search_bounds_r',
-                       'weight_corr', 'weight_u', 'weight_sr', 'weight_e'
-            new_value: New value (tuple for bounds, float for others)
+                       'weight_corr', 'weight_u', 'weight_sr', 'weight_e',
+                       'method'
+            new_value: New value (tuple for bounds, 'differential_evolution'
+                       or 'grid' for method, float for others)
 
         Returns:
             self for method chaining
@@ -821,6 +866,7 @@ class SHPBReanalyzer:
             specimen_height=specimen['height'],
             k_linear=align.get('k_linear', 0.35),
             weights=weights,
+            method=align.get('method', 'differential_evolution'),
         )
 
         search_bounds_t = align.get('search_bounds_t')
@@ -918,13 +964,17 @@ class SHPBReanalyzer:
     def save(
         self,
         version_suffix: str = "_reanalyzed",
-        overwrite: bool = False
+        overwrite: bool = False,
+        file_format: Optional[str] = None
     ) -> Tuple[Path, Path]:
         """Save re-analyzed results.
 
         Args:
             version_suffix: Suffix to add to filenames (ignored if overwrite=True)
             overwrite: If True, replace original files
+            file_format: Processed file format ('csv' or 'npz'). Defaults to
+                the format of the loaded processed file, else
+                config.SERIES_FILE_FORMAT. Ignored if overwrite=True.
 
         Returns:
             Tuple of (csv_path, ttl_path) for saved files
@@ -939,16 +989,19 @@ class SHPBReanalyzer:
         if overwrite:
             csv_path = self._processed_csv_path
             ttl_path = self._test_ttl_path
+            fmt = detect_series_format(csv_path, self._processed_file_format)
             logger.warning(f"Overwriting original files: {csv_path}, {ttl_path}")
         else:
-            csv_path = specimen_dir / "processed" / f"{test_name}{version_suffix}_processed.csv"
+            from dynamat.config import config
+            fmt = normalize_series_format(
+                file_format or self._processed_file_format or config.SERIES_FILE_FORMAT
+            )
+            csv_path = specimen_dir / "processed" / f"{test_name}{version_suffix}_processed.{fmt}"
             ttl_path = specimen_dir / f"{test_name}{version_suffix}.ttl"
 
-        # Save processed CSV
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-        results_df = pd.DataFrame(self._results)
-        results_df.to_csv(csv_path, index=False, float_format='%.6f')
-        logger.info(f"Saved processed CSV: {csv_path}")
+        # Save processed data file
+        save_series_table(self._results, csv_path, fmt, float_format='%.6f')
+        logger.info(f"Saved processed {fmt.upper()}: {csv_path}")
 
         # Save TTL with updated parameters
         self._save_ttl(ttl_path, csv_path)
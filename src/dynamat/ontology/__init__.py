@@ -20,6 +20,7 @@ from .core.namespace_manager import NamespaceManager
 from .query.sparql_executor import SPARQLExecutor
 from .query.domain_queries import DomainQueries
 from .cache.metadata_cache import MetadataCache
+from .cache.class_index import ClassHierarchyIndex
 from .schema.gui_schema_builder import GUISchemaBuilder
 
 from .template_manager import TemplateManager, TemplateMetadata
@@ -75,6 +76,7 @@ __all__ = [
     'SPARQLExecutor',
     'DomainQueries',
     'MetadataCache',
+    'ClassHierarchyIndex',
     'GUISchemaBuilder',
 
     # Additional components
@@ -0,0 +1,242 @@
+"""
+DynaMat Platform - Class Hierarchy Index
+In-memory subclass closure and instances-by-class index
+Answers class-membership and instance-listing questions without evaluating
+rdfs:subClassOf* property paths
+"""
+
+import logging
+import threading
+from typing import Dict, FrozenSet, Set, Union
+
+from rdflib import Graph, URIRef
+from rdflib.events import Event
+from rdflib.namespace import RDF, RDFS
+from rdflib.store import TripleAddedEvent, TripleRemovedEvent
+from rdflib.term import Node
+
+logger = logging.getLogger(__name__)
+
+ClassRef = Union[str, Node]
+
+
+class ClassHierarchyIndex:
+    """
+    Index of the rdfs:subClassOf hierarchy and rdf:type memberships of a graph.
+
+    Built with one pass over the rdf:type and rdfs:subClassOf triples, then
+    kept current by subscribing to the graph store's add/remove events
+    (see ObservableMemory for removals). Adding or removing individuals
+    updates the index in O(1); a change to rdfs:subClassOf drops the
+    memoized closures, which are recomputed on demand.
+
+    Semantics match the SPARQL path ``?x rdf:type/rdfs:subClassOf* ?class``:
+    every class is its own (reflexive) superclass.
+
+    Example:
+        >>> index = ClassHierarchyIndex(graph)
+        >>> index.is_instance_of(DYN.SS316, DYN.Material)
+        True
+        >>> index.get_instances(DYN.Material)
+        {rdflib.term.URIRef('...#SS316'), ...}
+    """
+
+    def __init__(self, graph: Graph, watch: bool = True):
+        """
+        Build the index.
+
+        Args:
+            graph: Graph to index
+            watch: Subscribe to the graph's store events to stay current
+        """
+        self.graph = graph
+        self._lock = threading.RLock()
+
+        # Direct edges
+        self._types: Dict[Node, Set[Node]] = {}              # instance -> classes
+        self._instances: Dict[Node, Set[Node]] = {}          # class -> instances
+        self._parents: Dict[Node, Set[Node]] = {}            # class -> superclasses
+        self._children: Dict[Node, Set[Node]] = {}           # class -> subclasses
+
+        # Memoized reflexive-transitive closures
+        self._ancestors: Dict[Node, FrozenSet[Node]] = {}
+        self._descendants: Dict[Node, FrozenSet[Node]] = {}
+
+        self._hierarchy_rebuilds = 0
+        self._stale = False
+        self.rebuild()
+
+        if watch:
+            dispatcher = graph.store.dispatcher
+            dispatcher.subscribe(TripleAddedEvent, self._on_triple_added)
+            dispatcher.subscribe(TripleRemovedEvent, self._on_triple_removed)
+
+    # ============================================================================
+    # QUERIES
+    # ============================================================================
+
+    def is_instance_of(self, instance: ClassRef, class_uri: ClassRef) -> bool:
+        """
+        Check whether an individual is a member of a class or of one of its subclasses.
+
+        Args:
+            instance: URI of the individual
+            class_uri: URI of the class
+
+        Returns:
+            True if the individual is typed with the class or a subclass of it
+        """
+        instance, class_uri = _ref(instance), _ref(class_uri)
+        with self._lock:
+            self._refresh_if_stale()
+            return any(
+                class_uri in self._closure(cls, self._parents, self._ancestors)
+                for cls in self._types.get(instance, ())
+            )
+
+    def get_instances(self, class_uri: ClassRef, include_subclasses: bool = True) -> Set[Node]:
+        """
+        Get the individuals typed with a class.
+
+        Args:
+            class_uri: URI of the class
+            include_subclasses: Also include individuals of subclasses
+
+        Returns:
+            Set of individual nodes
+        """
+        class_uri = _ref(class_uri)
+        with self._lock:
+            self._refresh_if_stale()
+            if not include_subclasses:
+                return set(self._instances.get(class_uri, ()))
+            instances: Set[Node] = set()
+            for cls in self._closure(class_uri, self._children, self._descendants):
+                instances.update(self._instances.get(cls, ()))
+            return instances
+
+    def get_types(self, instance: ClassRef) -> Set[Node]:
+        """Get the classes an individual is directly typed with."""
+        with self._lock:
+            self._refresh_if_stale()
+            return set(self._types.get(_ref(instance), ()))
+
+    def get_superclasses(self, class_uri: ClassRef) -> FrozenSet[Node]:
+        """Get a class and all of its transitive superclasses."""
+        with self._lock:
+            self._refresh_if_stale()
+            return self._closure(_ref(class_uri), self._parents, self._ancestors)
+
+    def get_subclasses(self, class_uri: ClassRef) -> FrozenSet[Node]:
+        """Get a class and all of its transitive subclasses."""
+        with self._lock:
+            self._refresh_if_stale()
+            return self._closure(_ref(class_uri), self._children, self._descendants)
+
+    def is_subclass_of(self, class_uri: ClassRef, superclass_uri: ClassRef) -> bool:
+        """Check rdfs:subClassOf* between two classes."""
+        return _ref(superclass_uri) in self.get_superclasses(class_uri)
+
+    # ============================================================================
+    # MAINTENANCE
+    # ============================================================================
+
+    def rebuild(self):
+        """Rebuild the whole index from the graph."""
+        with self._lock:
+            for mapping in (self._types, self._instances, self._parents, self._children):
+                mapping.clear()
+            self._stale = False
+            for instance, _, cls in self.graph.triples((None, RDF.type, None)):
+                self._link(self._types, self._instances, instance, cls)
+            for cls, _, parent in self.graph.triples((None, RDFS.subClassOf, None)):
+                self._link(self._parents, self._children, cls, parent)
+            self._reset_closures()
+
+        logger.info(
+            f"Class index built: {len(self._types)} typed nodes, "
+            f"{len(self._parents)} classes with superclasses"
+        )
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get index size and maintenance counters."""
+        with self._lock:
+            return {
+                'typed_nodes': len(self._types),
+                'classes_with_instances': len(self._instances),
+                'subclass_edges': sum(len(parents) for parents in self._parents.values()),
+                'memoized_closures': len(self._ancestors) + len(self._descendants),
+                'hierarchy_rebuilds': self._hierarchy_rebuilds,
+            }
+
+    def _on_triple_added(self, event: Event):
+        subject, predicate, obj = event.triple
+        if predicate == RDF.type:
+            with self._lock:
+                self._link(self._types, self._instances, subject, obj)
+        elif predicate == RDFS.subClassOf:
+            with self._lock:
+                self._link(self._parents, self._children, subject, obj)
+                self._reset_closures()
+
+    def _on_triple_removed(self, event: Event):
+        subject, predicate, obj = event.triple
+        if subject is None or predicate is None or obj is None:
+            # Wildcard removal reported (before it happens) by a store that
+            # does not expand patterns: rebuild on the next query
+            if predicate in (None, RDF.type, RDFS.subClassOf):
+                self._stale = True
+            return
+        if predicate == RDF.type:
+            with self._lock:
+                self._unlink(self._types, self._instances, subject, obj)
+        elif predicate == RDFS.subClassOf:
+            with self._lock:
+                self._unlink(self._parents, self._children, subject, obj)
+                self._reset_closures()
+
+    def _refresh_if_stale(self):
+        if self._stale:
+            self.rebuild()
+
+    def _reset_closures(self):
+        self._ancestors.clear()
+        self._descendants.clear()
+        self._hierarchy_rebuilds += 1
+
+    @staticmethod
+    def _link(forward: Dict[Node, Set[Node]], backward: Dict[Node, Set[Node]],
+              source: Node, target: Node):
+        forward.setdefault(source, set()).add(target)
+        backward.setdefault(target, set()).add(source)
+
+    @staticmethod
+    def _unlink(forward: Dict[Node, Set[Node]], backward: Dict[Node, Set[Node]],
+                source: Node, target: Node):
+        for mapping, key, value in ((forward, source, target), (backward, target, source)):
+            values = mapping.get(key)
+            if values is not None:
+                values.discard(value)
+                if not values:
+                    del mapping[key]
+
+    @staticmethod
+    def _closure(start: Node, edges: Dict[Node, Set[Node]],
+                 memo: Dict[Node, FrozenSet[Node]]) -> FrozenSet[Node]:
+        """Reflexive-transitive closure of `start` over `edges`, memoized (caller holds the lock)."""
+        closure = memo.get(start)
+        if closure is None:
+            seen = {start}
+            stack = [start]
+            while stack:
+                for nxt in edges.get(stack.pop(), ()):
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+            closure = memo[start] = frozenset(seen)
+        return closure
+
+
+def _ref(value: ClassRef) -> Node:
+    """Convert a URI string to a URIRef, leaving rdflib nodes unchanged."""
+    return value if isinstance(value, Node) else URIRef(str(value))
@@ -0,0 +1,129 @@
+"""
+DynaMat Platform - Instance Graph Cache
+LRU cache of parsed instance TTL files, bounded by total triple count and
+invalidated when a file's modification time or size changes
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+from rdflib import Graph
+
+logger = logging.getLogger(__name__)
+
+Stamp = Tuple[int, int]   # (mtime_ns, size)
+
+
+class InstanceGraphCache:
+    """
+    Parsed graphs of instance files for lazy loading.
+
+    get() stats the file and returns the cached graph while the file's
+    (mtime_ns, size) is unchanged; otherwise it parses the file again.
+    Graphs are kept in least-recently-used order and evicted once their
+    triples together exceed max_triples. A graph larger than the budget is
+    returned but not kept.
+
+    Cached graphs are shared between callers and must not be modified.
+
+    Example:
+        >>> cache = InstanceGraphCache(max_triples=200_000)
+        >>> graph = cache.get(Path("specimens/SPN-001/SPN-001_specimen.ttl"))  # parsed
+        >>> graph = cache.get(Path("specimens/SPN-001/SPN-001_specimen.ttl"))  # cached
+        >>> cache.get_statistics()['hits']
+        1
+    """
+
+    def __init__(self, max_triples: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_triples: Budget of triples over all cached graphs (0 disables caching)
+        """
+        if max_triples < 0:
+            raise ValueError(f"max_triples must be >= 0, got {max_triples}")
+        self.max_triples = max_triples
+
+        # path -> (stamp, graph, triple count), least recently used first
+        self._graphs: "OrderedDict[str, Tuple[Stamp, Graph, int]]" = OrderedDict()
+        self._triples = 0
+        self._lock = threading.RLock()
+
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0}
+
+    def get(self, path: Union[str, Path]) -> Graph:
+        """
+        Get the parsed graph of a TTL file.
+
+        Args:
+            path: TTL file
+
+        Returns:
+            Graph of the file (shared, read-only)
+
+        Raises:
+            OSError: If the file cannot be read
+            Exception: Parser errors of rdflib
+        """
+        name = os.path.abspath(path)
+        stat = os.stat(name)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._graphs.get(name)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._graphs.move_to_end(name)
+                    self._stats['hits'] += 1
+                    return entry[1]
+                self._stats['stale'] += 1
+                self._discard(name)
+            self._stats['misses'] += 1
+
+        # Parse outside the lock so other files can be served meanwhile
+        graph = Graph()
+        graph.parse(name, format="turtle")
+        size = len(graph)
+
+        with self._lock:
+            if self.max_triples and size <= self.max_triples:
+                self._discard(name)
+                self._graphs[name] = (stamp, graph, size)
+                self._triples += size
+                while self._triples > self.max_triples:
+                    _, (_, _, evicted_size) = self._graphs.popitem(last=False)
+                    self._triples -= evicted_size
+                    self._stats['evictions'] += 1
+        return graph
+
+    def invalidate(self, path: Union[str, Path]):
+        """Drop the cached graph of a file (e.g. after writing it)."""
+        with self._lock:
+            self._discard(os.path.abspath(path))
+
+    def clear(self):
+        """Drop every cached graph."""
+        with self._lock:
+            self._graphs.clear()
+            self._triples = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cached graph and triple counts and hit/miss counters."""
+        with self._lock:
+            return {
+                'graphs': len(self._graphs),
+                'triples': self._triples,
+                'max_triples': self.max_triples,
+                **self._stats,
+            }
+
+    def _discard(self, name: str):
+        """Remove an entry; the caller holds the lock."""
+        entry = self._graphs.pop(name, None)
+        if entry is not None:
+            self._triples -= entry[2]
@@ -0,0 +1,302 @@
+"""
+DynaMat Platform - Instance Index Store
+Persistent SQLite index of instance TTL files and their extracted display
+properties, so that rescanning an unchanged entity directory parses nothing
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import rdflib
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or the extracted metadata changes to
+# invalidate existing index files
+INDEX_FORMAT_VERSION = 1
+
+Metadata = Optional[Dict[str, Any]]
+
+
+@dataclass
+class IndexSync:
+    """Outcome of synchronizing one entity directory with the store."""
+    metadata: Dict[str, Metadata] = field(default_factory=dict)  # path -> metadata (None: no instance)
+    changed: Set[str] = field(default_factory=set)                # paths parsed in this sync
+    removed: Set[str] = field(default_factory=set)                # paths no longer on disk
+    files_parsed: int = 0
+    files_reused: int = 0
+    files_rehashed: int = 0   # stamp changed, content identical
+
+
+class InstanceIndexStore:
+    """
+    On-disk index of instance files for InstanceQueryBuilder.
+
+    One row per (file, class) holds the file's (mtime_ns, size), the SHA-1
+    of its contents and the pickled metadata dict extracted from it (or
+    None when the file holds no instance of the class). sync() compares the
+    files of an entity directory with the stored rows:
+
+    - same (mtime_ns, size): reuse the stored metadata
+    - different stamp, same SHA-1 (file touched or copied): reuse, update stamp
+    - new or modified file: passed to the extractor, result stored
+    - row without a file: delete
+
+    The database is opened per call, so the store can be used from any
+    thread, and files are parsed between two short transactions, never
+    while the database is held. A corrupt database or one written by
+    another format or rdflib version is recreated; a locked one is left
+    alone and the files are parsed without it.
+
+    Example:
+        >>> store = InstanceIndexStore(Path("~/.cache/dynamat/instance_index.sqlite"))
+        >>> sync = store.sync(specimens_dir, DYN_SPECIMEN, files, extract)
+        >>> sync.files_parsed, sync.files_reused
+        (3, 9997)
+    """
+
+    # Seconds to wait for another connection's lock before giving up
+    LOCK_TIMEOUT = 10.0
+
+    def __init__(self, path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+        self._version = f"{INDEX_FORMAT_VERSION}|{rdflib.__version__}"
+
+    # ============================================================================
+    # SYNCHRONIZATION
+    # ============================================================================
+
+    def sync(self, root: Path, class_uri: str, files: Iterable[Path],
+             extract: Callable[[List[Path]], Iterable[Metadata]]) -> IndexSync:
+        """
+        Bring the stored rows of a directory up to date with its files.
+
+        Args:
+            root: Scanned entity directory
+            class_uri: Class the files are indexed under
+            files: Instance files currently in the directory
+            extract: Parses a list of files into their metadata dicts (or
+                None), in order; called once with every file to parse
+
+        Returns:
+            IndexSync with the metadata of every file and what changed
+        """
+        root = os.path.abspath(root)
+        files = [os.path.abspath(f) for f in files]
+        try:
+            sync, pending = self._read(root, class_uri, files)
+        except sqlite3.Error as e:
+            if not self._is_damaged(e):
+                logger.warning(f"Instance index {self.path} unavailable, parsing all files: {e}")
+                return self._parse_all(files, extract)
+            logger.warning(f"Instance index {self.path} is unusable, recreating it: {e}")
+            self._delete_file()
+            try:
+                sync, pending = self._read(root, class_uri, files)
+            except sqlite3.Error as e:
+                logger.error(f"Instance index {self.path} unavailable, parsing all files: {e}")
+                return self._parse_all(files, extract)
+
+        # Parse with the database closed, so a long parse holds no lock
+        to_parse = pending['parse']
+        parsed = list(extract([Path(name) for name, _, _ in to_parse]))
+        for (name, _, _), metadata in zip(to_parse, parsed):
+            sync.metadata[name] = metadata
+            sync.changed.add(name)
+            sync.files_parsed += 1
+
+        try:
+            self._write(root, class_uri, pending, parsed)
+        except sqlite3.Error as e:
+            # The results are still returned; the next sync parses them again
+            logger.warning(f"Could not update instance index {self.path}: {e}")
+            if self._is_damaged(e):
+                self._delete_file()
+
+        logger.debug(
+            f"Instance index sync of {root}: {sync.files_parsed} parsed, "
+            f"{sync.files_reused + sync.files_rehashed} reused, {len(sync.removed)} removed"
+        )
+        return sync
+
+    def _read(self, root: str, class_uri: str,
+              files: Iterable[str]) -> Tuple[IndexSync, Dict[str, list]]:
+        """
+        Compare the files with the stored rows.
+
+        Returns:
+            IndexSync with the reused metadata and removed paths, and the
+            pending writes: 'parse' [(path, stamp, sha1)], 'restamp'
+            [(path, stamp)] and 'delete' [path]
+        """
+        sync = IndexSync()
+        pending: Dict[str, list] = {'parse': [], 'restamp': [], 'delete': []}
+        with self._transaction() as conn:
+            self._prune_missing_roots(conn)
+            stored: Dict[str, Tuple[int, int, str, bytes]] = {
+                path: (mtime_ns, size, sha1, blob)
+                for path, mtime_ns, size, sha1, blob in conn.execute(
+                    "SELECT path, mtime_ns, size, sha1, metadata FROM files "
+                    "WHERE root = ? AND class_uri = ?", (root, class_uri))
+            }
+
+        for name in files:
+            try:
+                stat = os.stat(name)
+            except OSError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            row = stored.pop(name, None)
+
+            if row is not None and row[:2] == stamp:
+                sync.metadata[name] = pickle.loads(row[3])
+                sync.files_reused += 1
+                continue
+
+            sha1 = self._file_hash(name)
+            if row is not None and row[2] == sha1:
+                pending['restamp'].append((name, stamp))
+                sync.metadata[name] = pickle.loads(row[3])
+                sync.files_rehashed += 1
+                continue
+
+            pending['parse'].append((name, stamp, sha1))
+
+        pending['delete'] = list(stored)
+        sync.removed.update(stored)
+        return sync, pending
+
+    def _write(self, root: str, class_uri: str, pending: Dict[str, list],
+               parsed: List[Metadata]):
+        """Store the parsed metadata, new stamps and deletions of a sync."""
+        if not any(pending.values()):
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ? AND class_uri = ?",
+                [(*stamp, name, class_uri) for name, stamp in pending['restamp']])
+            conn.executemany(
+                "INSERT OR REPLACE INTO files "
+                "(path, class_uri, root, mtime_ns, size, sha1, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(name, class_uri, root, *stamp, sha1,
+                  pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL))
+                 for (name, stamp, sha1), metadata in zip(pending['parse'], parsed)])
+            conn.executemany(
+                "DELETE FROM files WHERE path = ? AND class_uri = ?",
+                [(name, class_uri) for name in pending['delete']])
+
+    @staticmethod
+    def _parse_all(files: List[str],
+                   extract: Callable[[List[Path]], Iterable[Metadata]]) -> IndexSync:
+        """Parse every file without the database."""
+        sync = IndexSync()
+        for name, metadata in zip(files, extract([Path(name) for name in files])):
+            sync.metadata[name] = metadata
+            sync.changed.add(name)
+            sync.files_parsed += 1
+        return sync
+
+    # ============================================================================
+    # MAINTENANCE
+    # ============================================================================
+
+    def clear(self):
+        """Delete every stored row."""
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM files")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not clear instance index {self.path}: {e}")
+            if self._is_damaged(e):
+                self._delete_file()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the database path and row counts."""
+        stats: Dict[str, Any] = {'path': str(self.path), 'files': 0, 'roots': 0}
+        if not self.path.exists():
+            return stats
+        try:
+            with self._transaction() as conn:
+                stats['files'], stats['roots'] = conn.execute(
+                    "SELECT COUNT(*), COUNT(DISTINCT root) FROM files").fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read instance index {self.path}: {e}")
+        return stats
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open the database for one transaction and close it afterwards."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating or resetting the schema as needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=self.LOCK_TIMEOUT)
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != self._version:
+                if row is not None:
+                    logger.info("Instance index is from another format or rdflib version, resetting")
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self._version,))
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " path TEXT NOT NULL, class_uri TEXT NOT NULL, root TEXT NOT NULL,"
+                " mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, sha1 TEXT NOT NULL,"
+                " metadata BLOB NOT NULL, PRIMARY KEY (path, class_uri))")
+            conn.execute("CREATE INDEX IF NOT EXISTS files_by_root ON files (root, class_uri)")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _prune_missing_roots(conn: sqlite3.Connection):
+        """Drop rows of entity directories that no longer exist."""
+        roots = [root for (root,) in conn.execute("SELECT DISTINCT root FROM files")]
+        missing = [(root,) for root in roots if not Path(root).is_dir()]
+        if missing:
+            conn.executemany("DELETE FROM files WHERE root = ?", missing)
+
+    @staticmethod
+    def _file_hash(name: str) -> str:
+        """SHA-1 of a file's contents."""
+        with open(name, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    @staticmethod
+    def _is_damaged(error: sqlite3.Error) -> bool:
+        """Whether an error means the file is corrupt or has a bad schema,
+        rather than being busy or locked by another connection."""
+        if not isinstance(error, sqlite3.DatabaseError):
+            return False
+        return getattr(error, 'sqlite_errorcode', None) not in (sqlite3.SQLITE_BUSY,
+                                                               sqlite3.SQLITE_LOCKED)
+
+    def _delete_file(self):
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not delete instance index {self.path}: {e}")
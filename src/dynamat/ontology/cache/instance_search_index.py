@@ -0,0 +1,386 @@
+"""
+DynaMat Platform - Instance Search Index
+In-memory inverted and faceted index over the metadata of indexed instances
+Answers token, prefix, numeric-range and facet-count queries without SPARQL
+"""
+
+import logging
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+# (low, high), inclusive; None leaves that end open
+NumericRange = Tuple[Optional[float], Optional[float]]
+
+
+def _is_uri(value: Any) -> bool:
+    return isinstance(value, str) and (value.startswith('http://') or value.startswith('https://'))
+
+
+def display_value(value: Any) -> str:
+    """
+    Text of a metadata value as the index graph stores it.
+
+    Matches str() of the literal that InstanceQueryBuilder._index_triples
+    creates, so results equal those of the SPARQL queries.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def numeric_value(value: Any) -> Optional[float]:
+    """Number of a metadata value (int, float or QuantityValue dict), or None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict) and isinstance(value.get('value'), (int, float)):
+        return float(value['value'])
+    return None
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric runs of a text ("Al6061-T6" -> ["al6061", "t6"])."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _value_tokens(value: Any) -> List[str]:
+    """Search tokens of a metadata value: string text or URI local name."""
+    if not isinstance(value, str):
+        return []
+    if _is_uri(value):
+        value = value.rsplit('#', 1)[-1].rsplit('/', 1)[-1]
+    return tokenize(value)
+
+
+def _prefix_slice(keys: List[str], prefix: str) -> Tuple[int, int]:
+    """Index range of the sorted keys that start with prefix."""
+    return bisect_left(keys, prefix), bisect_left(keys, prefix + '\U0010ffff')
+
+
+class InstanceSearchIndex:
+    """
+    Inverted index of instance metadata for search and faceting.
+
+    Holds, per instance, the record returned by queries (display text of
+    every property, as the SPARQL queries return it) and maintains:
+
+    - instances by class
+    - postings of URI and boolean values (property -> value -> instances),
+      used for equality filters and facet counts
+    - postings of search tokens (token -> instances); tokens are the
+      lowercase alphanumeric runs of string values and URI local names
+    - numbers per property, from numeric literals and QuantityValues
+
+    add() and remove() update these incrementally. Sorted views for prefix
+    and range queries (token vocabulary, values and numbers per property)
+    are built on first use after a change.
+
+    Facet counts follow the usual faceted-search rule: the counts of a
+    property apply every filter except the one on that property, so they
+    show how many instances each alternative value would return.
+
+    Example:
+        >>> index = InstanceSearchIndex()
+        >>> index.add(DYN_SPECIMEN, metadata, "/data/specimens/SPN-001/SPN-001_specimen.ttl")
+        >>> index.find(DYN_SPECIMEN, filters={DYN_HAS_MATERIAL: DYN_SS316}, text="spn-0")
+        {'https://dynamat.utep.edu/ontology#SPN_001'}
+        >>> index.facet_counts(DYN_SPECIMEN, [DYN_HAS_MATERIAL])
+        {'https://dynamat.utep.edu/ontology#hasMaterial': {'https://...#SS316': 1}}
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self._lock = threading.RLock()
+
+        self._records: Dict[str, Dict[str, str]] = {}             # instance -> record
+        self._values: Dict[str, Dict[str, Any]] = {}              # instance -> metadata
+        self._classes: Dict[str, str] = {}                        # instance -> class
+        self._by_class: Dict[str, Set[str]] = {}                  # class -> instances
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}       # property -> value -> instances
+        self._tokens: Dict[str, Set[str]] = {}                    # token -> instances
+        self._numbers: Dict[str, Dict[str, float]] = {}           # property -> instance -> number
+
+        # Sorted views, rebuilt on demand after a change
+        self._sorted_tokens: Optional[List[str]] = None
+        self._sorted_values: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._sorted_numbers: Dict[str, Tuple[List[float], List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, instance_uri: str) -> bool:
+        return str(instance_uri) in self._records
+
+    # ============================================================================
+    # MAINTENANCE
+    # ============================================================================
+
+    def add(self, class_uri: str, metadata: Mapping[str, Any], file_path: str):
+        """
+        Index (or re-index) one instance.
+
+        Args:
+            class_uri: Class the instance is indexed under
+            metadata: Metadata dict from _extract_instance_metadata
+                ('uri', 'type' and property URI -> value)
+            file_path: Source TTL file of the instance
+        """
+        uri = str(metadata['uri'])
+        class_uri = str(class_uri)
+        values = {prop: value for prop, value in metadata.items() if prop not in ('uri', 'type')}
+        record = {'uri': uri, 'file_path': str(file_path)}
+        record.update((prop, display_value(value)) for prop, value in values.items())
+
+        with self._lock:
+            if uri in self._records:
+                self._remove(uri)
+            self._records[uri] = record
+            self._values[uri] = values
+            self._classes[uri] = class_uri
+            self._by_class.setdefault(class_uri, set()).add(uri)
+
+            for prop, value in values.items():
+                if isinstance(value, bool) or _is_uri(value):
+                    self._postings.setdefault(prop, {}).setdefault(record[prop], set()).add(uri)
+                number = numeric_value(value)
+                if number is not None:
+                    self._numbers.setdefault(prop, {})[uri] = number
+                for token in _value_tokens(value):
+                    self._tokens.setdefault(token, set()).add(uri)
+            self._invalidate()
+
+    def remove(self, instance_uri: str):
+        """Drop an instance from the index (no-op if not indexed)."""
+        with self._lock:
+            if str(instance_uri) in self._records:
+                self._remove(str(instance_uri))
+                self._invalidate()
+
+    def clear(self):
+        """Drop every instance."""
+        with self._lock:
+            for container in (self._records, self._values, self._classes, self._by_class,
+                              self._postings, self._tokens, self._numbers):
+                container.clear()
+            self._invalidate()
+
+    def _remove(self, uri: str):
+        record = self._records.pop(uri)
+        values = self._values.pop(uri)
+        class_uri = self._classes.pop(uri)
+        self._discard(self._by_class, class_uri, uri)
+
+        for prop, value in values.items():
+            if prop in self._postings:
+                self._discard(self._postings[prop], record[prop], uri)
+                if not self._postings[prop]:
+                    del self._postings[prop]
+            if prop in self._numbers:
+                self._numbers[prop].pop(uri, None)
+                if not self._numbers[prop]:
+                    del self._numbers[prop]
+            for token in _value_tokens(value):
+                self._discard(self._tokens, token, uri)
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[str]], key: str, uri: str):
+        members = postings.get(key)
+        if members is not None:
+            members.discard(uri)
+            if not members:
+                del postings[key]
+
+    def _invalidate(self):
+        self._sorted_tokens = None
+        self._sorted_values.clear()
+        self._sorted_numbers.clear()
+
+    # ============================================================================
+    # QUERIES
+    # ============================================================================
+
+    def find(self, class_uri: str, filters: Optional[Mapping[str, Any]] = None,
+             text: Optional[str] = None, prefixes: Optional[Mapping[str, str]] = None,
+             ranges: Optional[Mapping[str, NumericRange]] = None) -> Set[str]:
+        """
+        Find the instances of a class matching every given condition.
+
+        Args:
+            class_uri: Class to search
+            filters: Property URI -> value the property must equal
+                (same value types as InstanceQueryBuilder.filter_instances)
+            text: Every token of the text must start a token of the
+                instance ("ss3 00" matches "DYNML-SS316-0001")
+            prefixes: Property URI -> prefix the value must start with
+                (case-insensitive)
+            ranges: Property URI -> (low, high) the number must lie in
+
+        Returns:
+            Set of matching instance URIs
+        """
+        with self._lock:
+            return self._find(str(class_uri), filters or {}, text, prefixes or {}, ranges or {})
+
+    def facet_counts(self, class_uri: str, properties: Iterable[str],
+                     filters: Optional[Mapping[str, Any]] = None,
+                     text: Optional[str] = None, prefixes: Optional[Mapping[str, str]] = None,
+                     ranges: Optional[Mapping[str, NumericRange]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count matching instances per value of each facet property.
+
+        The counts of a property ignore the filter on that property itself;
+        other conditions are as in find().
+
+        Args:
+            class_uri: Class to search
+            properties: Facet property URIs
+            filters, text, prefixes, ranges: As in find()
+
+        Returns:
+            Property URI -> value (display text) -> instance count
+        """
+        filters = dict(filters or {})
+        prefixes = prefixes or {}
+        ranges = ranges or {}
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            base = self._find(str(class_uri), {}, text, prefixes, ranges)
+            for prop in properties:
+                others = {p: v for p, v in filters.items() if p != prop}
+                matches = self._apply_filters(base, others) if others else base
+                counts[prop] = self._count_values(prop, matches)
+        return counts
+
+    def get_records(self, instance_uris: Iterable[str],
+                    properties: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """
+        Records of instances, sorted by URI.
+
+        Args:
+            instance_uris: Indexed instance URIs
+            properties: Properties to include besides 'uri' and 'file_path'
+                (None includes all)
+
+        Returns:
+            List of dicts like those of InstanceQueryBuilder.filter_instances
+        """
+        with self._lock:
+            records = [self._records[uri] for uri in sorted(instance_uris) if uri in self._records]
+        if properties is None:
+            return [dict(record) for record in records]
+        keys = ['uri', 'file_path', *properties]
+        return [{key: record[key] for key in keys if key in record} for record in records]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get instance, token and posting counts."""
+        with self._lock:
+            return {
+                'instances': len(self._records),
+                'classes': {cls: len(uris) for cls, uris in self._by_class.items()},
+                'tokens': len(self._tokens),
+                'value_postings': sum(len(values) for values in self._postings.values()),
+                'numeric_properties': len(self._numbers),
+            }
+
+    def match_text(self, text: str) -> Set[str]:
+        """Instances where every token of text starts one of their tokens."""
+        with self._lock:
+            result: Optional[Set[str]] = None
+            for query_token in set(tokenize(text)):
+                matches: Set[str] = set()
+                vocabulary = self._token_vocabulary()
+                start, end = _prefix_slice(vocabulary, query_token)
+                for token in vocabulary[start:end]:
+                    matches |= self._tokens[token]
+                result = matches if result is None else result & matches
+                if not result:
+                    break
+            return result if result is not None else set(self._records)
+
+    def match_prefix(self, prop: str, prefix: str) -> Set[str]:
+        """Instances whose value of prop starts with prefix (case-insensitive)."""
+        with self._lock:
+            keys, uris = self._value_view(prop)
+            start, end = _prefix_slice(keys, prefix.lower())
+            return set(uris[start:end])
+
+    def match_range(self, prop: str, low: Optional[float] = None,
+                    high: Optional[float] = None) -> Set[str]:
+        """Instances whose number for prop lies in [low, high]."""
+        with self._lock:
+            keys, uris = self._number_view(prop)
+            start = 0 if low is None else bisect_left(keys, low)
+            end = len(keys) if high is None else bisect_right(keys, high)
+            return set(uris[start:end])
+
+    def _find(self, class_uri: str, filters: Mapping[str, Any], text: Optional[str],
+              prefixes: Mapping[str, str], ranges: Mapping[str, NumericRange]) -> Set[str]:
+        result = set(self._by_class.get(class_uri, ()))
+        for prop, prefix in prefixes.items():
+            result &= self.match_prefix(prop, prefix)
+        for prop, (low, high) in ranges.items():
+            result &= self.match_range(prop, low, high)
+        if text and text.strip():
+            result &= self.match_text(text)
+        return self._apply_filters(result, filters)
+
+    def _apply_filters(self, candidates: Set[str], filters: Mapping[str, Any]) -> Set[str]:
+        for prop, value in filters.items():
+            if not candidates:
+                break
+            if isinstance(value, bool) or _is_uri(str(value)):
+                candidates = candidates & self._postings.get(prop, {}).get(display_value(value), set())
+            elif isinstance(value, (int, float)):
+                numbers = self._numbers.get(prop, {})
+                candidates = {uri for uri in candidates if numbers.get(uri) == value}
+            else:
+                text = str(value)
+                candidates = {uri for uri in candidates if self._records[uri].get(prop) == text}
+        return candidates
+
+    def _count_values(self, prop: str, instances: Set[str]) -> Dict[str, int]:
+        postings = self._postings.get(prop)
+        if postings is not None:
+            counts = {value: len(uris & instances) for value, uris in postings.items()}
+            return {value: count for value, count in counts.items() if count}
+        counts: Dict[str, int] = {}
+        for uri in instances:
+            value = self._records[uri].get(prop)
+            if value is not None:
+                counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    # ============================================================================
+    # SORTED VIEWS
+    # ============================================================================
+
+    def _token_vocabulary(self) -> List[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._tokens)
+        return self._sorted_tokens
+
+    def _value_view(self, prop: str) -> Tuple[List[str], List[str]]:
+        view = self._sorted_values.get(prop)
+        if view is None:
+            pairs = sorted(
+                (record[prop].lower(), uri)
+                for uri, record in self._records.items() if prop in record
+            )
+            view = ([key for key, _ in pairs], [uri for _, uri in pairs])
+            self._sorted_values[prop] = view
+        return view
+
+    def _number_view(self, prop: str) -> Tuple[List[float], List[str]]:
+        view = self._sorted_numbers.get(prop)
+        if view is None:
+            pairs = sorted((number, uri) for uri, number in self._numbers.get(prop, {}).items())
+            view = ([number for number, _ in pairs], [uri for _, uri in pairs])
+            self._sorted_numbers[prop] = view
+        return view
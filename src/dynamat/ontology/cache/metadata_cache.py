@@ -5,10 +5,16 @@ Extracted from manager.py for better separation of concerns
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 import time
 
+from rdflib import Graph, URIRef
+from rdflib.events import Event
+from rdflib.namespace import RDF, RDFS
+from rdflib.store import TripleAddedEvent, TripleRemovedEvent
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +27,8 @@ class CacheStats:
     last_updated: Optional[float]
     cache_hits: int
     cache_misses: int
+    cache_evictions: int = 0
+    tracked_dependencies: int = 0
 
 
 class MetadataCache:
@@ -31,8 +39,27 @@ class MetadataCache:
     - Cache class metadata for GUI building
     - Cache property metadata
     - Cache QUDT units and quantity kinds
+    - Evict class/property entries when the graph triples they were
+      derived from change
     - Provide cache statistics and management
+
+    Dependency tracking:
+    Class and property entries can record the subjects they were derived
+    from (the class, its ancestors, its properties, ...) and the classes
+    whose instances they list. Once watch_graph() has subscribed the cache
+    to a graph, every added or removed triple evicts the entries that
+    depend on it:
+
+    - (s, p, o) changes subject s
+    - (s, rdfs:domain|rdfs:range|rdfs:subClassOf, o) also changes subject o
+    - (s, rdf:type, o) also changes the instances of class o
+
+    Entries cached without dependencies are only removed by the clear_*
+    methods.
     """
+
+    # Predicates whose object is structurally affected by the triple
+    SCHEMA_PREDICATES = frozenset({RDFS.domain, RDFS.range, RDFS.subClassOf})
     
     def __init__(self):
         """Initialize the metadata cache."""
@@ -43,23 +70,39 @@ class MetadataCache:
         # QUDT caches
         self.quantity_kinds_cache = {}
         self.units_cache = {}
+
+        # Dependency tracking: dependency key -> cache entries derived from it,
+        # and cache entry -> its dependency keys. Entries are
+        # ('class', uri) / ('property', uri); dependency keys are
+        # ('subject', uri) / ('instances', class_uri).
+        self._dependents: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self._dependencies: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self._lock = threading.RLock()
+        self._watched_graph: Optional[Graph] = None
         
         # Cache statistics
         self._cache_hits = 0
         self._cache_misses = 0
+        self._cache_evictions = 0
         self._last_updated = None
         
         logger.info("Metadata cache initialized")
     
-    def cache_class_metadata(self, class_uri: str, metadata: Any):
+    def cache_class_metadata(self, class_uri: str, metadata: Any,
+                             depends_on: Iterable[str] = (),
+                             depends_on_instances_of: Iterable[str] = ()):
         """
         Cache class metadata.
         
         Args:
             class_uri: URI of the class
             metadata: ClassMetadata object
+            depends_on: Subject URIs the metadata was derived from
+            depends_on_instances_of: Class URIs whose instances the metadata lists
         """
-        self.classes_cache[class_uri] = metadata
+        with self._lock:
+            self.classes_cache[class_uri] = metadata
+            self._track(('class', class_uri), depends_on, depends_on_instances_of)
         self._last_updated = time.time()
         logger.debug(f"Cached metadata for class: {class_uri}")
     
@@ -73,24 +116,31 @@ class MetadataCache:
         Returns:
             ClassMetadata object if cached, None otherwise
         """
-        if class_uri in self.classes_cache:
+        metadata = self.classes_cache.get(class_uri)
+        if metadata is not None:
             self._cache_hits += 1
             logger.debug(f"Cache hit for class: {class_uri}")
-            return self.classes_cache[class_uri]
+            return metadata
         else:
             self._cache_misses += 1
             logger.debug(f"Cache miss for class: {class_uri}")
             return None
     
-    def cache_property_metadata(self, property_uri: str, metadata: Any):
+    def cache_property_metadata(self, property_uri: str, metadata: Any,
+                                depends_on: Iterable[str] = (),
+                                depends_on_instances_of: Iterable[str] = ()):
         """
         Cache property metadata.
         
         Args:
             property_uri: URI of the property
             metadata: PropertyMetadata object
+            depends_on: Subject URIs the metadata was derived from
+            depends_on_instances_of: Class URIs whose instances the metadata lists
         """
-        self.properties_cache[property_uri] = metadata
+        with self._lock:
+            self.properties_cache[property_uri] = metadata
+            self._track(('property', property_uri), depends_on, depends_on_instances_of)
         self._last_updated = time.time()
         logger.debug(f"Cached metadata for property: {property_uri}")
     
@@ -104,9 +154,10 @@ class MetadataCache:
         Returns:
             PropertyMetadata object if cached, None otherwise
         """
-        if property_uri in self.properties_cache:
+        metadata = self.properties_cache.get(property_uri)
+        if metadata is not None:
             self._cache_hits += 1
-            return self.properties_cache[property_uri]
+            return metadata
         else:
             self._cache_misses += 1
             return None
@@ -151,27 +202,169 @@ class MetadataCache:
             self._cache_misses += 1
             return None
     
+    # ============================================================================
+    # DEPENDENCY TRACKING
+    # ============================================================================
+
+    def watch_graph(self, graph: Graph):
+        """
+        Evict dependent entries whenever triples are added to or removed from a graph.
+
+        Subscribes to the add/remove events of the graph's store, so every
+        mutation (Graph.add, Graph.parse, Graph.remove, ...) is seen,
+        whichever component makes it. rdflib's plain Memory store does not
+        report removals; OntologyLoader graphs use ObservableMemory, which
+        does. Call this after the ontology has been loaded to keep the
+        initial load free of event overhead.
+
+        Args:
+            graph: Graph the cached metadata is derived from
+        """
+        if graph is self._watched_graph:
+            return
+        dispatcher = graph.store.dispatcher
+        dispatcher.subscribe(TripleAddedEvent, self._on_triple_changed)
+        dispatcher.subscribe(TripleRemovedEvent, self._on_triple_changed)
+        self._watched_graph = graph
+        logger.debug("Metadata cache watching graph for changes")
+
+    def invalidate_subjects(self, subjects: Iterable[str] = (),
+                            instances_of: Iterable[str] = ()) -> int:
+        """
+        Evict every entry derived from the given subjects or class extensions.
+
+        Args:
+            subjects: URIs whose triples changed
+            instances_of: Class URIs that gained or lost instances
+
+        Returns:
+            Number of cache entries evicted
+        """
+        keys = [('subject', str(uri)) for uri in subjects]
+        keys.extend(('instances', str(uri)) for uri in instances_of)
+        return self._invalidate_keys(keys)
+
+    def get_dependencies(self, kind: str, uri: str) -> Set[Tuple[str, str]]:
+        """
+        Get the dependency keys recorded for a cache entry.
+
+        Args:
+            kind: 'class' or 'property'
+            uri: URI of the cached class or property
+
+        Returns:
+            Set of ('subject', uri) / ('instances', class_uri) keys
+        """
+        with self._lock:
+            return set(self._dependencies.get((kind, uri), ()))
+
+    def _on_triple_changed(self, event: Event):
+        """Store event handler: evict entries depending on the changed triple."""
+        subject, predicate, obj = event.triple
+        if subject is None or predicate is None:
+            # Pattern removal (e.g. graph.remove((None, p, o))) - cannot tell what changed
+            if self._dependencies:
+                self._invalidate_all()
+            return
+
+        keys = [('subject', str(subject))]
+        if isinstance(obj, URIRef):
+            if predicate == RDF.type:
+                keys.append(('instances', str(obj)))
+            elif predicate in self.SCHEMA_PREDICATES:
+                keys.append(('subject', str(obj)))
+        elif obj is None and predicate == RDF.type:
+            # Removing all types of a subject may shrink any class extension
+            self._invalidate_all()
+            return
+        self._invalidate_keys(keys)
+
+    def _track(self, entry: Tuple[str, str], depends_on: Iterable[str],
+               depends_on_instances_of: Iterable[str]):
+        """Record the dependencies of a cache entry (caller holds the lock)."""
+        self._untrack(entry)
+        keys = {('subject', str(uri)) for uri in depends_on if uri}
+        keys.update(('instances', str(uri)) for uri in depends_on_instances_of if uri)
+        if not keys:
+            return
+        self._dependencies[entry] = keys
+        for key in keys:
+            self._dependents.setdefault(key, set()).add(entry)
+
+    def _untrack(self, entry: Tuple[str, str]):
+        """Forget the dependencies of a cache entry (caller holds the lock)."""
+        for key in self._dependencies.pop(entry, ()):
+            dependents = self._dependents.get(key)
+            if dependents is not None:
+                dependents.discard(entry)
+                if not dependents:
+                    del self._dependents[key]
+
+    def _evict(self, entry: Tuple[str, str]):
+        """Remove a tracked entry from its cache (caller holds the lock)."""
+        kind, uri = entry
+        cache = self.classes_cache if kind == 'class' else self.properties_cache
+        self._untrack(entry)
+        if cache.pop(uri, None) is not None:
+            self._cache_evictions += 1
+            logger.debug(f"Evicted {kind} metadata after graph change: {uri}")
+
+    def _invalidate_keys(self, keys: Iterable[Tuple[str, str]]) -> int:
+        """Evict entries depending on any of the given dependency keys."""
+        if not self._dependents:
+            return 0
+        with self._lock:
+            entries = set()
+            for key in keys:
+                entries.update(self._dependents.get(key, ()))
+            before = self._cache_evictions
+            for entry in entries:
+                self._evict(entry)
+            return self._cache_evictions - before
+
+    def _invalidate_all(self) -> int:
+        """Evict every dependency-tracked entry."""
+        with self._lock:
+            before = self._cache_evictions
+            for entry in list(self._dependencies):
+                self._evict(entry)
+            return self._cache_evictions - before
+
+    # ============================================================================
+    # CACHE MANAGEMENT
+    # ============================================================================
+    
     def clear_all_caches(self):
         """Clear all caches."""
-        self.classes_cache.clear()
-        self.properties_cache.clear()
-        self.quantity_kinds_cache.clear()
-        self.units_cache.clear()
+        with self._lock:
+            self.classes_cache.clear()
+            self.properties_cache.clear()
+            self.quantity_kinds_cache.clear()
+            self.units_cache.clear()
+            self._dependents.clear()
+            self._dependencies.clear()
         
         self._cache_hits = 0
         self._cache_misses = 0
+        self._cache_evictions = 0
         self._last_updated = time.time()
         
         logger.info("All caches cleared")
     
     def clear_class_cache(self):
         """Clear only the class metadata cache."""
-        self.classes_cache.clear()
+        with self._lock:
+            for entry in [e for e in self._dependencies if e[0] == 'class']:
+                self._untrack(entry)
+            self.classes_cache.clear()
         logger.info("Class metadata cache cleared")
     
     def clear_property_cache(self):
         """Clear only the property metadata cache."""
-        self.properties_cache.clear()
+        with self._lock:
+            for entry in [e for e in self._dependencies if e[0] == 'property']:
+                self._untrack(entry)
+            self.properties_cache.clear()
         logger.info("Property metadata cache cleared")
     
     def clear_qudt_cache(self):
@@ -193,7 +386,9 @@ class MetadataCache:
             qudt_units_cached=len(self.units_cache),
             last_updated=self._last_updated,
             cache_hits=self._cache_hits,
-            cache_misses=self._cache_misses
+            cache_misses=self._cache_misses,
+            cache_evictions=self._cache_evictions,
+            tracked_dependencies=len(self._dependents)
         )
     
     def get_cached_class_uris(self) -> List[str]:
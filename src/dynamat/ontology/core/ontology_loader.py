@@ -2,13 +2,33 @@
 DynaMat Platform - Ontology Loader
 Handles TTL file loading and graph management
 Extracted from manager.py for better separation of concerns
+
+Parsed triples are kept in an on-disk snapshot keyed by the paths, mtimes
+and sizes of the source TTL files. An unchanged ontology is rebuilt from
+the snapshot without running the Turtle parser; when files change, only
+those files are re-parsed.
+
+Files that need parsing can be parsed in a process pool (max_workers > 1).
+Each worker parses into an independent graph; the triples are merged into
+the shared graph in load order, so the result does not depend on the
+worker count.
 """
 
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
+import rdflib
 from rdflib import Graph
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store, TripleRemovedEvent
+
+from .parallel import parallel_map_files, pool_size
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +39,92 @@ except ImportError:
     # Fallback if import fails
     config = None
 
+# Bump when the snapshot layout changes to invalidate existing snapshots
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class _TripleCollector(Store):
+    """
+    Minimal rdflib store that records parsed triples and prefixes in order.
+
+    Parsing into it skips the index maintenance of the in-memory store, so
+    collecting a file's triples costs no more than parsing it directly into
+    the shared graph. Repeated terms are interned so that pickling the
+    triples (to a worker's parent process) stores each term once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.triples: List[tuple] = []
+        self._terms: Dict[Any, Any] = {}
+        self._namespaces: Dict[str, Any] = {}
+        self._prefixes: Dict[Any, str] = {}
+
+    def add(self, triple, context, quoted=False):
+        terms = self._terms
+        s, p, o = triple
+        self.triples.append(
+            (terms.setdefault(s, s), terms.setdefault(p, p), terms.setdefault(o, o))
+        )
+
+    def bind(self, prefix, namespace, override=True):
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix):
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace):
+        return self._prefixes.get(namespace)
+
+    def namespaces(self):
+        yield from self._namespaces.items()
+
+
+class ObservableMemory(Memory):
+    """
+    In-memory store that dispatches an event for every removed triple.
+
+    rdflib's Memory store dispatches TripleAddedEvent on add() but never
+    TripleRemovedEvent, so subscribers (e.g. MetadataCache.watch_graph)
+    would miss removals. This store reports each concrete triple removed
+    by a (possibly wildcard) pattern. Matching triples are only collected
+    when someone subscribed to removals.
+    """
+
+    def remove(self, triple_pattern, context=None):
+        dispatch_map = self.dispatcher.get_map()
+        if not dispatch_map or TripleRemovedEvent not in dispatch_map:
+            return super().remove(triple_pattern, context)
+
+        removed = [triple for triple, _ in self.triples(triple_pattern, context=context)]
+        super().remove(triple_pattern, context)
+        for triple in removed:
+            Store.remove(self, triple, context)
+
+
+def parse_ttl_file(file_path: Path) -> Tuple[List[tuple], List[Tuple[str, str]]]:
+    """
+    Parse a TTL file independently of the shared graph.
+
+    Args:
+        file_path: Path to the TTL file
+
+    Returns:
+        Tuple of (triples, namespace bindings declared by the file)
+    """
+    collector = _TripleCollector()
+    Graph(store=collector, bind_namespaces="none").parse(file_path, format="turtle")
+    bindings = [(prefix, str(namespace)) for prefix, namespace in collector.namespaces()]
+    return collector.triples, bindings
+
+
+def _parse_ttl_file_timed(file_path: Path) -> Tuple[List[tuple], List[Tuple[str, str]], float]:
+    """Process-pool entry point: parse_ttl_file() plus its parse time in seconds."""
+    start_time = time.perf_counter()
+    triples, bindings = parse_ttl_file(file_path)
+    return triples, bindings, time.perf_counter() - start_time
+
 
 class OntologyLoader:
     """
@@ -30,22 +136,53 @@ class OntologyLoader:
     - Provide graph reloading capabilities
     - Manage graph state
     """
-    
-    def __init__(self, ontology_dir: Path):
+
+    def __init__(
+        self,
+        ontology_dir: Path,
+        use_snapshot: Optional[bool] = None,
+        snapshot_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize the ontology loader.
 
         Args:
             ontology_dir: Path to directory containing TTL files
+            use_snapshot: Load from/save to the parsed-ontology snapshot
+                (defaults to config.USE_ONTOLOGY_SNAPSHOT)
+            snapshot_dir: Directory for snapshot files
+                (defaults to config.ONTOLOGY_SNAPSHOT_DIR)
+            max_workers: Parser processes; 1 parses serially, 0 uses one
+                per CPU (defaults to config.ONTOLOGY_LOAD_WORKERS)
         """
         self.ontology_dir = ontology_dir
-        self.graph = Graph()
+        self.graph = Graph(store=ObservableMemory())
         self._files_loaded = 0
 
+        if max_workers is None:
+            max_workers = getattr(config, 'ONTOLOGY_LOAD_WORKERS', 1)
+        if max_workers < 0:
+            raise ValueError(f"max_workers must be >= 0, got {max_workers}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if use_snapshot is None:
+            use_snapshot = getattr(config, 'USE_ONTOLOGY_SNAPSHOT', False)
+        if snapshot_dir is None:
+            snapshot_dir = getattr(config, 'ONTOLOGY_SNAPSHOT_DIR', None)
+        self.use_snapshot = bool(use_snapshot) and snapshot_dir is not None
+        self.snapshot_path = self._snapshot_path(Path(snapshot_dir)) if snapshot_dir else None
+
         # Statistics tracking (always-on)
         self._loaded_files = []  # List of (filename, triples_added, load_time_seconds)
         self._failed_files = []  # List of (filename, error_message)
         self._total_load_time = 0.0
+        self._last_load_wall_time = 0.0
+        self._last_load_workers = 1
+        self._snapshot_hits = 0  # Loads served entirely from the snapshot
+        self._snapshot_misses = 0  # Loads that re-parsed at least one file
+        self._files_from_snapshot = 0
+        self._files_parsed = 0
 
         logger.info(f"Ontology loader initialized with directory: {ontology_dir}")
     
@@ -62,7 +199,71 @@ class OntologyLoader:
         """
         if not self.ontology_dir.exists():
             raise FileNotFoundError(f"Ontology directory not found: {self.ontology_dir}")
-        
+
+        source_files = self._collect_source_files()
+        if not source_files:
+            raise ValueError("No TTL files found in ontology directory")
+
+        wall_start = time.perf_counter()
+        self._files_loaded = 0
+        stamps = {str(path): self._file_stamp(path) for path in source_files}
+        snapshot_key = self._snapshot_key(stamps)
+        snapshot = self._read_snapshot() if self.use_snapshot else None
+        cached_files = snapshot['files'] if snapshot else {}
+
+        if snapshot and snapshot['key'] == snapshot_key:
+            self._snapshot_hits += 1
+            logger.info(f"Loading ontology from snapshot: {self.snapshot_path}")
+        elif self.use_snapshot:
+            self._snapshot_misses += 1
+
+        def is_cached(path: Path) -> bool:
+            entry = cached_files.get(str(path))
+            return entry is not None and entry['stamp'] == stamps[str(path)]
+
+        # Parse results arrive in load order, possibly from worker processes
+        to_parse = [path for path in source_files if not is_cached(path)]
+        self._last_load_workers = pool_size(len(to_parse), self.max_workers)
+        parsed_files = parallel_map_files(_parse_ttl_file_timed, to_parse, self.max_workers)
+
+        entries = {}
+        try:
+            for ttl_file in source_files:
+                name = str(ttl_file)
+                if is_cached(ttl_file):
+                    entry = cached_files[name]
+                    self._add_parsed_file(ttl_file, entry['triples'], entry['bindings'])
+                    self._files_from_snapshot += 1
+                else:
+                    entry = self._load_ttl_file(ttl_file, parsed_files)
+                    entry['stamp'] = stamps[name]
+                if self.use_snapshot:
+                    entries[name] = entry
+                self._files_loaded += 1
+        finally:
+            parsed_files.close()
+
+        user_files_loaded = sum(1 for path in source_files if self.ontology_dir not in path.parents)
+        if user_files_loaded > 0:
+            logger.info(f"Loaded {user_files_loaded} user-created individual files")
+
+        if self.use_snapshot and (to_parse or set(cached_files) != set(entries)):
+            self._write_snapshot(snapshot_key, entries)
+
+        self._last_load_wall_time = time.perf_counter() - wall_start
+        logger.info(
+            f"Loaded {self._files_loaded} TTL files successfully "
+            f"in {self._last_load_wall_time:.2f}s ({len(to_parse)} parsed)"
+        )
+        return self.graph
+
+    def _collect_source_files(self) -> List[Path]:
+        """
+        List the TTL files to load, in load order.
+
+        Returns:
+            Paths of ontology files followed by user-created individual files
+        """
         # Load files in specific order for dependencies
         load_order = [
             "core/DynaMat_core.ttl",
@@ -71,79 +272,191 @@ class OntologyLoader:
             "class_individuals/*.ttl"  # System-provided individuals
         ]
 
-        self._files_loaded = 0
-
+        source_files = []
         for pattern in load_order:
             if "*" in pattern:
                 # Handle wildcards
                 base_path = self.ontology_dir / pattern.replace("*.ttl", "")
                 if base_path.exists():
-                    for ttl_file in sorted(base_path.glob("*.ttl")):
-                        self._load_ttl_file(ttl_file)
-                        self._files_loaded += 1
+                    source_files.extend(sorted(base_path.glob("*.ttl")))
             else:
                 # Handle specific files
                 ttl_file = self.ontology_dir / pattern
                 if ttl_file.exists():
-                    self._load_ttl_file(ttl_file)
-                    self._files_loaded += 1
+                    source_files.append(ttl_file)
 
-        # Load user-created individuals from user_data/individuals/
+        # User-created individuals from user_data/individuals/
         if config and hasattr(config, 'USER_INDIVIDUALS_DIR'):
             user_individuals_dir = config.USER_INDIVIDUALS_DIR
             if user_individuals_dir.exists():
-                user_files_loaded = 0
-                for ttl_file in sorted(user_individuals_dir.glob("*.ttl")):
+                source_files.extend(
+                    ttl_file for ttl_file in sorted(user_individuals_dir.glob("*.ttl"))
                     # Skip .gitkeep files
-                    if ttl_file.name != ".gitkeep":
-                        self._load_ttl_file(ttl_file)
-                        self._files_loaded += 1
-                        user_files_loaded += 1
-
-                if user_files_loaded > 0:
-                    logger.info(f"Loaded {user_files_loaded} user-created individual files")
+                    if ttl_file.name != ".gitkeep"
+                )
 
-        if self._files_loaded == 0:
-            raise ValueError("No TTL files found in ontology directory")
+        return source_files
 
-        logger.info(f"Loaded {self._files_loaded} TTL files successfully")
-        return self.graph
-    
-    def _load_ttl_file(self, file_path: Path):
+    def _load_ttl_file(
+        self,
+        file_path: Path,
+        parsed_files: Optional[Iterator[Tuple[List[tuple], List[Tuple[str, str]], float]]] = None
+    ) -> Dict[str, Any]:
         """
-        Load a single TTL file into the graph.
+        Parse a single TTL file and add its triples to the graph.
 
         Args:
             file_path: Path to the TTL file
+            parsed_files: Iterator from parallel_map_files() whose next item
+                is this file's parse result (None to parse here)
+
+        Returns:
+            Snapshot entry with the file's triples and namespace bindings
 
         Raises:
             Exception: If file cannot be parsed
         """
-        import time
-
         try:
-            # Track graph size before loading
-            triples_before = len(self.graph)
-            start_time = time.time()
-
-            # Load the file
-            self.graph.parse(file_path, format="turtle")
-
-            # Calculate metrics
-            load_time = time.time() - start_time
-            triples_added = len(self.graph) - triples_before
-
-            # Track statistics
-            self._loaded_files.append((str(file_path), triples_added, load_time))
-            self._total_load_time += load_time
-
-            logger.debug(f"Loaded TTL file: {file_path} (+{triples_added} triples in {load_time:.3f}s)")
+            if parsed_files is None:
+                triples, bindings, parse_time = _parse_ttl_file_timed(file_path)
+            else:
+                triples, bindings, parse_time = next(parsed_files)
+            start_time = time.perf_counter() - parse_time
+            self._add_parsed_file(file_path, triples, bindings, start_time)
+            self._files_parsed += 1
+            return {'triples': triples, 'bindings': bindings}
 
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
             # Track failed file
             self._failed_files.append((str(file_path), str(e)))
             raise
+
+    def _add_parsed_file(
+        self,
+        file_path: Path,
+        triples: List[tuple],
+        bindings: List[Tuple[str, str]],
+        start_time: Optional[float] = None
+    ):
+        """
+        Add one file's parsed triples and prefixes to the graph.
+
+        Args:
+            file_path: Source TTL file (for statistics)
+            triples: Triples parsed from the file
+            bindings: Namespace bindings declared by the file
+            start_time: perf_counter() value when loading of the file started
+                (None to time only the graph insertion)
+        """
+        if start_time is None:
+            start_time = time.perf_counter()
+
+        # Track graph size before loading
+        triples_before = len(self.graph)
+        self.graph.addN((s, p, o, self.graph) for s, p, o in triples)
+        for prefix, namespace in bindings:
+            self.graph.bind(prefix, namespace)
+
+        # Calculate metrics
+        load_time = time.perf_counter() - start_time
+        triples_added = len(self.graph) - triples_before
+
+        # Track statistics
+        self._loaded_files.append((str(file_path), triples_added, load_time))
+        self._total_load_time += load_time
+
+        logger.debug(f"Loaded TTL file: {file_path} (+{triples_added} triples in {load_time:.3f}s)")
+
+    # ==================== SNAPSHOT ====================
+
+    def _snapshot_path(self, snapshot_dir: Path) -> Path:
+        """Snapshot file for this ontology directory."""
+        dir_hash = hashlib.sha1(str(Path(self.ontology_dir).resolve()).encode()).hexdigest()
+        return snapshot_dir / f"ontology_{dir_hash[:12]}.pickle"
+
+    @staticmethod
+    def _file_stamp(file_path: Path) -> Tuple[int, int]:
+        """(mtime_ns, size) of a source file."""
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _snapshot_key(stamps: Dict[str, Tuple[int, int]]) -> str:
+        """Content hash of the source files' paths, mtimes and sizes."""
+        digest = hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}|{rdflib.__version__}".encode())
+        for name, (mtime_ns, size) in stamps.items():
+            digest.update(f"\n{name}|{mtime_ns}|{size}".encode())
+        return digest.hexdigest()
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the snapshot file.
+
+        Returns:
+            Snapshot dict, or None if missing, unreadable or from another
+            snapshot format/rdflib version
+        """
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return None
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ontology snapshot {self.snapshot_path}: {e}")
+            return None
+
+        if (snapshot.get('format_version') != SNAPSHOT_FORMAT_VERSION
+                or snapshot.get('rdflib_version') != rdflib.__version__):
+            logger.info("Ontology snapshot is from another format or rdflib version, ignoring")
+            return None
+        return snapshot
+
+    def _write_snapshot(self, snapshot_key: str, entries: Dict[str, Dict[str, Any]]):
+        """
+        Atomically replace the snapshot file.
+
+        Args:
+            snapshot_key: Content hash of the loaded source files
+            entries: Per-file snapshot entries (stamp, triples, bindings)
+        """
+        # Share term objects across files: pickle then writes (and later
+        # reconstructs) each distinct URI/literal only once
+        terms = {}
+        entries = {
+            name: dict(entry, triples=[
+                (terms.setdefault(s, s), terms.setdefault(p, p), terms.setdefault(o, o))
+                for s, p, o in entry['triples']
+            ])
+            for name, entry in entries.items()
+        }
+        snapshot = {
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'rdflib_version': rdflib.__version__,
+            'key': snapshot_key,
+            'files': entries,
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.snapshot_path.parent, suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.snapshot_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            logger.debug(f"Wrote ontology snapshot: {self.snapshot_path}")
+        except Exception as e:
+            logger.warning(f"Could not write ontology snapshot {self.snapshot_path}: {e}")
+
+    def clear_snapshot(self):
+        """Delete the snapshot file so the next load re-parses every file."""
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self.snapshot_path.unlink()
+            logger.info(f"Deleted ontology snapshot: {self.snapshot_path}")
     
     def reload_ontology(self) -> Graph:
         """
@@ -155,7 +468,7 @@ class OntologyLoader:
             The reloaded RDF graph
         """
         logger.info("Reloading ontology files...")
-        self.graph = Graph()
+        self.graph = Graph(store=ObservableMemory())
         return self.load_ontology_files()
     
     def get_graph(self) -> Graph:
@@ -186,7 +499,10 @@ class OntologyLoader:
         return {
             'configuration': {
                 'ontology_directory': str(self.ontology_dir),
-                'directory_exists': self.ontology_dir.exists()
+                'directory_exists': self.ontology_dir.exists(),
+                'max_workers': self.max_workers,
+                'snapshot_enabled': self.use_snapshot,
+                'snapshot_path': str(self.snapshot_path) if self.snapshot_path else None
             },
             'execution': {
                 'files_loaded': self._files_loaded,
@@ -206,7 +522,11 @@ class OntologyLoader:
                         'error': error
                     }
                     for filename, error in self._failed_files
-                ]
+                ],
+                'snapshot_hits': self._snapshot_hits,
+                'snapshot_misses': self._snapshot_misses,
+                'files_from_snapshot': self._files_from_snapshot,
+                'files_parsed': self._files_parsed
             },
             'health': {
                 'total_failures': len(self._failed_files),
@@ -222,7 +542,9 @@ class OntologyLoader:
                     (self._total_load_time / self._files_loaded * 1000)
                     if self._files_loaded > 0
                     else 0
-                )
+                ),
+                'last_load_wall_time_ms': self._last_load_wall_time * 1000,
+                'last_load_workers': self._last_load_workers
             }
         }
 
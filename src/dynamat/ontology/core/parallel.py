@@ -0,0 +1,73 @@
+"""
+DynaMat Platform - Parallel File Mapping
+Process-pool map over TTL files, shared by the ontology loader, the
+instance index scan and the specimen loader
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Below this many files, a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def pool_size(n_files: int, max_workers: int, min_files: Optional[int] = None) -> int:
+    """
+    Number of processes parallel_map_files() uses for n_files files.
+
+    Args:
+        n_files: Files to map
+        max_workers: Pool size limit (0: one per CPU)
+        min_files: Below this many files, map in this process
+            (default: PARALLEL_MIN_FILES)
+
+    Returns:
+        1 for serial mapping, otherwise the pool size
+    """
+    if min_files is None:
+        min_files = PARALLEL_MIN_FILES
+    if n_files < min_files:
+        return 1
+    return max(1, min(max_workers or os.cpu_count() or 1, n_files))
+
+
+def parallel_map_files(fn: Callable[[Path], T], files: Sequence[Path], max_workers: int,
+                       min_files: Optional[int] = None) -> Iterator[T]:
+    """
+    Apply fn to every file and yield the results in input order.
+
+    With a pool size above 1 (see pool_size()), fn runs in worker
+    processes and must be picklable (a module-level function or a
+    functools.partial of one); otherwise files are mapped lazily in this
+    process. Exceptions raised by fn propagate to the caller.
+
+    Args:
+        fn: Function of one file path
+        files: Files to map
+        max_workers: Pool size limit (0: one per CPU, 1: serial)
+        min_files: Below this many files, map in this process
+            (default: PARALLEL_MIN_FILES)
+
+    Yields:
+        fn(file) for each file, in order
+    """
+    workers = pool_size(len(files), max_workers, min_files)
+    if workers <= 1:
+        yield from map(fn, files)
+        return
+
+    logger.info(f"Parsing {len(files)} files with {workers} worker processes")
+    # Several files per task amortizes inter-process overhead for small files
+    chunksize = max(1, len(files) // (workers * 8))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from executor.map(fn, files, chunksize=chunksize)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -4,19 +4,97 @@ SPARQL-based query system for finding and loading entity instances
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import threading
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
 from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef, BNode
 from rdflib.namespace import XSD
 
+from .cache.instance_graph_cache import InstanceGraphCache
+from .core.parallel import parallel_map_files
+from .cache.instance_index_store import IndexSync, InstanceIndexStore
+from .cache.instance_search_index import InstanceSearchIndex, NumericRange
+
+# Import config for the persistent index, scan workers and graph cache
+try:
+    from ..config import config
+except ImportError:
+    # Fallback if import fails
+    config = None
+
 QUDT = Namespace("http://qudt.org/schema/qudt/")
 PROV = Namespace("http://www.w3.org/ns/prov#")
 DC = Namespace("http://purl.org/dc/elements/1.1/")
+DYN = Namespace("https://dynamat.utep.edu/ontology#")
 
 logger = logging.getLogger(__name__)
 
+# (files done, files total); called with (total, total) when a scan completes
+ProgressCallback = Callable[[int, int], None]
+
+
+def _extract_instance_metadata(ttl_file: Path, class_uri: URIRef) -> Optional[Dict[str, Any]]:
+    """
+    Extract minimal metadata from TTL file for indexing.
+
+    Module-level so that scan worker processes can run it; the returned
+    dict holds only rdflib terms and plain Python values and is picklable.
+
+    Extracts:
+    - Instance URI
+    - Instance type (to verify it matches class_uri)
+    - Display properties (ID, label, material, shape, etc.)
+
+    Args:
+        ttl_file: Path to TTL file
+        class_uri: Expected class URI
+
+    Returns:
+        Dictionary with metadata, or None if file invalid
+    """
+    try:
+        # Load TTL file
+        graph = Graph()
+        graph.parse(ttl_file, format="turtle")
+
+        # Find instance of the specified class
+        instance_uri = None
+        for s in graph.subjects(RDF.type, class_uri):
+            instance_uri = s
+            break
+
+        if not instance_uri:
+            logger.debug(f"No instance of {class_uri} found in {ttl_file.name}")
+            return None
+
+        # Extract common display properties
+        metadata = {
+            'uri': instance_uri,
+            'type': class_uri
+        }
+
+        # Extract all properties for this instance
+        for pred, obj in graph.predicate_objects(instance_uri):
+            pred_str = str(pred)
+
+            # Convert RDF value to Python value
+            if isinstance(obj, Literal):
+                metadata[pred_str] = obj.toPython()
+            elif isinstance(obj, URIRef):
+                metadata[pred_str] = str(obj)
+            elif isinstance(obj, BNode) and (obj, RDF.type, QUDT.QuantityValue) in graph:
+                metadata[pred_str] = InstanceQueryBuilder._extract_quantity_value(graph, obj)
+
+        return metadata
+
+    except Exception as e:
+        logger.error(f"Failed to extract metadata from {ttl_file}: {e}")
+        return None
+
 
 class InstanceQueryBuilder:
     """
@@ -28,9 +106,21 @@ class InstanceQueryBuilder:
     3. Provides SPARQL queries for fast searching
     4. Supports lazy loading of full instance data
 
+    Extracted metadata is kept in an on-disk InstanceIndexStore, so a rescan
+    (or the first scan of a new session) only parses files that were added
+    or modified since they were last indexed. Large scans can parse files
+    in a process pool (max_workers > 1); the extracted metadata is merged
+    into the index graph in one batch.
+
+    Indexed instances are also kept in an InstanceSearchIndex, which
+    search_instances() and facet_counts() query without SPARQL. Instance
+    files are located through a URI -> path map, and their parsed graphs
+    are kept in an LRU InstanceGraphCache for load_full_instance_data().
+
     Features:
     - Find all instances of a class
     - Filter by properties
+    - Token, prefix and numeric-range search with facet counts
     - Get display metadata for lists/tables
     - Load full instance data on demand
 
@@ -46,18 +136,43 @@ class InstanceQueryBuilder:
         )
     """
 
-    def __init__(self, ontology_manager=None):
+    # Default properties of facet_counts()
+    FACET_PROPERTIES = (
+        str(DYN.hasMaterial),
+        str(DYN.hasShape),
+        str(DYN.hasStructure),
+        str(DYN.hasTestType),
+        str(DYN.hasTestValidity),
+    )
+
+    def __init__(self, ontology_manager=None, use_persistent_index: Optional[bool] = None,
+                 index_path: Optional[Path] = None, max_workers: Optional[int] = None,
+                 graph_cache_triples: Optional[int] = None):
         """
         Initialize the query builder.
 
         Args:
             ontology_manager: Optional OntologyManager for namespace resolution
+            use_persistent_index: Keep extracted metadata in an on-disk index
+                (defaults to config.USE_INSTANCE_INDEX)
+            index_path: Index database file
+                (defaults to config.INSTANCE_INDEX_PATH)
+            max_workers: Parser processes for scans; 1 parses serially, 0
+                uses one per CPU (defaults to config.INSTANCE_SCAN_WORKERS)
+            graph_cache_triples: Triple budget of parsed instance files kept
+                for lazy loading; 0 disables the cache
+                (defaults to config.INSTANCE_GRAPH_CACHE_TRIPLES)
         """
         self.logger = logging.getLogger(__name__)
         self.ontology_manager = ontology_manager
 
-        # Index graph for fast queries
+        # Index graph for fast queries; hold lock while querying or changing
+        # it from more than one thread (e.g. EntitySelectorWidget's worker)
         self.index_graph = Graph()
+        self.lock = threading.RLock()
+
+        # Inverted and faceted index of the same instances
+        self.search_index = InstanceSearchIndex()
 
         # Setup namespaces
         self.DYN = Namespace("https://dynamat.utep.edu/ontology#")
@@ -72,6 +187,27 @@ class InstanceQueryBuilder:
 
         # Index metadata
         self.indexed_classes = {}  # class_uri -> {'dir': Path, 'pattern': str, 'count': int}
+        self._indexed_files: Dict[Tuple[str, str], Dict[str, URIRef]] = {}  # (dir, class_uri) -> path -> instance
+        self._instance_paths: Dict[str, str] = {}  # instance URI -> file path
+
+        if use_persistent_index is None:
+            use_persistent_index = getattr(config, 'USE_INSTANCE_INDEX', False)
+        if index_path is None:
+            index_path = getattr(config, 'INSTANCE_INDEX_PATH', None)
+        self.index_store = (
+            InstanceIndexStore(Path(index_path))
+            if use_persistent_index and index_path is not None else None
+        )
+
+        if max_workers is None:
+            max_workers = getattr(config, 'INSTANCE_SCAN_WORKERS', 1)
+        if max_workers < 0:
+            raise ValueError(f"max_workers must be >= 0, got {max_workers}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if graph_cache_triples is None:
+            graph_cache_triples = getattr(config, 'INSTANCE_GRAPH_CACHE_TRIPLES', 0)
+        self.graph_cache = InstanceGraphCache(graph_cache_triples)
 
         self.logger.info("InstanceQueryBuilder initialized")
 
@@ -79,7 +215,8 @@ class InstanceQueryBuilder:
     # INDEXING METHODS
     # ============================================================================
 
-    def scan_and_index(self, entity_dir: Path, class_uri: str, file_pattern: str = "*.ttl") -> int:
+    def scan_and_index(self, entity_dir: Path, class_uri: str, file_pattern: str = "*.ttl",
+                       progress_callback: Optional[ProgressCallback] = None) -> int:
         """
         Scan directory and build index for instances of a specific class.
 
@@ -89,10 +226,16 @@ class InstanceQueryBuilder:
         - File path for lazy loading
         - Last indexed timestamp
 
+        Rescanning a directory only updates the instances of files that were
+        added, modified or deleted. With the persistent index enabled,
+        unchanged files are not parsed even on the first scan of a session.
+
         Args:
             entity_dir: Directory containing entity folders (e.g., specimens/)
             class_uri: Full URI of the ontology class (e.g., "https://dynamat.utep.edu/ontology#Specimen")
             file_pattern: Glob pattern for TTL files (default: "*.ttl")
+            progress_callback: Called with (files done, files total) while
+                files are parsed and with (total, total) when the scan ends
 
         Returns:
             Number of instances indexed
@@ -104,56 +247,99 @@ class InstanceQueryBuilder:
                 self.logger.warning(f"Directory does not exist: {entity_dir}")
                 return 0
 
-            indexed_count = 0
             class_uri_ref = URIRef(class_uri)
 
             # Scan directory structure
+            ttl_files = []
             for entity_folder in entity_dir.iterdir():
-                if not entity_folder.is_dir():
-                    continue
-
-                # Find TTL files matching pattern
-                ttl_files = list(entity_folder.glob(file_pattern))
-
-                for ttl_file in ttl_files:
+                if entity_folder.is_dir():
+                    ttl_files.extend(entity_folder.glob(file_pattern))
+            total = len(ttl_files)
+
+            def extract(files: List[Path]) -> Iterator[Optional[Dict[str, Any]]]:
+                done = total - len(files)
+                for metadata in self._extract_files(files, class_uri_ref):
+                    done += 1
+                    if progress_callback and done < total:
+                        progress_callback(done, total)
+                    yield metadata
+
+            if self.index_store is not None:
+                sync = self.index_store.sync(entity_dir, class_uri, ttl_files, extract)
+            else:
+                sync = IndexSync()
+                for ttl_file, metadata in zip(ttl_files, extract(ttl_files)):
+                    name = os.path.abspath(ttl_file)
+                    sync.metadata[name] = metadata
+                    sync.changed.add(name)
+                    sync.files_parsed += 1
+
+            indexed = self._indexed_files.setdefault((os.path.abspath(entity_dir), class_uri), {})
+
+            with self.lock:
+                # Drop instances of deleted and modified files
+                for name in [n for n in indexed if n in sync.changed or n not in sync.metadata]:
+                    instance_uri = indexed.pop(name)
+                    self.index_graph.remove((instance_uri, None, None))
+                    self.search_index.remove(instance_uri)
+                    self._instance_paths.pop(str(instance_uri), None)
+
+                # Add new and modified instances in one batch
+                indexed_at = Literal(datetime.now().isoformat(), datatype=XSD.dateTime)
+                triples = []
+                for name, metadata in sync.metadata.items():
+                    if metadata is None or name in indexed:
+                        continue
                     try:
-                        # Extract key metadata from TTL file
-                        metadata = self._extract_index_metadata(ttl_file, class_uri_ref)
-
-                        if metadata:
-                            # Add to index graph
-                            self._add_to_index(metadata, ttl_file, class_uri_ref)
-                            indexed_count += 1
-                            self.logger.debug(f"Indexed: {ttl_file.name}")
-
+                        triples.extend(self._index_triples(metadata, Path(name), class_uri_ref, indexed_at))
+                        self.search_index.add(class_uri, metadata, name)
+                        self._instance_paths[str(metadata['uri'])] = name
+                        indexed[name] = metadata['uri']
                     except Exception as e:
-                        self.logger.error(f"Failed to index {ttl_file}: {e}")
-                        continue
+                        self.logger.error(f"Failed to index {name}: {e}")
+                self.index_graph.addN((s, p, o, self.index_graph) for s, p, o in triples)
+
+            indexed_count = len(indexed)
 
             # Store index metadata
             self.indexed_classes[class_uri] = {
                 'dir': entity_dir,
                 'pattern': file_pattern,
                 'count': indexed_count,
-                'last_scan': datetime.now()
+                'last_scan': datetime.now(),
+                'files_parsed': sync.files_parsed,
+                'files_reused': sync.files_reused + sync.files_rehashed,
+                'files_removed': len(sync.removed),
             }
 
-            self.logger.info(f"Indexed {indexed_count} instances of {class_uri}")
+            if progress_callback:
+                progress_callback(total, total)
+
+            self.logger.info(
+                f"Indexed {indexed_count} instances of {class_uri} "
+                f"({sync.files_parsed} files parsed)"
+            )
             return indexed_count
 
         except Exception as e:
             self.logger.error(f"Failed to scan and index {entity_dir}: {e}")
             return 0
 
+    def _extract_files(self, files: List[Path], class_uri: URIRef) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Extract index metadata from files and yield it in input order.
+
+        Args:
+            files: TTL files to parse
+            class_uri: Expected class URI
+        """
+        extract = partial(_extract_instance_metadata, class_uri=class_uri)
+        yield from parallel_map_files(extract, files, self.max_workers)
+
     def _extract_index_metadata(self, ttl_file: Path, class_uri: URIRef) -> Optional[Dict[str, Any]]:
         """
         Extract minimal metadata from TTL file for indexing.
 
-        Extracts:
-        - Instance URI
-        - Instance type (to verify it matches class_uri)
-        - Display properties (ID, label, material, shape, etc.)
-
         Args:
             ttl_file: Path to TTL file
             class_uri: Expected class URI
@@ -161,72 +347,48 @@ class InstanceQueryBuilder:
         Returns:
             Dictionary with metadata, or None if file invalid
         """
-        try:
-            # Load TTL file
-            graph = Graph()
-            graph.parse(ttl_file, format="turtle")
-
-            # Find instance of the specified class
-            instance_uri = None
-            for s in graph.subjects(RDF.type, class_uri):
-                instance_uri = s
-                break
-
-            if not instance_uri:
-                self.logger.debug(f"No instance of {class_uri} found in {ttl_file.name}")
-                return None
-
-            # Extract common display properties
-            metadata = {
-                'uri': instance_uri,
-                'type': class_uri
-            }
-
-            # Extract all properties for this instance
-            for pred, obj in graph.predicate_objects(instance_uri):
-                pred_str = str(pred)
-
-                # Convert RDF value to Python value
-                if isinstance(obj, Literal):
-                    metadata[pred_str] = obj.toPython()
-                elif isinstance(obj, URIRef):
-                    metadata[pred_str] = str(obj)
-                elif isinstance(obj, BNode) and (obj, RDF.type, QUDT.QuantityValue) in graph:
-                    metadata[pred_str] = self._extract_quantity_value(graph, obj)
-
-            return metadata
-
-        except Exception as e:
-            self.logger.error(f"Failed to extract metadata from {ttl_file}: {e}")
-            return None
+        return _extract_instance_metadata(ttl_file, class_uri)
 
     def _add_to_index(self, metadata: Dict[str, Any], ttl_file: Path, class_uri: URIRef):
         """
-        Add instance metadata to index graph.
+        Add instance metadata to index graph and search index.
 
         Args:
             metadata: Metadata dictionary from _extract_index_metadata
             ttl_file: Path to source TTL file
             class_uri: Class URI
         """
-        instance_uri = metadata['uri']
+        indexed_at = Literal(datetime.now().isoformat(), datatype=XSD.dateTime)
+        with self.lock:
+            for triple in self._index_triples(metadata, ttl_file, class_uri, indexed_at):
+                self.index_graph.add(triple)
+            self.search_index.add(class_uri, metadata, os.path.abspath(ttl_file))
+            self._instance_paths[str(metadata['uri'])] = os.path.abspath(ttl_file)
+
+    def _index_triples(self, metadata: Dict[str, Any], ttl_file: Path, class_uri: URIRef,
+                       indexed_at: Literal) -> List[tuple]:
+        """
+        Build the index graph triples of one instance.
 
-        # Add instance type
-        self.index_graph.add((instance_uri, RDF.type, class_uri))
+        Args:
+            metadata: Metadata dictionary from _extract_index_metadata
+            ttl_file: Path to source TTL file
+            class_uri: Class URI
+            indexed_at: Last indexed timestamp literal
 
-        # Add file path for lazy loading
-        self.index_graph.add((
-            instance_uri,
-            self.FILE_PATH,
-            Literal(str(ttl_file.absolute()))
-        ))
+        Returns:
+            List of (subject, predicate, object) triples
+        """
+        instance_uri = metadata['uri']
 
-        # Add last indexed timestamp
-        self.index_graph.add((
-            instance_uri,
-            self.LAST_INDEXED,
-            Literal(datetime.now().isoformat(), datatype=XSD.dateTime)
-        ))
+        triples = [
+            # Instance type
+            (instance_uri, RDF.type, class_uri),
+            # File path for lazy loading
+            (instance_uri, self.FILE_PATH, Literal(os.path.abspath(ttl_file))),
+            # Last indexed timestamp
+            (instance_uri, self.LAST_INDEXED, indexed_at),
+        ]
 
         # Add all other properties from metadata
         for prop_uri, value in metadata.items():
@@ -238,7 +400,7 @@ class InstanceQueryBuilder:
 
                 # Add as literal or URI reference
                 if isinstance(value, str) and (value.startswith('http://') or value.startswith('https://')):
-                    self.index_graph.add((instance_uri, prop_ref, URIRef(value)))
+                    triples.append((instance_uri, prop_ref, URIRef(value)))
                 else:
                     # Infer datatype
                     if isinstance(value, bool):
@@ -250,16 +412,19 @@ class InstanceQueryBuilder:
                     else:
                         lit = Literal(str(value))
 
-                    self.index_graph.add((instance_uri, prop_ref, lit))
+                    triples.append((instance_uri, prop_ref, lit))
 
             except Exception as e:
                 self.logger.debug(f"Could not add property {prop_uri}: {e}")
 
+        return triples
+
     def rebuild_index(self):
         """
         Rebuild all indexes from scratch.
 
         Clears current index and re-scans all previously indexed directories.
+        The persistent index is kept, so only changed files are re-parsed.
         """
         self.logger.info("Rebuilding all indexes")
 
@@ -267,10 +432,14 @@ class InstanceQueryBuilder:
         classes_to_rebuild = list(self.indexed_classes.items())
 
         # Clear index
-        self.index_graph = Graph()
-        self.index_graph.bind("dyn", self.DYN)
-        self.index_graph.bind("gui", self.GUI)
-        self.index_graph.bind("xsd", XSD)
+        with self.lock:
+            self.index_graph = Graph()
+            self.index_graph.bind("dyn", self.DYN)
+            self.index_graph.bind("gui", self.GUI)
+            self.index_graph.bind("xsd", XSD)
+            self.search_index.clear()
+            self._instance_paths.clear()
+            self._indexed_files.clear()
 
         # Rebuild each class
         for class_uri, info in classes_to_rebuild:
@@ -329,7 +498,8 @@ class InstanceQueryBuilder:
                 """
 
             # Execute query
-            results = self.index_graph.query(query)
+            with self.lock:
+                results = list(self.index_graph.query(query))
 
             # Process results
             if display_properties:
@@ -402,7 +572,8 @@ class InstanceQueryBuilder:
                 }}
             """
 
-            results = self.index_graph.query(query)
+            with self.lock:
+                results = list(self.index_graph.query(query))
 
             # Group properties by instance
             instance_data = None
@@ -472,7 +643,8 @@ class InstanceQueryBuilder:
             """
 
             self.logger.debug(f"Filter query: {query}")
-            results = self.index_graph.query(query)
+            with self.lock:
+                results = list(self.index_graph.query(query))
 
             # Group by instance
             instances_dict = {}
@@ -497,6 +669,82 @@ class InstanceQueryBuilder:
             self.logger.error(f"Failed to filter instances: {e}")
             return []
 
+    def search_instances(self, class_uri: str, filters: Optional[Dict[str, Any]] = None,
+                         text: Optional[str] = None, prefixes: Optional[Dict[str, str]] = None,
+                         ranges: Optional[Dict[str, NumericRange]] = None,
+                         display_properties: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search instances in the search index (no SPARQL).
+
+        Results have the same form as filter_instances(). Short property
+        names (e.g. "hasMaterial") are expanded to the dyn: namespace.
+
+        Args:
+            class_uri: Full URI of the class
+            filters: Property URI -> value the property must equal
+            text: Search text; each of its tokens must start a token of a
+                string value or URI local name (e.g. "ss3" matches SS316)
+            prefixes: Property URI -> prefix the value must start with
+            ranges: Property URI -> (low, high) inclusive numeric bounds;
+                QuantityValue properties compare their numeric value
+            display_properties: Properties to include (if None, includes all)
+
+        Returns:
+            List of matching instances, sorted by URI
+        """
+        try:
+            uris = self.search_index.find(
+                class_uri,
+                filters=self._expand_keys(filters),
+                text=text,
+                prefixes=self._expand_keys(prefixes),
+                ranges=self._expand_keys(ranges),
+            )
+            return self.search_index.get_records(uris, display_properties)
+        except Exception as e:
+            self.logger.error(f"Failed to search instances of {class_uri}: {e}")
+            return []
+
+    def facet_counts(self, class_uri: str, properties: Optional[List[str]] = None,
+                     filters: Optional[Dict[str, Any]] = None, text: Optional[str] = None,
+                     prefixes: Optional[Dict[str, str]] = None,
+                     ranges: Optional[Dict[str, NumericRange]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count matching instances per value of facet properties.
+
+        The counts of each property apply every filter except its own, so
+        they give the result size of selecting that value instead.
+
+        Args:
+            class_uri: Full URI of the class
+            properties: Facet property URIs (default: FACET_PROPERTIES)
+            filters, text, prefixes, ranges: As in search_instances()
+
+        Returns:
+            Property URI -> value -> instance count
+        """
+        if properties is None:
+            properties = list(self.FACET_PROPERTIES)
+        try:
+            return self.search_index.facet_counts(
+                class_uri,
+                list(self._expand_keys(dict.fromkeys(properties))),
+                filters=self._expand_keys(filters),
+                text=text,
+                prefixes=self._expand_keys(prefixes),
+                ranges=self._expand_keys(ranges),
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to count facets of {class_uri}: {e}")
+            return {}
+
+    def _expand_keys(self, mapping: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Expand short property names in mapping keys to full dyn: URIs."""
+        return {
+            str(prop) if str(prop).startswith('http') else f"{self.DYN}{prop}": value
+            for prop, value in (mapping or {}).items()
+        }
+
     # ============================================================================
     # LAZY LOADING METHODS
     # ============================================================================
@@ -511,31 +759,16 @@ class InstanceQueryBuilder:
         Returns:
             Path to TTL file, or None if not found
         """
-        try:
-            query = f"""
-                SELECT ?filePath
-                WHERE {{
-                    <{instance_uri}> <{self.FILE_PATH}> ?filePath
-                }}
-            """
-
-            results = self.index_graph.query(query)
-
-            for row in results:
-                return Path(str(row.filePath))
-
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Failed to get file path for {instance_uri}: {e}")
-            return None
+        file_path = self._instance_paths.get(str(instance_uri))
+        return Path(file_path) if file_path is not None else None
 
     def load_full_instance_data(self, instance_uri: str) -> Dict[str, Any]:
         """
         Load complete instance data from TTL file (lazy loading).
 
-        This re-parses the TTL file to get all property values in the format
-        expected by form widgets.
+        The parsed TTL file comes from the graph cache, so browsing
+        instances parses each file once (until it is modified). Values are
+        in the format expected by form widgets.
 
         Args:
             instance_uri: URI of the instance to load
@@ -551,9 +784,8 @@ class InstanceQueryBuilder:
                 self.logger.error(f"File not found for instance {instance_uri}")
                 return {}
 
-            # Parse full TTL file
-            graph = Graph()
-            graph.parse(file_path, format="turtle")
+            # Parsed TTL file (cached; read-only)
+            graph = self.graph_cache.get(file_path)
 
             # Extract all properties
             instance_ref = URIRef(instance_uri)
@@ -632,16 +864,38 @@ class InstanceQueryBuilder:
             stats['classes'][class_uri] = {
                 'count': info['count'],
                 'directory': str(info['dir']),
-                'last_scan': info['last_scan'].isoformat() if info.get('last_scan') else None
+                'last_scan': info['last_scan'].isoformat() if info.get('last_scan') else None,
+                'files_parsed': info.get('files_parsed', 0),
+                'files_reused': info.get('files_reused', 0),
+                'files_removed': info.get('files_removed', 0),
             }
 
+        stats['search_index'] = self.search_index.get_statistics()
+        stats['graph_cache'] = self.graph_cache.get_statistics()
+
+        if self.index_store is not None:
+            stats['persistent_index'] = self.index_store.get_statistics()
+
         return stats
 
-    def clear_index(self):
-        """Clear all indexed data."""
-        self.index_graph = Graph()
-        self.index_graph.bind("dyn", self.DYN)
-        self.index_graph.bind("gui", self.GUI)
-        self.index_graph.bind("xsd", XSD)
-        self.indexed_classes.clear()
+    def clear_index(self, persistent: bool = False):
+        """
+        Clear all indexed data.
+
+        Args:
+            persistent: Also empty the on-disk index, so the next scan
+                re-parses every file
+        """
+        with self.lock:
+            self.index_graph = Graph()
+            self.index_graph.bind("dyn", self.DYN)
+            self.index_graph.bind("gui", self.GUI)
+            self.index_graph.bind("xsd", XSD)
+            self.search_index.clear()
+            self._instance_paths.clear()
+            self.indexed_classes.clear()
+            self._indexed_files.clear()
+        self.graph_cache.clear()
+        if persistent and self.index_store is not None:
+            self.index_store.clear()
         self.logger.info("Index cleared")
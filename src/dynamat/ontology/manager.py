@@ -14,7 +14,9 @@ from .core.namespace_manager import NamespaceManager
 from .query.sparql_executor import SPARQLExecutor
 from .query.domain_queries import DomainQueries
 from .cache.metadata_cache import MetadataCache
+from .cache.class_index import ClassHierarchyIndex
 from .schema.gui_schema_builder import GUISchemaBuilder, ClassMetadata
+from .schema.metadata_prefetcher import MetadataPrefetcher
 from .qudt.qudt_manager import QUDTManager
 
 from ..config import config
@@ -59,6 +61,7 @@ class OntologyManager:
         self.namespace_manager = NamespaceManager()
         self.cache = MetadataCache()
         self.qudt_manager = QUDTManager()
+        self.metadata_prefetcher: Optional[MetadataPrefetcher] = None
         
         # Load ontology and setup components
         self._initialize()
@@ -73,16 +76,24 @@ class OntologyManager:
         # Setup namespaces
         self.namespace_manager = NamespaceManager(graph)
         self.namespace_manager.setup_graph_namespaces(graph)
+
+        # Evict cached metadata when the graph is mutated after loading
+        self.cache.watch_graph(graph)
+
+        # Subclass closure / instances-by-class index, kept current by graph events
+        self.class_index = ClassHierarchyIndex(graph)
         
         # Initialize query and schema components
         self.sparql_executor = SPARQLExecutor(graph, self.namespace_manager)
-        self.domain_queries = DomainQueries(self.sparql_executor, self.namespace_manager)
+        self.domain_queries = DomainQueries(self.sparql_executor, self.namespace_manager,
+                                            self.class_index)
         self.gui_schema_builder = GUISchemaBuilder(
                                                     self.sparql_executor, 
                                                     self.namespace_manager, 
                                                     self.cache,
                                                     self.qudt_manager  
                                                 )
+        self.metadata_prefetcher = MetadataPrefetcher(self.gui_schema_builder)
                                                 
         # Load QUDT data after initialization
         logger.info("Loading QUDT units data...")
@@ -97,10 +108,30 @@ class OntologyManager:
         """
         Get comprehensive class metadata for form building.
         
-        This is the main method called by form_builder.py.
+        This is the main method called by form_builder.py. If the class is
+        being prefetched in the background, waits for that build instead of
+        starting a second one.
         """
+        if self.metadata_prefetcher is not None:
+            metadata = self.metadata_prefetcher.claim(class_uri)
+            if metadata is not None:
+                return metadata
         return self.gui_schema_builder.get_class_metadata_for_form(class_uri)
 
+    def prefetch_class_metadata(self, class_uris: Optional[List[str]] = None) -> List[str]:
+        """
+        Build form metadata for classes on a background thread.
+
+        Args:
+            class_uris: Full class URIs (defaults to config.PREFETCH_FORM_CLASSES)
+
+        Returns:
+            Class URIs queued for prefetch (cached or queued classes are skipped)
+        """
+        if class_uris is None:
+            class_uris = config.PREFETCH_FORM_CLASSES
+        return self.metadata_prefetcher.prefetch(class_uris)
+
     def get_all_individuals(self, class_uri: Optional[str] = None, include_subclasses: bool = True) -> List[str]:
         """
         Get all individuals of a class (backwards compatibility method).
@@ -286,7 +317,8 @@ class OntologyManager:
         """Reload the entire ontology from files."""
         logger.info("Reloading ontology...")
         
-        # Clear all caches
+        # Stop background builds against the old graph, then clear all caches
+        self.metadata_prefetcher.shutdown(wait=True)
         self.cache.clear_all_caches()
         self.sparql_executor.clear_cache()
         
@@ -327,6 +359,7 @@ class OntologyManager:
                     'classes_cached': cache_stats.classes_cached,
                     'properties_cached': cache_stats.properties_cached,
                     'cache_hit_ratio': self.cache.get_cache_hit_ratio(),
+                    'cache_evictions': cache_stats.cache_evictions,
                     'query_cache_size': query_stats.get('cached_queries', 0)
                 }
             },
@@ -347,7 +380,9 @@ class OntologyManager:
             },
             'components': {
                 'loader': self.loader.get_statistics(),
-                'schema_builder': self.gui_schema_builder.get_statistics()
+                'schema_builder': self.gui_schema_builder.get_statistics(),
+                'class_index': self.class_index.get_statistics(),
+                'metadata_prefetcher': self.metadata_prefetcher.get_statistics()
             }
         }
     
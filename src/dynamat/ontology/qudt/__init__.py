@@ -2,6 +2,7 @@
 QUDT (Quantities, Units, Dimensions and Types) integration module.
 """
 
-from .qudt_manager import QUDTManager, QUDTUnit
+from .qudt_manager import QUDTManager, QUDTUnit, UnitConversion
+from .unit_table import UnitTable
 
-__all__ = ['QUDTManager', 'QUDTUnit']
\ No newline at end of file
+__all__ = ['QUDTManager', 'QUDTUnit', 'UnitConversion', 'UnitTable']
\ No newline at end of file
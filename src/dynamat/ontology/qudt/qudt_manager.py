@@ -7,20 +7,22 @@ import logging
 import json
 import pickle
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import urllib.request
 import urllib.error
 
+import numpy as np
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, RDFS
 from ...config import Config
+from .unit_table import UnitTable
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QUDTUnit:
     """QUDT Unit information"""
     uri: str
@@ -54,6 +56,53 @@ class QUDTUnit:
         return self.quantity_kinds[0] if self.quantity_kinds else 'unknown'
 
 
+@dataclass(frozen=True, slots=True)
+class UnitConversion:
+    """
+    Affine transform between two units: target = value * scale + shift.
+
+    Folds the QUDT formula (value + from_offset) * from_multiplier through the
+    SI unit into two constants, so whole arrays convert with one multiply
+    and one add. Obtained from QUDTManager.get_conversion().
+    """
+    from_unit_uri: str
+    to_unit_uri: str
+    scale: float = 1.0
+    shift: float = 0.0
+
+    @property
+    def is_identity(self) -> bool:
+        return self.scale == 1.0 and self.shift == 0.0
+
+    def convert_scalar(self, value: float) -> float:
+        """Convert a single value."""
+        return value * self.scale + self.shift
+
+    def __call__(self, values, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert an array.
+
+        Args:
+            values: Array-like of values in the source unit
+            out: Float array for the result; pass `values` itself to
+                convert in place
+
+        Returns:
+            Converted float64 array (`out` when given)
+        """
+        if out is None:
+            result = np.array(values, dtype=np.float64)
+        else:
+            result = out
+            if result is not values:
+                result[...] = values
+        if self.scale != 1.0:
+            np.multiply(result, self.scale, out=result)
+        if self.shift != 0.0:
+            np.add(result, self.shift, out=result)
+        return result
+
+
 class QUDTManager:
     """
     Manages QUDT ontology data with persistent caching.
@@ -63,12 +112,25 @@ class QUDTManager:
     - Cache QUDT data to disk for fast subsequent loads
     - Query units by quantity kind
     - Manage cache freshness and updates
+
+    The JSON cache is compiled into a binary UnitTable (``qudt_units_table.pickle``)
+    on first load; later starts unpickle the table instead of decoding the
+    JSON and rebuilding the indexes. An existing cache is always loaded
+    without touching the network, even when it is older than a week; only
+    rebuild_cache() refreshes it. The units are downloaded automatically
+    only when there is no usable cache.
     """
     
     # QUDT online sources
     QUDT_UNITS_URL = "https://qudt.org/2.1/vocab/unit"
     QUDT_QUANTITYKINDS_URL = "https://qudt.org/2.1/vocab/quantitykind"
 
+    # Seconds to wait for the QUDT server, and to wait after a failed
+    # automatic download before trying the network again. The failure time
+    # is kept in cache_metadata.json, so it holds across launches.
+    DOWNLOAD_TIMEOUT = 30
+    DOWNLOAD_RETRY_INTERVAL = 600
+
     # Engineering quantity kinds relevant to materials testing.
     # NOTE: StrainRate and VolumeRatio have no units in the QUDT 2.1 online vocab;
     # they are covered by SUPPLEMENTAL_UNITS below.  TemperaturePerTime was added
@@ -148,17 +210,20 @@ class QUDTManager:
         
         self.cache_file = self.cache_dir / "qudt_units_cache.json"
         self.metadata_file = self.cache_dir / "cache_metadata.json"
+        self.table_file = self.cache_dir / "qudt_units_table.pickle"
         
         # Namespaces
         self.QUDT = Namespace("http://qudt.org/schema/qudt/")
         self.UNIT = Namespace("http://qudt.org/vocab/unit/")
         self.QKDV = Namespace("http://qudt.org/vocab/quantitykind/")
         
-        # Cache data structures
-        self.units_by_uri: Dict[str, QUDTUnit] = {}
-        self.units_by_quantity_kind: Dict[str, List[QUDTUnit]] = {}
+        # Cache data structures (owned by the unit table, updated in place)
+        self.unit_table = UnitTable()
+        self.units_by_uri: Dict[str, QUDTUnit] = self.unit_table.units_by_uri
+        self.units_by_quantity_kind: Dict[str, List[QUDTUnit]] = self.unit_table.units_by_quantity_kind
         
         self._is_loaded = False
+        self._conversions: Dict[Tuple[str, str], UnitConversion] = {}
         
         logger.info(f"QUDT Manager initialized with cache directory: {self.cache_dir}")
     
@@ -176,24 +241,60 @@ class QUDTManager:
         if self._is_loaded and not force_refresh:
             logger.debug("QUDT data already loaded")
             return True
+
+        self._conversions.clear()
         
-        # Try to load from cache first
+        # Any cache, even an old one, is used without touching the network
         if not force_refresh and self._load_from_cache():
+            if not self._is_cache_fresh():
+                logger.info("QUDT cache is more than a week old; call rebuild_cache() to refresh it")
             self._add_supplemental_units()
             self._is_loaded = True
             return True
-        
-        # Try to download and build cache
-        logger.info("QUDT cache not found or expired, building cache...")
-        
-        if self._download_and_build_cache():
-            self._add_supplemental_units()
-            self._is_loaded = True
-            return True
+
+        # No usable cache: download, unless the last attempt failed recently
+        if force_refresh or self._download_allowed():
+            logger.info("Building QUDT cache...")
+            if self._download_and_build_cache():
+                self._add_supplemental_units()
+                self._is_loaded = True
+                return True
+            if not force_refresh:
+                self._record_download_failure()
 
         logger.error("Failed to load QUDT data")
         return False
 
+    def _read_metadata(self) -> Dict:
+        """Contents of cache_metadata.json, or {} if missing or unreadable."""
+        try:
+            with open(self.metadata_file, 'r') as f:
+                metadata = json.load(f)
+            return metadata if isinstance(metadata, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _download_allowed(self) -> bool:
+        """Check whether enough time has passed since the last failed download."""
+        failed = self._read_metadata().get('last_download_failure')
+        if failed is None:
+            return True
+        try:
+            elapsed = datetime.now() - datetime.fromisoformat(failed)
+        except (TypeError, ValueError):
+            return True
+        return not timedelta(0) <= elapsed < timedelta(seconds=self.DOWNLOAD_RETRY_INTERVAL)
+
+    def _record_download_failure(self):
+        """Store the time of a failed download in the cache metadata."""
+        metadata = self._read_metadata()
+        metadata['last_download_failure'] = datetime.now().isoformat()
+        try:
+            with open(self.metadata_file, 'w') as f:
+                json.dump(metadata, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not record failed QUDT download: {e}")
+
     def _add_supplemental_units(self) -> None:
         """Merge SUPPLEMENTAL_UNITS into the in-memory index.
 
@@ -203,32 +304,18 @@ class QUDTManager:
         are left unchanged; only the quantity-kind index is extended.
         """
         for entry in self.SUPPLEMENTAL_UNITS:
-            uri = entry["uri"]
-
-            if uri in self.units_by_uri:
-                # Unit already loaded from cache — just extend its QK index
-                existing = self.units_by_uri[uri]
-                for qk in entry["quantity_kinds"]:
-                    if qk not in self.units_by_quantity_kind:
-                        self.units_by_quantity_kind[qk] = []
-                    if not any(u.uri == uri for u in self.units_by_quantity_kind[qk]):
-                        self.units_by_quantity_kind[qk].append(existing)
-            else:
-                # Unit not in cache — create a new QUDTUnit and register it
-                unit = QUDTUnit(
-                    uri=uri,
+            # UnitTable.add keeps an already-loaded unit and only extends its QK index
+            self.unit_table.add(
+                QUDTUnit(
+                    uri=entry["uri"],
                     symbol=entry["symbol"],
                     label=entry["label"],
                     quantity_kinds=list(entry["quantity_kinds"]),
                     conversion_multiplier=entry.get("conversion_multiplier", 1.0),
                     conversion_offset=entry.get("conversion_offset", 0.0),
-                )
-                self.units_by_uri[uri] = unit
-                for qk in unit.quantity_kinds:
-                    if qk not in self.units_by_quantity_kind:
-                        self.units_by_quantity_kind[qk] = []
-                    if not any(u.uri == uri for u in self.units_by_quantity_kind[qk]):
-                        self.units_by_quantity_kind[qk].append(unit)
+                ),
+                entry["quantity_kinds"],
+            )
 
         logger.debug(
             f"Supplemental units applied; manager now covers "
@@ -239,63 +326,81 @@ class QUDTManager:
         """
         Force rebuild of QUDT cache.
         
-        Useful when updating the extraction logic.
+        Useful when updating the extraction logic or refreshing an old
+        cache. The existing cache files are only replaced once the download
+        succeeds.
         """
         logger.info("Forcing QUDT cache rebuild...")
-        self.clear_cache()
+        self.unit_table.clear()
+        self._conversions.clear()
         self._is_loaded = False
         return self.load(force_refresh=True)
     
     def _load_from_cache(self) -> bool:
-        """Load QUDT data from disk cache."""
+        """Load QUDT data from disk cache, preferring the compiled unit table."""
         if not self.cache_file.exists():
             logger.debug("Cache file does not exist")
             return False
-        
-        # Check cache freshness
-        if not self._is_cache_fresh():
-            logger.info("Cache is stale, will rebuild")
-            return False
+
+        source_stamp = self._cache_file_stamp()
+        if Config.USE_QUDT_UNIT_TABLE:
+            table = UnitTable.load(self.table_file, source_stamp)
+            if table is not None:
+                self._use_table(table)
+                logger.info(f"Loaded {len(self.units_by_uri)} units from unit table")
+                return True
         
         try:
             with open(self.cache_file, 'r') as f:
                 cache_data = json.load(f)
             
-            # Reconstruct units from cache
+            # Reconstruct units from cache, indexed by ALL quantity kinds
+            self.unit_table.clear()
             for unit_data in cache_data.get('units', []):
-                unit = QUDTUnit.from_dict(unit_data)
-                self.units_by_uri[unit.uri] = unit
-
-                # Index by ALL quantity kinds
-                for qk in unit.quantity_kinds:
-                    if qk not in self.units_by_quantity_kind:
-                        self.units_by_quantity_kind[qk] = []
-                    self.units_by_quantity_kind[qk].append(unit)
+                self.unit_table.add(QUDTUnit.from_dict(unit_data))
             
             logger.info(f"Loaded {len(self.units_by_uri)} units from cache")
-            return True
             
         except Exception as e:
             logger.error(f"Failed to load from cache: {e}")
+            self.unit_table.clear()
             return False
+
+        if Config.USE_QUDT_UNIT_TABLE:
+            self.unit_table.save(self.table_file, source_stamp)
+        return True
+
+    def _use_table(self, table: UnitTable):
+        """Replace the in-memory index with a loaded unit table."""
+        self.unit_table = table
+        self.units_by_uri = table.units_by_uri
+        self.units_by_quantity_kind = table.units_by_quantity_kind
+
+    def _cache_file_stamp(self) -> Optional[tuple]:
+        """(mtime_ns, size) of the JSON cache, used to match the unit table to it."""
+        try:
+            stat = self.cache_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
     
     def _is_cache_fresh(self, max_age_days: int = 7) -> bool:
-        """Check if cache is fresh enough to use."""
-        if not self.metadata_file.exists():
+        """
+        Check if cache is fresh enough to use.
+
+        Only inspects the cache metadata; load() uses a stale cache as well,
+        and rebuild_cache() refreshes it.
+        """
+        metadata = self._read_metadata()
+        if 'created' not in metadata:
             return False
-        
+
         try:
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
             cache_time = datetime.fromisoformat(metadata['created'])
             age = datetime.now() - cache_time
             
             is_fresh = age < timedelta(days=max_age_days)
-            if is_fresh == True:
-                logger.debug(f"Cache age: {age.days} days, fresh: {is_fresh}")
-            else:
-                self.rebuild_cache()
+            logger.debug(f"Cache age: {age.days} days, fresh: {is_fresh}")
             return is_fresh
             
         except Exception as e:
@@ -313,9 +418,11 @@ class QUDTManager:
         
         # Try to download QUDT units
         try:
-            # Download with timeout
             logger.info(f"Fetching from {self.QUDT_UNITS_URL}...")
-            graph.parse(self.QUDT_UNITS_URL, format='turtle')
+            request = urllib.request.Request(self.QUDT_UNITS_URL, headers={'Accept': 'text/turtle'})
+            with urllib.request.urlopen(request, timeout=self.DOWNLOAD_TIMEOUT) as response:
+                data = response.read()
+            graph.parse(data=data, format='turtle')
             logger.info(f"Successfully downloaded QUDT units ({len(graph)} triples)")
             
         except (urllib.error.URLError, Exception) as e:
@@ -323,6 +430,7 @@ class QUDTManager:
             return False
         
         # Extract units from graph
+        self.unit_table.clear()
         self._extract_units_from_graph(graph)
         
         # Save to cache
@@ -429,17 +537,8 @@ class QUDTManager:
                 conversion_offset=data['conversion_offset'] if data['conversion_offset'] is not None else 0.0
             )
 
-            # Store by URI (one instance per unit)
-            self.units_by_uri[unit_uri] = unit
-
-            # Index under ALL its quantity kinds
-            for qk in quantity_kinds_list:
-                if qk not in self.units_by_quantity_kind:
-                    self.units_by_quantity_kind[qk] = []
-
-                # Add this unit to the quantity kind index
-                if not any(u.uri == unit_uri for u in self.units_by_quantity_kind[qk]):
-                    self.units_by_quantity_kind[qk].append(unit)
+            # Store by URI (one instance per unit), indexed under ALL its quantity kinds
+            self.unit_table.add(unit)
         
         logger.info(f"Extracted {len(self.units_by_uri)} unique engineering units from graph")
         logger.info(f"Organized into {len(self.units_by_quantity_kind)} quantity kinds")
@@ -471,6 +570,9 @@ class QUDTManager:
             
             with open(self.metadata_file, 'w') as f:
                 json.dump(metadata, f, indent=2)
+
+            if Config.USE_QUDT_UNIT_TABLE:
+                self.unit_table.save(self.table_file, self._cache_file_stamp())
             
             logger.info(f"Saved cache to {self.cache_file}")
             return True
@@ -492,10 +594,8 @@ class QUDTManager:
         if not self._is_loaded:
             self.load()
         
-        units = self.units_by_quantity_kind.get(quantity_kind_uri, [])
-        
-        # Sort by symbol for better UX
-        return sorted(units, key=lambda u: u.symbol.lower())
+        # Sorted by symbol for better UX (memoized per quantity kind)
+        return list(self.unit_table.sorted_units(quantity_kind_uri))
     
     def get_unit_by_uri(self, unit_uri: str) -> Optional[QUDTUnit]:
         """Get unit information by URI."""
@@ -518,6 +618,9 @@ class QUDTManager:
         - Ratio scales (length, mass, force): offset = 0
         - Interval scales (temperature): offset ≠ 0
 
+        The unit pair is resolved once and cached (see get_conversion);
+        use convert_array() for whole series.
+
         Args:
             value: The numeric value in from_unit
             from_unit_uri: Source unit URI (e.g., "http://qudt.org/vocab/unit/IN")
@@ -536,51 +639,102 @@ class QUDTManager:
             >>> manager.convert_value(100.0, "unit:DEG_C", "unit:K")
             373.15  # 100°C = 373.15 K (interval scale, offset = 273.15)
         """
+        conversion = self.get_conversion(from_unit_uri, to_unit_uri)
+        if conversion.is_identity:
+            return value
+        return conversion.convert_scalar(value)
+
+    def convert_array(self, values, from_unit_uri: str, to_unit_uri: str,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert a whole array of values between two units.
+
+        The unit pair is resolved once (see get_conversion) and applied as a
+        vectorized multiply-add.
+
+        Args:
+            values: Array-like of values in from_unit
+            from_unit_uri: Source unit URI (full or prefixed)
+            to_unit_uri: Target unit URI (full or prefixed)
+            out: Float array for the result; pass `values` itself to convert
+                in place
+
+        Returns:
+            Converted float64 array
+
+        Raises:
+            ValueError: If units are not found
+
+        Example:
+            >>> manager.convert_array(np.array([1.0, 2.5]), "unit:MilliSEC", "unit:SEC")
+            array([0.001 , 0.0025])
+        """
+        return self.get_conversion(from_unit_uri, to_unit_uri)(values, out=out)
+
+    def get_conversion(self, from_unit_uri: str, to_unit_uri: str) -> UnitConversion:
+        """
+        Resolve a unit pair into a cached affine UnitConversion.
+
+        Uses the full QUDT formula for ratio and interval scales:
+            SI_value = (value + from_offset) * from_multiplier
+            target_value = SI_value / to_multiplier - to_offset
+
+        Args:
+            from_unit_uri: Source unit URI (full or prefixed)
+            to_unit_uri: Target unit URI (full or prefixed)
+
+        Returns:
+            UnitConversion with scale and shift
+
+        Raises:
+            ValueError: If units are not found
+        """
+        key = (from_unit_uri, to_unit_uri)
+        conversion = self._conversions.get(key)
+        if conversion is not None:
+            return conversion
+
         if not self._is_loaded:
             self.load()
 
         # Normalize URIs (handle both full URIs and prefixed forms)
-        from_unit_uri = self._normalize_unit_uri(from_unit_uri)
-        to_unit_uri = self._normalize_unit_uri(to_unit_uri)
+        from_uri = self._normalize_unit_uri(from_unit_uri)
+        to_uri = self._normalize_unit_uri(to_unit_uri)
 
         # If same unit, no conversion needed
-        if from_unit_uri == to_unit_uri:
-            return value
+        if from_uri == to_uri:
+            conversion = UnitConversion(from_uri, to_uri)
+            self._conversions[key] = conversion
+            return conversion
 
         # Get unit information
-        from_unit = self.get_unit_by_uri(from_unit_uri)
-        to_unit = self.get_unit_by_uri(to_unit_uri)
+        from_unit = self.units_by_uri.get(from_uri)
+        to_unit = self.units_by_uri.get(to_uri)
 
         if not from_unit:
-            raise ValueError(f"Source unit not found in QUDT: {from_unit_uri}")
+            raise ValueError(f"Source unit not found in QUDT: {from_uri}")
         if not to_unit:
-            raise ValueError(f"Target unit not found in QUDT: {to_unit_uri}")
+            raise ValueError(f"Target unit not found in QUDT: {to_uri}")
 
         # Check if units are compatible (share at least one quantity kind)
-        common_qks = set(from_unit.quantity_kinds) & set(to_unit.quantity_kinds)
-        if not common_qks:
+        if not set(from_unit.quantity_kinds) & set(to_unit.quantity_kinds):
             logger.warning(
                 f"Unit conversion between different quantity kinds: "
                 f"{from_unit.quantity_kinds} → {to_unit.quantity_kinds}"
             )
 
-        # Perform conversion through SI base unit with full QUDT formula
-        # QUDT Formula: SI_value = (value + conversionOffset) * conversionMultiplier
-        
-        # Step 1: Convert to SI base unit (handles both ratio and interval scales)
-        si_value = (value + from_unit.conversion_offset) * from_unit.conversion_multiplier
-
-        # Step 2: Convert from SI base unit to target unit
-        # target_value = (si_value / to_multiplier) - to_offset
-        target_value = (si_value / to_unit.conversion_multiplier) - to_unit.conversion_offset
+        # value → SI: (value + from_offset) * from_multiplier
+        # SI → target: si / to_multiplier - to_offset
+        scale = from_unit.conversion_multiplier / to_unit.conversion_multiplier
+        shift = from_unit.conversion_offset * scale - to_unit.conversion_offset
+        conversion = UnitConversion(from_uri, to_uri, scale, shift)
+        self._conversions[key] = conversion
 
         logger.debug(
-            f"Converted {value} {from_unit.symbol} → {target_value} {to_unit.symbol} "
-            f"(via {si_value} SI, from_offset={from_unit.conversion_offset}, "
-            f"to_offset={to_unit.conversion_offset})"
+            f"Resolved conversion {from_unit.symbol} → {to_unit.symbol}: "
+            f"x * {scale} + {shift}"
         )
-
-        return target_value
+        return conversion
 
     def _normalize_unit_uri(self, unit_uri: str) -> str:
         """
@@ -610,6 +764,8 @@ class QUDTManager:
                 self.cache_file.unlink()
             if self.metadata_file.exists():
                 self.metadata_file.unlink()
+            if self.table_file.exists():
+                self.table_file.unlink()
             logger.info("Cache cleared")
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
@@ -622,5 +778,7 @@ class QUDTManager:
             'cache_fresh': self._is_cache_fresh() if self.cache_file.exists() else False,
             'unit_count': len(self.units_by_uri),
             'quantity_kind_count': len(self.units_by_quantity_kind),
-            'cache_file': str(self.cache_file)
+            'cache_file': str(self.cache_file),
+            'table_file': str(self.table_file),
+            'table_exists': self.table_file.exists()
         }
\ No newline at end of file
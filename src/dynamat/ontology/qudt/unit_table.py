@@ -0,0 +1,245 @@
+"""
+DynaMat Platform - QUDT Unit Table
+Compact, precompiled index of QUDT units with per-quantity-kind conversion
+factor columns, persisted as a versioned binary file next to the JSON cache
+"""
+
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .qudt_manager import QUDTUnit
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout changes to invalidate existing table files
+UNIT_TABLE_FORMAT_VERSION = 1
+
+
+class UnitTable:
+    """
+    Row-oriented table of QUDT units.
+
+    Each unit occupies one row; the row's SI conversion multiplier and offset
+    are stored in two contiguous ``array('d')`` columns. Quantity kinds map
+    to arrays of row numbers, and the (multiplier, offset) columns of each
+    quantity kind are precomputed so conversions within a kind read two
+    floats instead of resolving unit objects. URIs and quantity kind strings
+    are interned, so the many repeated quantity kind URIs share one object.
+
+    ``units_by_uri`` and ``units_by_quantity_kind`` are plain dicts that
+    QUDTManager exposes directly.
+
+    Example:
+        >>> table = UnitTable()
+        >>> table.add(QUDTUnit(uri=".../MilliM", symbol="mm", label="millimetre",
+        ...                    quantity_kinds=[".../Length"], conversion_multiplier=0.001))
+        >>> table.conversion_factors(".../MilliM")
+        (0.001, 0.0)
+    """
+
+    __slots__ = (
+        'units_by_uri', 'units_by_quantity_kind',
+        '_rows', '_multipliers', '_offsets',
+        '_qk_rows', '_qk_members', '_qk_factors', '_qk_sorted',
+    )
+
+    def __init__(self):
+        self.units_by_uri: Dict[str, 'QUDTUnit'] = {}
+        self.units_by_quantity_kind: Dict[str, List['QUDTUnit']] = {}
+
+        self._rows: Dict[str, int] = {}                    # uri -> row
+        self._multipliers = array('d')
+        self._offsets = array('d')
+
+        self._qk_rows: Dict[str, array] = {}               # qk -> rows, in index order
+        self._qk_members: Dict[str, Set[str]] = {}         # qk -> uris (membership test)
+        self._qk_factors: Dict[str, Tuple[array, array]] = {}
+        self._qk_sorted: Dict[str, List['QUDTUnit']] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._rows
+
+    # ============================================================================
+    # BUILDING
+    # ============================================================================
+
+    def add(self, unit: 'QUDTUnit', quantity_kinds: Optional[Iterable[str]] = None) -> 'QUDTUnit':
+        """
+        Register a unit and index it under its quantity kinds.
+
+        A URI that is already registered keeps its existing unit; only the
+        quantity kind index is extended.
+
+        Args:
+            unit: Unit to register
+            quantity_kinds: Quantity kinds to index it under
+                (defaults to unit.quantity_kinds)
+
+        Returns:
+            The registered unit for the URI
+        """
+        uri = sys.intern(unit.uri)
+        existing = self.units_by_uri.get(uri)
+        if existing is None:
+            unit.uri = uri
+            unit.quantity_kinds = [sys.intern(qk) for qk in unit.quantity_kinds]
+            self._rows[uri] = len(self._multipliers)
+            self._multipliers.append(unit.conversion_multiplier)
+            self._offsets.append(unit.conversion_offset)
+            self.units_by_uri[uri] = unit
+            existing = unit
+
+        if quantity_kinds is None:
+            quantity_kinds = existing.quantity_kinds
+        row = self._rows[uri]
+        for qk in quantity_kinds:
+            qk = sys.intern(qk)
+            members = self._qk_members.setdefault(qk, set())
+            if uri in members:
+                continue
+            members.add(uri)
+            self.units_by_quantity_kind.setdefault(qk, []).append(existing)
+            self._qk_rows.setdefault(qk, array('l')).append(row)
+            self._qk_factors.pop(qk, None)
+            self._qk_sorted.pop(qk, None)
+        return existing
+
+    def clear(self):
+        """Remove every unit (the exposed dicts are cleared in place)."""
+        self.units_by_uri.clear()
+        self.units_by_quantity_kind.clear()
+        self._rows.clear()
+        del self._multipliers[:]
+        del self._offsets[:]
+        self._qk_rows.clear()
+        self._qk_members.clear()
+        self._qk_factors.clear()
+        self._qk_sorted.clear()
+
+    # ============================================================================
+    # LOOKUPS
+    # ============================================================================
+
+    def conversion_factors(self, uri: str) -> Optional[Tuple[float, float]]:
+        """(multiplier, offset) to the SI unit, or None for an unknown URI."""
+        row = self._rows.get(uri)
+        if row is None:
+            return None
+        return self._multipliers[row], self._offsets[row]
+
+    def quantity_kind_factors(self, quantity_kind: str) -> Tuple[array, array]:
+        """
+        Conversion columns of a quantity kind.
+
+        Returns:
+            (multipliers, offsets) arrays aligned with
+            units_by_quantity_kind[quantity_kind]
+        """
+        factors = self._qk_factors.get(quantity_kind)
+        if factors is None:
+            rows = self._qk_rows.get(quantity_kind, ())
+            factors = (
+                array('d', (self._multipliers[r] for r in rows)),
+                array('d', (self._offsets[r] for r in rows)),
+            )
+            self._qk_factors[quantity_kind] = factors
+        return factors
+
+    def sorted_units(self, quantity_kind: str) -> List['QUDTUnit']:
+        """Units of a quantity kind sorted by symbol (memoized; do not mutate)."""
+        units = self._qk_sorted.get(quantity_kind)
+        if units is None:
+            units = sorted(self.units_by_quantity_kind.get(quantity_kind, ()),
+                           key=lambda u: u.symbol.lower())
+            self._qk_sorted[quantity_kind] = units
+        return units
+
+    # ============================================================================
+    # PERSISTENCE
+    # ============================================================================
+
+    def save(self, path: Path, source_stamp: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Atomically write the table with its format version and source stamp.
+
+        Args:
+            path: Table file
+            source_stamp: (mtime_ns, size) of the JSON cache the table was built from
+
+        Returns:
+            True if the file was written
+        """
+        for qk in self._qk_rows:
+            self.quantity_kind_factors(qk)
+            self.sorted_units(qk)
+        payload = {
+            'format_version': UNIT_TABLE_FORMAT_VERSION,
+            'source_stamp': source_stamp,
+            'table': self,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            logger.debug(f"Wrote QUDT unit table: {path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write QUDT unit table {path}: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: Path, source_stamp: Optional[Tuple[int, int]] = None) -> Optional['UnitTable']:
+        """
+        Read a table file.
+
+        Args:
+            path: Table file
+            source_stamp: Expected (mtime_ns, size) of the JSON cache
+
+        Returns:
+            The table, or None if missing, unreadable, from another format
+            version or built from a different JSON cache
+        """
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable QUDT unit table {path}: {e}")
+            return None
+
+        if not isinstance(payload, dict):
+            logger.warning(f"Ignoring unreadable QUDT unit table {path}: not a table file")
+            return None
+        if payload.get('format_version') != UNIT_TABLE_FORMAT_VERSION:
+            logger.info("QUDT unit table is from another format version, ignoring")
+            return None
+        if payload.get('source_stamp') != source_stamp:
+            logger.info("QUDT unit table does not match the JSON cache, ignoring")
+            return None
+        table = payload.get('table')
+        return table if isinstance(table, cls) else None
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name in self.__slots__:
+            setattr(self, name, state[name])
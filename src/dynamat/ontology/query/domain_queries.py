@@ -8,8 +8,12 @@ import logging
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, date
 
+from rdflib import URIRef
+from rdflib.namespace import RDFS
+
 from .sparql_executor import SPARQLExecutor
 from ..core.namespace_manager import NamespaceManager
+from ..cache.class_index import ClassHierarchyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +29,20 @@ class DomainQueries:
     and query_builder.py domain queries.
     """
     
-    def __init__(self, sparql_executor: SPARQLExecutor, namespace_manager: NamespaceManager):
+    def __init__(self, sparql_executor: SPARQLExecutor, namespace_manager: NamespaceManager,
+                 class_index: Optional[ClassHierarchyIndex] = None):
         """
         Initialize domain queries.
         
         Args:
             sparql_executor: SPARQL executor for running queries
             namespace_manager: Namespace manager for query prefixes
+            class_index: Optional class hierarchy index; when given, instance
+                listing is answered from it instead of a SPARQL property path
         """
         self.sparql = sparql_executor
         self.ns = namespace_manager
+        self.class_index = class_index
         
         logger.info("Domain queries initialized")
     
@@ -125,6 +133,13 @@ class DomainQueries:
         Returns:
             List of dictionaries with instance information (uri, name/label)
         """
+        if self.class_index is not None:
+            try:
+                return self._get_indexed_instances(class_uri, include_subclasses)
+            except Exception as e:
+                logger.error(f"Failed to get instances of class {class_uri}: {e}")
+                return []
+
         if include_subclasses:
             query = """
             SELECT DISTINCT ?individual ?label ?name WHERE {{
@@ -179,6 +194,46 @@ class DomainQueries:
         except Exception as e:
             logger.error(f"Failed to get instances of class {class_uri}: {e}")
             return []
+
+    def _get_indexed_instances(self, class_uri: str, include_subclasses: bool) -> List[Dict[str, Any]]:
+        """
+        get_instances_of_class() answered from the class hierarchy index.
+
+        Looks up the label and name of each individual directly in the graph
+        (O(k) for k instances) and orders the result like the SPARQL query:
+        by label, name, then URI.
+        """
+        graph = self.sparql.graph
+        dyn = self.ns.DYN
+        name_predicates = (dyn.hasName, dyn.hasMaterialName, dyn.hasSpecimenID)
+
+        rows = []
+        with self.sparql.lock:
+            for individual in self.class_index.get_instances(class_uri, include_subclasses):
+                if not isinstance(individual, URIRef):
+                    continue
+                label = graph.value(individual, RDFS.label)
+                name = next(
+                    (value for value in (graph.value(individual, p) for p in name_predicates)
+                     if value is not None),
+                    None
+                )
+                uri = str(individual)
+                rows.append((
+                    str(label) if label is not None else '',
+                    str(name) if name is not None else '',
+                    uri,
+                ))
+        rows.sort()
+
+        instances = []
+        for label, name, uri in rows:
+            # Extract display name (prefer name > label > extracted from URI)
+            display_name = name or label or uri.split('#')[-1].split('/')[-1].replace('_', ' ')
+            instances.append({'uri': uri, 'name': display_name, 'label': label})
+
+        logger.debug(f"Found {len(instances)} instances of {class_uri} (indexed)")
+        return instances
     # ============================================================================
     # MATERIAL QUERIES
     # ============================================================================
@@ -5,11 +5,15 @@ Extracted from manager.py for better separation of concerns
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Hashable, Tuple, Union
 import time
 
 from rdflib import Graph
+from rdflib.events import Event
 from rdflib.plugins.sparql import prepareQuery
+from rdflib.store import TripleAddedEvent, TripleRemovedEvent
 
 from ..core.namespace_manager import NamespaceManager
 
@@ -25,22 +29,104 @@ class SPARQLExecutor:
     - Handle query result processing
     - Manage query performance and logging
     - Provide utility methods for common query patterns
+
+    Caching:
+    - Prepared queries (parsed and algebrized) are kept in an LRU keyed by
+      the query text and reused for every execution; variable bindings are
+      applied at execution time, so one prepared query serves all bindings.
+    - Result rows are cached only on request (use_cache=True), keyed by the
+      query text and bindings, and tagged with the graph version. The
+      version follows the TripleAddedEvent/TripleRemovedEvent events of the
+      graph's store (removals are reported by ObservableMemory), so stale
+      results are not served after a change. bump_graph_version() is only
+      needed for stores that do not report changes.
+
+    Thread safety:
+    Queries run under ``lock`` (re-entrant), which also guards the caches.
+    Code that reads or writes the graph directly from more than one thread
+    (e.g. background metadata prefetch) should hold the same lock.
     """
+
+    PREPARED_CACHE_SIZE = 256
+    RESULT_CACHE_SIZE = 512
     
-    def __init__(self, graph: Graph, namespace_manager: NamespaceManager):
+    def __init__(self, graph: Graph, namespace_manager: NamespaceManager,
+                 prepared_cache_size: Optional[int] = None,
+                 result_cache_size: Optional[int] = None):
         """
         Initialize the SPARQL executor.
         
         Args:
             graph: RDF graph to query
             namespace_manager: Namespace manager for query prefixes
+            prepared_cache_size: Maximum prepared queries kept (defaults to PREPARED_CACHE_SIZE)
+            result_cache_size: Maximum cached result sets kept (defaults to RESULT_CACHE_SIZE)
         """
         self.graph = graph
         self.namespace_manager = namespace_manager
-        self._query_cache = {}  # Simple query cache
+
+        self.prepared_cache_size = (
+            self.PREPARED_CACHE_SIZE if prepared_cache_size is None else prepared_cache_size
+        )
+        self.result_cache_size = (
+            self.RESULT_CACHE_SIZE if result_cache_size is None else result_cache_size
+        )
+        if self.prepared_cache_size < 0 or self.result_cache_size < 0:
+            raise ValueError("Cache sizes must be >= 0")
+
+        # query text -> prepared query
+        self._prepared_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # (query text, bindings) -> (graph version, result rows)
+        self._query_cache: "OrderedDict[Tuple[str, Hashable], Tuple[int, List[Dict[str, Any]]]]" = OrderedDict()
+        self._graph_version = 0
+        self.lock = threading.RLock()
+
+        dispatcher = getattr(graph.store, 'dispatcher', None)
+        if dispatcher is not None:
+            dispatcher.subscribe(TripleAddedEvent, self._on_triple_changed)
+            dispatcher.subscribe(TripleRemovedEvent, self._on_triple_changed)
+
+        self._stats = {
+            'prepared_hits': 0,
+            'prepared_misses': 0,
+            'prepared_evictions': 0,
+            'result_hits': 0,
+            'result_misses': 0,
+            'result_stale': 0,
+            'result_evictions': 0,
+        }
         
         logger.info("SPARQL executor initialized")
-    
+
+    # ============================================================================
+    # GRAPH VERSION
+    # ============================================================================
+
+    @property
+    def graph_version(self) -> int:
+        """Counter incremented whenever the graph is reported as changed."""
+        return self._graph_version
+
+    def bump_graph_version(self) -> int:
+        """
+        Record that triples were added to or removed from the graph.
+
+        Store events do this automatically; call it after changes the store
+        does not report. Cached result rows from earlier versions are no
+        longer served.
+        Prepared queries do not depend on graph content and are kept.
+
+        Returns:
+            The new graph version
+        """
+        self._graph_version += 1
+        logger.debug(f"Graph version bumped to {self._graph_version}")
+        return self._graph_version
+
+    def _on_triple_changed(self, event: Event):
+        """Store event handler: results cached before the change go stale."""
+        self._graph_version += 1
+
     def execute_query(self, query: str, bindings: Optional[Dict] = None, 
                      use_cache: bool = False) -> List[Dict[str, Any]]:
         """
@@ -54,40 +140,44 @@ class SPARQLExecutor:
         Returns:
             List of result dictionaries
         """
+        with self.lock:
+            return self._execute_query(query, bindings, use_cache)
+
+    def _execute_query(self, query: str, bindings: Optional[Dict],
+                       use_cache: bool) -> List[Dict[str, Any]]:
+        """execute_query() body; the caller holds the lock."""
         start_time = time.time()
-        
-        # Check cache if enabled
-        cache_key = None
-        if use_cache:
-            cache_key = hash(query + str(bindings or {}))
-            if cache_key in self._query_cache:
-                logger.debug(f"Query cache hit for key: {cache_key}")
-                return self._query_cache[cache_key]
+        # Rows are tagged with the version the query started from, so a
+        # change while it runs leaves them stale
+        version = self._graph_version
+
+        # Check result cache if enabled
+        cache_key = self._result_cache_key(query, bindings) if use_cache else None
+        if cache_key is not None:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                self._query_cache.move_to_end(cache_key)
+                self._stats['result_hits'] += 1
+                logger.debug("Query result cache hit")
+                return cached[1]
+            if cached is not None:
+                self._stats['result_stale'] += 1
+                del self._query_cache[cache_key]
+            self._stats['result_misses'] += 1
         
         try:
-            # Add namespace prefixes to query
-            prefixed_query = self._add_namespace_prefixes(query)
-            
-            # Prepare and execute query
-
-            # DEBUG: Check namespaces before query preparation
-            namespaces = self.namespace_manager.get_all_namespaces()
-            
-            # Check for None values
-            none_keys = [k for k, v in namespaces.items() if k is None or v is None]
-            if none_keys:
-                # Filter out None values
-                namespaces = {k: v for k, v in namespaces.items() if k is not None and v is not None}
-
-            prepared = prepareQuery(prefixed_query, initNs=self.namespace_manager.get_all_namespaces())
+            prepared = self._get_prepared_query(query)
             results = self.graph.query(prepared, initBindings=bindings or {})
             
             # Process results
             processed_results = self._process_query_results(results)
             
             # Cache results if requested
-            if use_cache and cache_key:
-                self._query_cache[cache_key] = processed_results
+            if cache_key is not None and self.result_cache_size > 0:
+                self._query_cache[cache_key] = (version, processed_results)
+                if len(self._query_cache) > self.result_cache_size:
+                    self._query_cache.popitem(last=False)
+                    self._stats['result_evictions'] += 1
             
             execution_time = time.time() - start_time
             logger.debug(f"Query executed in {execution_time:.3f}s, returned {len(processed_results)} results")
@@ -98,6 +188,51 @@ class SPARQLExecutor:
             logger.error(f"SPARQL query failed: {e}")
             logger.error(f"Query was: {query}")
             raise
+
+    def _get_prepared_query(self, query: str):
+        """
+        Return the prepared form of a query, preparing it on first use.
+
+        Args:
+            query: SPARQL query string (without namespace prefixes)
+
+        Returns:
+            Prepared rdflib query object
+        """
+        prepared = self._prepared_cache.get(query)
+        if prepared is not None:
+            self._prepared_cache.move_to_end(query)
+            self._stats['prepared_hits'] += 1
+            return prepared
+
+        self._stats['prepared_misses'] += 1
+        namespaces = {
+            k: v for k, v in self.namespace_manager.get_all_namespaces().items()
+            if k is not None and v is not None
+        }
+        prepared = prepareQuery(self._add_namespace_prefixes(query), initNs=namespaces)
+
+        if self.prepared_cache_size > 0:
+            self._prepared_cache[query] = prepared
+            if len(self._prepared_cache) > self.prepared_cache_size:
+                self._prepared_cache.popitem(last=False)
+                self._stats['prepared_evictions'] += 1
+        return prepared
+
+    @staticmethod
+    def _result_cache_key(query: str, bindings: Optional[Dict]) -> Optional[Tuple[str, Hashable]]:
+        """
+        Build the result cache key for a query and its bindings.
+
+        Returns:
+            Hashable key, or None if the bindings cannot be hashed
+        """
+        if not bindings:
+            return (query, frozenset())
+        try:
+            return (query, frozenset((str(k), v) for k, v in bindings.items()))
+        except TypeError:
+            return None
     
     def _add_namespace_prefixes(self, query: str) -> str:
         """
@@ -192,15 +327,20 @@ class SPARQLExecutor:
             return "data"  # Generic data property
     
     def clear_cache(self):
-        """Clear the query cache."""
-        self._query_cache.clear()
+        """Clear the prepared-query and result caches."""
+        with self.lock:
+            self._prepared_cache.clear()
+            self._query_cache.clear()
         logger.debug("Query cache cleared")
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get query cache statistics."""
         return {
             'cached_queries': len(self._query_cache),
-            'cache_size_bytes': sum(len(str(v)) for v in self._query_cache.values())
+            'cache_size_bytes': sum(len(str(rows)) for _, rows in self._query_cache.values()),
+            'prepared_queries': len(self._prepared_cache),
+            'graph_version': self._graph_version,
+            **self._stats
         }
     
     def count_triples(self) -> int:
@@ -219,10 +359,10 @@ class SPARQLExecutor:
             Boolean result
         """
         try:
-            prefixed_query = self._add_namespace_prefixes(query)
-            prepared = prepareQuery(prefixed_query, initNs=self.namespace_manager.get_all_namespaces())
-            result = self.graph.query(prepared, initBindings=bindings or {})
-            return bool(result)
+            with self.lock:
+                prepared = self._get_prepared_query(query)
+                result = self.graph.query(prepared, initBindings=bindings or {})
+                return bool(result)
         except Exception as e:
             logger.error(f"SPARQL ASK query failed: {e}")
             raise
\ No newline at end of file
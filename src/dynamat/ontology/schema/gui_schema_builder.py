@@ -5,10 +5,11 @@ Extracted from manager.py for better separation of concerns
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 
 from rdflib import URIRef, Literal
+from rdflib.namespace import OWL, RDF, RDFS
 
 from ..query.sparql_executor import SPARQLExecutor
 from ..core.namespace_manager import NamespaceManager
@@ -237,11 +238,18 @@ class GUISchemaBuilder:
 
         logger.info(f"Building class metadata for form: {class_uri}")
 
+        # Graph subjects and class extensions the metadata is derived from,
+        # recorded so the cache entry is evicted when any of them changes
+        dependencies = self._get_class_lineage(class_uri)
+        instance_dependencies: Set[str] = set()
+
         # Get basic class info
         class_info = self._get_basic_class_info(class_uri)
 
         # Get all properties with metadata
-        properties = self._get_class_properties_for_class(class_uri)
+        properties = self._get_class_properties_for_class(
+            class_uri, dependencies, instance_dependencies
+        )
 
         # Organize properties into form groups
         form_groups = self._organize_properties_into_groups(properties)
@@ -260,7 +268,11 @@ class GUISchemaBuilder:
 
         # Cache the result (controlled by global config)
         if Config.USE_SCHEMA_CACHE:
-            self.cache.cache_class_metadata(class_uri, metadata)
+            self.cache.cache_class_metadata(
+                class_uri, metadata,
+                depends_on=dependencies,
+                depends_on_instances_of=instance_dependencies
+            )
 
         logger.info(f"Generated metadata for {metadata.name} with {len(properties)} properties in {len(form_groups)} groups")
 
@@ -271,6 +283,22 @@ class GUISchemaBuilder:
 
         return metadata
     
+    def _expand_class_uri(self, class_uri: str) -> str:
+        """Expand a prefixed or bare class name to a full DynaMat URI."""
+        if class_uri.startswith("http"):
+            return class_uri
+        # Remove namespace prefix if present (e.g., "dyn:Specimen" -> "Specimen")
+        return f"{self.ns.DYN}{class_uri.split(':')[-1]}"
+
+    def _get_class_lineage(self, class_uri: str) -> Set[str]:
+        """Get the class URI and all of its (transitive) superclasses."""
+        class_ref = URIRef(self._expand_class_uri(class_uri))
+        with self.sparql.lock:
+            return {
+                str(cls) for cls in self.sparql.graph.transitive_objects(class_ref, RDFS.subClassOf)
+                if isinstance(cls, URIRef)
+            }
+
     def _get_basic_class_info(self, class_uri: str) -> Dict[str, Any]:
         """Get basic information about a class."""
         query = """
@@ -307,14 +335,29 @@ class GUISchemaBuilder:
         
         return info
     
-    def _get_class_properties_for_class(self, class_uri: str) -> List[PropertyMetadata]:
-        """Get all properties for a class with complete metadata."""
+    def _get_class_properties_for_class(self, class_uri: str,
+                                        dependencies: Optional[Set[str]] = None,
+                                        instance_dependencies: Optional[Set[str]] = None
+                                        ) -> List[PropertyMetadata]:
+        """
+        Get all properties for a class with complete metadata.
+
+        Args:
+            class_uri: URI of the class
+            dependencies: Optional set collecting the property and individual
+                URIs the metadata was derived from
+            instance_dependencies: Optional set collecting the range classes
+                whose instances were listed as valid values
+        """
+        from ...config import Config
+
+        if dependencies is None:
+            dependencies = set()
+        if instance_dependencies is None:
+            instance_dependencies = set()
 
         # Make sure class_uri is a proper URI
-        if not class_uri.startswith("http"):
-            # Remove namespace prefix if present (e.g., "dyn:Specimen" -> "Specimen")
-            class_uri = class_uri.split(":")[-1]
-            class_uri = f"{self.ns.DYN}{class_uri}"
+        class_uri = self._expand_class_uri(class_uri)
         
         # SPARQL QUERY - Extracts all class properties
         query = """
@@ -368,8 +411,21 @@ class GUISchemaBuilder:
                 self.logger.debug(f"  defaultUnit: {result.get('defaultUnit')}")
                 self.logger.debug(f"  quantityKind: {result.get('quantityKind')}")
         
+        # Bulk mode: functional flags and enumerations for every form property
+        # in one triple scan and one query instead of two queries per property
+        bulk = Config.USE_BULK_SCHEMA_EXTRACTION
+        if bulk:
+            form_property_uris = list(dict.fromkeys(
+                r['property'] for r in results if r.get('formGroup')
+            ))
+            functional_properties = self._get_functional_properties(form_property_uris)
+            enumerations = self._get_valid_values_for_properties(form_property_uris, dependencies)
+
         properties = []
         for result in results:
+            # Annotating a skipped property later must also refresh the form
+            dependencies.add(result['property'])
+
             # Skip properties without formGroup annotation - they shouldn't appear in forms
             if not result.get('formGroup'):
                 logger.debug(f"Skipping property {result.get('property')} - no formGroup annotation")
@@ -396,10 +452,16 @@ class GUISchemaBuilder:
                 form_group=result.get('formGroup'),  # Now guaranteed to be present due to filter above
                 display_order=int(result.get('displayOrder', 999)),
                 data_type=data_type,
-                is_functional=self._is_functional_property(result['property']),
+                is_functional=(
+                    result['property'] in functional_properties if bulk
+                    else self._is_functional_property(result['property'])
+                ),
                 is_required=bool(result.get('required', False)),
                 is_read_only=bool(result.get('isReadOnly', False)),
-                valid_values=self._get_valid_values_for_property(result['property']),
+                valid_values=(
+                    list(enumerations.get(result['property'], [])) if bulk
+                    else self._get_valid_values_for_property(result['property'], dependencies)
+                ),
                 default_unit=result.get('defaultUnit'),
                 quantity_kind=result.get('quantityKind'),
                 range_class=result.get('range'),
@@ -412,6 +474,9 @@ class GUISchemaBuilder:
                 default_value=result.get('defaultValue')
             )
             
+            if prop_metadata.range_class:
+                instance_dependencies.add(prop_metadata.range_class)
+
             # Set measurement property flag and units
             if data_type in ['double', 'float', 'integer'] and prop_metadata.default_unit:
                 prop_metadata.is_measurement_property = True
@@ -485,8 +550,15 @@ class GUISchemaBuilder:
         # Fallback: assume string for data properties without range
         return 'string'
 
-    def _get_valid_values_for_property(self, property_uri: str) -> List[str]:
-        """Get valid values for properties that should have combo boxes."""
+    def _get_valid_values_for_property(self, property_uri: str,
+                                       dependencies: Optional[Set[str]] = None) -> List[str]:
+        """
+        Get valid values for properties that should have combo boxes.
+
+        Args:
+            property_uri: URI of the property
+            dependencies: Optional set collecting the URIs of the listed individuals
+        """
         
         # Query for individuals of the range class for object properties
         query = """
@@ -505,10 +577,71 @@ class GUISchemaBuilder:
             for result in results:
                 label = result.get('label') or self._extract_name_from_uri(result['individual'])
                 values.append(label)
+                if dependencies is not None:
+                    dependencies.add(result['individual'])
             return values
         except:
             return []
     
+    def _get_valid_values_for_properties(self, property_uris: List[str],
+                                         dependencies: Optional[Set[str]] = None
+                                         ) -> Dict[str, List[str]]:
+        """
+        Get valid values for many properties with a single query.
+
+        Bulk counterpart of _get_valid_values_for_property(); each property's
+        values are in the same order.
+
+        Args:
+            property_uris: URIs of the properties
+            dependencies: Optional set collecting the URIs of the listed individuals
+
+        Returns:
+            Dictionary mapping property URI to its list of valid values
+        """
+        if not property_uris:
+            return {}
+
+        values_clause = " ".join(f"<{uri}>" for uri in property_uris)
+        query = """
+        SELECT DISTINCT ?property ?individual ?label
+        WHERE {{
+            VALUES ?property {{ {values} }}
+            ?property rdfs:range ?rangeClass .
+            ?individual rdf:type ?rangeClass .
+            OPTIONAL {{ ?individual rdfs:label ?label . }}
+        }}
+        ORDER BY ?property ?label
+        """.format(values=values_clause)
+
+        try:
+            results = self.sparql.execute_query(query)
+        except Exception as e:
+            logger.error(f"Bulk valid-value query failed: {e}")
+            return {}
+
+        values: Dict[str, List[str]] = {}
+        for result in results:
+            label = result.get('label') or self._extract_name_from_uri(result['individual'])
+            values.setdefault(result['property'], []).append(label)
+            if dependencies is not None:
+                dependencies.add(result['individual'])
+        return values
+
+    def _get_functional_properties(self, property_uris: List[str]) -> Set[str]:
+        """
+        Get which of the given properties are owl:FunctionalProperty.
+
+        Answered by direct triple lookups on the graph rather than one ASK
+        query per property.
+        """
+        graph = self.sparql.graph
+        with self.sparql.lock:
+            return {
+                uri for uri in property_uris
+                if (URIRef(uri), RDF.type, OWL.FunctionalProperty) in graph
+            }
+
     def _is_functional_property(self, property_uri: str) -> bool:
         """Check if property is functional."""
         query = """
@@ -654,6 +787,7 @@ class GUISchemaBuilder:
         return {
             'configuration': {
                 'caching_enabled': Config.USE_SCHEMA_CACHE,
+                'bulk_extraction': Config.USE_BULK_SCHEMA_EXTRACTION,
                 'sparql_executor_ready': self.sparql is not None,
                 'namespace_manager_ready': self.ns is not None,
                 'cache_ready': self.cache is not None,
@@ -0,0 +1,189 @@
+"""
+DynaMat Platform - Metadata Prefetcher
+Builds ClassMetadata for frequently used form classes on a background thread
+so that the first page or form that needs them does not stall.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from .gui_schema_builder import ClassMetadata, GUISchemaBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataPrefetcher:
+    """
+    Background builder of form metadata.
+
+    prefetch() queues GUISchemaBuilder.get_class_metadata_for_form() calls on
+    a worker thread; the results land in the schema builder's MetadataCache.
+    A foreground request for a class calls claim() first:
+
+    - build running on the worker: wait for it and reuse the result
+    - build still queued: cancel it and let the caller build immediately
+    - build finished or not queued: the caller reads the cache, which may
+      have evicted the entry since (see MetadataCache.watch_graph)
+
+    The worker shares the graph with the GUI thread; SPARQLExecutor.lock
+    serializes graph access and the MetadataCache is internally locked.
+
+    Example:
+        >>> prefetcher = MetadataPrefetcher(schema_builder)
+        >>> prefetcher.prefetch([f"{DYN}SHPBCompression", f"{DYN}Specimen"])
+        >>> metadata = prefetcher.claim(f"{DYN}Specimen")  # None if not prefetched
+    """
+
+    def __init__(self, schema_builder: GUISchemaBuilder, max_workers: int = 1):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            schema_builder: Schema builder whose metadata is prefetched
+            max_workers: Worker threads (builds are serialized on the graph
+                lock, so more than one rarely helps)
+        """
+        self.schema_builder = schema_builder
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dynamat-prefetch"
+        )
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._stats = {
+            'queued': 0,
+            'built': 0,
+            'failed': 0,
+            'claimed_running': 0,
+            'claimed_done': 0,
+            'cancelled': 0,
+            'build_time_ms': 0.0,
+        }
+
+    def prefetch(self, class_uris: Iterable[str]) -> List[str]:
+        """
+        Queue metadata builds for classes that are not cached or already queued.
+
+        Args:
+            class_uris: Full class URIs, built in the given order
+
+        Returns:
+            Class URIs that were queued
+        """
+        from ...config import Config
+
+        queued = []
+        if not Config.USE_SCHEMA_CACHE:
+            logger.debug("Schema cache disabled, skipping metadata prefetch")
+            return queued
+
+        with self._lock:
+            if self._closed:
+                return queued
+            # Forget finished builds so evicted classes can be queued again
+            for class_uri in [uri for uri, f in self._futures.items() if f.done()]:
+                del self._futures[class_uri]
+            for class_uri in class_uris:
+                if class_uri in self._futures or self.schema_builder.cache.is_class_cached(class_uri):
+                    continue
+                self._futures[class_uri] = self._executor.submit(self._build, class_uri)
+                queued.append(class_uri)
+            self._stats['queued'] += len(queued)
+
+        if queued:
+            logger.info(f"Prefetching form metadata for {len(queued)} classes")
+        return queued
+
+    def claim(self, class_uri: str, timeout: Optional[float] = None) -> Optional[ClassMetadata]:
+        """
+        Reuse a prefetched build for a foreground request.
+
+        Args:
+            class_uri: Class URI requested in the foreground
+            timeout: Maximum seconds to wait for a running build
+
+        Returns:
+            The prefetched ClassMetadata, or None if the caller should build it
+        """
+        with self._lock:
+            future = self._futures.pop(class_uri, None)
+            if future is None:
+                return None
+            if future.done():
+                self._stats['claimed_done'] += 1
+                return None
+            if future.cancel():
+                self._stats['cancelled'] += 1
+                return None
+            self._stats['claimed_running'] += 1
+
+        try:
+            return future.result(timeout=timeout)
+        except CancelledError:
+            return None
+        except Exception as e:
+            logger.warning(f"Prefetched build of {class_uri} failed, rebuilding: {e}")
+            return None
+
+    def is_pending(self, class_uri: str) -> bool:
+        """Check whether a class is queued or being built."""
+        with self._lock:
+            future = self._futures.get(class_uri)
+            return future is not None and not future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all queued builds to finish.
+
+        Returns:
+            True if every build finished within the timeout
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in futures:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except CancelledError:
+                pass
+            except Exception:
+                if not future.done():
+                    return False
+        return True
+
+    def shutdown(self, wait: bool = False):
+        """Cancel queued builds and stop the worker thread."""
+        with self._lock:
+            self._closed = True
+            self._futures.clear()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Get prefetch counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = sum(1 for f in self._futures.values() if not f.done())
+        return stats
+
+    def _build(self, class_uri: str) -> ClassMetadata:
+        """Worker entry point."""
+        start_time = time.perf_counter()
+        try:
+            metadata = self.schema_builder.get_class_metadata_for_form(class_uri)
+        except Exception as e:
+            with self._lock:
+                self._stats['failed'] += 1
+            logger.error(f"Prefetch of {class_uri} failed: {e}")
+            raise
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        with self._lock:
+            self._stats['built'] += 1
+            self._stats['build_time_ms'] += elapsed_ms
+        logger.debug(f"Prefetched metadata for {class_uri} in {elapsed_ms:.0f} ms")
+        return metadata
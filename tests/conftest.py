@@ -1,4 +1,5 @@
 import pytest
+import shutil
 import sys
 import os
 from pathlib import Path
@@ -6,11 +7,36 @@ from pathlib import Path
 # Ensure the src directory is in the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
+from dynamat.config import Config
 from dynamat.ontology import OntologyManager
 from dynamat.ontology.qudt.qudt_manager import QUDTManager
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_caches(tmp_path_factory):
+    """
+    Point every on-disk cache (ontology snapshot, QUDT cache, SHPB scratch
+    files, instance index) at a session temp directory, so tests neither
+    read stale user caches nor write to the user data dir or the package.
+
+    The ontology snapshot is disabled; tests of it pass use_snapshot and
+    snapshot_dir explicitly. The bundled QUDT cache is copied so that
+    QUDTManager still loads offline.
+    """
+    root = tmp_path_factory.mktemp("caches")
+    qudt_cache = root / "qudt"
+    shutil.copytree(Config.QUDT_CACHE_DIR, qudt_cache,
+                    ignore=shutil.ignore_patterns("*.pickle"))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, "USE_ONTOLOGY_SNAPSHOT", False)
+        mp.setattr(Config, "ONTOLOGY_SNAPSHOT_DIR", root / "snapshots")
+        mp.setattr(Config, "QUDT_CACHE_DIR", qudt_cache)
+        mp.setattr(Config, "SHPB_SCRATCH_DIR", root / "scratch")
+        mp.setattr(Config, "INSTANCE_INDEX_PATH", root / "instance_index.sqlite")
+        yield root
+
 @pytest.fixture(scope="session")
-def ontology_manager():
+def ontology_manager(isolated_caches):
     """
     Fixture to provide a loaded OntologyManager.
     Scope is 'session' to avoid reloading the ontology for every test.
@@ -20,7 +46,7 @@ def ontology_manager():
     return om
 
 @pytest.fixture(scope="session")
-def qudt_manager():
+def qudt_manager(isolated_caches):
     """
     Fixture to provide a loaded QUDTManager.
     """
@@ -0,0 +1,192 @@
+import numpy as np
+import pytest
+
+from dynamat.mechanical.shpb.core import pulse_alignment
+from dynamat.mechanical.shpb.core.pulse_alignment import PulseAligner
+
+
+N_POINTS = 3000
+SHIFT_T = 37
+SHIFT_R = -52
+
+
+def _pulse(center, n=N_POINTS):
+    """Smoothed trapezoidal pulse starting at ``center``."""
+    x = np.arange(n, dtype=float)
+    y = np.clip((x - center) / 250, 0, 1) * np.clip((center + 1200 - x) / 250, 0, 1)
+    return np.convolve(y, np.ones(41) / 41, mode='same')
+
+
+def _make_pulses(noise=0.0, seed=0):
+    """Physically consistent pulses offset by known shifts."""
+    rng = np.random.default_rng(seed)
+    incident = -1.0 * _pulse(800)
+    transmitted = -0.4 * _pulse(800 - SHIFT_T)
+    reflected = 0.6 * _pulse(800 - SHIFT_R)
+    if noise:
+        incident = incident + rng.normal(0, noise, N_POINTS)
+        transmitted = transmitted + rng.normal(0, noise, N_POINTS)
+        reflected = reflected + rng.normal(0, noise, N_POINTS)
+    time = np.arange(N_POINTS) * 1e-3
+    return incident, transmitted, reflected, time
+
+
+def _linear_region(aligner, incident):
+    grad = np.gradient(incident)
+    target = np.min(grad) * aligner.k_linear
+    min_idx = np.argmin(grad)
+    start = np.where(grad[:min_idx] >= target)[0][-1]
+    end = np.where(grad[min_idx:] >= target)[0][0] + min_idx
+    return np.arange(start, end)
+
+
+def _brute_force(aligner, inc, trs, ref, time, bounds_t, bounds_r):
+    """Reference: first minimizer of the exact fitness over the integer box."""
+    idx = _linear_region(aligner, inc)
+    integrals = aligner._cumulative_integrals(inc, trs, ref, time)
+    values = np.array([
+        [aligner._fitness_function((st, sr), inc, trs, ref, idx, time, integrals)
+         for sr in range(bounds_r[0], bounds_r[1] + 1)]
+        for st in range(bounds_t[0], bounds_t[1] + 1)
+    ])
+    i, j = np.unravel_index(np.argmin(values), values.shape)
+    return bounds_t[0] + int(i), bounds_r[0] + int(j)
+
+
+class TestPulseAlignerGrid:
+    """Tests for the exhaustive grid search engine."""
+
+    @pytest.mark.parametrize("noise,seed", [(0.0, 0), (1e-3, 0), (5e-4, 1)])
+    def test_grid_matches_brute_force(self, noise, seed):
+        """Grid shifts are identical to an exhaustive scan of the fitness."""
+        inc, trs, ref, time = _make_pulses(noise, seed)
+        aligner = PulseAligner(4953.3, 6.5, method='grid')
+        bounds_t, bounds_r = (15, 55), (-75, -35)
+
+        *_, shift_t, shift_r = aligner.align(
+            inc, trs, ref, time,
+            search_bounds_t=bounds_t, search_bounds_r=bounds_r
+        )
+
+        assert (shift_t, shift_r) == _brute_force(
+            aligner, inc, trs, ref, time, bounds_t, bounds_r
+        )
+
+    def test_grid_recovers_known_shifts(self):
+        """Noise-free pulses are aligned at the shifts used to build them."""
+        inc, trs, ref, time = _make_pulses()
+        aligner = PulseAligner(4953.3, 6.5, method='grid')
+
+        _, trs_aligned, ref_aligned, shift_t, shift_r = aligner.align(
+            inc, trs, ref, time,
+            search_bounds_t=(-100, 100), search_bounds_r=(-100, 100)
+        )
+
+        assert (shift_t, shift_r) == (SHIFT_T, SHIFT_R)
+        np.testing.assert_array_equal(
+            trs_aligned, PulseAligner._shift_signal(trs, SHIFT_T)
+        )
+        np.testing.assert_array_equal(
+            ref_aligned, PulseAligner._shift_signal(ref, SHIFT_R)
+        )
+
+    def test_grid_tiles_match_brute_force(self, monkeypatch):
+        """A small memory budget splits the box into many tiles."""
+        monkeypatch.setattr(pulse_alignment, '_GRID_CHUNK_ELEMENTS', 1 << 15)
+        inc, trs, ref, time = _make_pulses(1e-3)
+        aligner = PulseAligner(4953.3, 6.5, method='grid')
+        idx = _linear_region(aligner, inc)
+        bounds_t, bounds_r = (15, 55), (-75, -35)
+
+        cols, rows = PulseAligner._grid_tile_shape(41, 41, len(idx))
+        assert cols < 41 and rows < 41
+        assert (pulse_alignment._GRID_TILE_TEMPORARIES * rows * cols
+                + 2 * (rows + cols) * len(idx)) <= 1 << 15
+
+        *_, shift_t, shift_r = aligner.align(
+            inc, trs, ref, time,
+            search_bounds_t=bounds_t, search_bounds_r=bounds_r
+        )
+        assert (shift_t, shift_r) == _brute_force(
+            aligner, inc, trs, ref, time, bounds_t, bounds_r
+        )
+
+    def test_huge_box_falls_back_to_differential_evolution(self, monkeypatch, caplog):
+        monkeypatch.setattr(pulse_alignment, 'GRID_MAX_OPERATIONS', 10 ** 6)
+        monkeypatch.setattr(
+            PulseAligner, '_grid_search',
+            lambda *args, **kwargs: pytest.fail("grid search was not skipped")
+        )
+        inc, trs, ref, time = _make_pulses()
+        aligner = PulseAligner(4953.3, 6.5, method='grid')
+
+        with caplog.at_level('WARNING', logger=pulse_alignment.__name__):
+            *_, shift_t, shift_r = aligner.align(
+                inc, trs, ref, time,
+                search_bounds_t=(-100, 100), search_bounds_r=(-100, 100)
+            )
+
+        assert "differential evolution" in caplog.text
+        assert abs(shift_t - SHIFT_T) <= 2 and abs(shift_r - SHIFT_R) <= 2
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError):
+            PulseAligner(4953.3, 6.5, method='simplex')
+
+
+class TestPulseAlignerFitness:
+    """Tests for the windowed fitness evaluation."""
+
+    def test_windowed_fitness_matches_padded(self):
+        """Window views give bit-identical fitness to padded shifted copies."""
+        inc, trs, ref, time = _make_pulses(1e-3)
+        aligner = PulseAligner(4953.3, 6.5)
+        idx = _linear_region(aligner, inc)
+
+        for shift_t in (-2900, -400, -1, 0, 3, 250, 2999):
+            for shift_r in (-3100, -75, 0, 52, 1800):
+                shifts = (shift_t, shift_r)
+                assert aligner._fitness_function(
+                    shifts, inc, trs, ref, idx, time
+                ) == aligner._fitness_function_padded(
+                    shifts, inc, trs, ref, idx, time
+                )
+
+    def test_precomputed_strain_matches_integration(self):
+        """Precomputed-integral strain RMSE matches full re-integration."""
+        inc, trs, ref, time = _make_pulses(1e-3)
+        aligner = PulseAligner(4953.3, 6.5)
+        idx = _linear_region(aligner, inc)
+        integrals = aligner._cumulative_integrals(inc, trs, ref, time)
+        a, b = int(idx[0]), int(idx[-1]) + 1
+
+        for shift_t in (-3000, -2999, -400, 0, 3, 250, 2999, 3000):
+            for shift_r in (-3100, -75, 0, 52, 1800):
+                expected = PulseAligner._strain_rmse(
+                    4953.3, 6.5, inc,
+                    PulseAligner._shift_signal(trs, shift_t),
+                    PulseAligner._shift_signal(ref, shift_r),
+                    time, idx
+                )
+                actual = PulseAligner._strain_rmse_precomputed(
+                    4953.3, 6.5, integrals, trs, ref, shift_t, shift_r, a, b
+                )
+                assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+    def test_non_uniform_time_skips_precomputation(self):
+        inc, trs, ref, time = _make_pulses()
+        time = time + 1e-4 * np.sin(np.arange(N_POINTS))
+        assert PulseAligner._cumulative_integrals(inc, trs, ref, time) is None
+
+    def test_shifted_window_views_original(self):
+        """In-bounds windows are views; padded windows match _shift_signal."""
+        signal = np.arange(10, dtype=float)
+
+        window = PulseAligner._shifted_window(signal, 2, 4, 8)
+        assert np.shares_memory(window, signal)
+
+        for shift in (-12, -3, 0, 4, 11):
+            np.testing.assert_array_equal(
+                PulseAligner._shifted_window(signal, shift, 1, 9),
+                PulseAligner._shift_signal(signal, shift)[1:9]
+            )
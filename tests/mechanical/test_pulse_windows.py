@@ -0,0 +1,183 @@
+"""
+Tests for PulseDetector matched-filter window detection.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import fftconvolve
+
+from dynamat.mechanical.shpb.core import PulseDetector
+from dynamat.mechanical.shpb.core.pulse_windows import (
+    _template_spectrum,
+    clear_template_cache,
+)
+
+
+PULSE_POINTS = 2000
+
+
+def _make_trace(n_samples=60000, noise=2e-3, seed=0):
+    """Noisy trace with three compressive pulses of decreasing amplitude."""
+    rng = np.random.default_rng(seed)
+    signal = rng.normal(0, noise, n_samples)
+    x = np.arange(PULSE_POINTS)
+    shape = np.sin(np.pi * x / PULSE_POINTS)
+    for start, amp in ((15000, -1.0), (32000, -0.5), (47000, -0.2)):
+        signal[start:start + PULSE_POINTS] += amp * shape
+    return signal
+
+
+def _reference_matched_filter(detector, signal, k_sigma):
+    """Original single-threshold detector with a per-sample isolation loop."""
+    corr = fftconvolve(signal, detector._template[::-1], mode="same")
+    sigma = np.std(corr[:max(1, len(corr) // 10)])
+    peaks = np.where(corr > k_sigma * sigma)[0]
+    if peaks.size == 0:
+        return []
+    selected = [peaks[0]]
+    for p in peaks[1:]:
+        if p - selected[-1] >= detector.min_separation:
+            selected.append(p)
+    return [
+        (max(0, int(pk - detector.pulse_points // 2)),
+         min(len(signal), int(pk + detector.pulse_points // 2)))
+        for pk in selected
+    ]
+
+
+class TestPulseDetectorWindows:
+
+    @pytest.mark.parametrize("polarity", ["compressive", "tensile"])
+    @pytest.mark.parametrize("min_separation", [None, 1, 500])
+    def test_batched_detection_matches_reference(self, polarity, min_separation):
+        signal = _make_trace()
+        k_trials = (50.0, 20.0, 6.0, 4.0, 2.0, 0.5)
+        detector = PulseDetector(
+            PULSE_POINTS, k_trials=k_trials, polarity=polarity,
+            min_separation=min_separation
+        )
+
+        windows_by_k = detector._detect_windows(signal, k_trials)
+
+        for k in k_trials:
+            expected = _reference_matched_filter(detector, signal, k)
+            assert windows_by_k[k] == expected
+            assert detector._matched_filter(signal, k) == expected
+
+    def test_isolate_peaks_with_one_point_pulse(self):
+        detector = PulseDetector(pulse_points=1)
+        assert detector.min_separation == 1
+        peaks = np.array([3, 5, 9])
+        assert detector._isolate_peaks(peaks).tolist() == [3, 5, 9]
+        assert detector._isolate_peaks(peaks, last_peak=5).tolist() == [9]
+
+    def test_isolate_peaks_with_negative_separation(self):
+        detector = PulseDetector(PULSE_POINTS, min_separation=-5)
+        assert detector._isolate_peaks(np.array([3, 5, 9])).tolist() == [3, 5, 9]
+
+    def test_no_peaks_above_threshold(self):
+        detector = PulseDetector(PULSE_POINTS)
+        assert detector._matched_filter(_make_trace(), 1e9) == []
+
+    def test_find_window_selects_largest_pulse(self):
+        signal = _make_trace()
+        detector = PulseDetector(PULSE_POINTS, k_trials=(6.0, 4.0, 2.0))
+
+        start, end = detector.find_window(signal)
+        assert start <= 15000 + PULSE_POINTS // 2 <= end
+
+        start, end = detector.find_window(signal, lower_bound=25000)
+        assert start <= 32000 + PULSE_POINTS // 2 <= end
+
+    def test_find_window_raises_outside_bounds(self):
+        detector = PulseDetector(PULSE_POINTS)
+        with pytest.raises(RuntimeError):
+            detector.find_window(_make_trace(), lower_bound=59000)
+
+
+class TestTemplateSpectrumCache:
+
+    @pytest.mark.parametrize("n_samples", [1500, 2000, 60000, 60001])
+    @pytest.mark.parametrize("polarity", ["compressive", "tensile"])
+    def test_correlation_matches_fftconvolve(self, n_samples, polarity):
+        signal = _make_trace()[:n_samples]
+        detector = PulseDetector(PULSE_POINTS, polarity=polarity)
+        expected = fftconvolve(signal, detector._template[::-1], mode="same")
+        np.testing.assert_allclose(
+            detector._correlate_same(signal), expected, rtol=0, atol=1e-12
+        )
+
+    def test_spectrum_shared_between_detectors(self):
+        clear_template_cache()
+        signal = _make_trace()
+        for _ in range(5):
+            PulseDetector(PULSE_POINTS).find_window(signal)
+
+        info = _template_spectrum.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+        assert PulseDetector(PULSE_POINTS)._template is PulseDetector(PULSE_POINTS)._template
+
+    def test_cached_arrays_are_read_only(self):
+        detector = PulseDetector(PULSE_POINTS)
+        assert not detector._template.flags.writeable
+        assert not _template_spectrum(PULSE_POINTS, "compressive", 62208).flags.writeable
+
+
+class TestStreamingDetection:
+
+    K_TRIALS = (20.0, 6.0, 4.0, 2.0)
+
+    @pytest.mark.parametrize("chunk_size", [997, 2000, 8192, 100000])
+    @pytest.mark.parametrize("polarity", ["compressive", "tensile"])
+    def test_iter_windows_matches_in_memory(self, chunk_size, polarity):
+        signal = _make_trace()
+        detector = PulseDetector(PULSE_POINTS, k_trials=self.K_TRIALS, polarity=polarity)
+
+        expected = detector._detect_windows(signal, self.K_TRIALS)
+        streamed = {k: [] for k in self.K_TRIALS}
+        for k, window in detector.iter_windows(signal, chunk_size=chunk_size):
+            streamed[k].append(window)
+
+        assert streamed == expected
+
+    @pytest.mark.parametrize("metric", ["median", "peak"])
+    @pytest.mark.parametrize("lower_bound", [None, 25000, 40000])
+    def test_find_window_streaming_from_memmap(self, tmp_path, metric, lower_bound):
+        signal = _make_trace()
+        path = tmp_path / "trace.npy"
+        np.save(path, signal)
+        mapped = np.load(path, mmap_mode="r")
+        detector = PulseDetector(PULSE_POINTS, k_trials=self.K_TRIALS)
+
+        expected = detector.find_window(signal, lower_bound=lower_bound, metric=metric)
+        actual = detector.find_window_streaming(
+            mapped, lower_bound=lower_bound, metric=metric, chunk_size=4096
+        )
+        assert actual == expected
+
+    def test_find_window_streaming_from_generator(self):
+        signal = _make_trace()
+        detector = PulseDetector(PULSE_POINTS, k_trials=self.K_TRIALS)
+
+        def chunks():
+            # Irregular chunk sizes, as produced by a file reader
+            bounds = np.cumsum([0, 1, 3000, 17, 25000, 7000, 40000])
+            for a, b in zip(bounds[:-1], bounds[1:]):
+                yield signal[a:b].tolist()
+
+        actual = detector.find_window_streaming(
+            chunks, n_samples=len(signal), chunk_size=5000
+        )
+        assert actual == detector.find_window(signal)
+
+    def test_generator_requires_n_samples(self):
+        detector = PulseDetector(PULSE_POINTS)
+        with pytest.raises(ValueError):
+            list(detector.iter_windows(lambda: iter([_make_trace()])))
+
+    def test_short_generator_raises(self):
+        detector = PulseDetector(PULSE_POINTS)
+        signal = _make_trace()
+        with pytest.raises(ValueError):
+            list(detector.iter_windows(lambda: iter([signal]), n_samples=len(signal) + 10))
@@ -0,0 +1,80 @@
+"""
+Tests for CSV/NPZ series file storage.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dynamat.mechanical.shpb.io import CSVDataHandler
+from dynamat.mechanical.shpb.io.series_storage import (
+    detect_series_format,
+    load_series_table,
+    normalize_series_format,
+    save_series_table,
+)
+
+
+def _make_results(n_points=500, seed=0):
+    """Processed-results style dict with a scalar entry."""
+    rng = np.random.default_rng(seed)
+    return {
+        'time': np.arange(n_points) * 2e-4,
+        'stress_1w': rng.normal(300.0, 50.0, n_points),
+        'strain_1w': np.cumsum(rng.uniform(0, 1e-4, n_points)),
+        'strain_rate_1w': 1234.5,
+    }
+
+
+class TestSeriesStorage:
+
+    def test_npz_round_trip_is_lossless(self, tmp_path):
+        results = _make_results()
+        path = save_series_table(results, tmp_path / 'processed' / 'T_processed.npz', 'npz')
+
+        df = load_series_table(path)
+        assert list(df.columns) == list(results)
+        for key in ('time', 'stress_1w', 'strain_1w'):
+            np.testing.assert_array_equal(df[key].to_numpy(), results[key])
+        np.testing.assert_array_equal(df['strain_rate_1w'].to_numpy(), 1234.5)
+
+    def test_csv_round_trip_matches_float_format(self, tmp_path):
+        results = _make_results()
+        path = save_series_table(results, tmp_path / 'T_processed.csv', 'csv', '%.6e')
+
+        df = load_series_table(path)
+        assert list(df.columns) == list(results)
+        np.testing.assert_allclose(df['stress_1w'], results['stress_1w'], rtol=1e-6)
+
+    def test_declared_format_overrides_suffix(self, tmp_path):
+        path = save_series_table(_make_results(), tmp_path / 'legacy_name.csv', 'npz')
+
+        assert detect_series_format(path) == 'csv'
+        assert detect_series_format(path, 'NPZ') == 'npz'
+        df = load_series_table(path, 'npz')
+        assert len(df) == 500
+
+    def test_unknown_formats(self, tmp_path):
+        assert detect_series_format(tmp_path / 'data.txt') == 'csv'
+        assert detect_series_format(tmp_path / 'data.npz', 'hdf5') == 'npz'
+        assert normalize_series_format('.NPZ') == 'npz'
+        with pytest.raises(ValueError):
+            normalize_series_format('parquet')
+        with pytest.raises(ValueError):
+            save_series_table(_make_results(), tmp_path / 'data.h5', 'hdf5')
+
+    def test_csv_data_handler_save_npz(self, tmp_path):
+        df = pd.DataFrame({
+            'time': np.linspace(0, 1e-3, 100),
+            'incident': np.sin(np.linspace(0, 3, 100)),
+            'transmitted': np.cos(np.linspace(0, 3, 100)),
+        })
+        handler = CSVDataHandler(df)
+        path = tmp_path / 'raw' / 'T_raw.npz'
+        handler.save(path, file_format='npz')
+
+        pd.testing.assert_frame_equal(load_series_table(path), df)
+        metadata = handler.get_file_metadata_for_saving('npz')
+        assert metadata['file_format'] == 'NPZ'
+        assert metadata['delimiter'] is None
+        assert handler.get_file_metadata_for_saving()['file_format'] == 'CSV'
@@ -0,0 +1,173 @@
+"""
+Tests for StressStrainCalculator single-test and batched calculation.
+"""
+
+import numpy as np
+import pytest
+
+from dynamat.mechanical.shpb.core import StressStrainCalculator
+
+
+BAR = dict(bar_area=283.53, bar_wave_speed=4953.3, bar_elastic_modulus=199.99)
+GAUGE = {'gauge_res': 350, 'gauge_factor': 2.1, 'cal_voltage': 5.0, 'cal_resistance': 100000}
+N_TESTS, N_SAMPLES = 5, 3000
+
+
+def _make_batch(seed=0):
+    """Stacked pulses with physically plausible magnitudes."""
+    rng = np.random.default_rng(seed)
+    x = np.sin(np.pi * np.arange(N_SAMPLES) / N_SAMPLES)
+    amp = rng.uniform(0.5, 1.5, (N_TESTS, 1))
+    inc = -10 * amp * x + rng.normal(0, 0.1, (N_TESTS, N_SAMPLES))
+    trs = -4 * amp * x + rng.normal(0, 0.1, (N_TESTS, N_SAMPLES))
+    ref = 6 * amp * x + rng.normal(0, 0.1, (N_TESTS, N_SAMPLES))
+    time = np.arange(N_SAMPLES) * 2e-5
+    areas = rng.uniform(100, 130, N_TESTS)
+    heights = rng.uniform(5, 7, N_TESTS)
+    return inc, trs, ref, time, areas, heights
+
+
+def _assert_same_results(actual, expected):
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value, err_msg=key)
+
+
+class TestCalculateBatch:
+
+    @pytest.mark.parametrize("use_voltage_input", [False, True])
+    def test_rows_match_single_test_calculation(self, use_voltage_input):
+        inc, trs, ref, time, areas, heights = _make_batch()
+        gauges = dict(
+            use_voltage_input=use_voltage_input,
+            incident_reflected_gauge_params=GAUGE,
+            transmitted_gauge_params=GAUGE,
+        )
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5, **gauges)
+
+        batch = calculator.calculate_batch(
+            inc, trs, ref, time, specimen_area=areas, specimen_height=heights
+        )
+
+        for i in range(N_TESTS):
+            single = StressStrainCalculator(
+                **BAR, specimen_area=areas[i], specimen_height=heights[i], **gauges
+            ).calculate(inc[i], trs[i], ref[i], time)
+            row = {
+                key: batch[key][i] if key in StressStrainCalculator.SERIES_KEYS else batch[key]
+                for key in batch
+            }
+            _assert_same_results(row, single)
+
+    def test_scalar_geometry_and_per_test_time(self):
+        inc, trs, ref, time, _, _ = _make_batch()
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5)
+        time_2d = np.tile(time, (N_TESTS, 1))
+
+        batch = calculator.calculate_batch(inc, trs, ref, time_2d)
+        single = calculator.calculate(inc[2], trs[2], ref[2], time)
+
+        for key in StressStrainCalculator.SERIES_KEYS:
+            np.testing.assert_array_equal(batch[key][2], single[key], err_msg=key)
+
+    def test_writes_into_preallocated_buffers(self):
+        inc, trs, ref, time, areas, heights = _make_batch()
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5)
+        out = {
+            'stress_3w': np.empty((N_TESTS, N_SAMPLES)),
+            'strain_3w': np.empty((N_TESTS, N_SAMPLES)),
+        }
+
+        results = calculator.calculate_batch(
+            inc, trs, ref, time, specimen_area=areas, specimen_height=heights, out=out
+        )
+        expected = calculator.calculate_batch(
+            inc, trs, ref, time, specimen_area=areas, specimen_height=heights
+        )
+
+        assert results['stress_3w'] is out['stress_3w']
+        assert results['strain_3w'] is out['strain_3w']
+        np.testing.assert_array_equal(out['stress_3w'], expected['stress_3w'])
+
+    @pytest.mark.parametrize("kwargs", [
+        {'out': {'stress_3w': np.empty((N_TESTS, N_SAMPLES + 1))}},
+        {'out': {'stress_3w': np.empty((N_TESTS, N_SAMPLES), dtype=np.float32)}},
+        {'out': {'unknown': np.empty((N_TESTS, N_SAMPLES))}},
+        {'specimen_area': np.ones(N_TESTS + 1)},
+        {'specimen_height': np.ones((N_TESTS, 1))},
+    ])
+    def test_invalid_buffers_and_geometry_raise(self, kwargs):
+        inc, trs, ref, time, _, _ = _make_batch()
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5)
+        with pytest.raises(ValueError):
+            calculator.calculate_batch(inc, trs, ref, time, **kwargs)
+
+    def test_shape_mismatch_raises(self):
+        inc, trs, ref, time, _, _ = _make_batch()
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5)
+        with pytest.raises(ValueError):
+            calculator.calculate_batch(inc[0], trs[0], ref[0], time)
+        with pytest.raises(ValueError):
+            calculator.calculate_batch(inc, trs[:, :-1], ref, time)
+        with pytest.raises(ValueError):
+            calculator.calculate(inc[0], trs[0], ref[0], time[:-1])
+
+
+def _assert_metrics_close(actual, expected):
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        if np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+class TestEquilibriumMetrics:
+
+    def _results(self):
+        inc, trs, ref, time, areas, heights = _make_batch()
+        calculator = StressStrainCalculator(**BAR, specimen_area=126.68, specimen_height=6.5)
+        return calculator, calculator.calculate_batch(
+            inc, trs, ref, time, specimen_area=areas, specimen_height=heights
+        )
+
+    def test_fused_batch_matches_reference(self):
+        calculator, results = self._results()
+        batch = calculator.calculate_equilibrium_metrics_batch(results)
+
+        for i in range(N_TESTS):
+            row = {key: results[key][i] for key in StressStrainCalculator.SERIES_KEYS}
+            expected = calculator._equilibrium_metrics_reference(row)
+            _assert_metrics_close({key: batch[key][i] for key in batch}, expected)
+            _assert_metrics_close(calculator.calculate_equilibrium_metrics(row), expected)
+
+    def test_single_test_returns_floats(self):
+        calculator, results = self._results()
+        row = {key: results[key][0] for key in StressStrainCalculator.SERIES_KEYS}
+        metrics = calculator.calculate_equilibrium_metrics(row)
+        assert all(type(value) is float for value in metrics.values())
+
+    @pytest.mark.filterwarnings("ignore")
+    @pytest.mark.parametrize("case", ["no_valid", "two_samples", "constant_plateau"])
+    def test_degenerate_inputs_match_reference(self, case):
+        calculator, _ = self._results()
+        stress_3w = 500 * np.sin(np.pi * np.arange(N_SAMPLES) / N_SAMPLES)
+        stress_1w = stress_3w * 0.95
+        if case == "no_valid":
+            stress_3w = np.zeros(N_SAMPLES)
+        elif case == "two_samples":
+            stress_3w = np.zeros(N_SAMPLES)
+            stress_3w[100:102] = 5.0
+            stress_1w = stress_3w.copy()
+        else:
+            stress_1w = np.where(stress_3w >= 400, 450.0, stress_1w)
+            stress_3w = np.where(stress_3w >= 400, 480.0, stress_3w)
+        row = {
+            'stress_1w': stress_1w, 'stress_3w': stress_3w,
+            'bar_force_1w': 126.68 * stress_1w, 'bar_force_3w': 126.68 * stress_3w,
+        }
+
+        _assert_metrics_close(
+            calculator.calculate_equilibrium_metrics(row),
+            calculator._equilibrium_metrics_reference(row)
+        )
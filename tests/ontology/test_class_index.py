@@ -0,0 +1,86 @@
+"""
+Tests for the subclass-closure / instances-by-class index.
+"""
+
+import pytest
+from rdflib import Graph, Namespace, RDF, RDFS, URIRef
+
+from dynamat.ontology.cache.class_index import ClassHierarchyIndex
+from dynamat.ontology.core.ontology_loader import ObservableMemory
+
+DYN = Namespace("https://dynamat.utep.edu/ontology#")
+
+
+@pytest.fixture
+def graph():
+    g = Graph(store=ObservableMemory())
+    g.add((DYN.Alloy, RDFS.subClassOf, DYN.Material))
+    g.add((DYN.SteelAlloy, RDFS.subClassOf, DYN.Alloy))
+    g.add((DYN.SS316, RDF.type, DYN.SteelAlloy))
+    g.add((DYN.Epoxy, RDF.type, DYN.Material))
+    return g
+
+
+class TestClassHierarchyIndex:
+
+    def test_membership_and_instances(self, graph):
+        index = ClassHierarchyIndex(graph)
+        assert index.is_instance_of(DYN.SS316, DYN.Material)
+        assert index.is_instance_of(str(DYN.SS316), str(DYN.SteelAlloy))
+        assert not index.is_instance_of(DYN.Epoxy, DYN.Alloy)
+        assert not index.is_instance_of(DYN.Unknown, DYN.Material)
+
+        assert index.get_instances(DYN.Material) == {DYN.SS316, DYN.Epoxy}
+        assert index.get_instances(DYN.Material, include_subclasses=False) == {DYN.Epoxy}
+        assert index.get_subclasses(DYN.Material) == {DYN.Material, DYN.Alloy, DYN.SteelAlloy}
+        assert index.is_subclass_of(DYN.SteelAlloy, DYN.Material)
+
+    def test_incremental_updates(self, graph):
+        index = ClassHierarchyIndex(graph)
+        index.get_instances(DYN.Material)
+
+        graph.add((DYN.Ti64, RDF.type, DYN.TitaniumAlloy))
+        assert not index.is_instance_of(DYN.Ti64, DYN.Material)
+        graph.add((DYN.TitaniumAlloy, RDFS.subClassOf, DYN.Alloy))
+        assert index.is_instance_of(DYN.Ti64, DYN.Material)
+        assert DYN.Ti64 in index.get_instances(DYN.Alloy)
+
+        graph.remove((DYN.SS316, None, None))
+        assert DYN.SS316 not in index.get_instances(DYN.Material)
+        graph.remove((DYN.Alloy, RDFS.subClassOf, DYN.Material))
+        assert index.get_instances(DYN.Material) == {DYN.Epoxy}
+
+    def test_matches_sparql_property_path(self, ontology_manager):
+        graph = ontology_manager.graph
+        index = ontology_manager.class_index
+        material = URIRef(DYN.Material)
+
+        rows = graph.query(
+            "SELECT DISTINCT ?i WHERE { ?i a/rdfs:subClassOf* ?c }",
+            initNs={'rdfs': RDFS}, initBindings={'c': material}
+        )
+        assert {row.i for row in rows} == index.get_instances(material)
+
+        for instance in list(index.get_instances(material))[:5]:
+            assert index.is_instance_of(instance, material)
+            assert bool(graph.query(
+                "ASK { ?i a/rdfs:subClassOf* ?c }", initNs={'rdfs': RDFS},
+                initBindings={'i': instance, 'c': material}
+            ))
+
+
+def test_domain_queries_use_index(ontology_manager):
+    queries = ontology_manager.domain_queries
+    assert queries.class_index is ontology_manager.class_index
+
+    indexed = queries.get_instances_of_class(str(DYN.Material))
+    queries.class_index = None
+    try:
+        via_sparql = queries.get_instances_of_class(str(DYN.Material))
+    finally:
+        queries.class_index = ontology_manager.class_index
+
+    assert {i['uri'] for i in indexed} == {i['uri'] for i in via_sparql}
+    by_uri = {i['uri']: i for i in via_sparql}
+    for instance in indexed:
+        assert instance['name'] == by_uri[instance['uri']]['name']
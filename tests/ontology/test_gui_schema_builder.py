@@ -43,3 +43,30 @@ class TestGUISchemaBuilder:
         groups = metadata.get_ordered_groups()
         # Identification should generally be first or near top
         assert "Identification" in groups[:2]
+
+
+class TestBulkExtraction:
+    """Bulk extraction must produce the same metadata as per-property queries."""
+
+    def _build(self, ontology_manager, class_uri, bulk, monkeypatch):
+        from dynamat.config import Config
+        monkeypatch.setattr(Config, "USE_SCHEMA_CACHE", False)
+        monkeypatch.setattr(Config, "USE_BULK_SCHEMA_EXTRACTION", bulk)
+        sparql = ontology_manager.sparql_executor
+        before = sparql.get_cache_stats()
+        metadata = ontology_manager.get_class_metadata_for_form(class_uri)
+        after = sparql.get_cache_stats()
+        queries = (after['prepared_hits'] + after['prepared_misses']
+                   - before['prepared_hits'] - before['prepared_misses'])
+        return metadata, queries
+
+    def test_bulk_matches_per_property(self, ontology_manager, monkeypatch):
+        class_uri = str(ontology_manager.DYN.SHPBCompression)
+        per_property, slow_queries = self._build(ontology_manager, class_uri, False, monkeypatch)
+        bulk, bulk_queries = self._build(ontology_manager, class_uri, True, monkeypatch)
+
+        assert bulk == per_property
+        assert any(p.valid_values for p in bulk.properties)
+        assert any(p.is_functional for p in bulk.properties)
+        assert bulk_queries == 3
+        assert slow_queries > bulk_queries
@@ -0,0 +1,105 @@
+"""
+Tests for the LRU cache of parsed instance graphs.
+"""
+
+import os
+
+import pytest
+
+from dynamat.ontology.cache.instance_graph_cache import InstanceGraphCache
+from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
+
+DYN = "https://dynamat.utep.edu/ontology#"
+SPECIMEN = f"{DYN}Specimen"
+
+SPECIMEN_TTL = """
+@prefix dyn: <https://dynamat.utep.edu/ontology#> .
+
+dyn:{uri} a dyn:Specimen ;
+    dyn:hasSpecimenID "{sid}" ;
+    dyn:hasMaterialName "{material}" .
+"""
+
+
+def write_specimen(specimens_dir, i, material="Al6061"):
+    sid = f"SPN-{i:03d}"
+    folder = specimens_dir / sid
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{sid}_specimen.ttl"
+    path.write_text(SPECIMEN_TTL.format(uri=f"SPN_{i:03d}", sid=sid, material=material))
+    return path
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestInstanceGraphCache:
+
+    def test_hit_and_mtime_invalidation(self, tmp_path):
+        cache = InstanceGraphCache(max_triples=100)
+        path = write_specimen(tmp_path, 1)
+
+        graph = cache.get(path)
+        assert cache.get(str(path)) is graph
+
+        write_specimen(tmp_path, 1, material="SS316")
+        bump_mtime(path)
+        reloaded = cache.get(path)
+        assert reloaded is not graph
+        assert "SS316" in {str(o) for o in reloaded.objects()}
+
+        stats = cache.get_statistics()
+        assert (stats['hits'], stats['misses'], stats['stale']) == (1, 2, 1)
+        assert stats['graphs'] == 1 and stats['triples'] == 3
+
+    def test_lru_eviction_within_budget(self, tmp_path):
+        cache = InstanceGraphCache(max_triples=6)     # two 3-triple files
+        paths = [write_specimen(tmp_path, i) for i in range(3)]
+
+        first = cache.get(paths[0])
+        cache.get(paths[1])
+        assert cache.get(paths[0]) is first           # paths[1] is now least recent
+        cache.get(paths[2])
+
+        stats = cache.get_statistics()
+        assert (stats['graphs'], stats['triples'], stats['evictions']) == (2, 6, 1)
+        assert cache.get(paths[0]) is first
+        assert cache.get_statistics()['misses'] == 3
+
+    def test_disabled_cache_parses_every_time(self, tmp_path):
+        cache = InstanceGraphCache(max_triples=0)
+        path = write_specimen(tmp_path, 1)
+        assert cache.get(path) is not cache.get(path)
+        assert cache.get_statistics()['graphs'] == 0
+
+        with pytest.raises(ValueError):
+            InstanceGraphCache(max_triples=-1)
+
+
+class TestLazyInstanceLoading:
+
+    def test_full_data_is_parsed_once(self, tmp_path):
+        specimens_dir = tmp_path / "specimens"
+        for i in range(3):
+            write_specimen(specimens_dir, i)
+        builder = InstanceQueryBuilder(use_persistent_index=False, graph_cache_triples=1000)
+        builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+
+        uri = f"{DYN}SPN_001"
+        assert builder.get_instance_file_path(uri) == \
+            (specimens_dir / "SPN-001" / "SPN-001_specimen.ttl").absolute()
+        assert builder.get_instance_file_path(f"{DYN}SPN_999") is None
+
+        for _ in range(3):
+            data = builder.load_full_instance_data(uri)
+            assert data[f"{DYN}hasMaterialName"] == "Al6061"
+        stats = builder.get_index_statistics()['graph_cache']
+        assert (stats['misses'], stats['hits']) == (1, 2)
+
+        # A deleted file disappears from the URI -> path map on rescan
+        (specimens_dir / "SPN-001" / "SPN-001_specimen.ttl").unlink()
+        builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+        assert builder.get_instance_file_path(uri) is None
+        assert builder.load_full_instance_data(uri) == {}
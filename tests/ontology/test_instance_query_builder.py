@@ -1,7 +1,32 @@
+import os
+import sqlite3
+
 import pytest
 from pathlib import Path
+from dynamat.ontology.core import parallel as parallel_module
 from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
 
+SPECIMEN = "https://dynamat.utep.edu/ontology#Specimen"
+MATERIAL = "https://dynamat.utep.edu/ontology#hasMaterialName"
+
+SPECIMEN_TTL = """
+@prefix dyn: <https://dynamat.utep.edu/ontology#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+
+dyn:{sid} rdf:type dyn:Specimen ;
+    dyn:hasSpecimenID "{sid}" ;
+    dyn:hasMaterialName "{material}" .
+"""
+
+
+def write_specimen(specimens_dir, sid, material="Al6061"):
+    folder = specimens_dir / sid
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{sid}_specimen.ttl"
+    path.write_text(SPECIMEN_TTL.format(sid=sid, material=material))
+    return path
+
+
 class TestInstanceQueryBuilder:
     """Tests for InstanceQueryBuilder indexing and searching."""
 
@@ -72,3 +97,127 @@ class TestInstanceQueryBuilder:
         has_diameter_prop = "https://dynamat.utep.edu/ontology#hasOriginalDiameter"
         assert has_diameter_prop in data
         assert float(data[has_diameter_prop]) == 10.0
+
+
+class TestPersistentInstanceIndex:
+    """Rescans must only parse added or modified files."""
+
+    @pytest.fixture
+    def specimens_dir(self, tmp_path):
+        specimens_dir = tmp_path / "specimens"
+        for i in range(5):
+            write_specimen(specimens_dir, f"SPN-{i:03d}")
+        return specimens_dir
+
+    @pytest.fixture
+    def make_builder(self, tmp_path):
+        index_path = tmp_path / "cache" / "instance_index.sqlite"
+        return lambda: InstanceQueryBuilder(use_persistent_index=True, index_path=index_path)
+
+    @staticmethod
+    def materials(builder):
+        return sorted(i[MATERIAL] for i in builder.find_all_instances(SPECIMEN))
+
+    @staticmethod
+    def scan(builder, specimens_dir):
+        count = builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+        return count, builder.get_index_statistics()['classes'][SPECIMEN]['files_parsed']
+
+    def test_warm_index_parses_nothing(self, make_builder, specimens_dir):
+        cold = make_builder()
+        assert self.scan(cold, specimens_dir) == (5, 5)
+
+        warm = make_builder()
+        assert self.scan(warm, specimens_dir) == (5, 0)
+        assert self.materials(warm) == self.materials(cold)
+        assert warm.index_store.get_statistics()['files'] == 5
+
+    def test_rescan_updates_changed_files(self, make_builder, specimens_dir):
+        builder = make_builder()
+        self.scan(builder, specimens_dir)
+
+        modified = write_specimen(specimens_dir, "SPN-001", material="Ti6Al4V")
+        stat = modified.stat()
+        os.utime(modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        write_specimen(specimens_dir, "SPN-100")
+        (specimens_dir / "SPN-004" / "SPN-004_specimen.ttl").unlink()
+
+        assert self.scan(builder, specimens_dir) == (5, 2)
+        assert self.materials(builder) == ["Al6061"] * 4 + ["Ti6Al4V"]
+        # No stale values or duplicate timestamps left behind
+        assert len(builder.index_graph) == 5 * 5
+
+        # A fresh session sees the same state without parsing
+        assert self.scan(make_builder(), specimens_dir) == (5, 0)
+
+    def test_touched_file_is_not_reparsed(self, make_builder, specimens_dir):
+        self.scan(make_builder(), specimens_dir)
+        touched = specimens_dir / "SPN-002" / "SPN-002_specimen.ttl"
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        builder = make_builder()
+        assert self.scan(builder, specimens_dir) == (5, 0)
+        assert builder.get_index_statistics()['classes'][SPECIMEN]['files_reused'] == 5
+
+    def test_corrupt_index_is_rebuilt(self, make_builder, specimens_dir):
+        builder = make_builder()
+        builder.index_store.path.parent.mkdir(parents=True)
+        builder.index_store.path.write_bytes(b"not a database" * 100)
+
+        assert self.scan(builder, specimens_dir) == (5, 5)
+        assert self.scan(make_builder(), specimens_dir) == (5, 0)
+
+    def test_locked_index_is_kept(self, make_builder, specimens_dir):
+        self.scan(make_builder(), specimens_dir)
+        builder = make_builder()
+        builder.index_store.LOCK_TIMEOUT = 0.05
+        inode = builder.index_store.path.stat().st_ino
+
+        holder = sqlite3.connect(str(builder.index_store.path))
+        holder.execute("BEGIN EXCLUSIVE")
+        try:
+            assert self.scan(builder, specimens_dir) == (5, 5)
+        finally:
+            holder.rollback()
+            holder.close()
+
+        assert builder.index_store.path.stat().st_ino == inode
+        assert self.scan(make_builder(), specimens_dir) == (5, 0)
+
+    def test_files_are_parsed_outside_transactions(self, make_builder, specimens_dir):
+        store = make_builder().index_store
+        files = sorted(specimens_dir.rglob("*_specimen.ttl"))
+
+        def extract(paths):
+            # A writer from another connection must not be blocked meanwhile
+            other = sqlite3.connect(str(store.path), timeout=0)
+            with other:
+                other.execute("BEGIN IMMEDIATE")
+            other.close()
+            return [{'name': path.name} for path in paths]
+
+        store.sync(specimens_dir, SPECIMEN, files, extract)
+        touched = specimens_dir / "SPN-002" / "SPN-002_specimen.ttl"
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        write_specimen(specimens_dir, "SPN-001", material="Ti6Al4V")
+
+        sync = store.sync(specimens_dir, SPECIMEN, files, extract)
+        assert (sync.files_parsed, sync.files_rehashed, sync.files_reused) == (1, 1, 3)
+        assert store.sync(specimens_dir, SPECIMEN, files, extract).files_reused == 5
+
+    def test_parallel_scan_matches_serial(self, make_builder, specimens_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(parallel_module, "PARALLEL_MIN_FILES", 1)
+        serial = InstanceQueryBuilder(use_persistent_index=False)
+        self.scan(serial, specimens_dir)
+
+        parallel = InstanceQueryBuilder(use_persistent_index=True, max_workers=2,
+                                        index_path=tmp_path / "parallel.sqlite")
+        progress = []
+        count = parallel.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl",
+                                        progress_callback=lambda *p: progress.append(p))
+
+        assert count == 5
+        assert self.materials(parallel) == self.materials(serial)
+        assert progress == [(1, 5), (2, 5), (3, 5), (4, 5), (5, 5)]
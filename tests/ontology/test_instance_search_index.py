@@ -0,0 +1,147 @@
+"""
+Tests for the inverted / faceted instance search index.
+"""
+
+import os
+
+import pytest
+
+from dynamat.ontology.cache.instance_search_index import InstanceSearchIndex
+from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
+
+DYN = "https://dynamat.utep.edu/ontology#"
+SPECIMEN = f"{DYN}Specimen"
+TEST = f"{DYN}SHPBCompression"
+MATERIAL = f"{DYN}hasMaterial"
+SHAPE = f"{DYN}hasShape"
+DIAMETER = f"{DYN}hasOriginalDiameter"
+
+SPECIMEN_TTL = """
+@prefix dyn: <https://dynamat.utep.edu/ontology#> .
+@prefix qudt: <http://qudt.org/schema/qudt/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+dyn:{uri} a dyn:Specimen ;
+    dyn:hasSpecimenID "{sid}"^^xsd:string ;
+    dyn:hasMaterial dyn:{material} ;
+    dyn:hasShape dyn:{shape} ;
+    dyn:hasOriginalDiameter [ a qudt:QuantityValue ;
+        qudt:numericValue "{diameter}"^^xsd:double ] .
+"""
+
+
+def specimen(i, material, shape="Cylindrical", diameter=6.0):
+    return {
+        'uri': f"{DYN}SPN_{i:03d}",
+        'type': SPECIMEN,
+        f"{DYN}hasSpecimenID": f"DYNML-{material}-{i:03d}",
+        MATERIAL: f"{DYN}{material}",
+        SHAPE: f"{DYN}{shape}",
+        DIAMETER: {'pattern': 'quantity_value', 'value': diameter},
+        f"{DYN}isReference": i == 0,
+    }
+
+
+@pytest.fixture
+def index():
+    index = InstanceSearchIndex()
+    for i, (material, shape, diameter) in enumerate([
+        ("SS316", "Cylindrical", 6.0),
+        ("SS316", "Cuboid", 8.0),
+        ("Al6061", "Cylindrical", 10.0),
+        ("Ti64", "Cylindrical", 12.5),
+    ]):
+        index.add(SPECIMEN, specimen(i, material, shape, diameter), f"/data/SPN-{i:03d}.ttl")
+    index.add(TEST, {'uri': f"{DYN}TEST_001", MATERIAL: f"{DYN}SS316"}, "/data/TEST_001.ttl")
+    return index
+
+
+def uris(*numbers):
+    return {f"{DYN}SPN_{i:03d}" for i in numbers}
+
+
+class TestInstanceSearchIndex:
+
+    def test_filters_and_class_restriction(self, index):
+        assert index.find(SPECIMEN, filters={MATERIAL: f"{DYN}SS316"}) == uris(0, 1)
+        assert index.find(TEST, filters={MATERIAL: f"{DYN}SS316"}) == {f"{DYN}TEST_001"}
+        assert index.find(SPECIMEN, filters={f"{DYN}isReference": True}) == uris(0)
+        assert index.find(SPECIMEN, filters={f"{DYN}hasSpecimenID": "DYNML-Ti64-003"}) == uris(3)
+
+    def test_token_prefix_and_range_queries(self, index):
+        assert index.find(SPECIMEN, text="ss3") == uris(0, 1)
+        assert index.find(SPECIMEN, text="SS316 001") == uris(1)
+        assert index.find(SPECIMEN, text="cub") == uris(1)          # URI local name
+        assert index.find(SPECIMEN, text="steel") == set()
+        assert index.find(SPECIMEN, prefixes={f"{DYN}hasSpecimenID": "dynml-al"}) == uris(2)
+        assert index.find(SPECIMEN, ranges={DIAMETER: (8.0, 12.5)}) == uris(1, 2, 3)
+        assert index.find(SPECIMEN, ranges={DIAMETER: (None, 9)}, text="cyl") == uris(0)
+
+    def test_facet_counts_ignore_own_filter(self, index):
+        counts = index.facet_counts(SPECIMEN, [MATERIAL, SHAPE],
+                                    filters={MATERIAL: f"{DYN}SS316"})
+        assert counts[MATERIAL] == {f"{DYN}SS316": 2, f"{DYN}Al6061": 1, f"{DYN}Ti64": 1}
+        assert counts[SHAPE] == {f"{DYN}Cylindrical": 1, f"{DYN}Cuboid": 1}
+
+    def test_incremental_updates(self, index):
+        index.find(SPECIMEN, text="al")                         # build sorted views
+        index.add(SPECIMEN, specimen(2, "Ti64", diameter=20.0), "/data/SPN-002.ttl")
+        index.remove(f"{DYN}SPN_003")
+
+        assert index.find(SPECIMEN, text="al") == set()
+        assert index.find(SPECIMEN, ranges={DIAMETER: (12.0, None)}) == uris(2)
+        assert index.facet_counts(SPECIMEN, [MATERIAL])[MATERIAL] == {
+            f"{DYN}SS316": 2, f"{DYN}Ti64": 1}
+        assert len(index) == 4
+
+
+class TestQueryBuilderSearch:
+
+    @pytest.fixture
+    def specimens_dir(self, tmp_path):
+        specimens_dir = tmp_path / "specimens"
+        for i, material in enumerate(["SS316", "SS316", "Al6061", "Ti64"]):
+            self.write(specimens_dir, i, material)
+        return specimens_dir
+
+    @staticmethod
+    def write(specimens_dir, i, material, diameter=6.0):
+        sid = f"SPN-{i:03d}"
+        folder = specimens_dir / sid
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{sid}_specimen.ttl"
+        path.write_text(SPECIMEN_TTL.format(uri=f"SPN_{i:03d}", sid=sid, material=material,
+                                            shape="Cylindrical", diameter=diameter))
+        return path
+
+    def test_search_matches_sparql_filter(self, specimens_dir):
+        builder = InstanceQueryBuilder(use_persistent_index=False)
+        builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+
+        for filters in ({}, {MATERIAL: f"{DYN}SS316"}, {"hasMaterial": f"{DYN}Ti64"}):
+            expected = (builder.filter_instances(SPECIMEN, filters) if filters
+                        else builder.find_all_instances(SPECIMEN))
+            assert builder.search_instances(SPECIMEN, filters=filters) == expected
+
+        assert builder.facet_counts(SPECIMEN)[MATERIAL] == {
+            f"{DYN}SS316": 2, f"{DYN}Al6061": 1, f"{DYN}Ti64": 1}
+
+    def test_rescan_keeps_index_current(self, specimens_dir, tmp_path):
+        builder = InstanceQueryBuilder(use_persistent_index=True,
+                                       index_path=tmp_path / "index.sqlite")
+        builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+
+        modified = self.write(specimens_dir, 0, "Ti64", diameter=9.5)
+        stat = modified.stat()
+        os.utime(modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (specimens_dir / "SPN-003" / "SPN-003_specimen.ttl").unlink()
+        builder.scan_and_index(specimens_dir, SPECIMEN, "*_specimen.ttl")
+
+        assert builder.facet_counts(SPECIMEN, [MATERIAL])[MATERIAL] == {
+            f"{DYN}SS316": 1, f"{DYN}Al6061": 1, f"{DYN}Ti64": 1}
+        found = builder.search_instances(SPECIMEN, ranges={"hasOriginalDiameter": (9, 10)},
+                                         display_properties=[MATERIAL])
+        assert [i[MATERIAL] for i in found] == [f"{DYN}Ti64"]
+
+        builder.clear_index()
+        assert builder.search_instances(SPECIMEN) == []
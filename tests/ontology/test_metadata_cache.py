@@ -0,0 +1,121 @@
+"""
+Tests for dependency-tracked MetadataCache invalidation.
+"""
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF, RDFS
+
+from dynamat.ontology.cache.metadata_cache import MetadataCache
+from dynamat.ontology.core.ontology_loader import ObservableMemory
+
+DYN = Namespace("https://dynamat.utep.edu/ontology#")
+
+
+@pytest.fixture
+def watched():
+    graph = Graph(store=ObservableMemory())
+    graph.add((DYN.Material, RDFS.label, Literal("Material")))
+    cache = MetadataCache()
+    cache.watch_graph(graph)
+    cache.cache_class_metadata(
+        str(DYN.Specimen), "specimen-metadata",
+        depends_on=[DYN.Specimen, DYN.PhysicalObject, DYN.hasMaterial],
+        depends_on_instances_of=[DYN.Material],
+    )
+    cache.cache_class_metadata(str(DYN.Material), "material-metadata",
+                               depends_on=[DYN.Material])
+    return graph, cache
+
+
+class TestDependencyInvalidation:
+
+    def test_unrelated_triples_keep_entries(self, watched):
+        graph, cache = watched
+        graph.add((DYN.S1, DYN.hasSpecimenID, Literal("S1")))
+        graph.add((DYN.S1, RDF.type, DYN.Specimen))
+        assert cache.is_class_cached(str(DYN.Specimen))
+        assert cache.get_cache_stats().cache_evictions == 0
+
+    def test_new_instance_of_range_class_evicts(self, watched):
+        graph, cache = watched
+        graph.add((DYN.Unobtainium, RDF.type, DYN.Material))
+        assert not cache.is_class_cached(str(DYN.Specimen))
+        assert cache.is_class_cached(str(DYN.Material))
+        assert cache.get_cache_stats().cache_evictions == 1
+
+    def test_property_and_ancestor_changes_evict(self, watched):
+        graph, cache = watched
+        graph.add((DYN.hasMaterial, RDFS.label, Literal("Material")))
+        assert not cache.is_class_cached(str(DYN.Specimen))
+
+        cache.cache_class_metadata(str(DYN.Specimen), "rebuilt",
+                                   depends_on=[DYN.Specimen, DYN.PhysicalObject])
+        # A new property whose domain is an ancestor changes the ancestor
+        graph.add((DYN.hasColour, RDFS.domain, DYN.PhysicalObject))
+        assert not cache.is_class_cached(str(DYN.Specimen))
+
+    def test_removal_and_pattern_removal_evict(self, watched):
+        graph, cache = watched
+        graph.remove((DYN.Material, RDFS.label, None))
+        assert not cache.is_class_cached(str(DYN.Material))
+
+        cache.cache_class_metadata(str(DYN.Material), "rebuilt", depends_on=[DYN.Material])
+        graph.add((DYN.Material, RDFS.label, Literal("Material")))
+        cache.cache_class_metadata(str(DYN.Material), "rebuilt", depends_on=[DYN.Material])
+        graph.remove((None, RDFS.label, None))
+        assert cache.get_cached_class_uris() == [str(DYN.Specimen)]
+
+        # Removing a triple that is not in the graph changes nothing
+        cache.cache_class_metadata(str(DYN.Material), "rebuilt", depends_on=[DYN.Material])
+        graph.remove((DYN.Material, RDFS.comment, None))
+        assert cache.is_class_cached(str(DYN.Material))
+
+    def test_untracked_entries_survive_changes(self, watched):
+        graph, cache = watched
+        cache.cache_class_metadata(str(DYN.Test), "untracked")
+        graph.add((DYN.Test, RDFS.label, Literal("Test")))
+        assert cache.is_class_cached(str(DYN.Test))
+
+    def test_recaching_replaces_dependencies(self, watched):
+        graph, cache = watched
+        cache.cache_class_metadata(str(DYN.Specimen), "rebuilt", depends_on=[DYN.Specimen])
+        assert cache.get_dependencies('class', str(DYN.Specimen)) == {('subject', str(DYN.Specimen))}
+        graph.add((DYN.Other, RDF.type, DYN.Material))
+        assert cache.is_class_cached(str(DYN.Specimen))
+
+    def test_stats_counters(self, watched):
+        graph, cache = watched
+        cache.get_cached_class_metadata(str(DYN.Specimen))
+        cache.get_cached_class_metadata(str(DYN.Missing))
+        cache.invalidate_subjects(subjects=[DYN.Material])
+        stats = cache.get_cache_stats()
+        assert (stats.cache_hits, stats.cache_misses, stats.cache_evictions) == (1, 1, 1)
+
+        cache.clear_all_caches()
+        stats = cache.get_cache_stats()
+        assert (stats.cache_hits, stats.cache_misses, stats.cache_evictions) == (0, 0, 0)
+        assert stats.tracked_dependencies == 0
+
+
+def test_schema_builder_records_dependencies(ontology_manager):
+    """Adding a material refreshes the specimen form; adding a specimen does not."""
+    class_uri = str(DYN.Specimen)
+    graph = ontology_manager.graph
+    ontology_manager.cache.clear_class_cache()
+    metadata = ontology_manager.get_class_metadata_for_form(class_uri)
+
+    dependencies = ontology_manager.cache.get_dependencies('class', class_uri)
+    assert ('subject', class_uri) in dependencies
+    assert ('subject', str(DYN.hasMaterial)) in dependencies
+    assert ('instances', str(DYN.Material)) in dependencies
+
+    try:
+        graph.add((DYN.TEST_SPECIMEN_CACHE, RDF.type, DYN.Specimen))
+        assert ontology_manager.get_class_metadata_for_form(class_uri) is metadata
+
+        graph.add((DYN.TestUnobtainium, RDF.type, DYN.Material))
+        assert not ontology_manager.cache.is_class_cached(class_uri)
+        assert ontology_manager.get_class_metadata_for_form(class_uri) is not metadata
+    finally:
+        graph.remove((DYN.TEST_SPECIMEN_CACHE, None, None))
+        graph.remove((DYN.TestUnobtainium, None, None))
@@ -0,0 +1,85 @@
+"""
+Tests for background form-metadata prefetch.
+"""
+
+import threading
+
+import pytest
+
+from dynamat.ontology.cache.metadata_cache import MetadataCache
+from dynamat.ontology.schema.metadata_prefetcher import MetadataPrefetcher
+
+DYN = "https://dynamat.utep.edu/ontology#"
+
+
+class _BlockingBuilder:
+    """Schema builder whose builds wait until released."""
+
+    def __init__(self):
+        self.cache = MetadataCache()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.built = []
+
+    def get_class_metadata_for_form(self, class_uri):
+        self.started.set()
+        assert self.release.wait(10)
+        self.built.append(class_uri)
+        metadata = f"metadata:{class_uri}"
+        self.cache.cache_class_metadata(class_uri, metadata)
+        return metadata
+
+
+@pytest.fixture
+def blocking():
+    builder = _BlockingBuilder()
+    prefetcher = MetadataPrefetcher(builder)
+    yield builder, prefetcher
+    builder.release.set()
+    prefetcher.shutdown(wait=True)
+
+
+class TestMetadataPrefetcher:
+
+    def test_claim_waits_for_running_build_and_cancels_queued(self, blocking):
+        builder, prefetcher = blocking
+        assert prefetcher.prefetch([f"{DYN}A", f"{DYN}B"]) == [f"{DYN}A", f"{DYN}B"]
+        assert builder.started.wait(10)
+
+        # B is still queued behind A: claiming it cancels the background build
+        assert prefetcher.claim(f"{DYN}B") is None
+
+        threading.Timer(0.05, builder.release.set).start()
+        assert prefetcher.claim(f"{DYN}A") == f"metadata:{DYN}A"
+        assert prefetcher.wait(10)
+        assert builder.built == [f"{DYN}A"]
+
+        stats = prefetcher.get_statistics()
+        assert (stats['claimed_running'], stats['cancelled'], stats['built']) == (1, 1, 1)
+
+    def test_cached_and_queued_classes_are_skipped(self, blocking):
+        builder, prefetcher = blocking
+        builder.cache.cache_class_metadata(f"{DYN}A", "cached")
+        assert prefetcher.prefetch([f"{DYN}A", f"{DYN}B"]) == [f"{DYN}B"]
+        assert prefetcher.prefetch([f"{DYN}B"]) == []
+        assert prefetcher.is_pending(f"{DYN}B")
+
+    def test_shutdown_stops_accepting_work(self, blocking):
+        builder, prefetcher = blocking
+        builder.release.set()
+        prefetcher.shutdown(wait=True)
+        assert prefetcher.prefetch([f"{DYN}A"]) == []
+
+
+def test_manager_prefetch_populates_cache(ontology_manager):
+    classes = [f"{DYN}SegmentationParams", f"{DYN}TukeyWindowParams"]
+    ontology_manager.cache.clear_class_cache()
+
+    assert ontology_manager.prefetch_class_metadata(classes) == classes
+    assert ontology_manager.metadata_prefetcher.wait(120)
+    for class_uri in classes:
+        assert ontology_manager.cache.is_class_cached(class_uri)
+
+    metadata = ontology_manager.get_class_metadata_for_form(classes[0])
+    assert metadata is ontology_manager.cache.get_cached_class_metadata(classes[0])
+    assert metadata.properties
@@ -0,0 +1,156 @@
+import os
+import shutil
+from collections import Counter
+
+import pytest
+from rdflib import BNode, Graph
+
+from dynamat.config import config
+from dynamat.ontology.core.ontology_loader import OntologyLoader
+from dynamat.ontology.core import parallel as parallel_module
+from dynamat.ontology.core.parallel import parallel_map_files, pool_size
+
+
+@pytest.fixture
+def ontology_dir(tmp_path, monkeypatch):
+    """Writable copy of the ontology TTL files, without user individuals."""
+    target = tmp_path / "ontology"
+    for sub in ("core", "class_properties", "shapes", "class_individuals"):
+        shutil.copytree(config.ONTOLOGY_DIR / sub, target / sub,
+                        ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    monkeypatch.setattr(config, "USER_INDIVIDUALS_DIR", tmp_path / "no_individuals")
+    return target
+
+
+def _triple_shapes(graph):
+    """Multiset of triples with blank nodes masked (cheap isomorphism proxy)."""
+    return Counter(
+        tuple(None if isinstance(term, BNode) else term for term in triple)
+        for triple in graph
+    )
+
+
+def _load(ontology_dir, snapshot_dir):
+    loader = OntologyLoader(ontology_dir, use_snapshot=True, snapshot_dir=snapshot_dir)
+    loader.load_ontology_files()
+    return loader
+
+
+class TestOntologySnapshot:
+    """Tests for the parsed-ontology snapshot."""
+
+    def test_snapshot_round_trip(self, ontology_dir, tmp_path):
+        """A snapshot load yields the same graph and prefixes as parsing."""
+        snapshot_dir = tmp_path / "snapshots"
+        cold = _load(ontology_dir, snapshot_dir)
+        warm = _load(ontology_dir, snapshot_dir)
+
+        reference = Graph()
+        for ttl_file in cold._collect_source_files():
+            reference.parse(ttl_file, format="turtle")
+
+        assert _triple_shapes(warm.graph) == _triple_shapes(reference)
+        assert sorted(warm.graph.namespaces()) == sorted(reference.namespaces())
+
+        cold_stats = cold.get_statistics()["execution"]
+        warm_stats = warm.get_statistics()["execution"]
+        assert (cold_stats["snapshot_hits"], cold_stats["snapshot_misses"]) == (0, 1)
+        assert (warm_stats["snapshot_hits"], warm_stats["snapshot_misses"]) == (1, 0)
+        assert warm_stats["files_parsed"] == 0
+        assert warm_stats["files_from_snapshot"] == warm.get_files_loaded_count()
+        assert [f["triples_added"] for f in warm_stats["loaded_files"]] == \
+            [f["triples_added"] for f in cold_stats["loaded_files"]]
+
+    def test_only_changed_files_are_reparsed(self, ontology_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshots"
+        first = _load(ontology_dir, snapshot_dir)
+
+        changed = ontology_dir / "class_individuals" / "extra_individuals.ttl"
+        changed.write_text(
+            "@prefix dyn: <https://dynamat.utep.edu/ontology#> .\n"
+            "dyn:ExtraThing dyn:hasName \"extra\" .\n"
+        )
+        second = _load(ontology_dir, snapshot_dir)
+
+        stats = second.get_statistics()["execution"]
+        assert stats["snapshot_misses"] == 1
+        assert stats["files_parsed"] == 1
+        assert stats["files_from_snapshot"] == first.get_files_loaded_count()
+        assert len(second.graph) == len(first.graph) + 1
+
+        # Touching a file changes its mtime and invalidates only that file
+        st = changed.stat()
+        os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        third = _load(ontology_dir, snapshot_dir)
+        assert third.get_statistics()["execution"]["files_parsed"] == 1
+
+        changed.unlink()
+        fourth = _load(ontology_dir, snapshot_dir)
+        assert fourth.get_statistics()["execution"]["files_parsed"] == 0
+        assert len(fourth.graph) == len(first.graph)
+        assert _load(ontology_dir, snapshot_dir).get_statistics()["execution"]["snapshot_hits"] == 1
+
+    def test_corrupt_snapshot_is_ignored(self, ontology_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshots"
+        loader = _load(ontology_dir, snapshot_dir)
+        loader.snapshot_path.write_bytes(b"not a pickle")
+
+        reloaded = _load(ontology_dir, snapshot_dir)
+        assert len(reloaded.graph) == len(loader.graph)
+        assert reloaded.get_statistics()["execution"]["snapshot_misses"] == 1
+
+    def test_snapshot_disabled(self, ontology_dir, tmp_path):
+        loader = OntologyLoader(ontology_dir, use_snapshot=False, snapshot_dir=tmp_path)
+        loader.load_ontology_files()
+        stats = loader.get_statistics()
+        assert stats["configuration"]["snapshot_enabled"] is False
+        assert stats["execution"]["snapshot_misses"] == 0
+        assert not list(tmp_path.glob("*.pickle"))
+
+
+class TestParallelLoad:
+    """Tests for process-pool TTL parsing."""
+
+    def test_parallel_matches_serial(self, ontology_dir, monkeypatch):
+        monkeypatch.setattr(parallel_module, "PARALLEL_MIN_FILES", 1)
+        serial = OntologyLoader(ontology_dir, use_snapshot=False, max_workers=1)
+        parallel = OntologyLoader(ontology_dir, use_snapshot=False, max_workers=2)
+        serial.load_ontology_files()
+        parallel.load_ontology_files()
+
+        assert _triple_shapes(parallel.graph) == _triple_shapes(serial.graph)
+        assert sorted(parallel.graph.namespaces()) == sorted(serial.graph.namespaces())
+        assert parallel.get_load_order() == serial.get_load_order()
+
+        stats = parallel.get_statistics()
+        assert stats["performance"]["last_load_workers"] == 2
+        assert stats["execution"]["files_parsed"] == parallel.get_files_loaded_count()
+        assert all(f["load_time_ms"] > 0 for f in stats["execution"]["loaded_files"])
+
+    def test_parallel_parse_error_is_reported(self, ontology_dir, monkeypatch):
+        monkeypatch.setattr(parallel_module, "PARALLEL_MIN_FILES", 1)
+        broken = ontology_dir / "class_individuals" / "zz_broken.ttl"
+        broken.write_text("@prefix dyn: <https://dynamat.utep.edu/ontology#> .\ndyn:A dyn:b .\n")
+
+        loader = OntologyLoader(ontology_dir, use_snapshot=False, max_workers=2)
+        with pytest.raises(Exception):
+            loader.load_ontology_files()
+        failed = loader.get_statistics()["execution"]["failed_files"]
+        assert [f["filename"] for f in failed] == [str(broken)]
+
+    def test_small_loads_stay_serial(self, ontology_dir):
+        loader = OntologyLoader(ontology_dir, use_snapshot=False, max_workers=4)
+        loader.load_ontology_files()
+        assert loader.get_statistics()["performance"]["last_load_workers"] == 1
+
+    def test_parallel_map_files_keeps_order(self, tmp_path):
+        files = [tmp_path / f"{i:02d}.ttl" for i in range(10)]
+        assert list(parallel_map_files(os.path.basename, files, 2, min_files=1)) == \
+            [f.name for f in files]
+        assert pool_size(10, 4, min_files=1) == 4
+        assert pool_size(3, 4, min_files=1) == 3
+        assert pool_size(10, 4, min_files=32) == 1
+
+    def test_invalid_worker_count(self, ontology_dir):
+        with pytest.raises(ValueError):
+            OntologyLoader(ontology_dir, max_workers=-1)
@@ -64,3 +64,193 @@ class TestQUDTManager:
         """Test that non-existent units raise ValueError."""
         with pytest.raises(ValueError, match="Source unit not found"):
             qudt_manager.convert_value(10.0, "unit:NonExistentUnit", "unit:MilliM")
+
+
+import json
+import pickle
+import shutil
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+
+from dynamat.config import Config
+from dynamat.ontology.qudt import QUDTManager, UnitTable
+from dynamat.ontology.qudt import unit_table as unit_table_module
+
+STRAIN_RATE = "http://qudt.org/vocab/quantitykind/StrainRate"
+LENGTH = "http://qudt.org/vocab/quantitykind/Length"
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Make downloads fail; records the managers that attempted one."""
+    attempts = []
+
+    def fail_download(self):
+        attempts.append(self)
+        return False
+
+    monkeypatch.setattr(QUDTManager, "_download_and_build_cache", fail_download)
+    return attempts
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch, downloads):
+    """Fresh copy of the packaged JSON cache."""
+    target = tmp_path / "qudt_cache"
+    target.mkdir()
+    shutil.copy(Config.QUDT_CACHE_DIR / "qudt_units_cache.json", target)
+    _write_metadata(target, age_days=0)
+    monkeypatch.setattr(Config, "USE_QUDT_UNIT_TABLE", True)
+    return target
+
+
+def _write_metadata(directory, age_days):
+    created = datetime.now() - timedelta(days=age_days)
+    (directory / "cache_metadata.json").write_text(json.dumps({"created": created.isoformat()}))
+
+
+class TestUnitTable:
+    """Tests for the compiled unit table and offline cache handling."""
+
+    def test_table_written_and_reused(self, cache_dir, downloads, monkeypatch):
+        first = QUDTManager(cache_dir)
+        assert first.load()
+        assert first.get_cache_info()["table_exists"]
+
+        def no_rebuild(data):
+            raise AssertionError("Units rebuilt from JSON although the unit table is current")
+
+        monkeypatch.setattr(QUDTUnit, "from_dict", no_rebuild)
+        second = QUDTManager(cache_dir)
+        assert second.load()
+        assert second.units_by_uri.keys() == first.units_by_uri.keys()
+        assert [u.uri for u in second.get_units_for_quantity_kind(LENGTH)] == \
+            [u.uri for u in first.get_units_for_quantity_kind(LENGTH)]
+        assert second.convert_value(10.0, "unit:IN", "unit:MilliM") == pytest.approx(254.0)
+        assert not downloads
+
+    def test_table_ignored_when_stale_or_other_version(self, cache_dir, monkeypatch):
+        QUDTManager(cache_dir).load()
+        table_file = cache_dir / "qudt_units_table.pickle"
+        stamp = (cache_dir / "qudt_units_cache.json").stat()
+        assert UnitTable.load(table_file, (stamp.st_mtime_ns, stamp.st_size)) is not None
+        assert UnitTable.load(table_file, (stamp.st_mtime_ns + 1, stamp.st_size)) is None
+
+        monkeypatch.setattr(unit_table_module, "UNIT_TABLE_FORMAT_VERSION", -1)
+        assert UnitTable.load(table_file, (stamp.st_mtime_ns, stamp.st_size)) is None
+
+        table_file.write_bytes(b"not a pickle")
+        manager = QUDTManager(cache_dir)
+        assert manager.load()
+        assert len(manager.units_by_uri) > 0
+
+        table_file.write_bytes(pickle.dumps(["not", "a", "table"]))
+        assert UnitTable.load(table_file, (stamp.st_mtime_ns, stamp.st_size)) is None
+        manager = QUDTManager(cache_dir)
+        assert manager.load()
+        assert len(manager.units_by_uri) > 0
+
+    def test_stale_cache_loads_without_network(self, cache_dir, downloads):
+        _write_metadata(cache_dir, age_days=365)
+        manager = QUDTManager(cache_dir)
+        assert manager._is_cache_fresh() is False
+
+        assert manager.load()
+        assert manager.get_unit_by_uri("unit:MilliM").symbol == "mm"
+        assert not downloads
+
+        assert manager.rebuild_cache() is False
+        assert len(downloads) == 1
+
+    def test_failed_download_is_not_retried_on_next_launch(self, tmp_path, downloads):
+        cache_dir = tmp_path / "empty_cache"
+        assert QUDTManager(cache_dir).load() is False
+        assert len(downloads) == 1
+        metadata = json.loads((cache_dir / "cache_metadata.json").read_text())
+        assert "last_download_failure" in metadata
+
+        # A new process (fresh manager) reads the failure time from disk
+        assert QUDTManager(cache_dir).load() is False
+        assert len(downloads) == 1
+
+        failed = datetime.now() - timedelta(seconds=QUDTManager.DOWNLOAD_RETRY_INTERVAL + 1)
+        metadata["last_download_failure"] = failed.isoformat()
+        (cache_dir / "cache_metadata.json").write_text(json.dumps(metadata))
+        QUDTManager(cache_dir).load()
+        assert len(downloads) == 2
+
+    def test_download_uses_timeout(self, tmp_path, monkeypatch):
+        timeouts = []
+
+        def offline(request, timeout=None):
+            timeouts.append(timeout)
+            raise urllib.error.URLError("offline")
+
+        monkeypatch.setattr(urllib.request, "urlopen", offline)
+        manager = QUDTManager(tmp_path / "empty_cache")
+        assert manager._download_and_build_cache() is False
+        assert timeouts == [QUDTManager.DOWNLOAD_TIMEOUT]
+
+    def test_failed_rebuild_keeps_cache(self, cache_dir):
+        manager = QUDTManager(cache_dir)
+        assert manager.rebuild_cache() is False
+        assert (cache_dir / "qudt_units_cache.json").exists()
+        assert manager.load()
+
+    def test_supplemental_units_indexed_once(self, cache_dir):
+        manager = QUDTManager(cache_dir)
+        manager.load()
+        manager._add_supplemental_units()
+
+        strain_rate = manager.get_units_for_quantity_kind(STRAIN_RATE)
+        uris = [u.uri for u in strain_rate]
+        assert len(uris) == len(set(uris))
+        assert "http://qudt.org/vocab/unit/PER-SEC" in uris
+
+        multipliers, offsets = manager.unit_table.quantity_kind_factors(STRAIN_RATE)
+        assert list(multipliers) == [u.conversion_multiplier
+                                     for u in manager.units_by_quantity_kind[STRAIN_RATE]]
+        assert manager.unit_table.conversion_factors("http://qudt.org/vocab/unit/PER-MilliSEC") == (1000.0, 0.0)
+
+
+class TestArrayConversion:
+    """Tests for cached affine conversions of whole arrays."""
+
+    def test_matches_scalar_conversion(self, qudt_manager):
+        values = np.linspace(-50.0, 500.0, 101)
+        for from_unit, to_unit in [("unit:IN", "unit:MilliM"),
+                                   ("unit:DEG_F", "unit:DEG_C"),
+                                   ("unit:DEG_C", "unit:K"),
+                                   ("unit:MegaPA", "unit:PSI")]:
+            converted = qudt_manager.convert_array(values, from_unit, to_unit)
+            expected = [qudt_manager.convert_value(v, from_unit, to_unit) for v in values]
+            np.testing.assert_allclose(converted, expected, rtol=1e-12, atol=1e-9)
+
+    def test_in_place_and_out_of_place(self, qudt_manager):
+        values = np.array([1.0, 2.5, 10.0])
+        original = values.copy()
+
+        converted = qudt_manager.convert_array(values, "unit:MilliSEC", "unit:SEC")
+        np.testing.assert_allclose(converted, [0.001, 0.0025, 0.01])
+        np.testing.assert_array_equal(values, original)
+
+        result = qudt_manager.convert_array(values, "unit:MilliSEC", "unit:SEC", out=values)
+        assert result is values
+        np.testing.assert_allclose(values, [0.001, 0.0025, 0.01])
+
+        # Integer input converts to float64
+        assert qudt_manager.convert_array([1, 2], "unit:M", "unit:MilliM").dtype == np.float64
+
+    def test_conversion_is_cached(self, qudt_manager):
+        first = qudt_manager.get_conversion("unit:DEG_C", "unit:K")
+        assert qudt_manager.get_conversion("unit:DEG_C", "unit:K") is first
+        assert first.scale == pytest.approx(1.0)
+        assert first.shift == pytest.approx(273.15)
+
+        identity = qudt_manager.get_conversion("unit:MilliM", "http://qudt.org/vocab/unit/MilliM")
+        assert identity.is_identity
+
+    def test_unknown_unit_raises(self, qudt_manager):
+        with pytest.raises(ValueError, match="Target unit not found"):
+            qudt_manager.convert_array(np.ones(3), "unit:MilliM", "unit:NonExistentUnit")
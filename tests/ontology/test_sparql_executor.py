@@ -0,0 +1,175 @@
+"""
+Tests for SPARQLExecutor prepared-query and result caching.
+"""
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF
+
+from dynamat.ontology.core import parallel
+from dynamat.ontology.core.namespace_manager import NamespaceManager
+from dynamat.ontology.core.ontology_loader import ObservableMemory
+from dynamat.ontology.query.sparql_executor import SPARQLExecutor
+
+DYN = Namespace("https://dynamat.utep.edu/ontology#")
+
+NAME_QUERY = """
+SELECT ?name WHERE {
+    ?s a dyn:Specimen ;
+       dyn:hasName ?name .
+}
+"""
+
+
+def _add_specimen(graph, local_name):
+    subject = DYN[local_name]
+    graph.add((subject, RDF.type, DYN.Specimen))
+    graph.add((subject, DYN.hasName, Literal(local_name)))
+    return subject
+
+
+@pytest.fixture
+def executor():
+    graph = Graph()
+    namespace_manager = NamespaceManager(graph)
+    namespace_manager.setup_graph_namespaces(graph)
+    _add_specimen(graph, "S1")
+    _add_specimen(graph, "S2")
+    return SPARQLExecutor(graph, namespace_manager)
+
+
+class TestPreparedQueryCache:
+
+    def test_prepared_query_reused_across_bindings(self, executor):
+        first = executor.execute_query(NAME_QUERY, bindings={'s': DYN.S1})
+        second = executor.execute_query(NAME_QUERY, bindings={'s': DYN.S2})
+
+        assert first == [{'name': 'S1'}]
+        assert second == [{'name': 'S2'}]
+        assert len(executor.execute_query(NAME_QUERY)) == 2
+
+        stats = executor.get_cache_stats()
+        assert stats['prepared_queries'] == 1
+        assert (stats['prepared_misses'], stats['prepared_hits']) == (1, 2)
+        assert stats['cached_queries'] == 0
+
+    def test_ask_queries_share_the_cache(self, executor):
+        ask = "ASK { ?s dyn:hasName ?name }"
+        assert executor.execute_ask_query(ask, bindings={'name': Literal("S1")})
+        assert not executor.execute_ask_query(ask, bindings={'name': Literal("S9")})
+        assert executor.get_cache_stats()['prepared_hits'] == 1
+
+    def test_lru_eviction(self, executor):
+        executor.prepared_cache_size = 2
+        queries = [f"SELECT ?s WHERE {{ ?s dyn:hasName \"S{i}\" }}" for i in range(3)]
+        for query in queries:
+            executor.execute_query(query)
+        executor.execute_query(queries[1])   # hit, keeps queries[1] recent
+        executor.execute_query(queries[0])   # evicted earlier, prepared again
+
+        stats = executor.get_cache_stats()
+        assert stats['prepared_queries'] == 2
+        assert stats['prepared_evictions'] == 2
+        assert (stats['prepared_hits'], stats['prepared_misses']) == (1, 4)
+
+    def test_invalid_query_is_not_cached(self, executor):
+        with pytest.raises(Exception):
+            executor.execute_query("SELECT ?s WHERE { ?s unknownprefix:x ?o }")
+        assert executor.get_cache_stats()['prepared_queries'] == 0
+
+
+class TestResultCache:
+
+    def test_results_invalidated_by_graph_version(self, executor):
+        assert len(executor.execute_query(NAME_QUERY, use_cache=True)) == 2
+        assert len(executor.execute_query(NAME_QUERY, use_cache=True)) == 2
+        executor.bump_graph_version()
+        assert len(executor.execute_query(NAME_QUERY, use_cache=True)) == 2
+
+        stats = executor.get_cache_stats()
+        assert stats['graph_version'] == 1
+        assert (stats['result_hits'], stats['result_misses'], stats['result_stale']) == (1, 2, 1)
+        assert stats['cached_queries'] == 1
+
+    def test_graph_changes_invalidate_results(self):
+        graph = Graph(store=ObservableMemory())
+        namespace_manager = NamespaceManager(graph)
+        namespace_manager.setup_graph_namespaces(graph)
+        _add_specimen(graph, "S1")
+        executor = SPARQLExecutor(graph, namespace_manager)
+
+        assert len(executor.execute_query(NAME_QUERY, use_cache=True)) == 1
+        _add_specimen(graph, "S2")
+        assert len(executor.execute_query(NAME_QUERY, use_cache=True)) == 2
+        graph.remove((DYN.S1, None, None))
+        assert executor.execute_query(NAME_QUERY, use_cache=True) == [{'name': 'S2'}]
+        assert executor.get_cache_stats()['result_stale'] == 2
+
+    def test_results_keyed_by_bindings(self, executor):
+        s1 = executor.execute_query(NAME_QUERY, bindings={'s': DYN.S1}, use_cache=True)
+        s2 = executor.execute_query(NAME_QUERY, bindings={'s': DYN.S2}, use_cache=True)
+        assert s1 != s2
+        assert executor.execute_query(NAME_QUERY, bindings={'s': DYN.S1}, use_cache=True) is s1
+        assert executor.get_cache_stats()['cached_queries'] == 2
+
+    def test_result_cache_is_bounded(self, executor):
+        executor.result_cache_size = 1
+        executor.execute_query(NAME_QUERY, bindings={'s': DYN.S1}, use_cache=True)
+        executor.execute_query(NAME_QUERY, bindings={'s': DYN.S2}, use_cache=True)
+        stats = executor.get_cache_stats()
+        assert (stats['cached_queries'], stats['result_evictions']) == (1, 1)
+
+    def test_clear_cache(self, executor):
+        executor.execute_query(NAME_QUERY, use_cache=True)
+        executor.clear_cache()
+        stats = executor.get_cache_stats()
+        assert stats['cached_queries'] == stats['prepared_queries'] == 0
+
+
+def test_specimen_loader_invalidates_results(ontology_manager, tmp_path):
+    from dynamat.mechanical.shpb.io import SpecimenLoader
+
+    specimen_dir = tmp_path / "DYNML-TEST-00001"
+    specimen_dir.mkdir()
+    (specimen_dir / "DYNML-TEST-00001.ttl").write_text(
+        "@prefix dyn: <https://dynamat.utep.edu/ontology#> .\n"
+        "dyn:DYNML_TEST_00001 a dyn:Specimen .\n"
+    )
+    sparql = ontology_manager.sparql_executor
+    version = sparql.graph_version
+
+    loader = SpecimenLoader(ontology_manager)
+    try:
+        assert loader.load_specimen_files(tmp_path) == 1
+        assert sparql.graph_version > version
+    finally:
+        sparql.graph.remove((DYN.DYNML_TEST_00001, None, None))
+
+
+def test_specimen_loader_parallel_load(ontology_manager, tmp_path, monkeypatch):
+    from dynamat.mechanical.shpb.io import SpecimenLoader
+
+    count = 4
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_FILES", count)
+    for i in range(count):
+        specimen_dir = tmp_path / f"DYNML-PAR-{i:05d}"
+        specimen_dir.mkdir()
+        (specimen_dir / f"DYNML-PAR-{i:05d}.ttl").write_text(
+            "@prefix dyn: <https://dynamat.utep.edu/ontology#> .\n"
+            f'dyn:DYNML_PAR_{i:05d} a dyn:Specimen ; dyn:hasSpecimenID "DYNML-PAR-{i:05d}" .\n'
+        )
+    (tmp_path / "DYNML-PAR-00000" / "broken.ttl").write_text("dyn:Broken a")
+    sparql = ontology_manager.sparql_executor
+    progress = []
+
+    loader = SpecimenLoader(ontology_manager)
+    try:
+        loaded = loader.load_specimen_files(
+            tmp_path, max_workers=2, progress_callback=lambda *p: progress.append(p)
+        )
+        assert loaded == count
+        assert progress[-1] == (count + 1, count + 1)
+        assert all((DYN[f"DYNML_PAR_{i:05d}"], RDF.type, DYN.Specimen) in sparql.graph
+                   for i in range(count))
+    finally:
+        for i in range(count):
+            sparql.graph.remove((DYN[f"DYNML_PAR_{i:05d}"], None, None))
@@ -0,0 +1,118 @@
+"""
+Tests for SHPBAnalysisState array backends.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dynamat.gui.widgets.shpb.state import MemmapArrayStore, SHPBAnalysisState
+
+
+@pytest.fixture
+def raw_df():
+    rng = np.random.default_rng(0)
+    n = 20000
+    return pd.DataFrame({
+        'Time (s)': np.arange(n) * 1e-7,
+        'CH1': rng.normal(0, 1, n),
+        'CH2': rng.normal(0, 1, n).astype(np.float32),
+        'label': ['x'] * n,
+    })
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    from dynamat.config import config
+    monkeypatch.setattr(config, 'SHPB_SCRATCH_DIR', tmp_path)
+    state = SHPBAnalysisState(array_backend='memmap')
+    yield state
+    state.release_arrays()
+
+
+class TestMemmapBackend:
+
+    def test_raw_df_columns_are_read_only_views(self, state, raw_df):
+        state.raw_df = raw_df
+        state.column_mapping = {'time': 'Time (s)', 'incident': 'CH1', 'transmitted': 'CH2'}
+
+        pd.testing.assert_frame_equal(state.raw_df, raw_df)
+        for signal_type in ('time', 'incident', 'transmitted'):
+            signal = state.get_raw_signal(signal_type)
+            assert state.array_store.owns(signal)
+            assert not signal.flags.writeable
+        assert state.get_raw_signal('transmitted').dtype == np.float32
+
+    def test_pulse_dicts_spill_on_item_and_field_assignment(self, state):
+        pulse = np.sin(np.linspace(0, np.pi, 1000))
+        state.segmented_pulses['incident'] = pulse
+        state.aligned_pulses = {'incident': pulse, 'transmitted': -pulse}
+        state.calculation_results = {'stress_1w': pulse, 'n_points': 1000}
+
+        np.testing.assert_array_equal(state.segmented_pulses['incident'], pulse)
+        assert not state.aligned_pulses['transmitted'].flags.writeable
+        assert state.calculation_results['n_points'] == 1000
+        with pytest.raises(ValueError):
+            state.aligned_pulses['incident'][0] = 1.0
+        assert sorted(state.array_store.keys()) == [
+            'aligned_pulses.incident', 'aligned_pulses.transmitted',
+            'calculation_results.stress_1w', 'segmented_pulses.incident',
+        ]
+
+    def test_reassignment_and_reset_delete_files(self, state, raw_df):
+        state.raw_df = raw_df
+        state.time_vector = np.arange(100.0)
+        state.time_vector = np.arange(50.0)
+        state.aligned_pulses = {'incident': np.ones(10)}
+        assert len(list(state.array_store.scratch_dir.iterdir())) == 5
+
+        state.reset_from_stage(7)
+        assert state.time_vector is None
+        assert sorted(state.array_store.keys()) == ['raw_df.0', 'raw_df.1', 'raw_df.2']
+        assert len(list(state.array_store.scratch_dir.iterdir())) == 3
+
+        scratch_dir = state.array_store.scratch_dir
+        state.release_arrays()
+        assert not scratch_dir.exists()
+
+    def test_dict_methods_release_files(self, state):
+        pulses = state.aligned_pulses
+        pulses.update(incident=np.ones(10), transmitted=np.zeros(10))
+        pulses.setdefault('reflected', np.full(10, 2.0))
+        pulses |= {'strain': np.arange(10.0)}
+        assert all(state.array_store.owns(pulses[name]) for name in pulses)
+        assert len(list(state.array_store.scratch_dir.iterdir())) == 4
+
+        name, _ = pulses.popitem()
+        assert f"aligned_pulses.{name}" not in state.array_store.keys()
+        pulses['incident'] = None
+        pulses.pop('transmitted')
+        assert sorted(state.array_store.keys()) == ['aligned_pulses.reflected']
+        assert len(list(state.array_store.scratch_dir.iterdir())) == 1
+
+    def test_constructor_fields_are_spilled(self, tmp_path, monkeypatch):
+        from dynamat.config import config
+        monkeypatch.setattr(config, 'SHPB_SCRATCH_DIR', tmp_path)
+        state = SHPBAnalysisState(array_backend='memmap', time_vector=np.arange(10.0))
+        assert state.array_store.owns(state.time_vector)
+        state.release_arrays()
+
+    def test_memory_backend_keeps_objects(self, raw_df):
+        state = SHPBAnalysisState(array_backend='memory')
+        state.raw_df = raw_df
+        state.aligned_pulses = {'incident': np.ones(10)}
+        assert state.raw_df is raw_df
+        assert type(state.aligned_pulses) is dict
+        assert state._array_store is None
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            SHPBAnalysisState(array_backend='shared')
+
+
+def test_store_cleans_up_when_garbage_collected(tmp_path):
+    store = MemmapArrayStore(tmp_path)
+    store.put('a', np.ones(4))
+    scratch_dir = store.scratch_dir
+    del store
+    assert not scratch_dir.exists()
@@ -0,0 +1,188 @@
+"""
+Tests for the EntitySelectorWidget table model and background queries.
+"""
+
+import sys
+
+import pytest
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication, QEvent, QPersistentModelIndex, Qt
+from PyQt6.QtWidgets import QApplication
+
+from dynamat.gui.widgets.base.entity_selector import EntitySelectorConfig, EntitySelectorWidget
+from dynamat.gui.widgets.base.entity_selector import entity_selector_widget
+from dynamat.gui.widgets.base.entity_selector.entity_table_model import (
+    EntityTableModel, EntityTableSnapshot
+)
+from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
+
+DYN = "https://dynamat.utep.edu/ontology#"
+MATERIALS = ("Al6061", "SS316", "Ti64")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+def make_instances(count):
+    return [
+        {
+            'uri': f"{DYN}SPN_{i:05d}",
+            f"{DYN}hasSpecimenID": f"SPN-{i:05d}",
+            f"{DYN}hasMaterialName": MATERIALS[i % len(MATERIALS)],
+        }
+        for i in range(count)
+    ]
+
+
+def make_model(count):
+    props = [f"{DYN}hasSpecimenID", f"{DYN}hasMaterialName"]
+    model = EntityTableModel(["Specimen ID", "Material"])
+    model.set_snapshot(EntityTableSnapshot.build(make_instances(count), props, str))
+    return model
+
+
+def column(model, col):
+    return [model.data(model.index(row, col)) for row in range(model.rowCount())]
+
+
+class TestEntityTableModel:
+
+    def test_search_matches_any_cell_case_insensitive(self, qapp):
+        model = make_model(30)
+        model.set_search_text("SS3")
+        assert model.rowCount() == 10
+        model.set_search_text("ss316")         # narrowing
+        assert model.rowCount() == 10
+        model.set_search_text("spn-0001")      # new search
+        assert column(model, 0) == [f"SPN-{i:05d}" for i in range(10, 20)]
+        model.set_search_text("")
+        assert model.rowCount() == 30
+
+    def test_search_does_not_match_across_cells(self, qapp):
+        model = make_model(3)
+        model.set_search_text("00000al")
+        assert model.rowCount() == 0
+
+    def test_sort_keeps_search_and_selection(self, qapp):
+        model = make_model(30)
+        model.set_search_text("ti64")
+        persistent = model.index(0, 0)
+        selected = QPersistentModelIndex(persistent)
+        uri = model.instance_at(0)['uri']
+
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+        ids = column(model, 0)
+        assert ids == sorted(ids, reverse=True) and len(ids) == 10
+        assert model.instance_at(selected.row())['uri'] == uri
+        assert model.row_of_uri(uri) == selected.row()
+
+        # A search that hides the row invalidates it
+        model.set_search_text("al6061")
+        assert not selected.isValid()
+        assert model.row_of_uri(uri) == -1
+
+    def test_new_snapshot_keeps_sort(self, qapp):
+        model = make_model(5)
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+        model.set_snapshot(EntityTableSnapshot.build(
+            make_instances(8), [f"{DYN}hasSpecimenID"], str))
+        assert column(model, 0)[0] == "SPN-00007"
+
+    def test_build_is_cancellable(self):
+        snapshot = EntityTableSnapshot.build(make_instances(10), [f"{DYN}hasSpecimenID"],
+                                             str, is_cancelled=lambda: True)
+        assert snapshot is None
+
+
+class TestEntitySelectorWidget:
+
+    @pytest.fixture
+    def query_builder(self, tmp_path):
+        specimens_dir = tmp_path / "specimens"
+        for i in range(12):
+            sid = f"SPN-{i:03d}"
+            (specimens_dir / sid).mkdir(parents=True)
+            (specimens_dir / sid / f"{sid}_specimen.ttl").write_text(
+                "@prefix dyn: <https://dynamat.utep.edu/ontology#> .\n"
+                f'dyn:SPN_{i:03d} a dyn:Specimen ; dyn:hasSpecimenID "{sid}" ;\n'
+                f'    dyn:hasMaterialName "{MATERIALS[i % 3]}" .\n'
+            )
+        builder = InstanceQueryBuilder(use_persistent_index=False)
+        builder.scan_and_index(specimens_dir, f"{DYN}Specimen", "*_specimen.ttl")
+        return builder
+
+    @pytest.fixture
+    def widget(self, qapp, query_builder):
+        config = EntitySelectorConfig(
+            class_uri=f"{DYN}Specimen",
+            display_properties=["dyn:hasSpecimenID", "dyn:hasMaterialName"],
+            show_search_box=True,
+        )
+        widget = EntitySelectorWidget(config, query_builder=query_builder)
+        yield widget
+        widget.wait_for_refresh()
+
+    def test_refresh_runs_in_background(self, widget):
+        finished = []
+        widget.loading_finished.connect(finished.append)
+        widget.refresh()
+        assert widget.wait_for_refresh()
+        assert finished == [12]
+        assert widget._model.rowCount() == 12
+        assert not widget.is_loading()
+
+    def test_superseded_query_is_discarded(self, widget):
+        finished = []
+        widget.loading_finished.connect(finished.append)
+        widget.refresh()
+        widget.refresh()
+        widget.wait_for_refresh()
+        assert finished == [12]
+
+    def test_selection_requested_while_loading(self, widget):
+        widget.refresh()
+        widget.set_selected_entity(f"{DYN}SPN_007")
+        widget.wait_for_refresh()
+        assert widget.get_selected_entity()['uri'] == f"{DYN}SPN_007"
+
+    def test_worker_released_after_widget_destroyed(self, qapp, query_builder):
+        config = EntitySelectorConfig(class_uri=f"{DYN}Specimen",
+                                      display_properties=["dyn:hasSpecimenID"])
+        widget = EntitySelectorWidget(config, query_builder=query_builder)
+        worker = widget._worker
+        sip.delete(widget)
+
+        worker.wait()
+        QCoreApplication.sendPostedEvents()
+        assert worker not in entity_selector_widget._running_workers
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        assert sip.isdeleted(worker)
+
+    def test_search_box_filters_rows(self, widget):
+        widget.wait_for_refresh()
+        widget._filter_panel._search_box.setText("SS316")
+        assert widget._model.rowCount() == 4
+
+    def test_filter_options_show_facet_counts(self, qapp, query_builder):
+        config = EntitySelectorConfig(
+            class_uri=f"{DYN}Specimen",
+            display_properties=["dyn:hasSpecimenID", "dyn:hasMaterialName"],
+            filter_properties=["dyn:hasMaterialName"],
+        )
+        widget = EntitySelectorWidget(config, query_builder=query_builder)
+        panel = widget._filter_panel
+        panel.populate_filter_options("dyn:hasMaterialName", [(m, m) for m in MATERIALS])
+        widget.wait_for_refresh()
+        combo = panel._filter_combos[f"{DYN}hasMaterialName"]
+        assert [combo.itemText(i) for i in range(1, 4)] == ["Al6061 (4)", "SS316 (4)", "Ti64 (4)"]
+
+        widget.set_filters({"dyn:hasMaterialName": "Ti64"})
+        widget.wait_for_refresh()
+        assert widget._model.rowCount() == 4
+        assert combo.itemText(combo.currentIndex()) == "Ti64 (4)"
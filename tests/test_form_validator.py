@@ -0,0 +1,136 @@
+"""
+Tests for incremental SHACL validation of SHPB wizard page graphs.
+"""
+
+from collections import Counter
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, XSD
+
+from dynamat.gui.core.form_validator import IncrementalSHACLValidator
+
+DYN = Namespace("https://dynamat.utep.edu/ontology#")
+
+
+def equipment_page():
+    g = Graph()
+    test, specimen = DYN["TEST-001"], DYN["SPN-001"]
+    g.add((test, RDF.type, DYN.SHPBCompression))
+    g.add((test, DYN.hasTestID, Literal("TEST-2025-001")))
+    g.add((test, DYN.hasTestDate, Literal("2025-02-01", datatype=XSD.date)))
+    g.add((test, DYN.performedOn, specimen))
+    g.add((test, DYN.hasIncidentBar, DYN.IncidentBar_C350_6ft))
+    g.add((DYN.IncidentBar_C350_6ft, RDF.type, DYN.IncidentBar))
+    g.add((test, DYN.hasStrikerVelocity, Literal(15.0, datatype=XSD.double)))
+    g.add((specimen, RDF.type, DYN.Specimen))
+    g.add((specimen, DYN.hasSpecimenID, Literal("DYNML-AL-0001")))
+    return g
+
+
+def raw_data_page(columns):
+    g = Graph()
+    data_file = DYN["TEST-001_raw_csv"]
+    g.add((data_file, RDF.type, DYN.DataFile))
+    g.add((data_file, DYN.hasFileName, Literal("raw.csv")))
+    for i in range(columns):
+        series = DYN[f"TEST-001_series_{i}"]
+        g.add((series, RDF.type, DYN.RawSignal))
+        g.add((series, DYN.hasColumnName, Literal(f"CH{i}")))
+        g.add((series, DYN.hasColumnIndex, Literal(i)))
+        g.add((series, DYN.hasSeriesType, DYN.StressSeriesType))
+        g.add((data_file, DYN.hasDataColumn, series))
+    return g
+
+
+def detection_page(threshold):
+    g = Graph()
+    params = DYN["TEST-001_pulse_detection"]
+    g.add((params, RDF.type, DYN.PulseDetectionParams))
+    g.add((params, DYN.appliedToSeries, DYN["TEST-001_series_0"]))
+    g.add((params, DYN.hasDetectionThreshold, Literal(threshold)))
+    return g
+
+
+def issue_counts(result):
+    return Counter(
+        (i.severity, i.message, i.focus_node, i.result_path, i.value, i.source_shape)
+        for i in result.get_all_issues()
+    )
+
+
+@pytest.fixture
+def validator(ontology_manager):
+    return IncrementalSHACLValidator(ontology_manager)
+
+
+class TestIncrementalSHACLValidator:
+    """Incremental results must equal a full validation of the merged pages."""
+
+    def test_matches_full_validation(self, validator):
+        steps = [
+            ("equipment", equipment_page()),
+            ("raw_data", raw_data_page(4)),
+            ("pulse_detection", detection_page(0.1)),
+            ("raw_data", raw_data_page(2)),        # page revisited with new data
+            ("pulse_detection", None),             # page graph discarded
+        ]
+        pages = {}
+        for key, graph in steps:
+            if graph is None:
+                del pages[key]
+            else:
+                pages[key] = graph
+
+            merged = Graph()
+            for page_graph in pages.values():
+                for triple in page_graph:
+                    merged.add(triple)
+            expected = validator.validate(merged)
+            result = validator.validate_pages(dict(pages))
+
+            assert issue_counts(result) == issue_counts(expected), key
+            assert result.conforms == expected.conforms
+
+        stats = validator.get_statistics()
+        assert stats["full_runs"] == 1
+        assert stats["partial_runs"] == len(steps) - 1
+        assert stats["shapes_validated"] < len(steps) * stats["shapes"]
+
+    def test_unchanged_pages_skip_validation(self, validator):
+        pages = {"equipment": equipment_page(), "raw_data": raw_data_page(2)}
+        first = validator.validate_pages(pages)
+
+        # Same graphs, and an equal graph rebuilt by the page
+        again = validator.validate_pages(dict(pages))
+        rebuilt = validator.validate_pages({**pages, "raw_data": raw_data_page(2)})
+
+        assert issue_counts(again) == issue_counts(first)
+        assert issue_counts(rebuilt) == issue_counts(first)
+        stats = validator.get_statistics()
+        assert stats["full_runs"] == 1
+        assert stats["partial_runs"] == 0
+        assert stats["skipped_runs"] == 2
+
+    def test_page_edited_in_place(self, validator):
+        page = detection_page(0.1)
+        pages = {"equipment": equipment_page(), "pulse_detection": page}
+        validator.validate_pages(pages)
+
+        # Same graph object and triple count, different content
+        params = DYN["TEST-001_pulse_detection"]
+        page.set((params, DYN.hasDetectionThreshold, Literal("high")))
+        result = validator.validate_pages(pages)
+
+        merged = equipment_page() + page
+        assert issue_counts(result) == issue_counts(validator.validate(merged))
+        assert validator.get_statistics()["skipped_runs"] == 0
+
+    def test_shape_classification(self, validator):
+        global_shapes = validator._global_shapes
+        # Uniqueness checks compare ?this with every other instance
+        assert DYN.UniqueSpecimenIDConstraint in global_shapes
+        assert DYN.UniqueFileNameConstraint in global_shapes
+        # Property constraints and $this-anchored SPARQL only look forward
+        assert DYN.SHPBCompressionShape not in global_shapes
+        assert DYN.PulseShaperConstraint not in global_shapes
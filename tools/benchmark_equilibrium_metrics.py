@@ -0,0 +1,110 @@
+"""
+DynaMat Platform - Equilibrium Metrics Benchmark
+Measures wall time of StressStrainCalculator equilibrium metrics on
+synthetic stress histories.
+
+Compares three paths:
+- reference: separate masked passes per metric, one test at a time
+- single:    fused calculate_equilibrium_metrics(), one test at a time
+- batch:     fused calculate_equilibrium_metrics_batch() on stacked tests
+
+Usage:
+    python tools/benchmark_equilibrium_metrics.py
+    python tools/benchmark_equilibrium_metrics.py --tests 500 --points 25000
+"""
+
+import sys
+import time
+import argparse
+import warnings
+from typing import Dict
+
+import numpy as np
+
+from dynamat.mechanical.shpb.core import StressStrainCalculator
+
+
+VARIANTS = ('reference', 'single', 'batch')
+
+
+def make_results(n_tests: int, n_points: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    """Build stacked 1-wave/3-wave stress and force histories."""
+    rng = np.random.default_rng(seed)
+    shape = np.sqrt(np.sin(np.pi * np.linspace(0, 1, n_points)))
+    stress_3w = np.abs(
+        500 * shape * rng.uniform(0.5, 1.5, (n_tests, 1))
+        + rng.normal(0, 5, (n_tests, n_points))
+    )
+    stress_1w = np.abs(
+        stress_3w * rng.uniform(0.9, 1.1, (n_tests, 1))
+        + rng.normal(0, 10, (n_tests, n_points))
+    )
+    return {
+        'stress_1w': stress_1w,
+        'stress_3w': stress_3w,
+        'bar_force_1w': 126.68 * stress_1w,
+        'bar_force_3w': 126.68 * stress_3w,
+    }
+
+
+def run_variant(
+    variant: str,
+    calculator: StressStrainCalculator,
+    results: Dict[str, np.ndarray]
+) -> float:
+    """Return wall time of one pass over all tests."""
+    n_tests = results['stress_3w'].shape[0]
+    rows = [{k: v[i] for k, v in results.items()} for i in range(n_tests)]
+
+    t0 = time.perf_counter()
+    if variant == 'reference':
+        for row in rows:
+            calculator._equilibrium_metrics_reference(row)
+    elif variant == 'single':
+        for row in rows:
+            calculator.calculate_equilibrium_metrics(row)
+    else:
+        calculator.calculate_equilibrium_metrics_batch(results)
+    return time.perf_counter() - t0
+
+
+def main():
+    """Main entry point for the equilibrium metrics benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark StressStrainCalculator equilibrium metrics',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--tests', type=int, default=200,
+                        help='Number of tests in the batch (default: 200)')
+    parser.add_argument('--points', type=int, default=25000,
+                        help='Samples per test (default: 25000)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Timed runs per variant (default: 3)')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS,
+                        default=list(VARIANTS),
+                        help='Variants to benchmark (default: all)')
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    calculator = StressStrainCalculator(
+        bar_area=283.53, bar_wave_speed=4953.3, bar_elastic_modulus=199.99,
+        specimen_area=126.68, specimen_height=6.5
+    )
+    results = make_results(args.tests, args.points)
+
+    print(f"\nEquilibrium metrics benchmark: {args.tests} tests x "
+          f"{args.points} samples, best of {args.repeats}")
+    print("=" * 50)
+    print(f"  {'variant':<12s} {'time [s]':>10s} {'per test [ms]':>15s}")
+    print("-" * 50)
+
+    for variant in args.variants:
+        best = min(run_variant(variant, calculator, results) for _ in range(args.repeats))
+        print(f"  {variant:<12s} {best:>10.3f} {1e3 * best / args.tests:>15.3f}")
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
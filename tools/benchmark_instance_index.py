@@ -0,0 +1,158 @@
+"""
+DynaMat Platform - Instance Index Benchmark
+Measures wall time of InstanceQueryBuilder.scan_and_index() on a synthetic
+specimens directory laid out like SPECIMENS_DIR (one folder per specimen).
+
+Compares scan modes:
+- memory:      no persistent index, every file parsed
+- parallel:    no persistent index, files parsed in a process pool
+- cold:        persistent index empty, every file parsed and stored
+- warm:        new session with a populated index (no parsing)
+- incremental: a few files touched, modified, added and deleted since
+               the last scan (only modified and added files are parsed)
+
+Usage:
+    python tools/benchmark_instance_index.py
+    python tools/benchmark_instance_index.py --specimens 50000 --changes 200
+    python tools/benchmark_instance_index.py --specimens 1000 --variants cold warm
+    python tools/benchmark_instance_index.py --variants memory parallel --workers 2 4 8
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
+
+from benchmark_ontology_loader import MATERIALS, SPECIMEN_TEMPLATE
+
+
+VARIANTS = ('memory', 'parallel', 'cold', 'warm', 'incremental')
+SPECIMEN_CLASS = "https://dynamat.utep.edu/ontology#Specimen"
+FILE_PATTERN = "*_specimen.ttl"
+
+
+def write_specimen(specimens_dir: Path, i: int, length_offset: float = 0.0) -> Path:
+    """Write specimen `i` as specimens_dir/<ID>/<ID>_specimen.ttl."""
+    material = MATERIALS[i % len(MATERIALS)]
+    specimen_id = f"DYNML-{material}-{i:05d}"
+    folder = specimens_dir / specimen_id
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{specimen_id}_specimen.ttl"
+    path.write_text(SPECIMEN_TEMPLATE.format(
+        sid=specimen_id.replace('-', '_'),
+        id=specimen_id,
+        material=material,
+        batch=i % 100,
+        diameter=6.0 + (i % 7) * 0.5,
+        length=5.0 + (i % 5) * 0.5 + length_offset,
+        day=1 + i % 28,
+    ))
+    return path
+
+
+def apply_changes(specimens_dir: Path, count: int, changes: int, round_: int = 0) -> None:
+    """Touch, modify, add and delete `changes` specimens each."""
+    step = max(1, count // max(1, changes))
+    for i in range(0, min(count, changes * step), step):
+        for path in (specimens_dir / f"DYNML-{MATERIALS[i % len(MATERIALS)]}-{i:05d}").glob(FILE_PATTERN):
+            path.touch()                                           # same content
+        write_specimen(specimens_dir, i + 1, 0.25 * (round_ + 1))  # new content
+        write_specimen(specimens_dir, count * (round_ + 1) + i)    # new specimen
+        for stale in (specimens_dir / f"DYNML-{MATERIALS[(i + 2) % len(MATERIALS)]}-{i + 2:05d}").glob(FILE_PATTERN):
+            stale.unlink()                                         # deleted specimen
+
+
+def run_scan(specimens_dir: Path, use_index: bool, index_path: Path,
+             workers: int = 1) -> Dict[str, float]:
+    """Run one scan in a new query builder and return wall time and counters."""
+    builder = InstanceQueryBuilder(use_persistent_index=use_index, index_path=index_path,
+                                   max_workers=workers)
+    t0 = time.perf_counter()
+    count = builder.scan_and_index(specimens_dir, SPECIMEN_CLASS, FILE_PATTERN)
+    elapsed = time.perf_counter() - t0
+    info = builder.get_index_statistics()['classes'][SPECIMEN_CLASS]
+    return {
+        'time_s': elapsed,
+        'instances': count,
+        'parsed': info['files_parsed'],
+        'reused': info['files_reused'],
+        'removed': info['files_removed'],
+    }
+
+
+def main():
+    """Main entry point for the instance index benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark InstanceQueryBuilder scans with and without the persistent index',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--specimens', type=int, default=10000,
+                        help='Synthetic specimen files (default: 10000)')
+    parser.add_argument('--changes', type=int, default=50,
+                        help='Files touched, modified, added and deleted for '
+                             'the incremental variant (default: 50)')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=[os.cpu_count() or 1],
+                        help='Worker counts for the parallel variant (default: CPU count)')
+    parser.add_argument('--repeats', type=int, default=1,
+                        help='Scans per variant (default: 1)')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS,
+                        default=list(VARIANTS),
+                        help='Variants to benchmark (default: all)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='dynamat_bench_') as tmp:
+        tmp_path = Path(tmp)
+        specimens_dir = tmp_path / 'specimens'
+        index_path = tmp_path / 'cache' / 'instance_index.sqlite'
+        t0 = time.perf_counter()
+        for i in range(args.specimens):
+            write_specimen(specimens_dir, i)
+        print(f"\nWrote {args.specimens} synthetic specimen files "
+              f"in {time.perf_counter() - t0:.1f}s")
+
+        print(f"\nInstanceQueryBuilder scan benchmark: {args.specimens} specimens, "
+              f"{args.repeats} repeat(s), {os.cpu_count()} CPU(s)")
+        print("=" * 72)
+        print(f"  {'variant':<14s} {'time [s]':>10s} {'instances':>10s} "
+              f"{'parsed':>8s} {'reused':>8s} {'removed':>8s}")
+        print("-" * 72)
+
+        def report(name, r):
+            print(f"  {name:<14s} {r['time_s']:>10.2f} {r['instances']:>10d} "
+                  f"{r['parsed']:>8d} {r['reused']:>8d} {r['removed']:>8d}")
+
+        if 'memory' in args.variants:
+            for _ in range(args.repeats):
+                report('memory', run_scan(specimens_dir, False, index_path))
+
+        if 'parallel' in args.variants:
+            for workers in args.workers:
+                for _ in range(args.repeats):
+                    report(f'parallel x{workers}', run_scan(specimens_dir, False, index_path, workers))
+
+        if {'cold', 'warm', 'incremental'} & set(args.variants):
+            cold = run_scan(specimens_dir, True, index_path)
+            if 'cold' in args.variants:
+                report('cold', cold)
+
+        if 'warm' in args.variants:
+            for _ in range(args.repeats):
+                report('warm', run_scan(specimens_dir, True, index_path))
+
+        if 'incremental' in args.variants:
+            for round_ in range(args.repeats):
+                apply_changes(specimens_dir, args.specimens, args.changes, round_)
+                report('incremental', run_scan(specimens_dir, True, index_path))
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+DynaMat Platform - Instance Search Benchmark
+Compares InstanceQueryBuilder's SPARQL queries with the in-memory search
+index on a synthetic specimens directory.
+
+Queries:
+- all:     every specimen (find_all_instances vs search_instances)
+- filter:  one material (filter_instances vs search_instances)
+- facets:  facet counts of material and shape under a material filter
+- text:    token prefix search ("ss3 001")
+- range:   hasOriginalDiameter in [6.0, 7.0]
+
+Usage:
+    python tools/benchmark_instance_search.py
+    python tools/benchmark_instance_search.py --specimens 50000 --repeats 5
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from dynamat.ontology.instance_query_builder import InstanceQueryBuilder
+
+from benchmark_instance_index import write_specimen, SPECIMEN_CLASS, FILE_PATTERN
+
+DYN = "https://dynamat.utep.edu/ontology#"
+
+
+def best_time(func: Callable[[], object], repeats: int) -> float:
+    """Best wall time of `repeats` calls, in ms."""
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    """Main entry point for the instance search benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark SPARQL queries against the instance search index',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--specimens', type=int, default=10000,
+                        help='Synthetic specimen files (default: 10000)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Runs per query, best time reported (default: 3)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='dynamat_bench_') as tmp:
+        specimens_dir = Path(tmp) / 'specimens'
+        for i in range(args.specimens):
+            write_specimen(specimens_dir, i)
+
+        builder = InstanceQueryBuilder(use_persistent_index=False)
+        t0 = time.perf_counter()
+        builder.scan_and_index(specimens_dir, SPECIMEN_CLASS, FILE_PATTERN)
+        print(f"\nIndexed {args.specimens} specimens in {time.perf_counter() - t0:.1f}s")
+
+        filters = {f"{DYN}hasMaterial": f"{DYN}SS316"}
+        queries = [
+            ('all',
+             lambda: builder.find_all_instances(SPECIMEN_CLASS),
+             lambda: builder.search_instances(SPECIMEN_CLASS)),
+            ('filter',
+             lambda: builder.filter_instances(SPECIMEN_CLASS, filters),
+             lambda: builder.search_instances(SPECIMEN_CLASS, filters=filters)),
+            ('facets', None,
+             lambda: builder.facet_counts(SPECIMEN_CLASS, [f"{DYN}hasMaterial", f"{DYN}hasShape"],
+                                          filters=filters)),
+            ('text', None,
+             lambda: builder.search_instances(SPECIMEN_CLASS, text="ss3 001")),
+            ('range', None,
+             lambda: builder.search_instances(SPECIMEN_CLASS, ranges={"hasOriginalDiameter": (6.0, 7.0)})),
+        ]
+
+        print(f"\nInstance search benchmark: best of {args.repeats} run(s)")
+        print("=" * 60)
+        print(f"  {'query':<10s} {'SPARQL [ms]':>14s} {'index [ms]':>14s} {'results':>10s}")
+        print("-" * 60)
+        for name, sparql, indexed in queries:
+            sparql_ms = f"{best_time(sparql, args.repeats):14.1f}" if sparql else f"{'-':>14s}"
+            index_ms = best_time(indexed, args.repeats)
+            result = indexed()
+            size = len(result) if isinstance(result, list) else sum(map(len, result.values()))
+            print(f"  {name:<10s} {sparql_ms} {index_ms:>14.1f} {size:>10d}")
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+DynaMat Platform - Ontology Loader Benchmark
+Measures wall time of OntologyLoader.load_ontology_files() on the packaged
+ontology plus a synthetic user-individuals directory.
+
+Compares load modes:
+- serial:   every file parsed in this process (max_workers=1)
+- parallel: files parsed in a process pool (max_workers=N)
+- snapshot: warm start from the parsed-ontology snapshot (no parsing)
+
+The synthetic directory holds one TTL file per specimen, each with a
+handful of literal properties and two QuantityValue blank nodes.
+
+Usage:
+    python tools/benchmark_ontology_loader.py
+    python tools/benchmark_ontology_loader.py --specimens 10000 --workers 2 4 8
+    python tools/benchmark_ontology_loader.py --specimens 0 --variants serial snapshot
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from dynamat.config import config
+from dynamat.ontology.core.ontology_loader import OntologyLoader
+
+
+VARIANTS = ('serial', 'parallel', 'snapshot')
+
+SPECIMEN_TEMPLATE = """@prefix dyn: <https://dynamat.utep.edu/ontology#> .
+@prefix qudt: <http://qudt.org/schema/qudt/> .
+@prefix unit: <http://qudt.org/vocab/unit/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+dyn:{sid} a dyn:Specimen ;
+    dyn:hasSpecimenID "{id}"^^xsd:string ;
+    dyn:hasMaterial dyn:{material} ;
+    dyn:hasSpecimenRole dyn:TestSpecimen ;
+    dyn:hasShape dyn:Cylindrical ;
+    dyn:hasSpecimenBatchID "BATCH-{batch:03d}"^^xsd:string ;
+    dyn:hasOriginalDiameter [ a qudt:QuantityValue ;
+        qudt:numericValue "{diameter:.3f}"^^xsd:double ;
+        qudt:unit unit:MilliM ] ;
+    dyn:hasOriginalLength [ a qudt:QuantityValue ;
+        qudt:numericValue "{length:.3f}"^^xsd:double ;
+        qudt:unit unit:MilliM ] ;
+    dyn:hasCreatedDate "2024-01-{day:02d}"^^xsd:date .
+"""
+
+MATERIALS = ('SS316', 'A356', 'Al6061', 'Ti64')
+
+
+def write_synthetic_specimens(directory: Path, count: int) -> None:
+    """Write `count` specimen individual TTL files into `directory`."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        material = MATERIALS[i % len(MATERIALS)]
+        specimen_id = f"DYNML-{material}-{i:05d}"
+        (directory / f"{specimen_id}.ttl").write_text(SPECIMEN_TEMPLATE.format(
+            sid=specimen_id.replace('-', '_'),
+            id=specimen_id,
+            material=material,
+            batch=i % 100,
+            diameter=6.0 + (i % 7) * 0.5,
+            length=5.0 + (i % 5) * 0.5,
+            day=1 + i % 28,
+        ))
+
+
+def run_load(workers: int, use_snapshot: bool, snapshot_dir: Path) -> Dict[str, float]:
+    """Run one load and return wall time, graph size and loader statistics."""
+    loader = OntologyLoader(
+        config.ONTOLOGY_DIR, use_snapshot=use_snapshot,
+        snapshot_dir=snapshot_dir, max_workers=workers
+    )
+    t0 = time.perf_counter()
+    graph = loader.load_ontology_files()
+    elapsed = time.perf_counter() - t0
+    stats = loader.get_statistics()
+    return {
+        'time_s': elapsed,
+        'triples': len(graph),
+        'files': stats['execution']['files_loaded'],
+        'parsed': stats['execution']['files_parsed'],
+        'workers': stats['performance']['last_load_workers'],
+    }
+
+
+def main():
+    """Main entry point for the ontology loader benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark OntologyLoader serial, parallel and snapshot loads',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--specimens', type=int, default=10000,
+                        help='Synthetic specimen individual files (default: 10000)')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=[os.cpu_count() or 1],
+                        help='Worker counts for the parallel variant (default: CPU count)')
+    parser.add_argument('--repeats', type=int, default=1,
+                        help='Loads per variant (default: 1)')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS,
+                        default=list(VARIANTS),
+                        help='Variants to benchmark (default: all)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='dynamat_bench_') as tmp:
+        tmp_path = Path(tmp)
+        individuals_dir = tmp_path / 'individuals'
+        t0 = time.perf_counter()
+        write_synthetic_specimens(individuals_dir, args.specimens)
+        print(f"\nWrote {args.specimens} synthetic specimen files "
+              f"in {time.perf_counter() - t0:.1f}s")
+        config.USER_INDIVIDUALS_DIR = individuals_dir
+
+        runs: List[tuple] = []
+        if 'serial' in args.variants:
+            runs.append(('serial', 1, False))
+        if 'parallel' in args.variants:
+            runs.extend((f'parallel x{w}', w, False) for w in args.workers)
+
+        print(f"\nOntologyLoader benchmark: ontology + {args.specimens} specimens, "
+              f"{args.repeats} repeat(s), {os.cpu_count()} CPU(s)")
+        print("=" * 72)
+        print(f"  {'variant':<16s} {'time [s]':>10s} {'triples':>10s} "
+              f"{'files':>8s} {'parsed':>8s} {'workers':>8s}")
+        print("-" * 72)
+
+        def report(name, r):
+            print(f"  {name:<16s} {r['time_s']:>10.2f} {r['triples']:>10d} "
+                  f"{r['files']:>8d} {r['parsed']:>8d} {r['workers']:>8d}")
+
+        for name, workers, use_snapshot in runs:
+            for _ in range(args.repeats):
+                report(name, run_load(workers, use_snapshot, tmp_path / 'snapshot'))
+
+        if 'snapshot' in args.variants:
+            snapshot_dir = tmp_path / 'snapshot'
+            report('snapshot cold', run_load(max(args.workers), True, snapshot_dir))
+            for _ in range(args.repeats):
+                report('snapshot warm', run_load(1, True, snapshot_dir))
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
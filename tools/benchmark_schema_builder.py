@@ -0,0 +1,95 @@
+"""
+DynaMat Platform - GUI Schema Builder Benchmark
+Measures cold form-metadata build time per class with
+GUISchemaBuilder.get_class_metadata_for_form().
+
+Compares extraction modes:
+- per-property: valid values and functional flag queried per property
+- bulk:         one enumeration query and a triple scan per class
+
+Every build is cold (USE_SCHEMA_CACHE disabled). The number of SPARQL
+queries per build is read from the SPARQL executor's cache counters.
+
+Usage:
+    python tools/benchmark_schema_builder.py
+    python tools/benchmark_schema_builder.py --classes Specimen SHPBCompression --repeats 3
+"""
+
+import sys
+import time
+import argparse
+from typing import Dict
+
+from dynamat.config import Config
+from dynamat.ontology import OntologyManager
+
+
+DEFAULT_CLASSES = ('SHPBCompression', 'Specimen', 'Material', 'MechanicalTest', 'User')
+MODES = (('per-property', False), ('bulk', True))
+
+
+def _query_count(manager: OntologyManager) -> int:
+    stats = manager.sparql_executor.get_cache_stats()
+    return stats['prepared_hits'] + stats['prepared_misses']
+
+
+def build_once(manager: OntologyManager, class_uri: str, bulk: bool) -> Dict[str, float]:
+    """Build one class's metadata cold and return time, query and property counts."""
+    Config.USE_BULK_SCHEMA_EXTRACTION = bulk
+    queries_before = _query_count(manager)
+    t0 = time.perf_counter()
+    metadata = manager.gui_schema_builder.get_class_metadata_for_form(class_uri)
+    elapsed = time.perf_counter() - t0
+    return {
+        'time_ms': elapsed * 1000,
+        'queries': _query_count(manager) - queries_before,
+        'properties': len(metadata.properties),
+    }
+
+
+def main():
+    """Main entry point for the schema builder benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark cold GUISchemaBuilder form-metadata builds',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--classes', nargs='+', default=list(DEFAULT_CLASSES),
+                        help='DynaMat class names (default: %(default)s)')
+    parser.add_argument('--repeats', type=int, default=1,
+                        help='Builds per class and mode; the fastest is reported (default: 1)')
+    args = parser.parse_args()
+
+    original_cache = Config.USE_SCHEMA_CACHE
+    original_bulk = Config.USE_BULK_SCHEMA_EXTRACTION
+    Config.USE_SCHEMA_CACHE = False
+
+    try:
+        manager = OntologyManager()
+        dyn = str(manager.namespace_manager.DYN)
+
+        print(f"\nGUISchemaBuilder cold build benchmark, {args.repeats} repeat(s)")
+        print("=" * 72)
+        print(f"  {'class':<18s} {'mode':<13s} {'props':>6s} {'queries':>8s} "
+              f"{'time [ms]':>10s} {'speedup':>8s}")
+        print("-" * 72)
+
+        for name in args.classes:
+            class_uri = f"{dyn}{name}"
+            baseline = None
+            for mode, bulk in MODES:
+                runs = [build_once(manager, class_uri, bulk) for _ in range(args.repeats)]
+                best = min(runs, key=lambda r: r['time_ms'])
+                baseline = baseline or best['time_ms']
+                print(f"  {name:<18s} {mode:<13s} {best['properties']:>6d} "
+                      f"{best['queries']:>8d} {best['time_ms']:>10.1f} "
+                      f"{baseline / best['time_ms']:>7.1f}x")
+    finally:
+        Config.USE_SCHEMA_CACHE = original_cache
+        Config.USE_BULK_SCHEMA_EXTRACTION = original_bulk
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
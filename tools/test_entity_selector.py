@@ -214,8 +214,8 @@ def test_entity_selector_widget():
     assert widget._details_panel is not None, "Details panel should exist"
     assert widget._status_label is not None, "Status label should exist"
 
-    print(f"  Table columns: {widget._table.columnCount()}")
-    assert widget._table.columnCount() == 2, "Expected 2 columns"
+    print(f"  Table columns: {widget._model.columnCount()}")
+    assert widget._model.columnCount() == 2, "Expected 2 columns"
 
     # Test public methods
     selected = widget.get_selected_entity()
@@ -302,14 +302,16 @@ def test_integration_with_query_builder():
                 ontology_manager=ontology_manager
             )
 
-            # Check table was populated
-            row_count = widget._table.rowCount()
+            # Check table was populated (queries run in a worker thread)
+            widget.wait_for_refresh()
+            row_count = widget._model.rowCount()
             print(f"  EntitySelectorWidget loaded {row_count} specimens")
 
             if row_count > 0:
                 # Verify SPARQL filtering works
                 widget.set_filters({})  # Clear filters
-                all_count = widget._table.rowCount()
+                widget.wait_for_refresh()
+                all_count = widget._model.rowCount()
 
                 # Get a material from first specimen
                 first_instance = widget._instances_cache[0] if widget._instances_cache else {}
@@ -317,7 +319,8 @@ def test_integration_with_query_builder():
 
                 if material:
                     widget.set_filters({"https://dynamat.utep.edu/ontology#hasMaterial": material})
-                    filtered_count = widget._table.rowCount()
+                    widget.wait_for_refresh()
+                    filtered_count = widget._model.rowCount()
                     print(f"  Filtered by material '{material}': {filtered_count} of {all_count} specimens")
                     assert filtered_count <= all_count, "Filtered count should be <= total"
 